@@ -1,18 +1,48 @@
+#include <arpa/inet.h>
 #include <errno.h>
 #include <limits.h>
 #include <signal.h>
+#include <stdint.h>
 #include <stdio.h>
 #include <stdlib.h>
 #include <string.h>
+#include <sys/socket.h>
+#include <sys/stat.h>
+#include <sys/un.h>
 #include <sys/wait.h>
 #include <unistd.h>
 
+#define DAEMON_PROTOCOL "ICARUS-DAEMON-1"
+#define DAEMON_SOCKET_FMT "/tmp/icarus-daemon-%u/icarus.sock"
+#define DAEMON_DIR_FMT "/tmp/icarus-daemon-%u"
+
+extern char **environ;
+
 static pid_t child_pid = -1;
+static pid_t daemon_child_pgid = -1;
+static volatile sig_atomic_t forwarded_signal = 0;
 
 static void forward_signal(int sig) {
     if (child_pid > 0) {
         kill(child_pid, sig);
     }
+    if (daemon_child_pgid > 0) {
+        forwarded_signal = sig;
+        kill(-daemon_child_pgid, sig);
+    }
+}
+
+static void install_signal_forwarding(void) {
+    struct sigaction sa;
+    memset(&sa, 0, sizeof(sa));
+    sa.sa_handler = forward_signal;
+    sigemptyset(&sa.sa_mask);
+    sa.sa_flags = SA_RESTART;
+
+    sigaction(SIGINT, &sa, NULL);
+    sigaction(SIGTERM, &sa, NULL);
+    sigaction(SIGHUP, &sa, NULL);
+    sigaction(SIGQUIT, &sa, NULL);
 }
 
 static int ascend_dir(char *path, int levels) {
@@ -90,6 +120,274 @@ static int resolve_project_root(const char *exe_dir, char *out, size_t out_len)
     return -1;
 }
 
+static const char *logical_cwd(char *out, size_t out_len) {
+    /* Same as bash `pwd`: $PWD when it still points at the cwd. */
+    const char *pwd = getenv("PWD");
+    struct stat pwd_st;
+    struct stat dot_st;
+
+    if (pwd != NULL && pwd[0] == '/' && stat(pwd, &pwd_st) == 0 && stat(".", &dot_st) == 0 &&
+        pwd_st.st_dev == dot_st.st_dev && pwd_st.st_ino == dot_st.st_ino) {
+        return pwd;
+    }
+
+    if (getcwd(out, out_len) == NULL) {
+        return NULL;
+    }
+    return out;
+}
+
+static int set_icarus_env(const char *project_root) {
+    /* Mirrors the environment checks in scripts/icarus.sh. */
+    char cwd_buf[PATH_MAX];
+    const char *cwd = logical_cwd(cwd_buf, sizeof(cwd_buf));
+    int is_env_dev = cwd != NULL && strstr(cwd, "_Projects/Icarus") != NULL;
+    int is_icarus_dev = strstr(project_root, "_Projects/Icarus") != NULL;
+
+    if (is_env_dev && !is_icarus_dev) {
+        return -1;
+    }
+
+    if (setenv("ICARUS_ENV", is_env_dev ? "dev" : "prod", 1) != 0 ||
+        setenv("IS_ICARUS_DEV", is_icarus_dev ? "true" : "false", 1) != 0) {
+        return -1;
+    }
+    return 0;
+}
+
+static int append_field(char **buf, size_t *len, size_t *cap, const char *field) {
+    size_t field_len = strlen(field) + 1;
+
+    while (*len + field_len > *cap) {
+        size_t new_cap = *cap == 0 ? 4096 : *cap * 2;
+        char *new_buf = realloc(*buf, new_cap);
+        if (new_buf == NULL) {
+            return -1;
+        }
+        *buf = new_buf;
+        *cap = new_cap;
+    }
+
+    memcpy(*buf + *len, field, field_len);
+    *len += field_len;
+    return 0;
+}
+
+static int build_daemon_payload(const char *project_root, const char *cwd, int argc, char *argv[],
+                                char **out, size_t *out_len) {
+    char *buf = NULL;
+    size_t len = 0;
+    size_t cap = 0;
+    char count[32];
+    int envc = 0;
+
+    for (char **env = environ; *env != NULL; env++) {
+        envc++;
+    }
+
+    int failed = append_field(&buf, &len, &cap, DAEMON_PROTOCOL) != 0 ||
+                 append_field(&buf, &len, &cap, project_root) != 0 ||
+                 append_field(&buf, &len, &cap, cwd) != 0;
+
+    snprintf(count, sizeof(count), "%d", argc - 1);
+    failed = failed || append_field(&buf, &len, &cap, count) != 0;
+    for (int i = 1; i < argc && !failed; i++) {
+        failed = append_field(&buf, &len, &cap, argv[i]) != 0;
+    }
+
+    snprintf(count, sizeof(count), "%d", envc);
+    failed = failed || append_field(&buf, &len, &cap, count) != 0;
+    for (char **env = environ; *env != NULL && !failed; env++) {
+        failed = append_field(&buf, &len, &cap, *env) != 0;
+    }
+
+    if (failed) {
+        free(buf);
+        return -1;
+    }
+
+    *out = buf;
+    *out_len = len;
+    return 0;
+}
+
+static int send_all(int fd, const char *buf, size_t len) {
+    while (len > 0) {
+        ssize_t sent = send(fd, buf, len, MSG_NOSIGNAL);
+        if (sent < 0) {
+            if (errno == EINTR) {
+                continue;
+            }
+            return -1;
+        }
+        buf += sent;
+        len -= (size_t)sent;
+    }
+    return 0;
+}
+
+static int recv_int32(int fd, int32_t *out) {
+    uint32_t value = 0;
+    size_t received = 0;
+
+    while (received < sizeof(value)) {
+        ssize_t n = recv(fd, (char *)&value + received, sizeof(value) - received, 0);
+        if (n < 0) {
+            if (errno == EINTR) {
+                continue;
+            }
+            return -1;
+        }
+        if (n == 0) {
+            return -1;
+        }
+        received += (size_t)n;
+    }
+
+    *out = (int32_t)ntohl(value);
+    return 0;
+}
+
+static int connect_daemon(void) {
+    char dir_path[PATH_MAX];
+    struct sockaddr_un addr;
+    struct stat dir_st;
+
+    snprintf(dir_path, sizeof(dir_path), DAEMON_DIR_FMT, (unsigned)getuid());
+    if (lstat(dir_path, &dir_st) != 0 || !S_ISDIR(dir_st.st_mode) ||
+        dir_st.st_uid != getuid() || (dir_st.st_mode & 0077) != 0) {
+        return -1;
+    }
+
+    memset(&addr, 0, sizeof(addr));
+    addr.sun_family = AF_UNIX;
+    if (snprintf(addr.sun_path, sizeof(addr.sun_path), DAEMON_SOCKET_FMT, (unsigned)getuid()) >=
+        (int)sizeof(addr.sun_path)) {
+        return -1;
+    }
+
+    int fd = socket(AF_UNIX, SOCK_STREAM | SOCK_CLOEXEC, 0);
+    if (fd < 0) {
+        return -1;
+    }
+
+    if (connect(fd, (struct sockaddr *)&addr, sizeof(addr)) != 0) {
+        close(fd);
+        return -1;
+    }
+    return fd;
+}
+
+/*
+ * Forward the invocation to the resident daemon, see
+ * src/icarus/handlers/daemon_handler/daemon_server.py for the protocol.
+ * The daemon only serves the hot, non-interactive builder commands and
+ * refuses anything that may need the controlling terminal.
+ * Returns 0 and sets exit_code when the daemon served the request, -1
+ * when the caller must fall back to spawning icarus.
+ */
+static int run_via_daemon(const char *project_root, int argc, char *argv[], int *exit_code) {
+    if (argc > 1 && strcmp(argv[1], "daemon") == 0) {
+        return -1;
+    }
+
+    char cwd[PATH_MAX];
+    if (getcwd(cwd, sizeof(cwd)) == NULL) {
+        return -1;
+    }
+
+    int fd = connect_daemon();
+    if (fd < 0) {
+        return -1;
+    }
+
+    char *payload = NULL;
+    size_t payload_len = 0;
+    if (build_daemon_payload(project_root, cwd, argc, argv, &payload, &payload_len) != 0) {
+        close(fd);
+        return -1;
+    }
+
+    uint32_t header = htonl((uint32_t)payload_len);
+    int stdio_fds[3] = {STDIN_FILENO, STDOUT_FILENO, STDERR_FILENO};
+    char control[CMSG_SPACE(sizeof(stdio_fds))];
+    struct iovec iov = {.iov_base = &header, .iov_len = sizeof(header)};
+    struct msghdr msg;
+
+    memset(&msg, 0, sizeof(msg));
+    memset(control, 0, sizeof(control));
+    msg.msg_iov = &iov;
+    msg.msg_iovlen = 1;
+    msg.msg_control = control;
+    msg.msg_controllen = sizeof(control);
+
+    struct cmsghdr *cmsg = CMSG_FIRSTHDR(&msg);
+    cmsg->cmsg_level = SOL_SOCKET;
+    cmsg->cmsg_type = SCM_RIGHTS;
+    cmsg->cmsg_len = CMSG_LEN(sizeof(stdio_fds));
+    memcpy(CMSG_DATA(cmsg), stdio_fds, sizeof(stdio_fds));
+
+    ssize_t sent;
+    do {
+        sent = sendmsg(fd, &msg, MSG_NOSIGNAL);
+    } while (sent < 0 && errno == EINTR);
+
+    int failed = sent != (ssize_t)sizeof(header) || send_all(fd, payload, payload_len) != 0;
+    free(payload);
+
+    int32_t pid = 0;
+    if (failed || recv_int32(fd, &pid) != 0 || pid <= 0) {
+        close(fd);
+        return -1;
+    }
+
+    /* From here on the daemon owns the request, never fall back. */
+    daemon_child_pgid = (pid_t)pid;
+    install_signal_forwarding();
+
+    int32_t status = 0;
+    if (recv_int32(fd, &status) != 0) {
+        status = forwarded_signal != 0 ? 128 + forwarded_signal : 1;
+    }
+
+    close(fd);
+    *exit_code = (int)status;
+    return 0;
+}
+
+/*
+ * Replace the launcher with the runtime interpreter, this is what
+ * scripts/icarus.sh ends up doing once the runtime is in place.
+ * Returns only if the interpreter cannot be executed.
+ */
+static void exec_runtime_python(const char *project_root, int argc, char *argv[]) {
+    char python_path[PATH_MAX];
+    if (snprintf(python_path, sizeof(python_path), "%s/runtime/env/bin/python3", project_root) >=
+        (int)sizeof(python_path)) {
+        return;
+    }
+
+    if (access(python_path, X_OK) != 0) {
+        return;
+    }
+
+    char **python_argv = calloc((size_t)argc + 3, sizeof(char *));
+    if (python_argv == NULL) {
+        return;
+    }
+
+    python_argv[0] = python_path;
+    python_argv[1] = "-m";
+    python_argv[2] = "icarus";
+    for (int i = 1; i < argc; i++) {
+        python_argv[i + 2] = argv[i];
+    }
+    python_argv[argc + 2] = NULL;
+
+    execv(python_path, python_argv);
+    free(python_argv);
+}
+
 int main(int argc, char *argv[]) {
     char exe_dir[PATH_MAX];
     if (resolve_exe_dir(exe_dir, sizeof(exe_dir)) != 0) {
@@ -115,6 +413,20 @@ int main(int argc, char *argv[]) {
         return 1;
     }
 
+    /*
+     * Fast path, icarus.sh is only needed to update or install the
+     * runtime and to report a prod icarus run in the dev environment.
+     */
+    int is_update = argc > 1 && strcmp(argv[1], "--update") == 0;
+    if (!is_update && set_icarus_env(project_root_dir) == 0) {
+        int exit_code = 0;
+        if (run_via_daemon(project_root_dir, argc, argv, &exit_code) == 0) {
+            return exit_code;
+        }
+
+        exec_runtime_python(project_root_dir, argc, argv);
+    }
+
     char **child_argv = calloc((size_t)argc + 2, sizeof(char *));
     if (child_argv == NULL) {
         fprintf(stderr, "Failed to allocate argv.\n");
@@ -145,17 +457,7 @@ int main(int argc, char *argv[]) {
     }
 
     child_pid = pid;
-
-    struct sigaction sa;
-    memset(&sa, 0, sizeof(sa));
-    sa.sa_handler = forward_signal;
-    sigemptyset(&sa.sa_mask);
-    sa.sa_flags = SA_RESTART;
-
-    sigaction(SIGINT, &sa, NULL);
-    sigaction(SIGTERM, &sa, NULL);
-    sigaction(SIGHUP, &sa, NULL);
-    sigaction(SIGQUIT, &sa, NULL);
+    install_signal_forwarding();
 
     int status = 0;
     while (waitpid(pid, &status, 0) == -1) {
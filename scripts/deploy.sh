@@ -111,8 +111,8 @@ echo
 
 # Write the new version to the file
 today=$(date +%m/%d/%Y)
-new_cli_version="CLI_VERSION = f'build {_SEMANTIC_VERSION} built on ${today}'"
-sed -i '' "s|^CLI_VERSION = .*|${new_cli_version}|" "${cli_version_file}"
+new_cli_version="CLI_VERSION_TEMPLATE = 'build {semantic_version} built on ${today}'"
+sed -i '' "s|^CLI_VERSION_TEMPLATE = .*|${new_cli_version}|" "${cli_version_file}"
 
 new_version=$("${project_root_dir_abs}"/bin/icarus builder path 'pkg.version')
 echo -e "${bold_green}New version: build ${new_version} built on ${today}${end}"
@@ -31,6 +31,8 @@
 
 # Standard Library Imports
 import argparse
+import re
+from typing import Optional
 
 # Local Application Imports
 from icarus import config, handlers, utils
@@ -43,6 +45,7 @@
 __all__ = [
     'initialize_parser',
     'parse_args',
+    'fast_parse_args',
     'execute',
 ]
 
@@ -52,6 +55,75 @@
 # Type aliases
 #
 
+# Fixed-shape builder commands recognized by fast_parse_args, these
+# must match the sub-trees built by initialize_parser
+_FAST_PATH_BUILDER_PATH_NAMES = frozenset({
+    'platform-identifier',
+    'workspace.name',
+    'workspace.root',
+    'workspace.src-root',
+    'workspace.build-root',
+    'workspace.user-space-root',
+    'workspace.python-interpreters',
+    'pkg.config',
+    'pkg.language',
+    'pkg.name-pascal',
+    'pkg.name-snake',
+    'pkg.name-dashed',
+    'pkg.version',
+    'pkg.version-major',
+    'pkg.version-minor',
+    'pkg.version-patch',
+    'pkg.runtimefarm',
+    'pkg.pythonhome',
+    'pkg.pythonpath',
+    'pkg.bin',
+    'pkg.artifact',
+    'tool.name',
+    'tool.version',
+    'tool.runtimefarm',
+    'tool.pythonhome',
+    'tool.pythonpath',
+    'tool.bin',
+    'run.name',
+    'run.version',
+    'run.runtimefarm',
+    'run.pythonhome',
+    'run.pythonpath',
+    'run.bin',
+    'run_excluderoot.name',
+    'run_excluderoot.version',
+    'run_excluderoot.runtimefarm',
+    'run_excluderoot.pythonhome',
+    'run_excluderoot.pythonpath',
+    'run_excluderoot.bin',
+    'devrun.name',
+    'devrun.version',
+    'devrun.runtimefarm',
+    'devrun.pythonhome',
+    'devrun.pythonpath',
+    'devrun.bin',
+    'devrun_excluderoot.name',
+    'devrun_excluderoot.version',
+    'devrun_excluderoot.runtimefarm',
+    'devrun_excluderoot.pythonhome',
+    'devrun_excluderoot.pythonpath',
+    'devrun_excluderoot.bin',
+})
+# Cache subcommands and the defaults of their options
+_FAST_PATH_BUILDER_CACHE_SUBCOMMANDS: dict[str, dict[str, str]] = {
+    'root': {},
+    'clean': {},
+    'size': {'verify': ''},
+    'gc': {'max_size': ''},
+}
+_FAST_PATH_BUILDER_EXEC_COMMANDS = frozenset({
+    'exec-tool',
+    'exec-run',
+    'exec-dev',
+})
+_FAST_PATH_VERBOSE_RE = re.compile(r'-v+')
+
 
 def initialize_parser() -> argparse.ArgumentParser:
     """
@@ -199,6 +271,25 @@ def initialize_parser() -> argparse.ArgumentParser:
         metavar='<subcommand>',
     )
 
+    # Daemon
+    daemon_par = sl_par.add_parser(
+        name='daemon',
+        help='utilities to manage the resident icarus daemon',
+        description=(
+            'description:\n  The \'icarus daemon\' command manages the opt-in resident icarus'
+            ' daemon. The daemon keeps\n  a warm interpreter listening on a per-user Unix socket'
+            ' and the icarus launcher forwards\n  every invocation to it, falling back to starting'
+            ' a new interpreter when it is not running.'
+        ),
+        allow_abbrev=False,
+    )
+    daemon_sub = daemon_par.add_subparsers(
+        title='subcommands',
+        dest='daemon_command',
+        required=True,
+        metavar='<subcommand>',
+    )
+
     # ==================
     # Amazon subcommands
     # ==================
@@ -313,9 +404,20 @@ def initialize_parser() -> argparse.ArgumentParser:
         help=argparse.SUPPRESS,
     )
 
+    # Shared by every subcommand that builds or syncs runtimefarms.
+    builder_refresh_parent_parser = utils.IcarusArgumentParser(add_help=False)
+    builder_refresh_parent_parser.add_argument(
+        '--refresh',
+        required=False,
+        action='store_const',
+        const='--refresh',
+        default='',
+        help='re-resolve the runtimefarms dependencies even if they have not changed',
+    )
+
     builder_hook_par = builder_sub.add_parser(
         name='hook',
-        parents=[builder_release_parent_parser],
+        parents=[builder_release_parent_parser, builder_refresh_parent_parser],
         help='the hook(s) for the builder',
         description='',
         allow_abbrev=False,
@@ -526,6 +628,7 @@ def initialize_parser() -> argparse.ArgumentParser:
 
     builder_build = builder_sub.add_parser(
         name='build',
+        parents=[builder_refresh_parent_parser],
         help='create/re-create the project runtime environment',
         description='',
         allow_abbrev=False,
@@ -534,7 +637,7 @@ def initialize_parser() -> argparse.ArgumentParser:
 
     builder_release = builder_sub.add_parser(
         name='release',
-        parents=[builder_release_parent_parser],
+        parents=[builder_release_parent_parser, builder_refresh_parent_parser],
         help='run the full "release" pipeline',
         description='',
         allow_abbrev=False,
@@ -543,6 +646,7 @@ def initialize_parser() -> argparse.ArgumentParser:
 
     builder_format = builder_sub.add_parser(
         name='format',
+        parents=[builder_refresh_parent_parser],
         help='run the formatting tools',
         description='',
         allow_abbrev=False,
@@ -551,6 +655,7 @@ def initialize_parser() -> argparse.ArgumentParser:
 
     builder_docs = builder_sub.add_parser(
         name='docs',
+        parents=[builder_refresh_parent_parser],
         help='generate user documentation',
         description='',
         allow_abbrev=False,
@@ -559,6 +664,7 @@ def initialize_parser() -> argparse.ArgumentParser:
 
     builder_test = builder_sub.add_parser(
         name='test',
+        parents=[builder_refresh_parent_parser],
         help='run the automated test suite',
         description='',
         allow_abbrev=False,
@@ -647,12 +753,33 @@ def initialize_parser() -> argparse.ArgumentParser:
         description='',
         allow_abbrev=False,
     )
-    builder_cache_cmd_par.add_parser(
+    builder_cache_size_par = builder_cache_cmd_par.add_parser(
         name='size',
         help='show the size of the package cache',
         description='',
         allow_abbrev=False,
     )
+    builder_cache_size_par.add_argument(
+        '--verify',
+        required=False,
+        action='store_const',
+        const='--verify',
+        default='',
+        help='rescan the whole cache instead of answering from the cache index',
+    )
+    builder_cache_gc_par = builder_cache_cmd_par.add_parser(
+        name='gc',
+        help='evict the least recently used packages until the cache fits in the maximum size',
+        description='',
+        allow_abbrev=False,
+    )
+    builder_cache_gc_par.add_argument(
+        '--max-size',
+        required=False,
+        metavar='SIZE',
+        default='',
+        help='the maximum size of the package cache, e.g. 10G or 500M',
+    )
 
     builder_path_par = builder_sub.add_parser(
         name='path',
@@ -1227,6 +1354,37 @@ def initialize_parser() -> argparse.ArgumentParser:
         allow_abbrev=False,
     )
 
+    # ==================
+    # Daemon subcommands
+    # ==================
+    daemon_sub.add_parser(
+        name='start',
+        help='start the icarus daemon in the background',
+        description='',
+        allow_abbrev=False,
+    )
+
+    daemon_sub.add_parser(
+        name='stop',
+        help='stop the icarus daemon',
+        description='',
+        allow_abbrev=False,
+    )
+
+    daemon_sub.add_parser(
+        name='status',
+        help='check the running status of the icarus daemon',
+        description='',
+        allow_abbrev=False,
+    )
+
+    daemon_sub.add_parser(
+        name='run',
+        help='[DO NOT USE] internally used only to run the icarus daemon',
+        description='',
+        allow_abbrev=False,
+    )
+
     # =====================
     # Provision subcommands
     # =====================
@@ -1262,6 +1420,76 @@ def parse_args(parser: argparse.ArgumentParser) -> argparse.Namespace:
     return args
 
 
+def fast_parse_args(argv: list[str]) -> Optional[argparse.Namespace]:
+    """
+    Parse the hot, fixed-shape commands without building the parser.
+
+    Recognizes the global flags followed by nothing, or by one of
+    `builder path <path-name>`, `builder path --list`,
+    `builder cache <subcommand>` and `builder exec-* <CMD>...`, and
+    returns the same namespace the full parser would return.
+    Anything else, including `--help` and any other option, is left to
+    the full parser.
+
+    :param argv: The command-line arguments, without the program name.
+    :return: A namespace object containing the parsed arguments or
+        None if the arguments must be parsed by the full parser.
+    """
+
+    version = ''
+    verbose = 0
+    idx = 0
+
+    while idx < len(argv) and argv[idx].startswith('-'):
+        if argv[idx] == '--version':
+            version = '--version'
+        elif argv[idx] == '--verbose':
+            verbose += 1
+        elif _FAST_PATH_VERBOSE_RE.fullmatch(argv[idx]):
+            verbose += len(argv[idx]) - 1
+        else:
+            return None
+        idx += 1
+
+    args = argparse.Namespace(version=version, update='', verbose=verbose)
+    command = argv[idx:]
+
+    if not command:
+        args.tl_command = None
+        return args
+
+    if len(command) < 3 or command[0] != 'builder':
+        return None
+
+    args.tl_command = 'builder'
+    args.builder_command = command[1]
+    operands = command[2:]
+
+    if command[1] == 'path' and len(operands) == 1:
+        if operands[0] == '--list':
+            args.list = '--list'
+            args.path_name = None
+            return args
+        if operands[0] in _FAST_PATH_BUILDER_PATH_NAMES:
+            args.list = ''
+            args.path_name = operands[0]
+            return args
+
+    elif command[1] == 'cache' and len(operands) == 1:
+        if operands[0] in _FAST_PATH_BUILDER_CACHE_SUBCOMMANDS:
+            args.cache_subcommands = operands[0]
+            for name, default in _FAST_PATH_BUILDER_CACHE_SUBCOMMANDS[operands[0]].items():
+                setattr(args, name, default)
+            return args
+
+    elif command[1] in _FAST_PATH_BUILDER_EXEC_COMMANDS:
+        if not any(operand.startswith('-') for operand in operands):
+            setattr(args, command[1], operands)
+            return args
+
+    return None
+
+
 def execute(args: argparse.Namespace) -> int:
     """
     Execute the logic based on the parsed arguments.
@@ -1271,6 +1499,9 @@ def execute(args: argparse.Namespace) -> int:
     `tl_command` value. Each top-level command corresponds to a specific
     handler function that implements the logic for that command.
 
+    Handlers are resolved lazily by `icarus.handlers`, only the package
+    of the selected command is imported.
+
     :param args: The parsed arguments from the command-line.
     :return: Exit code of the script.
     """
@@ -1316,6 +1547,14 @@ def execute(args: argparse.Namespace) -> int:
 
         return return_code
 
+    elif args.tl_command == 'daemon':
+        module_logger.debug(
+            f"Running {args.tl_command=} handler={handlers.handle_daemon_command.__name__}"
+        )
+        return_code = handlers.handle_daemon_command(args=args)
+
+        return return_code
+
     elif args.tl_command == 'provision':
         module_logger.debug(
             f"Running {args.tl_command=} handler={handlers.handle_provision_command.__name__}"
@@ -2210,7 +2210,7 @@ function make_tar() {
         echo_error "Failed to pack up '${python_pkg_name}'."
         exit_code=1
     }
-    rm -rf "${python_builds:?}/${python_pkg_full_name:?}" || {
+    rm -rf "${python_builds:?}/${python_pkg_full_name:?}" "${python_builds:?}/${python_pkg_full_name:?}.sha256" || {
         echo_error "Failed to remove '${python_builds}/${python_pkg_full_name}'."
         exit_code=1
     }
@@ -2218,6 +2218,19 @@ function make_tar() {
         echo_error "Failed to move '${python_pkg_full_name}'."
         exit_code=1
     }
+    # Published next to the tarball, the builder verifies the download
+    # against it before caching it.
+    (
+        cd "${python_builds}" || exit 1
+        if command -v sha256sum >/dev/null 2>&1; then
+            sha256sum "${python_pkg_full_name}"
+        else
+            shasum -a 256 "${python_pkg_full_name}"
+        fi >"${python_pkg_full_name}.sha256"
+    ) || {
+        echo_error "Failed to write '${python_pkg_full_name}.sha256'."
+        exit_code=1
+    }
     du -h "${python_builds}/${python_pkg_full_name}"
     echo -e "done!"
     echo
@@ -183,74 +183,9 @@ function echo_summary() {
 ####################################################################################################
 # CONSTANTS
 ####################################################################################################
-function should_ignore_path() {
-    local path rel_path normalized_path ignored pat anchored dir_only anywhere need_anywhere p
-    local -a patterns
-
-    path="${1}"
-    rel_path="${2}"
-    normalized_path="${rel_path%/}"
-
-    if [[ -z "${path}" || -z "${rel_path}" ]]; then
-        echo_error "should_ignore_path() requires two arguments: path and rel_path" "errexit"
-        exit 1
-    fi
-
-    for ignored in "${icarus_ignore_array[@]}"; do
-        pat="${ignored#./}"
-        anchored=false
-        dir_only=false
-        anywhere=false
-        need_anywhere=false
-
-        if [[ "${pat}" == /* ]]; then
-            anchored=true
-            pat="${pat#/}"
-        fi
-        if [[ "${pat}" == */ ]]; then
-            dir_only=true
-            pat="${pat%/}"
-        fi
-        if [[ "${pat}" == '**/'* ]]; then
-            pat="${pat#**/}"
-            anywhere=true
-        fi
-        if [[ "${anywhere}" == true || "${pat}" == */* ]]; then
-            need_anywhere=true
-        fi
-
-        patterns=()
-        if [[ "${anchored}" == true ]]; then
-            patterns+=("${pat}")
-            if [[ "${dir_only}" == true ]]; then
-                patterns+=("${pat}/*" "${pat}/**")
-            fi
-        else
-            patterns+=("${pat}")
-            if [[ "${need_anywhere}" == true ]]; then
-                patterns+=("**/${pat}")
-            fi
-            if [[ "${dir_only}" == true ]]; then
-                patterns+=("${pat}/*" "${pat}/**")
-                if [[ "${need_anywhere}" == true ]]; then
-                    patterns+=("**/${pat}/*" "**/${pat}/**")
-                fi
-            fi
-        fi
-
-        for p in "${patterns[@]}"; do
-            if [[ "${normalized_path}" == ${p} ]]; then
-                return 0
-            fi
-        done
-    done
-
-    return 1
-}
-
 function set_constants() {
-    local pat anchored dir_only has_glob path rel_path
-    local -a find_cmd prune_patterns prune_expr
+    local pat list_name path index_file
+    local -a index_args
 
     echo -e "Reading constants"
     eval "${@}"
@@ -273,12 +208,19 @@ function set_constants() {
     passed="${bold_black}${bg_green} PASS ${end}"
     failed="${bold_black}${bg_red} FAIL ${end}"
     warned="${bold_black}${bg_yellow} WARN ${end}"
+    cached="${bold_black}${bg_blue}CACHED${end}"
     declare -g -r passed
     declare -g -r failed
     declare -g -r warned
+    declare -g -r cached
 
     path_called="N"
 
+    # Per-run memo of the paths resolved by path.sh, see
+    # _internal_icarus_builder_path_cmd
+    declare -a -g path_memo_keys=()
+    declare -a -g path_memo_values=()
+
     index_summary_status="${passed}"
     path_summary_status="${passed}"
     build_summary_status="${passed}"
@@ -327,6 +269,18 @@ function set_constants() {
     execdev_execution_time=0
     prayers_execution_time=0
 
+    # Written once per interpreter for the action cache, see
+    # _action_cache_args
+    action_files_filepath=""
+
+    # Filled by the single text hygiene pass, see run_text_hygiene
+    hygiene_ran=false
+    hygiene_failed=false
+    hygiene_cached=false
+    declare -a -g hygiene_hooks=()
+    declare -a -g hygiene_statuses=()
+    declare -a -g hygiene_paths=()
+
     declare -a -g active_dirs_d1=()
     declare -a -g active_py_files_d1=()
     declare -a -g active_sh_files_d1=()
@@ -335,88 +289,44 @@ function set_constants() {
 
     echo -e "Walking package root"
 
-    # We do a partial prune on safe ignore without any * to speed up find
-    # and exclude big excluded dirs
-    prune_patterns=()
+    # The ignore list is compiled once by the workspace helper, it
+    # prunes the ignored dirs and writes back NUL-separated
+    # `<list name>` `<path>` records. The index is persisted in the
+    # control plane so only the dirs changed since the last run are
+    # listed again.
+    index_args=()
     for pat in "${icarus_ignore_array[@]}"; do
-        anchored=false
-        dir_only=false
-        has_glob=false
-
-        pat="${pat#./}"
-        if [[ "${pat}" == /* ]]; then
-            anchored=true
-            pat="${pat#/}"
-        fi
-        if [[ "${pat}" == */ ]]; then
-            dir_only=true
-            pat="${pat%/}"
-        fi
-        if [[ "${pat}" == '**/'* ]]; then
-            pat="${pat#**/}"
-        fi
-        # Does it contain any of *, ? or [
-        if [[ "${pat}" == *[\*\?\[]* ]]; then
-            has_glob=true
-        fi
-
-        # Only use -prune for simple (no-glob) directory-like ignores
-        if [[ "${has_glob}" == false ]]; then
-            if [[ "${anchored}" == true ]]; then
-                prune_patterns+=("${project_root_dir_abs}/${pat}")
-            else
-                prune_patterns+=("${project_root_dir_abs}/${pat}")
-                prune_patterns+=("${project_root_dir_abs}/*/${pat}")
-            fi
-        fi
+        index_args+=("--ignore" "${pat}")
     done
 
-    if ((${#prune_patterns[@]})); then
-        prune_expr=("(")
-        for pat in "${prune_patterns[@]}"; do
-            prune_expr+=("-path" "${pat}" "-o")
-        done
-        # Slice to remove the trailing "-o"
-        prune_expr=("${prune_expr[@]:0:${#prune_expr[@]}-1}")
-        prune_expr+=(")")
-        find_cmd=("find" "${project_root_dir_abs}" "-mindepth" "1" "${prune_expr[@]}" "-prune" "-o" "-print0")
-    else
-        find_cmd=("find" "${project_root_dir_abs}" "-mindepth" "1" "-print0")
-    fi
-
-    while IFS= read -r -d '' path; do
-        # Strip the project root prefix plus the trailing / from the absolute path
-        rel_path="${path#${project_root_dir_abs}/}"
-
-        if should_ignore_path "${path}" "${rel_path}"; then
-            continue
-        fi
+    mkdir -p "${tmp_root}/builder" || {
+        echo_error "Failed to create '${tmp_root}/builder'." "errexit"
+        exit 1
+    }
+    index_file="$(mktemp "${tmp_root}/builder/workspace-index.XXXXXX")" || {
+        echo_error "Failed to create the workspace index file." "errexit"
+        exit 1
+    }
 
-        # Dirs classification
-        if [[ -d "${path}" ]]; then
-            if [[ "${rel_path}" != *'/'* ]]; then
-                # Depth-1 directories only
-                active_dirs_d1+=("${path}")
-            fi
-            continue
-        fi
+    "${cli_python_executable}" -I -m icarus.handlers.builder_handler.workspace_helper index \
+        "${project_root_dir_abs}" "${index_args[@]}" --mode "${workspace_index}" --persist \
+        --output "${index_file}" || {
+        rm -f "${index_file}"
+        echo_error "Failed to index '${project_root_dir_abs}'." "errexit"
+        exit 1
+    }
 
-        # If we get here then it's not a directory
-        # Files classification
-        if [[ "${rel_path}" != *'/'* ]]; then
-            # Depth-1 directories only
-            if [[ "${path}" =~ .+\.py$ ]]; then
-                active_py_files_d1+=("${path}")
-            elif [[ "${path}" =~ .+\.sh$ ]]; then
-                active_sh_files_d1+=("${path}")
-            else
-                active_other_files_d1+=("${path}")
-            fi
-        fi
+    while IFS= read -r -d '' list_name && IFS= read -r -d '' path; do
+        case "${list_name}" in
+        active_dirs_d1) active_dirs_d1+=("${path}") ;;
+        active_py_files_d1) active_py_files_d1+=("${path}") ;;
+        active_sh_files_d1) active_sh_files_d1+=("${path}") ;;
+        active_other_files_d1) active_other_files_d1+=("${path}") ;;
+        active_files_all) active_files_all+=("${path}") ;;
+        esac
+    done <"${index_file}"
 
-        # Always an active file regardless of the type and depth
-        active_files_all+=("${path}")
-    done < <("${find_cmd[@]}")
+    rm -f "${index_file}"
 
     declare -r -g active_dirs_d1
     declare -r -g active_py_files_d1
@@ -450,6 +360,295 @@ function set_icarus_cdk_constants() {
 ####################################################################################################
 # TOOLS
 ####################################################################################################
+function write_action_files() {
+    # Write the action cache inputs list once per interpreter, before
+    # any hook runs in a subshell.
+    if [[ -n "${action_files_filepath}" ]]; then
+        return
+    fi
+
+    mkdir -p "${tmp_root}/builder" || return 1
+    action_files_filepath="$(mktemp "${tmp_root}/builder/action-files.XXXXXX")" || return 1
+    if ((${#active_files_all[@]})); then
+        printf '%s\0' "${active_files_all[@]}" >"${action_files_filepath}" || return 1
+    fi
+}
+
+function _action_cache_args() {
+    # Sets action_cache_args, the key arguments of the action cache
+    # helper shared by lookup and store.
+    local hook
+
+    hook="${1}"
+    shift
+
+    write_action_files || return 1
+
+    action_cache_args=(
+        "--root" "${project_root_dir_abs}"
+        "--hook" "${hook}"
+        "--files-from" "${action_files_filepath}"
+        "--interpreter" "${python_full_version}-${platform_identifier}"
+        "--farm-info" "${FARMHOME}/farm-info/packages-py${python_full_version}.json"
+        "${@}"
+    )
+}
+
+function action_cache_lookup() {
+    # Sets action_key, action_hit_status and action_hit_output, the hit
+    # ones are empty on a miss or when the run is refreshed.
+    # Arguments are the hook name plus --tool/--extra key arguments.
+    action_key=""
+    action_hit_status=""
+    action_hit_output=""
+
+    _action_cache_args "${@}" || return 0
+
+    {
+        IFS= read -r action_key
+        IFS= read -r action_hit_status
+        IFS= read -r action_hit_output
+    } < <("${cli_python_executable}" -I -m icarus.handlers.builder_handler.action_cache_helper lookup \
+        "${action_cache_args[@]}" 2>/dev/null) || :
+
+    if [[ "${refresh}" == "Y" ]]; then
+        action_hit_status=""
+        action_hit_output=""
+    fi
+}
+
+function action_cache_store() {
+    # Arguments are the status (passed, warned or failed), the output
+    # file, the hook name plus the same key arguments of the lookup.
+    local status output_filepath
+
+    status="${1}"
+    output_filepath="${2}"
+    shift 2
+
+    if [[ -z "${action_key}" ]]; then
+        return
+    fi
+
+    _action_cache_args "${@}" || return 0
+
+    "${cli_python_executable}" -I -m icarus.handlers.builder_handler.action_cache_helper store \
+        "${action_cache_args[@]}" --before-key "${action_key}" --status "${status}" \
+        --output-file "${output_filepath}" || {
+        echo_warning "Failed to store the ${action_cache_args[3]} result in the action cache."
+    }
+}
+
+function run_cached_hook() {
+    # Run a hook through the action cache, a hit replays the output of
+    # the stored run. Arguments are the hook name, its run function and
+    # the executables the hook runs.
+    local hook runner tool previous_status status output_filepath
+    local -a key_args
+
+    hook="${1}"
+    runner="${2}"
+    shift 2
+
+    key_args=()
+    for tool in "${@}"; do
+        key_args+=("--tool" "${tool}")
+    done
+
+    eval previous_status='$'"${hook}_summary_status"
+
+    action_cache_lookup "${hook}" "${key_args[@]}"
+
+    if [[ -n "${action_hit_status}" ]] && cat -- "${action_hit_output}"; then
+        if [[ "${previous_status}" == "${failed}" || "${previous_status}" == "${warned}" ]]; then
+            return
+        fi
+        if [[ "${action_hit_status}" == "warned" ]]; then
+            printf -v "${hook}_summary_status" '%s' "${warned}"
+        else
+            printf -v "${hook}_summary_status" '%s' "${cached}"
+        fi
+        return
+    fi
+
+    output_filepath="$(mktemp "${tmp_root}/builder/action-output.XXXXXX")" || {
+        "${runner}"
+        return
+    }
+
+    # The status of this run alone decides what is stored, the status of
+    # the previous interpreters is put back afterwards.
+    printf -v "${hook}_summary_status" '%s' "${passed}"
+    "${runner}" > >(tee -- "${output_filepath}") 2>&1
+    wait "${!}" 2>/dev/null || :
+    eval status='$'"${hook}_summary_status"
+
+    if [[ "${status}" == "${passed}" ]]; then
+        action_cache_store passed "${output_filepath}" "${hook}" "${key_args[@]}"
+    elif [[ "${status}" == "${warned}" ]]; then
+        action_cache_store warned "${output_filepath}" "${hook}" "${key_args[@]}"
+    fi
+
+    rm -f "${output_filepath}"
+
+    if [[ "${previous_status}" == "${failed}" ]] ||
+        [[ "${previous_status}" == "${warned}" && "${status}" != "${failed}" ]]; then
+        printf -v "${hook}_summary_status" '%s' "${previous_status}"
+    fi
+}
+
+function run_checker_hook() {
+    # Run one of the hooks that only read the workspace, see
+    # schedule_checker_hooks.
+    local hook
+
+    hook="${1}"
+
+    case "${hook}" in
+    flake8)
+        echo_title "Running Flake8"
+        run_cached_hook flake8 run_flake8 flake8
+        ;;
+    mypy)
+        echo_title "Running mypy"
+        run_cached_hook mypy run_mypy mypy
+        ;;
+    gitleaks)
+        echo_title "Running gitleaks"
+        run_gitleaks
+        ;;
+    pytest)
+        echo_title "Running pytest"
+        run_cached_hook pytest run_pytest pytest
+        ;;
+    sphinx)
+        echo_title "Generating documentation"
+        if [[ "${is_python_default}" == true ]]; then
+            run_documentation_sphinx
+        else
+            echo_warning "Skipping Python${python_version} because it is not the python-default (in icarus.cfg)"
+        fi
+        ;;
+    *)
+        echo_error "run_checker_hook() unknown hook: ${hook}" "errexit"
+        exit 1
+        ;;
+    esac
+}
+
+function schedule_checker_hooks() {
+    local hook enabled job_dir max_jobs running pid i start_block end_block execution_time
+    local job_status job_exit_code job_execution_time
+    local -a hooks job_pids
+
+    # The writers (isort, black, shfmt and the hygiene passes) already
+    # ran in order, the hooks below only read the workspace so they run
+    # concurrently. Their order is the order the output is replayed.
+    hooks=()
+    for hook in flake8 mypy gitleaks pytest sphinx; do
+        eval enabled='$'"${hook}"
+        if [[ "${enabled}" == "Y" ]]; then
+            hooks+=("${hook}")
+        fi
+    done
+
+    if ((${#hooks[@]} == 0)); then
+        return
+    fi
+
+    if [[ -n "${build_jobs}" ]]; then
+        max_jobs="${build_jobs}"
+    else
+        max_jobs="$(getconf _NPROCESSORS_ONLN 2>/dev/null)" || max_jobs=1
+    fi
+    if [[ ! "${max_jobs}" =~ ^[1-9][0-9]*$ ]]; then
+        max_jobs=1
+    fi
+
+    job_dir=""
+    if ((${#hooks[@]} > 1 && max_jobs > 1)); then
+        mkdir -p "${tmp_root}/builder" &&
+            job_dir="$(mktemp -d "${tmp_root}/builder/checkers.XXXXXX")" &&
+            write_action_files || {
+            echo_warning "Failed to prepare the checker jobs, running them one at a time."
+            job_dir=""
+        }
+    fi
+
+    # Nothing to overlap, the hooks run and print as they go
+    if [[ -z "${job_dir}" ]]; then
+        for hook in "${hooks[@]}"; do
+            start_block=$(date +%s.%N)
+            run_checker_hook "${hook}"
+            end_block=$(date +%s.%N)
+            eval execution_time='$'"${hook}_execution_time"
+            printf -v "${hook}_execution_time" '%s' "$(echo "${execution_time} + ${end_block} - ${start_block}" | bc)"
+        done
+        return
+    fi
+
+    # Every job buffers its output in its own log and writes back the
+    # status, exit code and execution time it set in its subshell.
+    job_pids=()
+    for i in "${!hooks[@]}"; do
+        while true; do
+            running=0
+            for pid in "${job_pids[@]}"; do
+                if kill -0 "${pid}" 2>/dev/null; then
+                    running=$((running + 1))
+                fi
+            done
+            if ((running < max_jobs)); then
+                break
+            fi
+            sleep 0.1
+        done
+
+        (
+            hook="${hooks[${i}]}"
+            start_block=$(date +%s.%N)
+            run_checker_hook "${hook}"
+            end_block=$(date +%s.%N)
+            eval job_status='$'"${hook}_summary_status"
+            printf '%s\n%s\n%s\n' "${job_status}" "${exit_code}" "$(echo "${end_block} - ${start_block}" | bc)" >"${job_dir}/${i}.state"
+        ) >"${job_dir}/${i}.log" 2>&1 &
+        job_pids+=("$!")
+    done
+
+    # Jobs are replayed in the order they were scheduled, each one as
+    # soon as it and the ones before it are done.
+    for i in "${!hooks[@]}"; do
+        hook="${hooks[${i}]}"
+        wait "${job_pids[${i}]}" || :
+        cat "${job_dir}/${i}.log" || :
+
+        job_status=""
+        job_exit_code=""
+        job_execution_time=""
+        {
+            IFS= read -r job_status
+            IFS= read -r job_exit_code
+            IFS= read -r job_execution_time
+        } 2>/dev/null <"${job_dir}/${i}.state" || :
+
+        if [[ -z "${job_status}" || -z "${job_execution_time}" ]]; then
+            echo_error "The ${hook} job exited without reporting its status."
+            job_status="${failed}"
+            job_exit_code=1
+            job_execution_time=0
+        fi
+
+        printf -v "${hook}_summary_status" '%s' "${job_status}"
+        if [[ "${job_exit_code}" != 0 ]]; then
+            exit_code=1
+        fi
+        eval execution_time='$'"${hook}_execution_time"
+        printf -v "${hook}_execution_time" '%s' "$(echo "${execution_time} + ${job_execution_time}" | bc)"
+    done
+
+    rm -rf "${job_dir}"
+}
+
 function run_isort() {
     local el
     local -a elements
@@ -562,109 +761,113 @@ function run_shfmt() {
     done
 }
 
-function run_char_replacement() {
-    local el counter
-    local -a elements
-
-    counter=0
-    elements=("${active_files_all[@]}")
+function run_text_hygiene() {
+    local hook enabled status path files_file report_file empty_file
+    local -a fix_args key_args
 
-    for el in "${elements[@]}"; do
-        # Skip this script
-        if [[ "${ICARUS_ENV}" == "dev" && $(basename "${el}") == "${this_script_filename}" ]]; then
-            continue
+    # The single pass runs with the first enabled hygiene hook, the
+    # other ones only report their part of it
+    if [[ "${hygiene_ran}" == true ]]; then
+        return
+    fi
+    hygiene_ran=true
+
+    fix_args=()
+    key_args=()
+    for hook in eolnorm whitespaces trailing eofnewline; do
+        eval enabled='$'"${hook}"
+        if [[ "${enabled}" == "Y" ]]; then
+            fix_args+=("--fix" "${hook}")
+            key_args+=("--extra" "${hook}")
         fi
+    done
 
-        # Skip empty files
-        if [[ ! -s "${el}" ]]; then
-            continue
-        fi
+    # The enabled hygiene hooks are cached as one unit, a hit means
+    # the last pass over the same files found nothing to fix
+    action_cache_lookup hygiene "${key_args[@]}"
+    if [[ -n "${action_hit_status}" ]]; then
+        hygiene_cached=true
+        return
+    fi
 
-        # Skip non-text (binary) files
-        if file_path=$(command -v file); then
-            if [[ $("${file_path}" -b --mime-type -- "${el}") != text/* ]]; then
-                continue
-            fi
-        else
-            grep -Iq . "${el}" || continue
-        fi
+    if [[ -n "${build_jobs}" ]]; then
+        fix_args+=("--jobs" "${build_jobs}")
+    fi
 
-        echo -e "Fixing: ${el}"
-        ((counter = counter + 1))
+    mkdir -p "${tmp_root}/builder" || {
+        echo_error "Failed to create '${tmp_root}/builder'."
+        hygiene_failed=true
+        return
+    }
+    files_file="$(mktemp "${tmp_root}/builder/hygiene-files.XXXXXX")" || {
+        echo_error "Failed to create the text hygiene files list."
+        hygiene_failed=true
+        return
+    }
+    report_file="$(mktemp "${tmp_root}/builder/hygiene-report.XXXXXX")" || {
+        rm -f "${files_file}"
+        echo_error "Failed to create the text hygiene report."
+        hygiene_failed=true
+        return
+    }
 
-        if [[ $(uname -s) == "Darwin" ]]; then
-            # macOS
-            find "${el}" -type f -exec sed -i '' 's/ / /g' {} + 2>&1 || {
-                whitespaces_summary_status="${failed}"
-                exit_code=1
-            }
-        else
-            # Linux
-            find "${el}" -type f -exec sed -i 's/ / /g' {} + 2>&1 || {
-                whitespaces_summary_status="${failed}"
-                exit_code=1
-            }
-        fi
-    done
+    if ((${#active_files_all[@]})); then
+        printf '%s\0' "${active_files_all[@]}" >"${files_file}"
+    fi
 
-    echo
-    echo -e "Fixed ${counter} file(s)"
-    echo
+    "${cli_python_executable}" -I -m icarus.handlers.builder_handler.hygiene_helper fix \
+        "${fix_args[@]}" --files-from "${files_file}" --output "${report_file}" 2>&1 || {
+        echo_error "Failed to run the text hygiene."
+        hygiene_failed=true
+    }
+
+    while IFS= read -r -d '' hook && IFS= read -r -d '' status && IFS= read -r -d '' path; do
+        hygiene_hooks+=("${hook}")
+        hygiene_statuses+=("${status}")
+        hygiene_paths+=("${path}")
+    done <"${report_file}"
+
+    # Stored only if the pass left every file as it was
+    if [[ "${hygiene_failed}" != true ]] && ((${#hygiene_hooks[@]} == 0)); then
+        empty_file="$(mktemp "${tmp_root}/builder/hygiene-output.XXXXXX")" && {
+            action_cache_store passed "${empty_file}" hygiene "${key_args[@]}"
+            rm -f "${empty_file}"
+        }
+    fi
+
+    rm -f "${files_file}" "${report_file}"
 }
 
-function run_eofnewline() {
-    local el counter last_byte fixed file_path penultimate_byte
-    local -a elements
+function echo_text_hygiene_report() {
+    local hook i counter status
 
+    hook="${1}"
     counter=0
-    elements=("${active_files_all[@]}")
 
-    for el in "${elements[@]}"; do
-        # Skip empty files – they already satisfy the "blank line" rule.
-        if [[ ! -s "${el}" ]]; then
+    if [[ -z "${hook}" ]]; then
+        echo_error "echo_text_hygiene_report() requires one argument: hook" "errexit"
+        exit 1
+    fi
+
+    if [[ "${hygiene_failed}" == true ]]; then
+        printf -v "${hook}_summary_status" '%s' "${failed}"
+        exit_code=1
+    fi
+
+    for i in "${!hygiene_hooks[@]}"; do
+        if [[ "${hygiene_hooks[${i}]}" != "${hook}" ]]; then
             continue
         fi
 
-        # Skip non-text (binary) files
-        if file_path=$(command -v file); then
-            if [[ $("${file_path}" -b --mime-type -- "${el}") != text/* ]]; then
-                continue
-            fi
-        else
-            grep -Iq . "${el}" || continue
+        if [[ "${hygiene_statuses[${i}]}" == "failed" ]]; then
+            echo_error "Failed to fix ${hygiene_paths[${i}]}"
+            printf -v "${hook}_summary_status" '%s' "${failed}"
+            exit_code=1
+            continue
         fi
 
-        # Read last byte safely (strip spaces cranked out by od)
-        last_byte=$(tail -c 1 -- "${el}" | od -An -tu1 | tr -d '[:space:]')
-        fixed=false
-
-        # Add \n only if it isn't one already.
-        if [[ "${last_byte}" != 10 ]]; then
-            echo "Fixing: ${el}"
-            printf '\n' >>"${el}" || {
-                eofnewline_summary_status="${failed}"
-                exit_code=1
-            }
-            ((counter = counter + 1))
-        # The last char already is a \n.
-        else
-            while true; do
-                penultimate_byte=$(tail -c 2 -- "${el}" | head -c 1 | od -An -tu1 | tr -d '[:space:]')
-                if [[ "${penultimate_byte}" == 10 ]]; then
-                    if [[ "${fixed}" != true ]]; then
-                        fixed=true
-                        echo "Fixing: ${el}"
-                        ((counter = counter + 1))
-                    fi
-                    truncate -s -1 -- "${el}" || {
-                        eofnewline_summary_status="${failed}"
-                        exit_code=1
-                    }
-                else
-                    break
-                fi
-            done
-        fi
+        echo "Fixing: ${hygiene_paths[${i}]}"
+        ((counter = counter + 1))
     done
 
     if [[ "${counter}" -ge 1 ]]; then
@@ -672,97 +875,33 @@ function run_eofnewline() {
     fi
     echo -e "Fixed ${counter} file(s)"
     echo
-}
-
-function run_trailingwhitespaces() {
-    local el counter file_path
-    local -a elements
 
-    counter=0
-    elements=("${active_files_all[@]}")
-
-    for el in "${elements[@]}"; do
-        # Skip empty files – they already satisfy the "blank line" rule.
-        if [[ ! -s "${el}" ]]; then
-            continue
-        fi
-
-        # Skip non-text (binary) files
-        if file_path=$(command -v file); then
-            if [[ $("${file_path}" -b --mime-type -- "${el}") != text/* ]]; then
-                continue
-            fi
-        else
-            grep -Iq . "${el}" || continue
+    if [[ "${hygiene_cached}" == true ]]; then
+        eval status='$'"${hook}_summary_status"
+        if [[ "${status}" != "${failed}" && "${status}" != "${warned}" ]]; then
+            printf -v "${hook}_summary_status" '%s' "${cached}"
         fi
+    fi
+}
 
-        # Trail whitespaces
-        echo "Fixing: ${el}"
-        ((counter = counter + 1))
+function run_char_replacement() {
+    run_text_hygiene
+    echo_text_hygiene_report "whitespaces"
+}
 
-        if [[ $(uname -s) == "Darwin" ]]; then
-            # macOS
-            sed -E -i '' 's/[[:space:]]+$//' "${el}" || {
-                trailing_summary_status="${failed}"
-                exit_code=1
-            }
-        else
-            # Linux
-            sed -E -i 's/[[:space:]]+$//' "${el}" || {
-                trailing_summary_status="${failed}"
-                exit_code=1
-            }
-        fi
-    done
+function run_eofnewline() {
+    run_text_hygiene
+    echo_text_hygiene_report "eofnewline"
+}
 
-    echo
-    echo -e "Fixed ${counter} file(s)"
-    echo
+function run_trailingwhitespaces() {
+    run_text_hygiene
+    echo_text_hygiene_report "trailing"
 }
 
 function run_eolnorm() {
-    local el counter file_path tmp
-    local -a elements
-
-    counter=0
-    elements=("${active_files_all[@]}")
-
-    for el in "${elements[@]}"; do
-        # Skip empty files – they already satisfy the "blank line" rule.
-        if [[ ! -s "${el}" ]]; then
-            continue
-        fi
-
-        # Skip non-text (binary) files
-        if file_path=$(command -v file); then
-            if [[ $("${file_path}" -b --mime-type -- "${el}") != text/* ]]; then
-                continue
-            fi
-        else
-            grep -Iq . "${el}" || continue
-        fi
-
-        # Does the file actually contain a CR?
-        if ! grep -q $'\r' "${el}"; then
-            continue
-        fi
-
-        echo "Fixing: ${el}"
-        ((counter = counter + 1))
-
-        tmp=$(mktemp --tmpdir="$(dirname "${el}")" "$(basename "${el}").XXXX")
-        { sed 's/\r$//' "${el}" | tr '\r' '\n'; } >"${tmp}" && mv "${tmp}" "${el}" || {
-            echo_error "Failed to normalize EOLs in ${el}"
-            eolnorm_summary_status="${failed}"
-            exit_code=1
-        }
-    done
-
-    if [[ "${counter}" -ge 1 ]]; then
-        echo
-    fi
-    echo -e "Fixed ${counter} file(s)"
-    echo
+    run_text_hygiene
+    echo_text_hygiene_report "eolnorm"
 }
 
 function run_gitleaks() {
@@ -929,7 +1068,7 @@ function run_pypi() {
 
     # Resolve path to dist root dir. If we fail it we return but do not
     # errexit so we let other possible build proceed.
-    artifacts_root="$(_internal_icarus_builder_path_cmd "${path_pkg_artifact_name}")" || {
+    _internal_icarus_builder_path_cmd "${path_pkg_artifact_name}" artifacts_root || {
         pypi_summary_status="${failed}"
         exit_code=1
         echo_error "Failed to resolve path ${path_pkg_artifact_name}."
@@ -999,7 +1138,7 @@ function run_build_icarus_python3() {
 
     # Resolve path to dist root dir. If we fail it we return but do not
     # errexit so we let other possible build proceed.
-    artifacts_root="$(_internal_icarus_builder_path_cmd "${path_pkg_artifact_name}")" || {
+    _internal_icarus_builder_path_cmd "${path_pkg_artifact_name}" artifacts_root || {
         build_summary_status="${failed}"
         build_single_run_status=1
         exit_code=1
@@ -1152,89 +1291,53 @@ function resolve_path() {
 
     case "${p_name}" in
     "${path_pkg_runtimefarm_name}")
-        path_runtime="$(_internal_icarus_builder_path_cmd "${path_pkg_runtimefarm_name}")" || {
+        _internal_icarus_builder_path_batch_cmd "${path_pkg_runtimefarm_name}" path_runtime path_python_home || {
             path_summary_status="${failed}"
             exit_code=1
             echo_error "Failed to resolve path ${path_pkg_runtimefarm_name}. Have you built it?"
             echo_help_verbose "errexit"
         }
-        path_python_home="$(_internal_icarus_builder_path_cmd "${path_pkg_pythonhome_name}")" || {
-            path_summary_status="${failed}"
-            exit_code=1
-            echo_error "Failed to resolve path ${path_pkg_pythonhome_name}."
-            echo_help_verbose "errexit"
-        }
         ;;
     "${path_tool_runtimefarm_name}")
-        path_runtime="$(_internal_icarus_builder_path_cmd "${path_tool_runtimefarm_name}")" || {
+        _internal_icarus_builder_path_batch_cmd "${path_tool_runtimefarm_name}" path_runtime path_python_home || {
             path_summary_status="${failed}"
             exit_code=1
             echo_error "Failed to resolve path ${path_tool_runtimefarm_name}."
             echo_help_verbose "errexit"
         }
-        path_python_home="$(_internal_icarus_builder_path_cmd "${path_tool_pythonhome_name}")" || {
-            path_summary_status="${failed}"
-            exit_code=1
-            echo_error "Failed to resolve path ${path_tool_pythonhome_name}."
-            echo_help_verbose "errexit"
-        }
         ;;
     "${path_run_runtimefarm_name}")
-        path_runtime="$(_internal_icarus_builder_path_cmd "${path_run_runtimefarm_name}")" || {
+        _internal_icarus_builder_path_batch_cmd "${path_run_runtimefarm_name}" path_runtime path_python_home || {
             path_summary_status="${failed}"
             exit_code=1
             echo_error "Failed to resolve path ${path_run_runtimefarm_name}."
             echo_help_verbose "errexit"
         }
-        path_python_home="$(_internal_icarus_builder_path_cmd "${path_run_pythonhome_name}")" || {
-            path_summary_status="${failed}"
-            exit_code=1
-            echo_error "Failed to resolve path ${path_run_pythonhome_name}."
-            echo_help_verbose "errexit"
-        }
         ;;
     "${path_devrun_runtimefarm_name}")
-        path_runtime="$(_internal_icarus_builder_path_cmd "${path_devrun_runtimefarm_name}")" || {
+        _internal_icarus_builder_path_batch_cmd "${path_devrun_runtimefarm_name}" path_runtime path_python_home || {
             path_summary_status="${failed}"
             exit_code=1
             echo_error "Failed to resolve path ${path_devrun_runtimefarm_name}."
             echo_help_verbose "errexit"
         }
-        path_python_home="$(_internal_icarus_builder_path_cmd "${path_devrun_pythonhome_name}")" || {
-            path_summary_status="${failed}"
-            exit_code=1
-            echo_error "Failed to resolve path ${path_devrun_pythonhome_name}."
-            echo_help_verbose "errexit"
-        }
         ;;
     "${path_devrun_excluderoot_runtimefarm_name}")
         # We build pkg_runtimefarm so that we can get the PYTHONPATH from it and augment
         # the default search path for module files. This is the only reason why we build
         # the pkg_runtimefarm.
-        path_runtime="$(_internal_icarus_builder_path_cmd "${path_pkg_runtimefarm_name}")" || {
+        _internal_icarus_builder_path_batch_cmd "${path_pkg_runtimefarm_name}" path_runtime "" pkg_pythonpath || {
             path_summary_status="${failed}"
             exit_code=1
             echo_error "Failed to resolve path ${path_pkg_runtimefarm_name}. Have you built it?"
             echo_help_verbose "errexit"
         }
-        pkg_pythonpath="$(_internal_icarus_builder_path_cmd "${path_pkg_pythonpath_name}")" || {
-            path_summary_status="${failed}"
-            exit_code=1
-            echo_error "Failed to resolve path ${path_pkg_pythonpath_name}."
-            echo_help_verbose "errexit"
-        }
-        path_runtime="$(_internal_icarus_builder_path_cmd "${path_devrun_excluderoot_runtimefarm_name}")" || {
+        _internal_icarus_builder_path_batch_cmd "${path_devrun_excluderoot_runtimefarm_name}" path_runtime path_python_home || {
             path_summary_status="${failed}"
             exit_code=1
             echo_error "Failed to resolve path ${path_devrun_excluderoot_runtimefarm_name}."
             echo_help_verbose "errexit"
         }
-        path_python_home="$(_internal_icarus_builder_path_cmd "${path_devrun_excluderoot_pythonhome_name}")" || {
-            path_summary_status="${failed}"
-            exit_code=1
-            echo_error "Failed to resolve path ${path_devrun_excluderoot_pythonhome_name}."
-            echo_help_verbose "errexit"
-        }
         ;;
     *)
         echo_error "Unknown path name: '${p_name}'" "errexit"
@@ -1258,6 +1361,143 @@ function resolve_path() {
     set +a
 }
 
+function schedule_runtimefarms() {
+    local python_version_composite p_name farm_prefix job_dir max_jobs running pid i
+    local return_code path_runtimefarm path_pythonhome path_pythonpath
+    local -a farms composites job_farms job_composites job_pids
+
+    # The runtimefarms that do not depend on the freshly built package are
+    # built or synced up front, every farm and python version as its own
+    # job, so that the serial loop only finds them in the path memo.
+    # pkg, run and devrun install the package and are still resolved by
+    # the loop once the package is built.
+    farms=()
+    if [[ "${build}" == "Y" ]]; then
+        farms+=("${path_tool_runtimefarm_name}")
+    fi
+    if [[ "${build}" != "Y" || "${is_only_build_hook}" != "Y" ]]; then
+        farms+=("${path_devrun_excluderoot_runtimefarm_name}")
+    fi
+
+    # PyPi sets run_once, so only python-default runs the loop.
+    if [[ "${pypi}" == "Y" ]]; then
+        composites=("${python_versions[0]}")
+    else
+        composites=("${python_versions[@]}")
+    fi
+
+    job_farms=()
+    job_composites=()
+    for python_version_composite in "${composites[@]}"; do
+        for p_name in "${farms[@]}"; do
+            job_farms+=("${p_name}")
+            job_composites+=("${python_version_composite}")
+        done
+    done
+
+    if ((${#job_farms[@]} < 2)); then
+        echo -e "nothing to do here - skipping"
+        return
+    fi
+
+    if [[ -n "${build_jobs}" ]]; then
+        max_jobs="${build_jobs}"
+    else
+        max_jobs="$(getconf _NPROCESSORS_ONLN 2>/dev/null)" || max_jobs=1
+    fi
+    if [[ ! "${max_jobs}" =~ ^[1-9][0-9]*$ ]]; then
+        max_jobs=1
+    fi
+
+    mkdir -p "${tmp_root}/builder" || {
+        echo_error "Failed to create '${tmp_root}/builder'."
+        return
+    }
+    job_dir="$(mktemp -d "${tmp_root}/builder/farms.XXXXXX")" || {
+        echo_error "Failed to create the runtimefarms job dir."
+        return
+    }
+
+    echo -e "Scheduling ${#job_farms[@]} runtimefarm job(s) on ${max_jobs} worker(s)"
+
+    # Every job buffers the path.sh output in its own log, path.sh takes
+    # the farm and interpreter locks so jobs sharing them wait for each
+    # other.
+    job_pids=()
+    for i in "${!job_farms[@]}"; do
+        while true; do
+            running=0
+            for pid in "${job_pids[@]}"; do
+                if kill -0 "${pid}" 2>/dev/null; then
+                    running=$((running + 1))
+                fi
+            done
+            if ((running < max_jobs)); then
+                break
+            fi
+            sleep 0.1
+        done
+
+        (
+            set_icarus_python3_constants "${job_composites[${i}]}"
+            _internal_icarus_builder_path_spawn "${job_farms[${i}]}" path_runtimefarm "Y" "${job_dir}/${i}.log" || exit 1
+            printf '%s\n' "${path_runtimefarm}" >"${job_dir}/${i}.response" || exit 1
+            if [[ "${path_summary_status}" == "${warned}" ]]; then
+                exit 2
+            fi
+        ) &
+        job_pids+=("$!")
+    done
+
+    # Jobs are replayed in the order they were scheduled, a failed job
+    # does not stop the others. path.sh (clean_farm) already invalidated
+    # the failed python version of the farm, and only that version, the
+    # serial loop resolves it again and errors as usual if it still
+    # fails.
+    for i in "${!job_farms[@]}"; do
+        return_code=0
+        wait "${job_pids[${i}]}" || return_code="${?}"
+
+        set_icarus_python3_constants "${job_composites[${i}]}"
+        p_name="${job_farms[${i}]}"
+        farm_prefix="${p_name%.runtimefarm}"
+
+        if [[ "${verbose}" == "Y" ]]; then
+            cat "${job_dir}/${i}.log" >&2 || :
+        fi
+
+        if [[ "${return_code}" == 1 ]]; then
+            echo -e "${p_name} [Python${python_full_version}] ${failed}"
+            echo_warning "Failed to build ${p_name} for Python${python_full_version}, it will be resolved again."
+            continue
+        elif [[ "${return_code}" == 2 ]]; then
+            path_summary_status="${warned}"
+            echo -e "${p_name} [Python${python_full_version}] ${warned}"
+        else
+            echo -e "${p_name} [Python${python_full_version}] ${passed}"
+        fi
+
+        # A job that reported a response but left no ready file was
+        # invalidated and must not be memoized.
+        if [[ ! -f "${path_root}/${p_name}/farm-info/ready-py${python_full_version}" ]]; then
+            continue
+        fi
+
+        {
+            IFS= read -r path_runtimefarm
+            IFS= read -r path_pythonhome
+            IFS= read -r path_pythonpath
+        } <"${job_dir}/${i}.response"
+        _internal_icarus_builder_path_memo_set "${p_name}" "${path_runtimefarm}"
+        _internal_icarus_builder_path_memo_set "${farm_prefix}.pythonhome" "${path_pythonhome}"
+        _internal_icarus_builder_path_memo_set "${farm_prefix}.pythonpath" "${path_pythonpath}"
+    done
+
+    rm -rf "${job_dir}" || {
+        echo_error "Failed to remove '${job_dir}'."
+    }
+}
+
 function workspace_merge() (
     # Using a subshell to avoid mutating existing variables from the ready-* file.
     # Variables set inside this subshell (like exit_code) do not propagate to the
@@ -1298,17 +1538,20 @@ function workspace_merge() (
 
     echo -e "Detected runtimefarms: $(printf '%s\n' "${farms_to_merge[@]}" | paste -s -d ';' -)"
 
-    echo -e "Merging workspace (this can take a while)..."
-    rm -rf "${path_root}" || {
-        echo_error "Failed to merge workspace."
-        exit 1
-    }
+    echo -e "Merging workspace..."
+    echo
 
+    # Every ready farm keeps the manifest of the User Space links it owns,
+    # so only the entries added or removed since the last merge are linked
+    # or unlinked, and an unchanged User Space is a no-op.
     for p_name in "${farms_to_merge[@]}"; do
-        resolve_path "${p_name}" || {
+        echo -e "${bold_green}${sparkles} Symlinking 'User Space' into ${p_name}${end}"
+        link_prefix_to_farm --manifest "${path_root}/${p_name}/farm-info/user-space-manifest.json" \
+            "${runtime_root}/local" "${path_root}/${p_name}" "lib64" ".envroot" || {
             echo_error "Failed to merge workspace."
             exit 1
         }
+        echo
     done
 
     echo -e "Done!"
@@ -1332,6 +1575,16 @@ function clean_icarus_root() {
         }
         echo
     done
+
+    # The farms just removed may have held the last links to some of the
+    # packages in the store.
+    echo -e "Cleaning '${blue}package store${end}'"
+    "${cli_python_executable}" -I -m icarus.handlers.builder_handler.store_helper gc "${store_root}" || {
+        echo_error "Failed to clean '${store_root}'."
+        clean_summary_status="${failed}"
+        exit_code=1
+    }
+    echo
 }
 
 function clean_macos() {
@@ -1449,19 +1702,81 @@ function restore_paths() {
     export PATH="${_OLD_PATH}"
 }
 
-function _internal_icarus_builder_path_cmd() {
-    local p_name response stderr_target
-    local -a new_argv
+function _internal_icarus_builder_path_memo_key() {
+    local p_name key_var farm_ready_file line ready_lines ready_timestamp
 
     p_name="${1}"
-
-    if [[ -z "${p_name}" ]]; then
-        echo_error "Missing argument: 'path_name'"
-        path_summary_status="${failed}"
-        exit_code=1
-        return 1
+    key_var="${2}"
+
+    # The memo key is the path name, the python version and the state of
+    # the ready-py* file of the farm the path belongs to. The ready file
+    # gains a timestamp line every time the farm is built or synced and is
+    # removed when the farm is cleaned, either way the key changes and the
+    # path is resolved again. Read with the `read` builtin, no fork.
+    farm_ready_file="${path_root}/${p_name%%.*}.runtimefarm/farm-info/ready-py${python_full_version}"
+    ready_lines=0
+    ready_timestamp=""
+
+    if [[ -f "${farm_ready_file}" ]]; then
+        while IFS= read -r line || [[ -n "${line}" ]]; do
+            ready_lines=$((ready_lines + 1))
+            if [[ "${line}" == timestamp=* ]]; then
+                ready_timestamp="${line#timestamp=}"
+            fi
+        done <"${farm_ready_file}"
     fi
 
+    printf -v "${key_var}" '%s|%s|%s|%s' "${p_name}" "${python_full_version}" "${ready_lines}" "${ready_timestamp}"
+}
+
+function _internal_icarus_builder_path_memo_get() {
+    local p_name value_var memo_key i
+
+    p_name="${1}"
+    value_var="${2}"
+
+    _internal_icarus_builder_path_memo_key "${p_name}" memo_key
+
+    for i in "${!path_memo_keys[@]}"; do
+        if [[ "${path_memo_keys[${i}]}" == "${memo_key}" ]]; then
+            printf -v "${value_var}" '%s' "${path_memo_values[${i}]}"
+            return 0
+        fi
+    done
+
+    return 1
+}
+
+function _internal_icarus_builder_path_memo_set() {
+    local p_name value memo_key i
+
+    p_name="${1}"
+    value="${2}"
+
+    # Must be called after path.sh returned, so that the key reflects the
+    # ready-py* file as left by the build or sync.
+    _internal_icarus_builder_path_memo_key "${p_name}" memo_key
+
+    # Drop the stale entry of this path for the current python version.
+    for i in "${!path_memo_keys[@]}"; do
+        if [[ "${path_memo_keys[${i}]}" == "${p_name}|${python_full_version}|"* ]]; then
+            unset 'path_memo_keys[i]' 'path_memo_values[i]'
+        fi
+    done
+
+    path_memo_keys+=("${memo_key}")
+    path_memo_values+=("${value}")
+}
+
+function _internal_icarus_builder_path_spawn() {
+    local p_name response_var path_batch_flag stderr_target path_response return_code
+    local -a new_argv
+
+    p_name="${1}"
+    response_var="${2}"
+    path_batch_flag="${3:-N}"
+    stderr_target="${4:-}"
+
     # The builder.sh receives the same args from the python cli parser
     # and path_name is an empty string as default. We need to remove it
     # from the original argv and replace it with the passed in path_name.
@@ -1475,24 +1790,98 @@ function _internal_icarus_builder_path_cmd() {
     # previous value!
     new_argv=("${argv[@]}")
     new_argv+=("path_name='${p_name}'")
+    new_argv+=("path_batch='${path_batch_flag}'")
     new_argv+=("python_versions=( '${python_version}:${python_full_version}' )")
 
-    if [[ "${verbose}" == "Y" ]]; then
+    if [[ -n "${stderr_target}" ]]; then
+        # The caller buffers the path.sh output, see schedule_runtimefarms
+        :
+    elif [[ "${verbose}" == "Y" ]]; then
         stderr_target="/dev/stderr"
     else
         stderr_target="/dev/null"
     fi
 
-    bash "${builder_path_script_abs}" "${new_argv[@]}" 2>"${stderr_target}" || {
-        response="${?}"
-        if [[ "${response}" == 1 ]]; then
-            path_summary_status="${failed}"
-            exit_code=1
-            return 1
-        elif [[ "${response}" == 2 ]]; then
-            path_summary_status="${warned}"
-        fi
-    }
+    return_code=0
+    path_response="$(bash "${builder_path_script_abs}" "${new_argv[@]}" 2>"${stderr_target}")" || return_code="${?}"
+
+    if [[ "${return_code}" == 1 ]]; then
+        path_summary_status="${failed}"
+        exit_code=1
+        return 1
+    elif [[ "${return_code}" == 2 ]]; then
+        path_summary_status="${warned}"
+    fi
+
+    printf -v "${response_var}" '%s' "${path_response}"
+}
+
+function _internal_icarus_builder_path_cmd() {
+    local p_name out_var path_value
+
+    p_name="${1}"
+    out_var="${2}"
+
+    if [[ -z "${p_name}" || -z "${out_var}" ]]; then
+        echo_error "Missing argument: 'path_name'"
+        path_summary_status="${failed}"
+        exit_code=1
+        return 1
+    fi
+
+    # A path resolved once in this run is answered from the memo, path.sh
+    # is only spawned again when the farm behind it changed.
+    if _internal_icarus_builder_path_memo_get "${p_name}" path_value; then
+        printf -v "${out_var}" '%s' "${path_value}"
+        return 0
+    fi
+
+    _internal_icarus_builder_path_spawn "${p_name}" path_value || return 1
+    _internal_icarus_builder_path_memo_set "${p_name}" "${path_value}"
+
+    printf -v "${out_var}" '%s' "${path_value}"
+}
+
+function _internal_icarus_builder_path_batch_cmd() {
+    local p_name runtimefarm_var pythonhome_var pythonpath_var farm_prefix response
+    local path_runtimefarm path_pythonhome path_pythonpath
+
+    p_name="${1}"
+    runtimefarm_var="${2}"
+    pythonhome_var="${3}"
+    pythonpath_var="${4}"
+    farm_prefix="${p_name%.runtimefarm}"
+
+    if [[ -z "${p_name}" || -z "${runtimefarm_var}" || "${farm_prefix}" == "${p_name}" ]]; then
+        echo_error "Missing argument: 'runtimefarm path_name'"
+        path_summary_status="${failed}"
+        exit_code=1
+        return 1
+    fi
+
+    # Resolves the runtimefarm, pythonhome and pythonpath of a farm with a
+    # single path.sh run, an empty var name skips that path.
+    if ! _internal_icarus_builder_path_memo_get "${p_name}" path_runtimefarm ||
+        ! _internal_icarus_builder_path_memo_get "${farm_prefix}.pythonhome" path_pythonhome ||
+        ! _internal_icarus_builder_path_memo_get "${farm_prefix}.pythonpath" path_pythonpath; then
+        _internal_icarus_builder_path_spawn "${p_name}" response "Y" || return 1
+        {
+            IFS= read -r path_runtimefarm
+            IFS= read -r path_pythonhome
+            IFS= read -r path_pythonpath
+        } <<<"${response}"
+        _internal_icarus_builder_path_memo_set "${p_name}" "${path_runtimefarm}"
+        _internal_icarus_builder_path_memo_set "${farm_prefix}.pythonhome" "${path_pythonhome}"
+        _internal_icarus_builder_path_memo_set "${farm_prefix}.pythonpath" "${path_pythonpath}"
+    fi
+
+    printf -v "${runtimefarm_var}" '%s' "${path_runtimefarm}"
+    if [[ -n "${pythonhome_var}" ]]; then
+        printf -v "${pythonhome_var}" '%s' "${path_pythonhome}"
+    fi
+    if [[ -n "${pythonpath_var}" ]]; then
+        printf -v "${pythonpath_var}" '%s' "${path_pythonpath}"
+    fi
 }
 
 ####################################################################################################
@@ -1524,6 +1913,24 @@ function dispatch_icarus_python3_after_plugins() {
     echo
 }
 
+function dispatch_icarus_python3_before_farms_plugins() {
+    local start_block end_block
+
+    # Merge, clean and exec run alone and resolve their own farm.
+    if [[ "${merge}" == "Y" || "${clean}" == "Y" || "${exectool}" == "Y" || "${execrun}" == "Y" || "${execdev}" == "Y" ]]; then
+        return
+    fi
+
+    echo_title "Before Plugins [FARMS]"
+    echo -e "${bold_yellow}[plugins] Executing commands for: before-all${end}"
+    start_block=$(date +%s.%N)
+    echo -e "running: schedule_runtimefarms"
+    schedule_runtimefarms
+    end_block=$(date +%s.%N)
+    path_execution_time=$(echo "${path_execution_time}" + "${end_block} - ${start_block}" | bc)
+    echo
+}
+
 function dispatch_icarus_python3_before_build_plugins() {
     local start_block end_block
     echo_title "Before Plugins [BUILD]"
@@ -1800,7 +2207,7 @@ function dispatch_icarus_python3_tools() {
         start_block=$(date +%s.%N)
         echo_title "Running iSort"
         if [[ "${is_python_default}" == true ]]; then
-            run_isort
+            run_cached_hook isort run_isort isort
         else
             echo_warning "Skipping Python${python_version} because it is not the python-default (in icarus.cfg)"
         fi
@@ -1812,7 +2219,7 @@ function dispatch_icarus_python3_tools() {
         start_block=$(date +%s.%N)
         echo_title "Running Black"
         if [[ "${is_python_default}" == true ]]; then
-            run_black
+            run_cached_hook black run_black black
         else
             echo_warning "Skipping Python${python_version} because it is not the python-default (in icarus.cfg)"
         fi
@@ -1820,27 +2227,11 @@ function dispatch_icarus_python3_tools() {
         black_execution_time=$(echo "${black_execution_time}" + "${end_block} - ${start_block}" | bc)
     fi
 
-    if [[ "${flake8}" == "Y" ]]; then
-        start_block=$(date +%s.%N)
-        echo_title "Running Flake8"
-        run_flake8
-        end_block=$(date +%s.%N)
-        flake8_execution_time=$(echo "${flake8_execution_time}" + "${end_block} - ${start_block}" | bc)
-    fi
-
-    if [[ "${mypy}" == "Y" ]]; then
-        start_block=$(date +%s.%N)
-        echo_title "Running mypy"
-        run_mypy
-        end_block=$(date +%s.%N)
-        mypy_execution_time=$(echo "${mypy_execution_time}" + "${end_block} - ${start_block}" | bc)
-    fi
-
     if [[ "${shfmt}" == "Y" ]]; then
         start_block=$(date +%s.%N)
         echo_title "Running shfmt (bash formatter)"
         if [[ "${is_python_default}" == true ]]; then
-            run_shfmt
+            run_cached_hook shfmt run_shfmt shfmt
         else
             echo_warning "Skipping Python${python_version} because it is not the python-default (in icarus.cfg)"
         fi
@@ -1896,33 +2287,8 @@ function dispatch_icarus_python3_tools() {
         eofnewline_execution_time=$(echo "${eofnewline_execution_time}" + "${end_block} - ${start_block}" | bc)
     fi
 
-    if [[ "${gitleaks}" == "Y" ]]; then
-        start_block=$(date +%s.%N)
-        echo_title "Running gitleaks"
-        run_gitleaks
-        end_block=$(date +%s.%N)
-        gitleaks_execution_time=$(echo "${gitleaks_execution_time}" + "${end_block} - ${start_block}" | bc)
-    fi
-
-    if [[ "${pytest}" == "Y" ]]; then
-        start_block=$(date +%s.%N)
-        echo_title "Running pytest"
-        run_pytest
-        end_block=$(date +%s.%N)
-        pytest_execution_time=$(echo "${pytest_execution_time}" + "${end_block} - ${start_block}" | bc)
-    fi
-
-    if [[ "${sphinx}" == "Y" ]]; then
-        start_block=$(date +%s.%N)
-        echo_title "Generating documentation"
-        if [[ "${is_python_default}" == true ]]; then
-            run_documentation_sphinx
-        else
-            echo_warning "Skipping Python${python_version} because it is not the python-default (in icarus.cfg)"
-        fi
-        end_block=$(date +%s.%N)
-        sphinx_execution_time=$(echo "${sphinx_execution_time}" + "${end_block} - ${start_block}" | bc)
-    fi
+    # flake8, mypy, gitleaks, pytest and sphinx
+    schedule_checker_hooks
 
     if [[ "${readthedocs}" == "Y" ]]; then
         start_block=$(date +%s.%N)
@@ -1959,6 +2325,10 @@ function dispatch_icarus_python3_tools() {
     fi
 
     dispatch_icarus_python3_after_tools_plugins
+
+    # The next interpreter writes its own list of the action cache inputs
+    rm -f "${action_files_filepath}"
+    action_files_filepath=""
 }
 
 function dispatch_icarus_cdk_before_plugins() {
@@ -2000,6 +2370,7 @@ function dispatch_build_system() {
 
     if [[ "${build_system_in_use}" == "icarus-python3" ]]; then
         dispatch_icarus_python3_before_plugins
+        dispatch_icarus_python3_before_farms_plugins
         for python_version_composite in "${python_versions[@]}"; do
             set_icarus_python3_constants "${python_version_composite}"
             echo_title "Running tools for: Python${python_version}" "header"
@@ -200,6 +200,7 @@ function declare_path_names() {
 function declare_global_vars() {
     # These variables are passed in by the cli parser
     declare -r -g verbose
+    declare -r -g refresh
     declare -r -g run_log_filepath
     declare -r -g all_hooks
     declare -r -g icarus_config_filename
@@ -216,13 +217,17 @@ function declare_global_vars() {
     declare -r -g package_version_patch
     declare -r -g build_system_in_use
     declare -r -g platform_identifier
+    declare -r -g cli_python_executable
     declare -r -g build_root_dir
+    declare -r -g build_jobs
+    declare -r -g workspace_index
     declare -r -g python_version_default_for_icarus
     declare -r -g python_versions_for_icarus
     declare -r -g tool_requirements_paths
     declare -r -g run_requirements_paths
     declare -r -g run_requirements_pyproject_toml
     declare -r -g dev_requirements_paths
+    declare -r -g precompile_farms
     declare -r -g read_the_docs_requirements_path
     declare -r -g icarus_ignore_array
     declare -r -g build
@@ -259,15 +264,25 @@ function declare_global_vars() {
     declare -r -g python_default_full_version
     declare -r -g python_versions
     declare -r -g path_name
+    declare -r -g path_batch
     declare -r -g list_paths
     declare -r -g cache_root_dir
     declare -r -g cache_clean
     declare -r -g cache_size
+    declare -r -g cache_gc
+    declare -r -g cache_verify
+    declare -r -g cache_max_size
 
     # These variables are shared across the build system
     cache_root="${tmp_root}/builder/cache"
     declare -r -g cache_root
 
+    store_root="${cache_root}/store"
+    declare -r -g store_root
+
+    runtime_store_root="${cache_root}/runtime-store"
+    declare -r -g runtime_store_root
+
     runtime_root="${project_root_dir_abs}/${build_root_dir}/${platform_identifier}/runtime"
     declare -r -g runtime_root
 
@@ -345,6 +360,69 @@ function echo_prayers() {
     } 1>&2
 }
 
+function link_prefix_to_farm() {
+    # This function will link a prefix into a farm, used by path.sh to
+    # assemble the farms and by merge to relink the user space.
+    local source_prefix dest_prefix arg is_nofold return_code
+    local -a linker_args
+
+    linker_args=()
+
+    # An optional leading --manifest <file> makes the relink incremental,
+    # only the entries added or removed since the last link are touched.
+    if [[ "${1}" == "--manifest" ]]; then
+        linker_args+=("--manifest" "${2}")
+        shift 2
+    fi
+
+    source_prefix=$1
+    dest_prefix=$2
+    shift 2
+
+    # Remaining args are the excluded top-level names, optionally followed
+    # by -- and the nofold patterns (see farm_helper.py).
+    is_nofold=false
+    for arg in "$@"; do
+        if [[ "${arg}" == "--" ]]; then
+            is_nofold=true
+        elif [[ "${is_nofold}" == true ]]; then
+            linker_args+=("--nofold" "${arg}")
+        else
+            linker_args+=("--exclude" "${arg}")
+        fi
+    done
+
+    # Initial validations
+    if [[ -z "${source_prefix}" || -z "${dest_prefix}" ]]; then
+        echo_error "Missing arguments: 'source_prefix' and/or 'dest_prefix'"
+        exit_code=1
+        return 1
+    fi
+
+    if [[ ! -d "${source_prefix}" ]]; then
+        echo_error "Source prefix does not exist: '${source_prefix}'"
+        exit_code=1
+        return 1
+    fi
+
+    # Directories contributed by a single source are linked as a whole
+    # and only split where sources overlap, conflicts are detected while
+    # scanning the trees. -I so that an active farm PYTHONHOME does not
+    # leak into the cli interpreter.
+    return_code=0
+    "${cli_python_executable}" -I -m icarus.handlers.builder_handler.farm_helper link \
+        "${source_prefix}" "${dest_prefix}" "${linker_args[@]}" || return_code="${?}"
+
+    if [[ "${return_code}" == 2 ]]; then
+        echo_warning "Destination file exists"
+        exit_code=2
+    elif [[ "${return_code}" != 0 ]]; then
+        echo_error "Failed to link '${source_prefix}' into '${dest_prefix}'."
+        exit_code=1
+        return 1
+    fi
+}
+
 function bootstrap_workspace() {
     # This function will create the basic structure for the workspace
     local dir
@@ -63,10 +63,35 @@ function clean_cache() {
 }
 
 function calculate_cache_size() {
-    size_cache_bytes=$(find "${cache_root}" -type f -ls | awk '{s+=$7} END {print s+0}')
-    size_cache_human=$(du -sh "${cache_root}" 2>/dev/null | awk '{print $1}')
+    local -a helper_args
 
-    echo -e "Cache size: ${size_cache_human:-0} (${size_cache_bytes} bytes)"
+    # Answered from the cache index unless a full rescan is requested.
+    helper_args=()
+    if [[ "${cache_verify}" == "Y" ]]; then
+        helper_args+=("--verify")
+    fi
+
+    "${cli_python_executable}" -I -m icarus.handlers.builder_handler.cache_helper size \
+        "${cache_root}" "${helper_args[@]}" || {
+        echo_error "Failed to calculate the cache size."
+        exit_code=1
+    }
+}
+
+function collect_cache_garbage() {
+    local -a helper_args
+
+    # Without a maximum size only the cache index is reconciled.
+    helper_args=()
+    if [[ -n "${cache_max_size}" ]]; then
+        helper_args+=("--max-size" "${cache_max_size}")
+    fi
+
+    "${cli_python_executable}" -I -m icarus.handlers.builder_handler.cache_helper gc \
+        "${cache_root}" "${helper_args[@]}" || {
+        echo_error "Failed to clean '${cache_root}'."
+        exit_code=1
+    }
 }
 
 ####################################################################################################
@@ -84,6 +109,10 @@ function dispatch_build_system() {
     if [[ "${cache_size}" == "Y" ]]; then
         calculate_cache_size
     fi
+
+    if [[ "${cache_gc}" == "Y" ]]; then
+        collect_cache_garbage
+    fi
 }
 
 ####################################################################################################
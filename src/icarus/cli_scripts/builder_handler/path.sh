@@ -45,6 +45,12 @@ function set_constants() {
     declare -r delimiter_char
 
     response=''
+
+    # Locks held by this run and the fds they are held on, released on
+    # exit whatever the exit path.
+    declare -a -g held_lock_files=()
+    declare -a -g held_lock_fds=()
+    trap release_held_locks EXIT
 }
 
 function set_icarus_python3_constants() {
@@ -67,6 +73,9 @@ function set_icarus_python3_constants() {
     python_pkg_name="cpython-${python_full_version}-${platform_identifier}"
     python_pkg_full_name="${python_pkg_name}.tar.gz"
     python_pkg_download_url="https://github.com/64rl0/PythonRuntime/releases/download/${python_pkg_name}/${python_pkg_full_name}"
+
+    python_shebang_shim="#!/${cli_name}/bin/envroot \"\$ENVROOT/CPython/${python_full_version}/bin/python${python_version}\""
+    python_store_key="cpython-${python_full_version}-${platform_identifier}"
 }
 
 function set_icarus_cdk_constants() {
@@ -76,89 +85,6 @@ function set_icarus_cdk_constants() {
 ####################################################################################################
 # TOOLS
 ####################################################################################################
-function link_prefix_to_farm() {
-    local source_prefix dest_prefix subdir name conflict conflict_files old_dotglob old_nullglob
-    local -a excludes
-
-    source_prefix=$1
-    dest_prefix=$2
-    shift 2
-    excludes=("$@")
-    conflict=false
-
-    # Initial validations
-    if [[ -z "${source_prefix}" || -z "${dest_prefix}" ]]; then
-        echo_error "Missing arguments: 'source_prefix' and/or 'dest_prefix'"
-        exit_code=1
-        return 1
-    fi
-
-    if [[ ! -d "${source_prefix}" ]]; then
-        echo_error "Source prefix does not exist: '${source_prefix}'"
-        exit_code=1
-        return 1
-    fi
-
-    # Make sure the destination exists
-    mkdir -p "${dest_prefix}" || {
-        echo_error "Failed to create '${dest_prefix}'."
-        exit_code=1
-        return 1
-    }
-
-    # Build associative check for excludes (bash 3 compatible)
-    function _is_excluded() {
-        local check="$1" ex
-        for ex in "${excludes[@]}"; do
-            if [[ "${check}" == "${ex}" ]]; then
-                return 0
-            fi
-        done
-        return 1
-    }
-
-    # We need to expand hidden files and null with the * here in the loop.
-    old_dotglob=$(shopt -p dotglob) || :
-    old_nullglob=$(shopt -p nullglob) || :
-    shopt -s dotglob nullglob
-
-    # Process each top-level item in source
-    for subdir in "${source_prefix}"/*; do
-        if [[ ! -e "${subdir}" ]]; then
-            continue
-        fi
-
-        name="$(basename "${subdir}")"
-        conflict_files=""
-
-        # Skip excluded directories
-        if _is_excluded "${name}"; then
-            continue
-        fi
-
-        # Use cp -asn for fast recursive symlink creation
-        # -a: archive mode (preserves structure, recursive)
-        # -s: create symlinks instead of copying
-        # -n: no-clobber (first source wins)
-        # Note: BSD cp may return exit 1 on "File exists" even with -n.
-        # Lines that do not contain -> should be errors
-        conflict_files=$(cp -a -s -n -v "${subdir}" "${dest_prefix}/" | grep -v -- '->')
-
-        if [[ -n "${conflict_files}" ]]; then
-            echo "${conflict_files}"
-            conflict=true
-        fi
-    done
-
-    eval "${old_dotglob}"
-    eval "${old_nullglob}"
-
-    if [[ "${conflict}" == true ]]; then
-        echo_warning "Destination file exists"
-        exit_code=2
-    fi
-}
-
 function install_user_space_runtime() {
     local dir user_space_runtime
     local -a root_tree
@@ -184,6 +110,11 @@ function install_user_space_runtime() {
         }
     done
 
+    # The User Space is shared by every farm and python version.
+    acquire_lock "${user_space_runtime}.flock" || {
+        echo_error "Failed to lock 'User Space'." "errexit"
+    }
+
     # Make lib64 → lib symlink
     ln -f -s -n "./lib" "${user_space_runtime}/lib64" || {
         echo_error "Failed to create '${user_space_runtime}/lib64' symlink."
@@ -196,6 +127,8 @@ function install_user_space_runtime() {
         exit_code=1
     }
 
+    release_lock "${user_space_runtime}.flock"
+
     echo -e "Done!"
     echo
 }
@@ -219,7 +152,8 @@ function link_user_space_runtime_into_runtimefarm() {
     # If there isn't a symlink farm, then we incur the risk of using system binaries,
     # therefore this is a hard stop.
 
-    link_prefix_to_farm "${runtime_root}/local" "${farm_path}" "${excluded[@]}" || {
+    link_prefix_to_farm --manifest "${farm_path}/farm-info/user-space-manifest.json" \
+        "${runtime_root}/local" "${farm_path}" "${excluded[@]}" || {
         exit_code=1
         # We invalidate the farm and error
         clean_farm "${p_name}"
@@ -231,12 +165,12 @@ function link_user_space_runtime_into_runtimefarm() {
 }
 
 function fix_shebang_shim_core() {
-    local python_dir filepath first_line tmp shebang d
-    local -a prune_dirs prune_expr
+    local python_dir manifest_file d
+    local -a helper_args
 
     python_dir="$1"
-    shift
-    prune_dirs=("$@")
+    manifest_file="$2"
+    shift 2
 
     if [[ ! -d "${python_dir}" ]]; then
         echo_error "Missing directory: '${python_dir}'"
@@ -246,61 +180,23 @@ function fix_shebang_shim_core() {
 
     echo -e "${bold_green}${sparkles} Fixing shebang shim${end}"
 
-    # Build find prune expression
-    prune_expr=()
-    for d in "${prune_dirs[@]}"; do
-        if ((${#prune_expr[@]} > 0)); then
-            prune_expr+=("-o")
-        fi
-        prune_expr+=("-path" "${python_dir}/${d}")
+    # Remaining args are the dirs not scanned, relative to python_dir.
+    helper_args=()
+    for d in "$@"; do
+        helper_args+=("--prune" "${d}")
     done
 
-    while IFS= read -r -d '' filepath; do
-        if [[ ! -e "${filepath}" ]]; then
-            continue
-        fi
-        if ! grep -Iq . "${filepath}" 2>/dev/null; then
-            continue
-        fi
-
-        IFS= read -r first_line <"${filepath}" || continue
-
-        if [[ "${first_line}" != "#!/"* ]]; then
-            continue
-        fi
-        if [[ "${first_line}" != *"python3"* ]]; then
-            continue
-        fi
-
-        tmp="${filepath}.shim"
-        shebang="#!/${cli_name}/bin/envroot \"\$ENVROOT/CPython/${python_full_version}/bin/python${python_version}\""
-
-        echo -e "Fixing ${filepath}"
-
-        {
-            printf '%s\n' "${shebang}"
-            tail -n +2 "${filepath}"
-        } >"${tmp}" || {
-            echo_error "Failed to update shebang for '${filepath}'."
-            exit_code=1
-        }
-
-        cat "${tmp}" >"${filepath}" || {
-            echo_error "Failed to update shebang for '${filepath}'."
-            exit_code=1
-        }
+    # With a manifest the files already checked are skipped on the next run.
+    if [[ -n "${manifest_file}" ]]; then
+        helper_args+=("--manifest" "${manifest_file}")
+    fi
 
-        rm -rf "${tmp}" || {
-            echo_error "Failed to remove '${tmp}'."
-            exit_code=1
-        }
-    done < <(
-        if ((${#prune_expr[@]} > 0)); then
-            find "${python_dir}" \( "${prune_expr[@]}" \) -prune -o \( -type f -o -type l \) -print0
-        else
-            find "${python_dir}" \( -type f -o -type l \) -print0
-        fi
-    )
+    "${cli_python_executable}" -I -m icarus.handlers.builder_handler.farm_helper shebang \
+        "${python_dir}" --shebang "${python_shebang_shim}" "${helper_args[@]}" || {
+        echo_error "Failed to update shebangs in '${python_dir}'."
+        exit_code=1
+        return 1
+    }
 
     echo -e "Done!"
     echo
@@ -319,11 +215,69 @@ function fix_shebang_shim() {
         return
     fi
 
-    fix_shebang_shim_core "${python_dir}" "include" "lib" "lib64" "local" "share"
+    fix_shebang_shim_core "${python_dir}" "${farm_path}/farm-info/shebang-py${python_full_version}.json" \
+        "include" "lib" "lib64" "local" "share"
+}
+
+function prefetch_python_runtimes() {
+    local python_version_composite
+    local -a helper_args
+
+    # Only the runtimefarm recipes install a runtime.
+    if [[ "${path_name}" != *.runtimefarm ]]; then
+        return
+    fi
+
+    # Runtimes not yet installed nor stored are stored together, each
+    # one unpacked while it is downloaded, before the farms are built
+    # one python version at a time and clone them from the store.
+    helper_args=()
+    for python_version_composite in "${python_versions[@]}"; do
+        set_icarus_python3_constants "${python_version_composite}"
+        if [[ -f "${path_root}/${path_name}/farm-info/ready-py${python_full_version}" ]]; then
+            continue
+        fi
+        if [[ -f "${runtime_root}/CPython/${python_full_version}/build-py${python_full_version}" ]]; then
+            continue
+        fi
+        if [[ -f "${runtime_store_root}/${python_pkg_name}/.icarus-runtime.json" ]]; then
+            continue
+        fi
+        helper_args+=(
+            "--runtime"
+            "${python_pkg_download_url}"
+            "${cache_root}/CPython/${python_pkg_full_name}"
+            "${python_pkg_name}"
+            "${python_shebang_shim}"
+        )
+    done
+
+    if [[ ${#helper_args[@]} -lt 10 ]]; then
+        return
+    fi
+
+    echo -e "${bold_green}${sparkles} Storing $((${#helper_args[@]} / 5)) python runtimes${end}"
+
+    mkdir -p "${cache_root}/CPython" || {
+        echo_warning "Failed to create '${cache_root}/CPython'."
+        return
+    }
+
+    # A failure here is not fatal, install_python_runtime populates the
+    # store entry again and reports the error for its python version.
+    "${cli_python_executable}" -I -m icarus.handlers.builder_handler.runtime_helper store \
+        "${helper_args[@]}" \
+        --store "${runtime_store_root}" \
+        --prune "include" --prune "lib64" --prune "local" --prune "share" \
+        --jobs "${build_jobs:-0}" \
+        --cache-root "${cache_root}" --owner "${project_root_dir_abs}" || {
+        echo_warning "Failed to prefetch the python runtimes."
+    }
+    echo
 }
 
 function install_python_runtime() {
-    local dir compression dest_tar single_run_status build_info_file python_dir retries max_retries
+    local dir dest_tar single_run_status build_info_file python_dir
     local -a root_tree
 
     # Initializing single_run_status per python version.
@@ -337,10 +291,6 @@ function install_python_runtime() {
         "${runtime_root}/CPython/${python_full_version}"
     )
 
-    # 30 min -> 2 sec sleep * 900 secs
-    retries=0
-    max_retries=900
-
     for dir in "${root_tree[@]}"; do
         mkdir -p "${dir}" || {
             echo_error "Failed to create '${dir}'."
@@ -351,109 +301,53 @@ function install_python_runtime() {
 
     echo -e "${bold_green}${sparkles} Installing 'Python${python_full_version}'${end}"
 
+    # The runtime is shared by every farm of this python version, only
+    # one farm unpacks it while the others wait and then use it.
+    acquire_lock "${runtime_root}/CPython/${python_full_version}.flock" || {
+        echo_error "Failed to lock 'Python${python_full_version}'." "errexit"
+    }
+
     # If the runtime is already created, use it
     if [[ -f "${build_info_file}" ]]; then
         echo -e "Using cached runtime"
         echo
+        release_lock "${runtime_root}/CPython/${python_full_version}.flock"
         return
     fi
 
-    # Download or use cached one
-    # The while loop is used to prevent race conditions.
-    while true; do
-        # File exists, assume download complete.
-        if [[ -f "${dest_tar}" && ! -d "${dest_tar}.lock" ]]; then
-            echo -e "Using cached ${python_pkg_full_name}"
-            echo
-            break
-
-        # mkdir is atomic—only one process will succeed.
-        # Successfully acquired lock; perform the download.
-        elif mkdir "${dest_tar}.lock" 2>/dev/null; then
-            echo -e "Downloading ${python_pkg_full_name}"
-            echo
-            # Cleanup / Remove partial download just in case was left there
-            rm -rf "${dest_tar}" || {
-                echo_error "Failed to remove '${dest_tar}'."
-                single_run_status=1
-                exit_code=1
-            }
-            # Check if python version is available on https://github.com/64rl0/PythonRuntime
-            if curl -s -f -L -I "${python_pkg_download_url}" -o "/dev/null"; then
-                # Download
-                curl -L "${python_pkg_download_url}" -o "${dest_tar}" || {
-                    echo_error "Failed to download '${python_pkg_name}'."
-                    single_run_status=1
-                    exit_code=1
-                    # Remove partial download
-                    rm -rf "${dest_tar}" || {
-                        echo_error "Failed to remove '${dest_tar}'."
-                    }
-                }
-                echo
-            else
-                echo_error "${python_pkg_full_name} not available on https://github.com/64rl0/PythonRuntime"
-                single_run_status=1
-                exit_code=1
-            fi
-            # Always release the lock before breaking the loop
-            rm -rf "${dest_tar}.lock" || {
-                echo_error "Failed to remove '${dest_tar}.lock'."
-                single_run_status=1
-                exit_code=1
-            }
-            break
-
-        # Someone else is downloading; wait for them to finish.
-        else
-            ((retries = retries + 1))
-            if ((retries >= max_retries)); then
-                echo_error "Timed out waiting for ${python_pkg_name} download lock."
-                single_run_status=1
-                exit_code=1
-                break
-            fi
-            echo -e "Waiting for download own by another process to complete..."
-            sleep 2
-        fi
+    # Clean any partial or old dir left there before cloning, with the
+    # precompiled marker of the old stdlib so the clone is compiled again.
+    for dir in \
+        "${runtime_root}/CPython/${python_full_version}/precompiled-py${python_full_version}" \
+        "${python_dir}" \
+        "${runtime_root}/CPython/${python_full_version}"/.clone-*; do
+        rm -rf "${dir}" || {
+            echo_error "Failed to remove '${dir}'."
+            single_run_status=1
+            exit_code=1
+        }
     done
 
-    # After the download process we verify the single_run_status to check if
-    # the download was successful.
-    if [[ "${single_run_status}" -ne 0 ]]; then
+    # Clone the runtime from the store shared by every project.
+    # The store keeps one read-only copy of every runtime, unpacked while
+    # it is downloaded and with the shebangs already pointed at the shim.
+    # The project runtime is a hardlink clone of it, the store entry is
+    # populated first when it is missing or damaged.
+    "${cli_python_executable}" -I -m icarus.handlers.builder_handler.runtime_helper install \
+        --url "${python_pkg_download_url}" \
+        --tarball "${dest_tar}" \
+        --store "${runtime_store_root}" \
+        --key "${python_pkg_name}" \
+        --target "${python_dir}" \
+        --shebang "${python_shebang_shim}" \
+        --prune "include" --prune "lib64" --prune "local" --prune "share" \
+        --cache-root "${cache_root}" \
+        --owner "${project_root_dir_abs}" || {
+        echo_error "Failed to install '${python_pkg_full_name}' from https://github.com/64rl0/PythonRuntime"
         single_run_status=1
         exit_code=1
+        release_lock "${runtime_root}/CPython/${python_full_version}.flock"
         return
-    fi
-
-    # Clean any partial or old dir left there before moving to runtime root.
-    rm -rf "${runtime_root}/CPython/${python_full_version}/${python_full_version}" || {
-        echo_error "Failed to remove '${runtime_root}/CPython/${python_full_version}/${python_full_version}'."
-        single_run_status=1
-        exit_code=1
-    }
-    rm -rf "${runtime_root}/CPython/${python_full_version}/runtime" || {
-        echo_error "Failed to remove '${runtime_root}/CPython/${python_full_version}/runtime'."
-        single_run_status=1
-        exit_code=1
-    }
-
-    # Unpacking.
-    compression="$(file "${dest_tar}" | awk '{print $2}' | tr '[:upper:]' '[:lower:]')" || {
-        echo_error "Failed to detect '${dest_tar}' compression type."
-        exit_code=1
-    }
-    tar -v -x --"${compression}" -f "${dest_tar}" -C "${runtime_root}/CPython/${python_full_version}" || {
-        echo_error "Failed to unpack '${python_pkg_name}'."
-        single_run_status=1
-        exit_code=1
-    }
-
-    # Unpack by default in ${python_full_version} we need to rename it to: 'runtime' dir.
-    mv "${runtime_root}/CPython/${python_full_version}/${python_full_version}" "${runtime_root}/CPython/${python_full_version}/runtime" || {
-        echo_error "Failed to move '${runtime_root}/CPython/${python_full_version}/${python_full_version}' to '${runtime_root}/CPython/${python_full_version}/runtime'."
-        single_run_status=1
-        exit_code=1
     }
 
     if [[ "${single_run_status}" -eq 0 ]]; then
@@ -461,9 +355,6 @@ function install_python_runtime() {
         echo
     fi
 
-    # Fixing runtime shebang.
-    fix_shebang_shim_core "${python_dir}" "include" "lib64" "local" "share"
-
     # Save the build release info.
     printf '%s\n' \
         "# The path command creates build variables from a graph of dependencies defined in package." \
@@ -482,17 +373,21 @@ function install_python_runtime() {
         echo_error "Failed to create '${build_info_file}'."
         exit_code=1
     }
+
+    release_lock "${runtime_root}/CPython/${python_full_version}.flock"
 }
 
 function link_python_runtime_into_python_farm() {
     local farm_path p_name path_to_python_runtime path_to_python_farm
-    local -a excluded
+    local -a excluded nofold
 
     p_name="$1"
     farm_path="${path_root}/${p_name}"
     path_to_python_farm="${farm_path}/CPython/${python_full_version}"
     path_to_python_runtime="${runtime_root}/CPython/${python_full_version}/runtime"
     excluded=("lib64" ".envroot")
+    # pip installs into these, they must not be linked to the runtime
+    nofold=("bin" "include" "share" "lib/python*/site-packages")
 
     if [[ -z "${p_name}" ]]; then
         echo_error "Missing argument: 'p_name'"
@@ -505,7 +400,7 @@ function link_python_runtime_into_python_farm() {
     # If there isn't a symlink farm, then we incur the risk of using system binaries,
     # therefore this is a hard stop.
 
-    link_prefix_to_farm "${path_to_python_runtime}" "${path_to_python_farm}" "${excluded[@]}" || {
+    link_prefix_to_farm "${path_to_python_runtime}" "${path_to_python_farm}" "${excluded[@]}" -- "${nofold[@]}" || {
         exit_code=1
         # We invalidate the farm and error
         clean_farm "${p_name}"
@@ -673,6 +568,186 @@ function build_runtimefarm_icarus_python3() {
     echo
 }
 
+function sha256_digest() {
+    if command -v sha256sum >/dev/null 2>&1; then
+        sha256sum | cut -d ' ' -f 1
+    else
+        shasum -a 256 | cut -d ' ' -f 1
+    fi
+}
+
+function get_sync_fingerprint() {
+    # The fingerprint covers everything the pip resolver depends on: the
+    # requirements (file content or specifiers), the interpreter and pip.
+    # Arguments are pip install arguments, `--requirement <file>` or specifiers.
+    local pip_dist_info pip_version
+
+    pip_version="none"
+    for pip_dist_info in "${PYTHONHOME}/lib/python${python_version}/site-packages/pip-"*.dist-info; do
+        if [[ -e "${pip_dist_info}" ]]; then
+            pip_version="${pip_dist_info##*/}"
+        fi
+    done
+
+    {
+        echo "python=${python_full_version}"
+        echo "pip=${pip_version}"
+        while (("${#}" > 0)); do
+            if [[ "${1}" == "--requirement" ]]; then
+                echo "requirement-file=${2}"
+                cat "${2}" 2>/dev/null || echo "missing"
+                shift
+            else
+                echo "requirement=${1}"
+            fi
+            shift
+        done
+    } | sha256_digest
+}
+
+function is_sync_fingerprint_unchanged() {
+    local report_path fingerprint
+
+    report_path="${1}"
+    shift
+
+    if [[ "${refresh}" == "Y" || ! -f "${report_path}.build" || ! -f "${report_path}.fingerprint" ]]; then
+        return 1
+    fi
+
+    fingerprint="$(get_sync_fingerprint "${@}")" || return 1
+
+    [[ "$(<"${report_path}.fingerprint")" == "${fingerprint}" ]]
+}
+
+function write_sync_fingerprint() {
+    local report_path
+
+    report_path="${1}"
+    shift
+
+    get_sync_fingerprint "${@}" >"${report_path}.fingerprint" || {
+        rm -f "${report_path}.fingerprint"
+    }
+}
+
+function precompile_farm() {
+    # This function will compile the bytecode of the farms opted in with
+    # `precompile` in the config, so the first run of every tool does not
+    # compile each module it imports. The stdlib of the shared runtime is
+    # immutable and gets unchecked-hash pycs, site-packages changes on sync
+    # and keeps the default timestamp pycs.
+    local p_name p_graph farm_path stdlib_dir runtime_stdlib_dir precompiled_file packages_digest
+    local farm is_opted_in
+
+    p_name="$1"
+    p_graph="$(echo "${p_name}" | cut -d'.' -f 1)"
+    farm_path="${path_root}/${p_name}"
+    stdlib_dir="${PYTHONHOME}/lib/python${python_version}"
+    runtime_stdlib_dir="${runtime_root}/CPython/${python_full_version}/runtime/lib/python${python_version}"
+    precompiled_file="${farm_path}/farm-info/precompiled-py${python_full_version}"
+
+    if [[ -z "${p_name}" ]]; then
+        echo_error "Missing argument: 'p_name'"
+        exit_code=1
+        return
+    fi
+
+    is_opted_in=false
+    for farm in "${precompile_farms[@]}"; do
+        if [[ "${farm}" == "${p_graph}" ]]; then
+            is_opted_in=true
+        fi
+    done
+
+    if [[ "${is_opted_in}" != true ]]; then
+        return
+    fi
+
+    echo -e "${bold_green}${sparkles} Precompiling ${p_name}${end}"
+
+    # Nothing to compile again while the installed packages are the same.
+    packages_digest="$(sha256_digest <"${farm_path}/farm-info/packages-py${python_full_version}.json")" || packages_digest=""
+    if [[ -n "${packages_digest}" && -f "${precompiled_file}" && "$(<"${precompiled_file}")" == "${packages_digest}" ]]; then
+        echo -e "Precompile complete! (packages unchanged)"
+        echo
+        return
+    fi
+
+    # The runtime stdlib is shared by every farm of this python version and
+    # the farms link its packages as a whole, so it is compiled in place once.
+    acquire_lock "${runtime_root}/CPython/${python_full_version}.flock" || {
+        echo_error "Failed to lock 'Python${python_full_version}'." "errexit"
+    }
+    if [[ ! -f "${runtime_root}/CPython/${python_full_version}/precompiled-py${python_full_version}" ]]; then
+        "${PYTHONBIN}" -m compileall -q -j "${build_jobs:-0}" --invalidation-mode unchecked-hash \
+            -x '/(site-packages|test|tests|idlelib|lib2to3)/' "${runtime_stdlib_dir}" || {
+            echo_warning "Some stdlib modules of 'Python${python_full_version}' cannot be precompiled."
+        }
+        touch "${runtime_root}/CPython/${python_full_version}/precompiled-py${python_full_version}" || {
+            echo_error "Failed to create 'precompiled-py${python_full_version}'."
+            exit_code=1
+        }
+    fi
+    release_lock "${runtime_root}/CPython/${python_full_version}.flock"
+
+    # The top-level stdlib modules are linked one by one into the farm, their
+    # pycs are written in the farm.
+    "${PYTHONBIN}" -m compileall -q -l -j "${build_jobs:-0}" --invalidation-mode unchecked-hash \
+        "${stdlib_dir}" || {
+        echo_warning "Some stdlib modules of ${p_name} cannot be precompiled."
+    }
+
+    "${PYTHONBIN}" -m compileall -q -j "${build_jobs:-0}" "${stdlib_dir}/site-packages" || {
+        echo_warning "Some packages of ${p_name} cannot be precompiled."
+    }
+
+    if [[ -n "${packages_digest}" ]]; then
+        echo "${packages_digest}" >"${precompiled_file}" || {
+            echo_error "Failed to create 'precompiled-py${python_full_version}'."
+            exit_code=1
+        }
+    fi
+
+    echo -e "Done!"
+    echo
+}
+
+function pip_install_from_store() {
+    # This function will install a [build] dependencies graph into the active
+    # farm. Index distributions are linked from the package store shared by
+    # every farm, the rest (local paths, VCS and direct URLs) is left to pip.
+    local report_file fallback_file
+
+    report_file="$1"
+    fallback_file="${report_file}.fallback"
+
+    if [[ ! -f "${report_file}" ]]; then
+        echo_error "Missing dependencies graph: '${report_file}'"
+        return 1
+    fi
+
+    "${cli_python_executable}" -I -m icarus.handlers.builder_handler.store_helper install \
+        "${report_file}" \
+        --store "${store_root}" \
+        --key "${python_store_key}" \
+        --prefix "${PYTHONHOME}" \
+        --python "${PYTHONBIN}" \
+        --shebang "${python_shebang_shim}" \
+        --fallback "${fallback_file}" \
+        --cache-root "${cache_root}" \
+        --owner "${project_root_dir_abs}" || return 1
+
+    if [[ -s "${fallback_file}" ]]; then
+        "${PYTHONBIN}" -m pip install \
+            --force-reinstall \
+            --no-deps \
+            --no-compile \
+            --no-warn-script-location \
+            --requirement "${fallback_file}" || return 1
+    fi
+}
+
 function pip_pip() {
     local p_name p_graph p_recipe p_ver installation_type report_path
 
@@ -691,6 +766,13 @@ function pip_pip() {
 
     report_path="${path_cache_root}/pip_${p_graph}_${p_recipe}_${p_ver}"
 
+    if [[ "${installation_type}" == "sync" ]] && is_sync_fingerprint_unchanged "${report_path}" pip; then
+        echo -e "${bold_green}${sparkles} Syncing pip${end}"
+        echo -e "Sync complete! (fingerprint unchanged)"
+        echo
+        return
+    fi
+
     echo -e "${bold_green}${sparkles} Caching [${installation_type}] [pip] dependencies graph${end}"
     "${PYTHONBIN}" -m pip install \
         --dry-run \
@@ -710,7 +792,10 @@ function pip_pip() {
             pip || {
             echo_error "Failed to install pip."
             exit_code=1
+            echo
+            return
         }
+        write_sync_fingerprint "${report_path}" pip
         echo
     elif [[ "${installation_type}" == "sync" ]]; then
         echo -e "${bold_green}${sparkles} Syncing pip${end}"
@@ -721,6 +806,7 @@ function pip_pip() {
             echo_warning "Requirements changed."
             pip_pip "${p_name}" "build"
         else
+            write_sync_fingerprint "${report_path}" pip
             echo -e "Sync complete!"
             echo
         fi
@@ -806,6 +892,14 @@ function pip_tool_dependencies() {
         requirements_path_basename="$(basename "${requirements_path}")"
         report_path="${path_cache_root}/$(basename "$(echo "${requirements_path}" | tr '.' '-')_${p_graph}_${p_recipe}_${p_ver}")"
 
+        if [[ "${installation_type}" == "sync" ]] &&
+            is_sync_fingerprint_unchanged "${report_path}" --requirement "${project_root_dir_abs}/${requirements_path}"; then
+            echo -e "${bold_green}${sparkles} Syncing ${requirements_path_basename}${end}"
+            echo -e "Sync complete! (fingerprint unchanged)"
+            echo
+            continue
+        fi
+
         echo -e "${bold_green}${sparkles} Caching [${installation_type}] [tool:${requirements_path_basename}] dependencies graph${end}"
         "${PYTHONBIN}" -m pip install \
             --dry-run \
@@ -819,14 +913,13 @@ function pip_tool_dependencies() {
 
         if [[ "${installation_type}" == "build" ]]; then
             echo -e "${bold_green}${sparkles} Installing ${requirements_path_basename}${end}"
-            "${PYTHONBIN}" -m pip install \
-                --force-reinstall \
-                --no-compile \
-                --no-warn-script-location \
-                --requirement "${project_root_dir_abs}/${requirements_path}" || {
+            pip_install_from_store "${report_path}.${installation_type}" || {
                 echo_error "Failed to install requirements ${requirements_path_basename}."
                 exit_code=1
+                echo
+                continue
             }
+            write_sync_fingerprint "${report_path}" --requirement "${project_root_dir_abs}/${requirements_path}"
             echo
         elif [[ "${installation_type}" == "sync" ]]; then
             echo -e "${bold_green}${sparkles} Syncing ${requirements_path_basename}${end}"
@@ -837,6 +930,7 @@ function pip_tool_dependencies() {
                 echo_warning "Requirements changed."
                 pip_tool_dependencies "${p_name}" "build"
             else
+                write_sync_fingerprint "${report_path}" --requirement "${project_root_dir_abs}/${requirements_path}"
                 echo -e "Sync complete!"
                 echo
             fi
@@ -866,6 +960,13 @@ function pip_run_dependencies() {
 
     report_path="${path_cache_root}/run_${p_graph}_${p_recipe}_${p_ver}"
 
+    if [[ "${installation_type}" == "sync" ]] && is_sync_fingerprint_unchanged "${report_path}" "${run_requirements_pyproject_toml[@]}"; then
+        echo -e "${bold_green}${sparkles} Syncing pyproject.toml dependencies${end}"
+        echo -e "Sync complete! (fingerprint unchanged)"
+        echo
+        return
+    fi
+
     echo -e "${bold_green}${sparkles} Caching [${installation_type}] [run:pyproject.toml] dependencies graph${end}"
     "${PYTHONBIN}" -m pip install \
         --dry-run \
@@ -879,14 +980,13 @@ function pip_run_dependencies() {
 
     if [[ "${installation_type}" == "build" ]]; then
         echo -e "${bold_green}${sparkles} Installing pyproject.toml dependencies${end}"
-        "${PYTHONBIN}" -m pip install \
-            --force-reinstall \
-            --no-compile \
-            --no-warn-script-location \
-            "${run_requirements_pyproject_toml[@]}" || {
+        pip_install_from_store "${report_path}.${installation_type}" || {
             echo_error "Failed to install pyproject.toml dependencies."
             exit_code=1
+            echo
+            return
         }
+        write_sync_fingerprint "${report_path}" "${run_requirements_pyproject_toml[@]}"
         echo
     elif [[ "${installation_type}" == "sync" ]]; then
         echo -e "${bold_green}${sparkles} Syncing pyproject.toml dependencies${end}"
@@ -897,6 +997,7 @@ function pip_run_dependencies() {
             echo_warning "Requirements changed."
             pip_run_dependencies "${p_name}" "build"
         else
+            write_sync_fingerprint "${report_path}" "${run_requirements_pyproject_toml[@]}"
             echo -e "Sync complete!"
             echo
         fi
@@ -927,6 +1028,14 @@ function pip_run_dependencies_legacy() {
         requirements_path_basename="$(basename "${requirements_path}")"
         report_path="${path_cache_root}/$(basename "$(echo "${requirements_path}" | tr '.' '-')_${p_graph}_${p_recipe}_${p_ver}")"
 
+        if [[ "${installation_type}" == "sync" ]] &&
+            is_sync_fingerprint_unchanged "${report_path}" --requirement "${project_root_dir_abs}/${requirements_path}"; then
+            echo -e "${bold_green}${sparkles} Syncing ${requirements_path_basename}${end}"
+            echo -e "Sync complete! (fingerprint unchanged)"
+            echo
+            continue
+        fi
+
         echo -e "${bold_green}${sparkles} Caching [${installation_type}] [run-legacy:${requirements_path_basename}] dependencies graph${end}"
         "${PYTHONBIN}" -m pip install \
             --dry-run \
@@ -940,14 +1049,13 @@ function pip_run_dependencies_legacy() {
 
         if [[ "${installation_type}" == "build" ]]; then
             echo -e "${bold_green}${sparkles} Installing ${requirements_path_basename}${end}"
-            "${PYTHONBIN}" -m pip install \
-                --force-reinstall \
-                --no-compile \
-                --no-warn-script-location \
-                --requirement "${project_root_dir_abs}/${requirements_path}" || {
+            pip_install_from_store "${report_path}.${installation_type}" || {
                 echo_error "Failed to install requirements ${requirements_path_basename}."
                 exit_code=1
+                echo
+                continue
             }
+            write_sync_fingerprint "${report_path}" --requirement "${project_root_dir_abs}/${requirements_path}"
             echo
         elif [[ "${installation_type}" == "sync" ]]; then
             echo -e "${bold_green}${sparkles} Syncing ${requirements_path_basename}${end}"
@@ -958,6 +1066,7 @@ function pip_run_dependencies_legacy() {
                 echo_warning "Requirements changed."
                 pip_run_dependencies_legacy "${p_name}" "build"
             else
+                write_sync_fingerprint "${report_path}" --requirement "${project_root_dir_abs}/${requirements_path}"
                 echo -e "Sync complete!"
                 echo
             fi
@@ -989,6 +1098,14 @@ function pip_dev_dependencies() {
         requirements_path_basename="$(basename "${requirements_path}")"
         report_path="${path_cache_root}/$(basename "$(echo "${requirements_path}" | tr '.' '-')_${p_graph}_${p_recipe}_${p_ver}")"
 
+        if [[ "${installation_type}" == "sync" ]] &&
+            is_sync_fingerprint_unchanged "${report_path}" --requirement "${project_root_dir_abs}/${requirements_path}"; then
+            echo -e "${bold_green}${sparkles} Syncing ${requirements_path_basename}${end}"
+            echo -e "Sync complete! (fingerprint unchanged)"
+            echo
+            continue
+        fi
+
         echo -e "${bold_green}${sparkles} Caching [${installation_type}] [dev:${requirements_path_basename}] dependencies graph${end}"
         "${PYTHONBIN}" -m pip install \
             --dry-run \
@@ -1002,14 +1119,13 @@ function pip_dev_dependencies() {
 
         if [[ "${installation_type}" == "build" ]]; then
             echo -e "${bold_green}${sparkles} Installing ${requirements_path_basename}${end}"
-            "${PYTHONBIN}" -m pip install \
-                --force-reinstall \
-                --no-compile \
-                --no-warn-script-location \
-                --requirement "${project_root_dir_abs}/${requirements_path}" || {
+            pip_install_from_store "${report_path}.${installation_type}" || {
                 echo_error "Failed to install requirements ${requirements_path_basename}."
                 exit_code=1
+                echo
+                continue
             }
+            write_sync_fingerprint "${report_path}" --requirement "${project_root_dir_abs}/${requirements_path}"
             echo
         elif [[ "${installation_type}" == "sync" ]]; then
             echo -e "${bold_green}${sparkles} Syncing ${requirements_path_basename}${end}"
@@ -1020,6 +1136,7 @@ function pip_dev_dependencies() {
                 echo_warning "Requirements changed."
                 pip_dev_dependencies "${p_name}" "build"
             else
+                write_sync_fingerprint "${report_path}" --requirement "${project_root_dir_abs}/${requirements_path}"
                 echo -e "Sync complete!"
                 echo
             fi
@@ -1035,7 +1152,7 @@ function write_python_packages_release_info() {
 
     p_name="$1"
     farm_path="${path_root}/${p_name}"
-    packages_file="${farm_path}/farm-info/packages-py${python_full_version}"
+    packages_file="${farm_path}/farm-info/packages-py${python_full_version}.json"
 
     if [[ -z "${p_name}" ]]; then
         echo_error "Missing argument: 'p_name'"
@@ -1043,18 +1160,11 @@ function write_python_packages_release_info() {
         return
     fi
 
-    printf '%s\n' \
-        "# The path command creates build variables from a graph of dependencies defined in package." \
-        "# It is strongly recommended that you use the ${cli_name} builder path command to manage" \
-        "# your environments." \
-        "" \
-        >"${packages_file}" || {
-        echo_error "Failed to create 'packages-py${python_full_version}'."
-        exit_code=1
-    }
-
-    "${PYTHONBIN}" -m pip freeze --all >>"${packages_file}" || {
-        echo_error "Failed to create 'packages-py${python_full_version}'."
+    # Read from the dist-info METADATA headers, the same packages as
+    # `pip freeze --all` without starting pip.
+    "${cli_python_executable}" -I -m icarus.handlers.builder_handler.farm_helper packages \
+        "${PYTHONHOME}/lib/python${python_version}/site-packages" --output "${packages_file}" || {
+        echo_error "Failed to create 'packages-py${python_full_version}.json'."
         exit_code=1
     }
 }
@@ -1138,12 +1248,130 @@ function clean_farm() {
         return
     fi
 
-    rm -rf "${farm_path}" || {
-        echo_error "Failed to remove '${farm_path}'."
+    # Only the failing python version is invalidated, the builder can
+    # build the other versions of the farm concurrently and they keep
+    # their files. The ready file goes first so a half removed version
+    # is never taken as ready, the next run builds it again.
+    rm -rf \
+        "${farm_path}/farm-info/ready-py${python_full_version}" \
+        "${farm_path}/farm-info/"*"-py${python_full_version}" \
+        "${farm_path}/farm-info/"*"-py${python_full_version}.json" \
+        "${farm_path}/CPython/${python_full_version}" || {
+        echo_error "Failed to invalidate Python${python_full_version} in '${farm_path}'."
         exit_code=1
     }
 }
 
+function acquire_lock() {
+    local lock_file lock_fd return_code
+
+    lock_file="$1"
+
+    if [[ -z "${lock_file}" ]]; then
+        echo_error "Missing argument: 'lock_file'"
+        exit_code=1
+        return 1
+    fi
+
+    exec {lock_fd}>>"${lock_file}" || {
+        echo_error "Failed to open '${lock_file}'."
+        exit_code=1
+        return 1
+    }
+
+    # The flock is taken on the open file description this shell keeps,
+    # it is released when the fd is closed or when the process dies, so
+    # a killed build never leaves a stale lock. The waiters are woken by
+    # the kernel as soon as the holder releases it.
+    return_code=0
+    "${cli_python_executable}" -I -m icarus.handlers.builder_handler.lock_helper acquire \
+        --fd "${lock_fd}" --timeout 0 || return_code="${?}"
+
+    if [[ "${return_code}" == 2 ]]; then
+        echo -e "Waiting for lock owned by another process to be released..."
+        return_code=0
+        # 30 min
+        "${cli_python_executable}" -I -m icarus.handlers.builder_handler.lock_helper acquire \
+            --fd "${lock_fd}" --timeout 1800 || return_code="${?}"
+        if [[ "${return_code}" == 2 ]]; then
+            echo_error "Timed out waiting for lock '${lock_file}'."
+        fi
+    fi
+
+    if [[ "${return_code}" != 0 ]]; then
+        exec {lock_fd}>&-
+        exit_code=1
+        return 1
+    fi
+
+    held_lock_files+=("${lock_file}")
+    held_lock_fds+=("${lock_fd}")
+}
+
+function release_lock() {
+    local lock_file lock_fd i
+
+    lock_file="$1"
+
+    for i in "${!held_lock_files[@]}"; do
+        if [[ "${held_lock_files[${i}]}" == "${lock_file}" ]]; then
+            lock_fd="${held_lock_fds[${i}]}"
+            exec {lock_fd}>&-
+            unset 'held_lock_files[i]' 'held_lock_fds[i]'
+        fi
+    done
+}
+
+function release_held_locks() {
+    local lock_fd
+
+    for lock_fd in "${held_lock_fds[@]}"; do
+        exec {lock_fd}>&- || :
+    done
+    held_lock_files=()
+    held_lock_fds=()
+}
+
+function acquire_farm_lock() {
+    local p_name
+
+    p_name="$1"
+
+    if [[ -z "${p_name}" ]]; then
+        echo_error "Missing argument: 'p_name'"
+        exit_code=1
+        return
+    fi
+
+    # The farm root is shared by every python version of the farm, the
+    # builder can run them concurrently so the steps writing into the
+    # farm root must hold the farm lock. The lock lives next to the farm
+    # so that clean_farm does not remove it.
+    mkdir -p "${path_root}" || {
+        echo_error "Failed to create '${path_root}'."
+        exit_code=1
+        return
+    }
+
+    acquire_lock "${path_root}/${p_name}.flock" || {
+        echo_error "Failed to lock ${p_name}." "errexit"
+    }
+}
+
+function release_farm_lock() {
+    local p_name
+
+    p_name="$1"
+
+    if [[ -z "${p_name}" ]]; then
+        echo_error "Missing argument: 'p_name'"
+        exit_code=1
+        return
+    fi
+
+    release_lock "${path_root}/${p_name}.flock"
+}
+
 function activate_farm_icarus_python3() {
     local p_name farm_path farm_path_file
 
@@ -1191,7 +1419,7 @@ function join_deps() {
     p_name="$1"
     farm_path="${path_root}/${p_name}"
     farm_ready_file="${farm_path}/farm-info/ready-py${python_full_version}"
-    python_packages_release_info="${farm_path}/farm-info/packages-py${python_full_version}"
+    python_packages_release_info="${farm_path}/farm-info/packages-py${python_full_version}.json"
 
     if [[ -z "${p_name}" ]]; then
         echo_error "Missing argument: 'p_name'"
@@ -1205,9 +1433,15 @@ function join_deps() {
         return 1
     fi
 
-    # Split on space so local imports will be clean
-    # exclude empty lines and lines starting with #
-    cut -d ' ' -f 1 "${python_packages_release_info}" | grep '^[a-zA-Z]' | paste -s -d ${delimiter_char} -
+    # Farms built before the packages manifest get it on first use.
+    if [[ ! -f "${python_packages_release_info}" ]]; then
+        "${cli_python_executable}" -I -m icarus.handlers.builder_handler.farm_helper packages \
+            "${farm_path}/CPython/${python_full_version}/lib/python${python_version}/site-packages" \
+            --output "${python_packages_release_info}" || return 1
+    fi
+
+    "${cli_python_executable}" -I -m icarus.handlers.builder_handler.farm_helper join-packages \
+        "${python_packages_release_info}" --delimiter "${delimiter_char}"
 }
 
 function join_deps_names() {
@@ -1216,7 +1450,7 @@ function join_deps_names() {
     p_name="$1"
     farm_path="${path_root}/${p_name}"
     farm_ready_file="${farm_path}/farm-info/ready-py${python_full_version}"
-    python_packages_release_info="${farm_path}/farm-info/packages-py${python_full_version}"
+    python_packages_release_info="${farm_path}/farm-info/packages-py${python_full_version}.json"
 
     if [[ -z "${p_name}" ]]; then
         echo_error "Missing argument: 'p_name'"
@@ -1230,9 +1464,15 @@ function join_deps_names() {
         return 1
     fi
 
-    # Split on space so local imports will be clean
-    # exclude empty lines and lines starting with #
-    cut -d ' ' -f 1 "${python_packages_release_info}" | cut -d '=' -f 1 | grep '^[a-zA-Z]' | paste -s -d ${delimiter_char} -
+    # Farms built before the packages manifest get it on first use.
+    if [[ ! -f "${python_packages_release_info}" ]]; then
+        "${cli_python_executable}" -I -m icarus.handlers.builder_handler.farm_helper packages \
+            "${farm_path}/CPython/${python_full_version}/lib/python${python_version}/site-packages" \
+            --output "${python_packages_release_info}" || return 1
+    fi
+
+    "${cli_python_executable}" -I -m icarus.handlers.builder_handler.farm_helper join-packages \
+        "${python_packages_release_info}" --delimiter "${delimiter_char}" --names
 }
 
 function join_python_versions() {
@@ -1458,9 +1698,11 @@ function build_path_icarus_python3() {
         if [[ ! -f "${path_root}/${path_tool_runtimefarm_name}/farm-info/ready-py${python_full_version}" ]]; then
             installation_type="build"
             echo -e "${bold_blue}${hammer_and_wrench} Building farm ${path_tool_runtimefarm_name}${end}"
+            acquire_farm_lock "${path_tool_runtimefarm_name}"
             build_runtimefarm_icarus_python3 "${path_tool_runtimefarm_name}"
             install_user_space_runtime
             link_user_space_runtime_into_runtimefarm "${path_tool_runtimefarm_name}"
+            release_farm_lock "${path_tool_runtimefarm_name}"
             install_python_runtime
             link_python_runtime_into_python_farm "${path_tool_runtimefarm_name}"
         else
@@ -1472,10 +1714,13 @@ function build_path_icarus_python3() {
         pip_tool_dependencies "${path_tool_runtimefarm_name}" "${installation_type}"
         write_python_packages_release_info "${path_tool_runtimefarm_name}"
         fix_shebang_shim "${path_tool_runtimefarm_name}"
+        precompile_farm "${path_tool_runtimefarm_name}"
         mark_farm_ready_icarus_python3 "${path_tool_runtimefarm_name}" "${installation_type}"
         deactivate_farm_icarus_python3
         if [[ "${is_python_default}" == true ]]; then
+            acquire_farm_lock "${path_tool_runtimefarm_name}"
             link_python_runtime_into_runtimefarm "${path_tool_runtimefarm_name}"
+            release_farm_lock "${path_tool_runtimefarm_name}"
         fi
         validate_farm_integrity "${path_tool_runtimefarm_name}"
         response="${path_root}/${path_tool_runtimefarm_name}"
@@ -1484,9 +1729,11 @@ function build_path_icarus_python3() {
         if [[ ! -f "${path_root}/${path_pkg_runtimefarm_name}/farm-info/ready-py${python_full_version}" ]]; then
             installation_type="build"
             echo -e "${bold_blue}${hammer_and_wrench} Building farm ${path_pkg_runtimefarm_name}${end}"
+            acquire_farm_lock "${path_pkg_runtimefarm_name}"
             build_runtimefarm_icarus_python3 "${path_pkg_runtimefarm_name}"
             install_user_space_runtime
             link_user_space_runtime_into_runtimefarm "${path_pkg_runtimefarm_name}"
+            release_farm_lock "${path_pkg_runtimefarm_name}"
             install_python_runtime
             link_python_runtime_into_python_farm "${path_pkg_runtimefarm_name}"
         else
@@ -1498,10 +1745,13 @@ function build_path_icarus_python3() {
         pip_target_package "${path_pkg_runtimefarm_name}" "build" # We never sync pkg_only
         write_python_packages_release_info "${path_pkg_runtimefarm_name}"
         fix_shebang_shim "${path_pkg_runtimefarm_name}"
+        precompile_farm "${path_pkg_runtimefarm_name}"
         mark_farm_ready_icarus_python3 "${path_pkg_runtimefarm_name}" "${installation_type}"
         deactivate_farm_icarus_python3
         if [[ "${is_python_default}" == true ]]; then
+            acquire_farm_lock "${path_pkg_runtimefarm_name}"
             link_python_runtime_into_runtimefarm "${path_pkg_runtimefarm_name}"
+            release_farm_lock "${path_pkg_runtimefarm_name}"
         fi
         validate_farm_integrity "${path_pkg_runtimefarm_name}"
         response="${path_root}/${path_pkg_runtimefarm_name}"
@@ -1510,9 +1760,11 @@ function build_path_icarus_python3() {
         if [[ ! -f "${path_root}/${path_run_runtimefarm_name}/farm-info/ready-py${python_full_version}" ]]; then
             installation_type="build"
             echo -e "${bold_blue}${hammer_and_wrench} Building farm ${path_run_runtimefarm_name}${end}"
+            acquire_farm_lock "${path_run_runtimefarm_name}"
             build_runtimefarm_icarus_python3 "${path_run_runtimefarm_name}"
             install_user_space_runtime
             link_user_space_runtime_into_runtimefarm "${path_run_runtimefarm_name}"
+            release_farm_lock "${path_run_runtimefarm_name}"
             install_python_runtime
             link_python_runtime_into_python_farm "${path_run_runtimefarm_name}"
         else
@@ -1526,10 +1778,13 @@ function build_path_icarus_python3() {
         pip_target_package "${path_run_runtimefarm_name}" "build" # This will install a fresh pkg
         write_python_packages_release_info "${path_run_runtimefarm_name}"
         fix_shebang_shim "${path_run_runtimefarm_name}"
+        precompile_farm "${path_run_runtimefarm_name}"
         mark_farm_ready_icarus_python3 "${path_run_runtimefarm_name}" "${installation_type}"
         deactivate_farm_icarus_python3
         if [[ "${is_python_default}" == true ]]; then
+            acquire_farm_lock "${path_run_runtimefarm_name}"
             link_python_runtime_into_runtimefarm "${path_run_runtimefarm_name}"
+            release_farm_lock "${path_run_runtimefarm_name}"
         fi
         validate_farm_integrity "${path_run_runtimefarm_name}"
         response="${path_root}/${path_run_runtimefarm_name}"
@@ -1538,9 +1793,11 @@ function build_path_icarus_python3() {
         if [[ ! -f "${path_root}/${path_run_excluderoot_runtimefarm_name}/farm-info/ready-py${python_full_version}" ]]; then
             installation_type="build"
             echo -e "${bold_blue}${hammer_and_wrench} Building farm ${path_run_excluderoot_runtimefarm_name}${end}"
+            acquire_farm_lock "${path_run_excluderoot_runtimefarm_name}"
             build_runtimefarm_icarus_python3 "${path_run_excluderoot_runtimefarm_name}"
             install_user_space_runtime
             link_user_space_runtime_into_runtimefarm "${path_run_excluderoot_runtimefarm_name}"
+            release_farm_lock "${path_run_excluderoot_runtimefarm_name}"
             install_python_runtime
             link_python_runtime_into_python_farm "${path_run_excluderoot_runtimefarm_name}"
         else
@@ -1553,10 +1810,13 @@ function build_path_icarus_python3() {
         pip_run_dependencies_legacy "${path_run_excluderoot_runtimefarm_name}" "${installation_type}"
         write_python_packages_release_info "${path_run_excluderoot_runtimefarm_name}"
         fix_shebang_shim "${path_run_excluderoot_runtimefarm_name}"
+        precompile_farm "${path_run_excluderoot_runtimefarm_name}"
         mark_farm_ready_icarus_python3 "${path_run_excluderoot_runtimefarm_name}" "${installation_type}"
         deactivate_farm_icarus_python3
         if [[ "${is_python_default}" == true ]]; then
+            acquire_farm_lock "${path_run_excluderoot_runtimefarm_name}"
             link_python_runtime_into_runtimefarm "${path_run_excluderoot_runtimefarm_name}"
+            release_farm_lock "${path_run_excluderoot_runtimefarm_name}"
         fi
         validate_farm_integrity "${path_run_excluderoot_runtimefarm_name}"
         response="${path_root}/${path_run_excluderoot_runtimefarm_name}"
@@ -1565,9 +1825,11 @@ function build_path_icarus_python3() {
         if [[ ! -f "${path_root}/${path_devrun_runtimefarm_name}/farm-info/ready-py${python_full_version}" ]]; then
             installation_type="build"
             echo -e "${bold_blue}${hammer_and_wrench} Building farm ${path_devrun_runtimefarm_name}${end}"
+            acquire_farm_lock "${path_devrun_runtimefarm_name}"
             build_runtimefarm_icarus_python3 "${path_devrun_runtimefarm_name}"
             install_user_space_runtime
             link_user_space_runtime_into_runtimefarm "${path_devrun_runtimefarm_name}"
+            release_farm_lock "${path_devrun_runtimefarm_name}"
             install_python_runtime
             link_python_runtime_into_python_farm "${path_devrun_runtimefarm_name}"
         else
@@ -1583,10 +1845,13 @@ function build_path_icarus_python3() {
         pip_target_package "${path_devrun_runtimefarm_name}" "build" # This will install a fresh pkg
         write_python_packages_release_info "${path_devrun_runtimefarm_name}"
         fix_shebang_shim "${path_devrun_runtimefarm_name}"
+        precompile_farm "${path_devrun_runtimefarm_name}"
         mark_farm_ready_icarus_python3 "${path_devrun_runtimefarm_name}" "${installation_type}"
         deactivate_farm_icarus_python3
         if [[ "${is_python_default}" == true ]]; then
+            acquire_farm_lock "${path_devrun_runtimefarm_name}"
             link_python_runtime_into_runtimefarm "${path_devrun_runtimefarm_name}"
+            release_farm_lock "${path_devrun_runtimefarm_name}"
         fi
         validate_farm_integrity "${path_devrun_runtimefarm_name}"
         response="${path_root}/${path_devrun_runtimefarm_name}"
@@ -1595,9 +1860,11 @@ function build_path_icarus_python3() {
         if [[ ! -f "${path_root}/${path_devrun_excluderoot_runtimefarm_name}/farm-info/ready-py${python_full_version}" ]]; then
             installation_type="build"
             echo -e "${bold_blue}${hammer_and_wrench} Building farm ${path_devrun_excluderoot_runtimefarm_name}${end}"
+            acquire_farm_lock "${path_devrun_excluderoot_runtimefarm_name}"
             build_runtimefarm_icarus_python3 "${path_devrun_excluderoot_runtimefarm_name}"
             install_user_space_runtime
             link_user_space_runtime_into_runtimefarm "${path_devrun_excluderoot_runtimefarm_name}"
+            release_farm_lock "${path_devrun_excluderoot_runtimefarm_name}"
             install_python_runtime
             link_python_runtime_into_python_farm "${path_devrun_excluderoot_runtimefarm_name}"
         else
@@ -1611,10 +1878,13 @@ function build_path_icarus_python3() {
         pip_dev_dependencies "${path_devrun_excluderoot_runtimefarm_name}" "${installation_type}"
         write_python_packages_release_info "${path_devrun_excluderoot_runtimefarm_name}"
         fix_shebang_shim "${path_devrun_excluderoot_runtimefarm_name}"
+        precompile_farm "${path_devrun_excluderoot_runtimefarm_name}"
         mark_farm_ready_icarus_python3 "${path_devrun_excluderoot_runtimefarm_name}" "${installation_type}"
         deactivate_farm_icarus_python3
         if [[ "${is_python_default}" == true ]]; then
+            acquire_farm_lock "${path_devrun_excluderoot_runtimefarm_name}"
             link_python_runtime_into_runtimefarm "${path_devrun_excluderoot_runtimefarm_name}"
+            release_farm_lock "${path_devrun_excluderoot_runtimefarm_name}"
         fi
         validate_farm_integrity "${path_devrun_excluderoot_runtimefarm_name}"
         response="${path_root}/${path_devrun_excluderoot_runtimefarm_name}"
@@ -1626,6 +1896,33 @@ function build_path_icarus_python3() {
     esac
 }
 
+function build_path_batch_icarus_python3() {
+    local p_name farm_prefix path_runtimefarm path_pythonhome
+
+    p_name="${1}"
+    farm_prefix="${p_name%.runtimefarm}"
+
+    if [[ "${farm_prefix}" == "${p_name}" ]]; then
+        echo_error "Batch mode only resolves runtimefarm paths: '${p_name}'"
+        exit_code=1
+        return
+    fi
+
+    # Resolve the runtimefarm, then answer its pythonhome and pythonpath
+    # from the same run, one per line.
+    build_path_icarus_python3 "${p_name}"
+    path_runtimefarm="${response}"
+
+    response=''
+    build_path_icarus_python3 "${farm_prefix}.pythonhome"
+    path_pythonhome="${response}"
+
+    response=''
+    build_path_icarus_python3 "${farm_prefix}.pythonpath"
+
+    printf -v response '%s\n%s\n%s' "${path_runtimefarm}" "${path_pythonhome}" "${response}"
+}
+
 function build_path_icarus_cdk() {
     :
 }
@@ -1644,9 +1941,14 @@ function dispatch_build_system() {
     # and only print on stdout the path response so the caller can capture it.
     {
         if [[ "${build_system_in_use}" == "icarus-python3" ]]; then
+            prefetch_python_runtimes
             for python_version_composite in "${python_versions[@]}"; do
                 set_icarus_python3_constants "${python_version_composite}"
-                build_path_icarus_python3 "${path_name}"
+                if [[ "${path_batch}" == "Y" ]]; then
+                    build_path_batch_icarus_python3 "${path_name}"
+                else
+                    build_path_icarus_python3 "${path_name}"
+                fi
                 if [[ "${run_once}" == true ]]; then
                     # Those command that set run_once, only runs with the
                     # python-default which is the first in the loop.
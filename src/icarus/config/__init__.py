@@ -29,7 +29,11 @@
 # Importing required libraries and modules for the application.
 # ======================================================================
 
+# Standard Library Imports
+from typing import Any
+
 # Local Application Imports
+from icarus.config import constants as _constants
 from icarus.config.aaa_env_vars import *
 from icarus.config.constants import *
 from icarus.config.tools import *
@@ -46,3 +50,8 @@
 
 # Type aliases
 #
+
+
+def __getattr__(name: str) -> Any:
+    # Lazily resolved constants, i.e. CLI_VERSION
+    return getattr(_constants, name)
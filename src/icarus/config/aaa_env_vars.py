@@ -29,15 +29,17 @@
 # Importing required libraries and modules for the application.
 # ======================================================================
 
-# Third Party Library Imports
-import dotenv
+# Standard Library Imports
+import os
 
 # END IMPORTS
 # ======================================================================
 
 
 # List of public names in the module
-# __all__ = []
+__all__ = [
+    'load_env_vars',
+]
 
 # Setting up logger for current module
 # module_logger =
@@ -46,5 +48,41 @@
 #
 
 
+def _find_dotenv() -> str:
+    """
+    Search for a .env file walking up from this module's directory, the
+    same search dotenv.load_dotenv() performs by default.
+
+    :return: The .env file path or an empty string if none is found.
+    """
+
+    path = os.path.dirname(os.path.abspath(__file__))
+
+    while True:
+        dotenv_path = os.path.join(path, '.env')
+        if os.path.isfile(dotenv_path):
+            return dotenv_path
+        parent = os.path.dirname(path)
+        if parent == path:
+            return ''
+        path = parent
+
+
+def load_env_vars() -> None:
+    """
+    Load the environment variables from the .env file, if any.
+    dotenv is only imported when there is a .env file to load.
+
+    :return: None
+    """
+
+    dotenv_path = _find_dotenv()
+
+    if dotenv_path:
+        import dotenv
+
+        dotenv.load_dotenv(dotenv_path)
+
+
 # Load environment variables to filesystem
-dotenv.load_dotenv()
+load_env_vars()
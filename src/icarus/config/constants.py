@@ -31,7 +31,6 @@
 
 # Standard Library Imports
 import datetime
-import importlib.metadata
 import os
 import pathlib
 import sys
@@ -64,8 +63,7 @@
 )
 CLI_EPILOG = ''
 
-_SEMANTIC_VERSION = importlib.metadata.version(CLI_NAME)
-CLI_VERSION = f'build {_SEMANTIC_VERSION} built on 08/16/2026'
+CLI_VERSION_TEMPLATE = 'build {semantic_version} built on 08/16/2026'
 
 ROOT_DIR = pathlib.Path(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..'))
 CLI_SCRIPTS_DIR = pathlib.Path(
@@ -92,3 +90,38 @@
 ICARUS_REPORT_FILENAME = 'index.html'
 ICARUS_LOCK_DIRNAME = 'lock'
 ICARUS_BUILDER_LOCK_FILENAME = 'builder.lock'
+
+ICARUS_TMP_ROOT_DIR = pathlib.Path('/tmp', CLI_NAME)
+ICARUS_BUILDER_CACHE_ROOT_DIR = ICARUS_TMP_ROOT_DIR / 'builder' / 'cache'
+ICARUS_PYTHON_VERSIONS_CACHE_FILENAME = 'python-versions.json'
+ICARUS_CACHE_INDEX_FILENAME = 'cache-index.json'
+ICARUS_COMPILED_CFG_FILENAME = 'compiled-cfg.json'
+ICARUS_WORKSPACE_INDEX_FILENAME = 'workspace-index.json'
+
+ICARUS_DAEMON_DIR = pathlib.Path('/tmp', f'{CLI_NAME}-daemon-{os.getuid()}')
+ICARUS_DAEMON_SOCKET_FILENAME = 'icarus.sock'
+ICARUS_DAEMON_PID_FILENAME = 'icarus.pid'
+ICARUS_DAEMON_LOG_FILENAME = 'icarus.log'
+ICARUS_DAEMON_PROTOCOL = 'ICARUS-DAEMON-1'
+
+
+def __getattr__(name: str) -> str:
+    """
+    Resolve CLI_VERSION on first access only, importlib.metadata is
+    slow to import and most commands never need the version.
+
+    :param name: The attribute name.
+    :return: The attribute value.
+    """
+
+    if name == 'CLI_VERSION':
+        import importlib.metadata
+
+        cli_version = CLI_VERSION_TEMPLATE.format(
+            semantic_version=importlib.metadata.version(CLI_NAME)
+        )
+        globals()['CLI_VERSION'] = cli_version
+
+        return cli_version
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -29,8 +29,9 @@
 # Importing required libraries and modules for the application.
 # ======================================================================
 
-# My Library Imports
-import carlogtt_python_library
+# Standard Library Imports
+import logging
+from typing import Any, Optional
 
 # Local Application Imports
 from icarus.config import constants
@@ -50,9 +51,104 @@
 # Type aliases
 #
 
-master_logger = carlogtt_python_library.Logger(
+
+class _LazyLogger:
+    """
+    Stand-in for carlogtt_python_library.Logger that defers importing
+    the library until the logger is actually used.
+
+    Child loggers are plain stdlib loggers below ``log_name`` so they
+    can be created at import time for free. The real Logger, and its
+    console handler, are created on the first record that reaches the
+    logger or on the first access to any other Logger attribute.
+
+    :param log_name: The name of the logger.
+    :param log_level: The minimum log level for the logger.
+    :param log_fmt: The log format.
+    """
+
+    def __init__(self, log_name: str, log_level: str, log_fmt: str) -> None:
+        self._log_name = log_name
+        self._log_level = log_level
+        self._log_fmt = log_fmt
+        self._logger: Optional[Any] = None
+
+        self._app_logger = logging.getLogger(log_name)
+        self._app_logger.setLevel(log_level)
+        self._bootstrap_handler = _BootstrapHandler(self)
+        self._app_logger.addHandler(self._bootstrap_handler)
+
+    def get_child_logger(self, log_name: str) -> logging.Logger:
+        """
+        Creates and returns a child logger with a specific name.
+
+        :param log_name: The name of the child logger.
+        :return: A new child logger instance.
+        """
+
+        return self._app_logger.getChild(log_name)
+
+    def change_logger_level(self, log_level: str) -> None:
+        """
+        Change the logger's effective level at runtime.
+
+        :param log_level: The desired new log level.
+        :return: None
+        """
+
+        if self._logger is None:
+            self._log_level = log_level
+            self._app_logger.setLevel(log_level.upper())
+        else:
+            self._logger.change_logger_level(log_level)
+
+    def get_logger(self) -> Any:
+        """
+        Return the real carlogtt_python_library.Logger, creating it on
+        first use.
+
+        :return: The carlogtt_python_library.Logger instance.
+        """
+
+        if self._logger is None:
+            import carlogtt_python_library
+
+            self._app_logger.removeHandler(self._bootstrap_handler)
+            self._logger = carlogtt_python_library.Logger(
+                log_name=self._log_name,
+                log_fmt=self._log_fmt,
+                log_level=self._log_level,
+            )
+            self._logger.add_console_handler()
+            self._logger.change_logger_level(self._log_level)
+
+        return self._logger
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.get_logger(), name)
+
+
+class _BootstrapHandler(logging.Handler):
+    """
+    Handler attached until the real Logger exists. The first record it
+    receives creates the real Logger and is then replayed through the
+    real handlers.
+    """
+
+    def __init__(self, lazy_logger: _LazyLogger) -> None:
+        super().__init__()
+        self._lazy_logger = lazy_logger
+
+    def emit(self, record: logging.LogRecord) -> None:
+        logger = self._lazy_logger.get_logger()
+
+        for handler in logger.app_logger.handlers:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+
+master_logger = _LazyLogger(
     log_name=constants.CLI_NAME,
     log_fmt='%(levelname)-8s | %(asctime)s | %(filename)-20s:%(lineno)-3d | %(message)s',
     log_level='WARNING',
 )
-master_logger.add_console_handler()
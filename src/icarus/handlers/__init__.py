@@ -29,13 +29,19 @@
 # Importing required libraries and modules for the application.
 # ======================================================================
 
-# Local Application Imports
-from icarus.handlers.amazon_handler import *
-from icarus.handlers.builder_handler import *
-from icarus.handlers.global_handler import *
-from icarus.handlers.macos_handler import *
-from icarus.handlers.provision_handler import *
-from icarus.handlers.unison_handler import *
+# Standard Library Imports
+import importlib
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from icarus.handlers.amazon_handler import handle_amazon_command
+    from icarus.handlers.builder_handler import handle_builder_command
+    from icarus.handlers.daemon_handler import handle_daemon_command
+    from icarus.handlers.global_handler import handle_global_command
+    from icarus.handlers.macos_handler import handle_macos_command
+    from icarus.handlers.provision_handler import handle_provision_command
+    from icarus.handlers.unison_handler import handle_unison_command
 
 # END IMPORTS
 # ======================================================================
@@ -48,4 +54,26 @@
 # module_logger =
 
 # Type aliases
-#
+Handler = Callable[..., int]
+
+# Handler packages are imported on first access only, so that a command
+# never pays the import cost of the handlers it does not use
+_HANDLERS = {
+    'handle_amazon_command': 'icarus.handlers.amazon_handler',
+    'handle_builder_command': 'icarus.handlers.builder_handler',
+    'handle_daemon_command': 'icarus.handlers.daemon_handler',
+    'handle_global_command': 'icarus.handlers.global_handler',
+    'handle_macos_command': 'icarus.handlers.macos_handler',
+    'handle_provision_command': 'icarus.handlers.provision_handler',
+    'handle_unison_command': 'icarus.handlers.unison_handler',
+}
+
+
+def __getattr__(name: str) -> Handler:
+    if name not in _HANDLERS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    handler: Handler = getattr(importlib.import_module(_HANDLERS[name]), name)
+    globals()[name] = handler
+
+    return handler
@@ -34,9 +34,6 @@
 import json
 import subprocess
 
-# Third Party Library Imports
-import requests
-
 # Local Application Imports
 from icarus import config
 
@@ -63,6 +60,9 @@ def update_hots() -> int:
     :return: Exit code of the function.
     """
 
+    # Deferred import, requests is slow to import
+    import requests
+
     url = "https://dns.google/resolve?name=cpgbackup.logitech.com&type=A"
 
     response = requests.get(url)
@@ -0,0 +1,425 @@
+# ======================================================================
+# MODULE DETAILS
+# This section provides metadata about the module, including its
+# creation date, author, copyright information, and a brief description
+# of the module's purpose and functionality.
+# ======================================================================
+
+#   __|    \    _ \  |      _ \   __| __ __| __ __|
+#  (      _ \     /  |     (   | (_ |    |      |
+# \___| _/  _\ _|_\ ____| \___/ \___|   _|     _|
+
+# src/icarus/handlers/builder_handler/action_cache_helper.py
+# Created 10/19/26 - 2:40 AM UK Time (London) by carlogtt
+
+"""
+This module caches the results of the builder hooks.
+
+A hook result is keyed by a digest of everything the hook reads:
+
+    - the content of its input files, from the workspace index
+    - the config files of the tools (pyproject.toml, setup.cfg, ...)
+    - the tool executables found on PATH
+    - the packages installed in the farm the tools run from
+    - the interpreter version and the Icarus version
+
+The files are hashed once and their digests are kept in the control
+plane with their size, mtime and inode, so an unchanged file is never
+read again.
+
+Only the results of the runs that left their inputs unchanged are
+stored, so a hit replays exactly what running the hook again would
+print. For a checker that is every run that did not fail, for a writer
+it is the run that found nothing to fix.
+
+builder.sh runs it with `python -m` through the `lookup` and `store`
+subcommands.
+"""
+
+# ======================================================================
+# EXCEPTIONS
+# This section documents any exceptions made code or quality rules.
+# These exceptions may be necessary due to specific coding requirements
+# or to bypass false positives.
+# ======================================================================
+#
+
+# ======================================================================
+# IMPORTS
+# Importing required libraries and modules for the application.
+# ======================================================================
+
+# Standard Library Imports
+import argparse
+import dataclasses
+import hashlib
+import json
+import os
+import shutil
+import sys
+import time
+from collections.abc import Iterable
+from typing import Any, Optional
+
+# Local Application Imports
+from icarus import config
+
+# END IMPORTS
+# ======================================================================
+
+
+# List of public names in the module
+__all__ = [
+    'ActionResult',
+    'compute_action_key',
+    'lookup_action',
+    'store_action',
+]
+
+# Setting up logger for current module
+module_logger = config.master_logger.get_child_logger(__name__)
+
+# Type aliases
+#
+
+# Statuses that are stored, a failed run is always run again
+_STORED_STATUSES = ('passed', 'warned')
+
+# Input file suffixes of the hooks that only read python files, the
+# other hooks read every file of the workspace index
+_HOOK_INPUT_SUFFIXES = {
+    'isort': ('.py', '.pyi'),
+    'black': ('.py', '.pyi'),
+    'flake8': ('.py', '.pyi'),
+    'mypy': ('.py', '.pyi'),
+}
+
+# Config files of the tools, relative to the package root
+_CONFIG_FILENAMES = (
+    'pyproject.toml',
+    'setup.cfg',
+    '.flake8',
+    'tox.ini',
+    'mypy.ini',
+    '.isort.cfg',
+    'pytest.ini',
+)
+
+# Results kept per hook, the oldest ones are removed first
+_MAX_ENTRIES_PER_HOOK = 4
+
+_ACTION_CACHE_DIRNAME = 'action-cache'
+_FILE_DIGESTS_FILENAME = 'file-digests.json'
+
+# A file modified less than this before it was hashed may be modified
+# again within the same mtime tick, its digest is not kept
+_RACY_MTIME_NS = 2_000_000_000
+
+_READ_SIZE = 1024 * 1024
+
+
+@dataclasses.dataclass(kw_only=True)
+class ActionResult:
+    status: str
+    output_filepath: str
+
+
+def compute_action_key(
+    root: str,
+    hook: str,
+    filepaths: Iterable[str],
+    tools: Iterable[str] = (),
+    farm_info: Optional[str] = None,
+    interpreter: str = '',
+    extras: Iterable[str] = (),
+) -> str:
+    """
+    Compute the key of a hook run.
+
+    :param root: The package root.
+    :param hook: The hook name.
+    :param filepaths: The files of the workspace index, the ones the
+        hook does not read are left out.
+    :param tools: The executables of the hook, looked up on PATH.
+    :param farm_info: The packages manifest of the farm the tools run
+        from.
+    :param interpreter: The interpreter version and platform.
+    :param extras: Any other option of the hook run.
+    :return: The hex digest of the key.
+    """
+
+    suffixes = _HOOK_INPUT_SUFFIXES.get(hook)
+    file_digests = _FileDigests(_get_cache_dir(root))
+
+    inputs = hashlib.sha256()
+    for filepath in sorted(filepaths):
+        if suffixes is not None and not filepath.endswith(suffixes):
+            continue
+        digest = file_digests.get(filepath)
+        inputs.update(f"{os.path.relpath(filepath, root)}\0{digest}\0".encode())
+
+    key = {
+        'cli_version': config.CLI_VERSION,
+        'hook': hook,
+        'inputs': inputs.hexdigest(),
+        'configs': {name: file_digests.get(os.path.join(root, name)) for name in _CONFIG_FILENAMES},
+        'tools': {tool: _get_tool_signature(tool) for tool in sorted(set(tools))},
+        'farm_info': file_digests.get(farm_info) if farm_info else None,
+        'interpreter': interpreter,
+        'extras': sorted(extras),
+    }
+
+    file_digests.save()
+
+    return hashlib.sha256(json.dumps(key, sort_keys=True).encode()).hexdigest()
+
+
+def lookup_action(root: str, hook: str, key: str) -> Optional[ActionResult]:
+    """
+    Look up the stored result of a hook run.
+
+    :param root: The package root.
+    :param hook: The hook name.
+    :param key: The key of the run.
+    :return: The ActionResult, or None on a miss.
+    """
+
+    entry_path = os.path.join(_get_cache_dir(root), hook, key)
+
+    try:
+        with open(f"{entry_path}.json", 'r') as entry_file:
+            entry = json.load(entry_file)
+    except (OSError, ValueError):
+        return None
+
+    if (
+        not isinstance(entry, dict)
+        or entry.get('status') not in _STORED_STATUSES
+        or not os.path.isfile(f"{entry_path}.out")
+    ):
+        return None
+
+    # Recently used entries are the last ones evicted
+    try:
+        os.utime(f"{entry_path}.json")
+    except OSError:
+        pass
+
+    return ActionResult(status=entry['status'], output_filepath=f"{entry_path}.out")
+
+
+def store_action(root: str, hook: str, key: str, status: str, output: bytes) -> bool:
+    """
+    Store the result of a hook run, the failed runs are not stored.
+
+    :param root: The package root.
+    :param hook: The hook name.
+    :param key: The key of the run.
+    :param status: 'passed', 'warned' or 'failed'.
+    :param output: The output of the run.
+    :return: True if the result was stored.
+    """
+
+    if status not in _STORED_STATUSES:
+        return False
+
+    hook_dir = os.path.join(_get_cache_dir(root), hook)
+    entry_path = os.path.join(hook_dir, key)
+    os.makedirs(hook_dir, exist_ok=True)
+
+    # The output first, an entry is only complete with its json file
+    _write_atomically(f"{entry_path}.out", output)
+    _write_atomically(f"{entry_path}.json", json.dumps({'status': status}).encode())
+
+    entries = sorted(
+        (e for e in os.scandir(hook_dir) if e.name.endswith('.json')),
+        key=lambda e: e.stat().st_mtime_ns,
+        reverse=True,
+    )
+    for entry in entries[_MAX_ENTRIES_PER_HOOK:]:
+        for suffix in ('.json', '.out'):
+            try:
+                os.remove(entry.path.removesuffix('.json') + suffix)
+            except FileNotFoundError:
+                pass
+
+    return True
+
+
+class _FileDigests:
+    """
+    The sha256 of the files, kept with their size, mtime and inode and
+    computed again only when one of them changed.
+    """
+
+    def __init__(self, cache_dir: str) -> None:
+        self._filepath = os.path.join(cache_dir, _FILE_DIGESTS_FILENAME)
+        self._racy_mtime_ns = time.time_ns() - _RACY_MTIME_NS
+        self._is_changed = False
+
+        try:
+            with open(self._filepath, 'r') as digests_file:
+                digests = json.load(digests_file)
+        except (OSError, ValueError):
+            digests = {}
+
+        self._digests: dict[str, list[Any]] = digests if isinstance(digests, dict) else {}
+
+    def get(self, filepath: str) -> Optional[str]:
+        """
+        Return the digest of a file.
+
+        :param filepath: The file.
+        :return: The sha256 hex digest, or None if the file cannot be
+            read.
+        """
+
+        try:
+            stat = os.stat(filepath)
+        except OSError:
+            return None
+
+        signature = [stat.st_size, stat.st_mtime_ns, stat.st_ino]
+        cached = self._digests.get(filepath)
+        if isinstance(cached, list) and cached[:3] == signature:
+            return str(cached[3])
+
+        digest = hashlib.sha256()
+        try:
+            with open(filepath, 'rb') as input_file:
+                while chunk := input_file.read(_READ_SIZE):
+                    digest.update(chunk)
+        except OSError:
+            return None
+
+        self._is_changed = True
+        if stat.st_mtime_ns < self._racy_mtime_ns:
+            self._digests[filepath] = [*signature, digest.hexdigest()]
+        else:
+            self._digests.pop(filepath, None)
+
+        return digest.hexdigest()
+
+    def save(self) -> None:
+        """
+        Persist the digests when some were computed, the ones of the
+        files that no longer exist are dropped.
+
+        :return: None
+        """
+
+        if not self._is_changed:
+            return
+
+        digests = {p: d for p, d in self._digests.items() if os.path.exists(p)}
+
+        try:
+            os.makedirs(os.path.dirname(self._filepath), exist_ok=True)
+            _write_atomically(self._filepath, json.dumps(digests).encode())
+        except OSError as e:
+            module_logger.debug(f"Failed to persist the file digests -- {repr(e)}")
+
+
+def _get_tool_signature(tool: str) -> Optional[list[Any]]:
+    """
+    Identify a tool executable without running it.
+
+    :param tool: The executable name.
+    :return: The resolved path, size and mtime of the executable, or
+        None if it is not on PATH.
+    """
+
+    tool_path = shutil.which(tool)
+    if tool_path is None:
+        return None
+
+    tool_path = os.path.realpath(tool_path)
+    try:
+        stat = os.stat(tool_path)
+    except OSError:
+        return None
+
+    return [tool_path, stat.st_size, stat.st_mtime_ns]
+
+
+def _get_cache_dir(root: str) -> str:
+    return os.path.join(root, config.ICARUS_CONTROL_PLANE_DIRNAME, _ACTION_CACHE_DIRNAME)
+
+
+def _write_atomically(filepath: str, data: bytes) -> None:
+    tmp_filepath = f"{filepath}.{os.getpid()}.tmp"
+    with open(tmp_filepath, 'wb') as tmp_file:
+        tmp_file.write(data)
+    os.replace(tmp_filepath, filepath)
+
+
+def _read_filepaths(files_from: str) -> list[str]:
+    with open(files_from, 'rb') as files_from_file:
+        return [os.fsdecode(p) for p in files_from_file.read().split(b'\0') if p]
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """
+    Entry point used by builder.sh.
+
+    lookup prints three lines: the key, the stored status and the
+    stored output file, the last two are empty on a miss. store only
+    stores the result when the key is still the one looked up before
+    the run.
+
+    :param argv: The command line arguments.
+    :return: Exit code of the script.
+    """
+
+    parser = argparse.ArgumentParser(prog=f"{config.CLI_NAME}-action-cache-helper")
+    subparsers = parser.add_subparsers(dest='action_cache_command', required=True)
+
+    key_parser = argparse.ArgumentParser(add_help=False)
+    key_parser.add_argument('--root', required=True)
+    key_parser.add_argument('--hook', required=True)
+    key_parser.add_argument('--files-from', required=True)
+    key_parser.add_argument('--tool', action='append', default=[])
+    key_parser.add_argument('--farm-info', default=None)
+    key_parser.add_argument('--interpreter', default='')
+    key_parser.add_argument('--extra', action='append', default=[])
+
+    subparsers.add_parser('lookup', parents=[key_parser])
+
+    store_parser = subparsers.add_parser('store', parents=[key_parser])
+    store_parser.add_argument('--before-key', required=True)
+    store_parser.add_argument('--status', choices=('passed', 'warned', 'failed'), required=True)
+    store_parser.add_argument('--output-file', required=True)
+
+    args = parser.parse_args(argv)
+
+    try:
+        key = compute_action_key(
+            root=args.root,
+            hook=args.hook,
+            filepaths=_read_filepaths(args.files_from),
+            tools=args.tool,
+            farm_info=args.farm_info,
+            interpreter=args.interpreter,
+            extras=args.extra,
+        )
+
+        if args.action_cache_command == 'lookup':
+            result = lookup_action(args.root, args.hook, key)
+            print(key)
+            print(result.status if result else '')
+            print(result.output_filepath if result else '')
+            return 0
+
+        if key == args.before_key:
+            with open(args.output_file, 'rb') as output_file:
+                store_action(args.root, args.hook, key, args.status, output_file.read())
+
+    except OSError as e:
+        print(f"Failed to {args.action_cache_command} '{args.hook}' -- {repr(e)}", file=sys.stderr)
+        return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
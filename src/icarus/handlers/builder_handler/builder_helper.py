@@ -31,27 +31,22 @@
 
 # Standard Library Imports
 import argparse
+import copy
 import datetime
 import errno
 import fcntl
 import getpass
+import hashlib
 import json
 import os
 import pathlib
-import re
+import tempfile
 import time
-import tomllib
-from typing import IO, Optional, Union
-
-# Third Party Library Imports
-import requests
-import yaml
-
-# My Library Imports
-import carlogtt_python_library as mylib
+from typing import IO, Any, Optional, Union
 
 # Local Application Imports
 from icarus import config, utils
+from icarus.handlers.builder_handler import python_version_helper
 from icarus.handlers.builder_handler.model import (
     BuildSystems,
     IcarusBuilderArg,
@@ -73,11 +68,37 @@
     'parse_icarus_builder_cli_arg',
     'get_ib_arg',
     'get_ib_argv',
+    'preload_compiled_cfg',
 ]
 
 # Setting up logger for current module
 module_logger = config.master_logger.get_child_logger(__name__)
 
+# Fields never stored in the compiled config cache
+_COMPILED_CFG_EXCLUDED_FIELDS = frozenset({
+    'all_hooks',
+    'platform_identifier',
+    'cli_python_executable',
+    'run_log_filepath',
+})
+
+# Compiled configs already loaded by this process, by compiled config
+# file path, with their key and IcarusBuilderArg fields
+_compiled_cfg_memo: dict[str, tuple[dict[str, Any], dict[str, Any]]] = {}
+
+# How the builder indexes the package root, the first is the default
+_WORKSPACE_INDEX_MODES = ('walk', 'git')
+
+# Farms that can be precompiled, same names as the path.sh farm graphs
+_PRECOMPILE_FARMS = (
+    'tool',
+    'pkg',
+    'run',
+    'run_excluderoot',
+    'devrun',
+    'devrun_excluderoot',
+)
+
 
 def ensure_builder_control_plane() -> None:
     """
@@ -231,8 +252,9 @@ def parse_icarus_builder_cli_arg(args: argparse.Namespace) -> IcarusBuilderCliAr
     standalone_arg = '{hook} is a standalone argument and must be used alone'
     release_only_arg = '{hook} can only be used with the release target and nothing else'
 
-    base_args: dict[str, Union[int]] = {
+    base_args: dict[str, Union[int, str]] = {
         'verbose': args.verbose,
+        'refresh': getattr(args, 'refresh', ''),
     }
 
     builder_hooks: dict[str, Union[str, list[str]]] = {
@@ -276,10 +298,18 @@ def parse_icarus_builder_cli_arg(args: argparse.Namespace) -> IcarusBuilderCliAr
         'cache_size': (
             args.cache_subcommands if getattr(args, 'cache_subcommands', '') == 'size' else ''
         ),
+        'cache_gc': (
+            args.cache_subcommands if getattr(args, 'cache_subcommands', '') == 'gc' else ''
+        ),
     }
 
     cache_hooks_count = sum(1 for el in cache_hooks.values() if el)
 
+    cache_options: dict[str, Union[str, list[str]]] = {
+        'cache_verify': getattr(args, 'verify', ''),
+        'cache_max_size': getattr(args, 'max_size', ''),
+    }
+
     path_hooks: dict[str, Union[str, list[str]]] = {
         'list_paths': getattr(args, 'list', ''),
         'path_name': getattr(args, 'path_name', ''),
@@ -311,7 +341,7 @@ def parse_icarus_builder_cli_arg(args: argparse.Namespace) -> IcarusBuilderCliAr
             raise utils.IcarusParserException(too_many_args)
 
         ib_cli_arg.operation = IcarusBuilderOperation.CACHE
-        ib_cli_arg.args = {**base_args, **builder_hooks, **cache_hooks}
+        ib_cli_arg.args = {**base_args, **builder_hooks, **cache_hooks, **cache_options}
 
     elif args.builder_command == 'path':
         if path_hooks_count == 0:
@@ -380,11 +410,23 @@ def get_ib_arg(cli_ib_arg: dict[str, Union[int, str, list[str]]]) -> IcarusBuild
     ib_arg = IcarusBuilderArg()
 
     _read_icarus_build_cfg(ib_arg)
-    _parse_icarus_build_cfg(ib_arg)
-    _validate_icarus_build_cfg(ib_arg)
-    _parse_pyproject_toml(ib_arg)
+
+    compiled_cfg_key = _get_compiled_icarus_build_cfg_key(ib_arg)
+    compiled_cfg = _load_compiled_icarus_build_cfg(ib_arg, compiled_cfg_key)
+
+    if compiled_cfg is not None:
+        ib_arg = compiled_cfg
+    else:
+        _parse_icarus_build_cfg(ib_arg)
+        _validate_icarus_build_cfg(ib_arg)
+        _parse_pyproject_toml(ib_arg)
+        _normalize_and_set_defaults_icarus_build_cfg(ib_arg)
+        _store_compiled_icarus_build_cfg(ib_arg, compiled_cfg_key)
+
+    # Floating python versions are resolved on every call, against the
+    # python versions cache, so that new patch releases are picked up
+    # even when the config files have not changed.
     _process_cli_ib_args(ib_arg, cli_ib_arg)
-    _normalize_and_set_defaults_icarus_build_cfg(ib_arg)
     _normalize_and_set_python_version(ib_arg)
 
     return ib_arg
@@ -405,6 +447,23 @@ def get_ib_argv(cli_ib_arg: dict[str, Union[int, str, list[str]]]) -> str:
     return ib_argv
 
 
+def preload_compiled_cfg(cwd: str) -> None:
+    """
+    Load the compiled config of the project containing cwd in memory,
+    get_ib_arg then only checks its key. The daemon calls it before
+    forking, so its children start with the config already parsed.
+
+    :param cwd: A directory of the project.
+    :return: None
+    :raise IcarusParserException: If cwd is not in a project.
+    """
+
+    ib_arg = IcarusBuilderArg()
+
+    _read_icarus_build_cfg(ib_arg, cwd)
+    _load_compiled_icarus_build_cfg(ib_arg, _get_compiled_icarus_build_cfg_key(ib_arg))
+
+
 def _process_cli_ib_args(
     ib_arg: IcarusBuilderArg, cli_ib_arg: dict[str, Union[int, str, list[str]]]
 ) -> None:
@@ -420,6 +479,9 @@ def _process_cli_ib_args(
     if cli_ib_arg.get('verbose'):
         ib_arg.verbose = 'Y'
 
+    if cli_ib_arg.get('refresh'):
+        ib_arg.refresh = 'Y'
+
     if cli_ib_arg.get('exectool'):
         assert not isinstance(cli_ib_arg['exectool'], int)
         if len(cli_ib_arg['exectool']) == 1:
@@ -579,17 +641,156 @@ def _process_cli_ib_args(
         ib_arg.cache_clean = 'Y'
     if cli_ib_arg.get('cache_size'):
         ib_arg.cache_size = 'Y'
+    if cli_ib_arg.get('cache_gc'):
+        ib_arg.cache_gc = 'Y'
+    if cli_ib_arg.get('cache_verify'):
+        ib_arg.cache_verify = 'Y'
+    if cli_ib_arg.get('cache_max_size'):
+        assert isinstance(cli_ib_arg['cache_max_size'], str)
+        ib_arg.cache_max_size = cli_ib_arg['cache_max_size']
+
+
+def _get_compiled_icarus_build_cfg_filepath(ib_arg: IcarusBuilderArg) -> pathlib.Path:
+    """
+    Return the path of the compiled config cache file.
+
+    :param ib_arg: The IcarusBuilderArg object.
+    :return: The compiled config cache file path.
+    """
+
+    return (
+        pathlib.Path(ib_arg.project_root_dir_abs)
+        / config.ICARUS_CONTROL_PLANE_DIRNAME
+        / config.ICARUS_COMPILED_CFG_FILENAME
+    )
+
+
+def _get_compiled_icarus_build_cfg_key(ib_arg: IcarusBuilderArg) -> dict[str, Any]:
+    """
+    Compute the key of the compiled config cache.
+    The key is made of size, mtime and content hash of the config input
+    files, the project location and the Icarus version.
+
+    :param ib_arg: The IcarusBuilderArg object.
+    :return: The compiled config cache key.
+    """
+
+    inputs: dict[str, Any] = {}
+
+    for filepath in (
+        ib_arg.icarus_config_filepath,
+        os.path.join(ib_arg.project_root_dir_abs, 'pyproject.toml'),
+    ):
+        try:
+            with open(filepath, 'rb') as input_file:
+                stat = os.fstat(input_file.fileno())
+                digest = hashlib.sha256(input_file.read()).hexdigest()
+        except OSError:
+            inputs[filepath] = None
+            continue
+
+        inputs[filepath] = {
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+            'sha256': digest,
+        }
+
+    return {
+        'cli_version': config.CLI_VERSION,
+        'project_root_dir_abs': ib_arg.project_root_dir_abs,
+        'inputs': inputs,
+    }
+
+
+def _load_compiled_icarus_build_cfg(
+    ib_arg: IcarusBuilderArg, compiled_cfg_key: dict[str, Any]
+) -> Optional[IcarusBuilderArg]:
+    """
+    Load the compiled config from the cache when the key still matches.
+
+    :param ib_arg: The IcarusBuilderArg object.
+    :param compiled_cfg_key: The current compiled config cache key.
+    :return: The cached IcarusBuilderArg object or None on a cache miss.
+    """
+
+    compiled_cfg_filepath = str(_get_compiled_icarus_build_cfg_filepath(ib_arg))
+
+    memo = _compiled_cfg_memo.get(compiled_cfg_filepath)
+    if memo is not None and memo[0] == compiled_cfg_key:
+        return IcarusBuilderArg(**copy.deepcopy(memo[1]))
+
+    try:
+        with open(compiled_cfg_filepath, 'r') as compiled_cfg_file:
+            compiled_cfg = json.load(compiled_cfg_file)
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(compiled_cfg, dict) or compiled_cfg.get('key') != compiled_cfg_key:
+        return None
+
+    try:
+        cached_ib_arg = IcarusBuilderArg(**copy.deepcopy(compiled_cfg['ib_arg']))
+    except (KeyError, TypeError):
+        return None
+
+    _compiled_cfg_memo[compiled_cfg_filepath] = (compiled_cfg_key, compiled_cfg['ib_arg'])
+
+    return cached_ib_arg
+
+
+def _store_compiled_icarus_build_cfg(
+    ib_arg: IcarusBuilderArg, compiled_cfg_key: dict[str, Any]
+) -> None:
+    """
+    Atomically store the compiled config in the cache.
+    Only the fields derived from the config files are stored, per
+    invocation fields are always computed from the CLI arguments.
+    Failing to store the compiled config is not fatal.
+
+    :param ib_arg: The IcarusBuilderArg object.
+    :param compiled_cfg_key: The current compiled config cache key.
+    :return: None
+    """
+
+    compiled_cfg_filepath = _get_compiled_icarus_build_cfg_filepath(ib_arg)
+    default_ib_arg = IcarusBuilderArg().as_dict()
 
+    compiled_cfg = {
+        'key': compiled_cfg_key,
+        'ib_arg': {
+            k: v
+            for k, v in ib_arg.as_dict().items()
+            if k not in _COMPILED_CFG_EXCLUDED_FIELDS and v != default_ib_arg[k]
+        },
+    }
 
-def _read_icarus_build_cfg(ib_arg: IcarusBuilderArg) -> None:
+    try:
+        compiled_cfg_filepath.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_filepath = tempfile.mkstemp(
+            dir=compiled_cfg_filepath.parent, prefix=f".{compiled_cfg_filepath.name}-"
+        )
+        try:
+            with os.fdopen(fd, 'w') as tmp_file:
+                json.dump(compiled_cfg, tmp_file)
+            os.replace(tmp_filepath, compiled_cfg_filepath)
+        except BaseException:
+            os.unlink(tmp_filepath)
+            raise
+    except OSError as e:
+        module_logger.debug(f"Unable to write {compiled_cfg_filepath} -- {repr(e)}")
+
+
+def _read_icarus_build_cfg(ib_arg: IcarusBuilderArg, cwd: Optional[str] = None) -> None:
     """
     Read the icarus build config file.
 
     :param ib_arg: The IcarusBuilderArg object to be updated.
+    :param cwd: The directory to search the project from, the current
+        working directory if None.
     :return:
     """
 
-    project_root_dir_abs = _find_project_root_dir()
+    project_root_dir_abs = _find_project_root_dir(cwd)
     config_filepath = os.path.join(project_root_dir_abs, config.ICARUS_CFG_FILENAME)
 
     ib_arg.icarus_config_filename = config.ICARUS_CFG_FILENAME
@@ -606,6 +807,9 @@ def _parse_icarus_build_cfg(ib_arg: IcarusBuilderArg) -> None:
     :return:
     """
 
+    # Deferred import, yaml is only needed on a compiled config miss
+    import yaml
+
     try:
         with open(ib_arg.icarus_config_filepath) as icarus_build_config:
             ibc = yaml.safe_load(icarus_build_config)
@@ -645,6 +849,16 @@ def _parse_icarus_build_cfg(ib_arg: IcarusBuilderArg) -> None:
     except Exception:
         pass
 
+    try:
+        ib_arg.build_jobs = [d['jobs'] for d in bs if d.get('jobs')][0]
+    except Exception:
+        pass
+
+    try:
+        ib_arg.workspace_index = [d['workspace-index'] for d in bs if d.get('workspace-index')][0]
+    except Exception:
+        pass
+
     try:
         ib_arg.python_version_default_for_icarus = [
             d['python-default'] for d in ipy if d.get('python-default')
@@ -679,6 +893,11 @@ def _parse_icarus_build_cfg(ib_arg: IcarusBuilderArg) -> None:
     except Exception:
         pass
 
+    try:
+        ib_arg.precompile_farms = [d['precompile'] for d in ipy if d.get('precompile')][0]
+    except Exception:
+        pass
+
     try:
         read_the_docs_dict = [d['read-the-docs'] for d in ipy if d.get('read-the-docs')][0]
         ib_arg.read_the_docs_requirements_path = [
@@ -760,6 +979,29 @@ def _validate_icarus_build_cfg(ib_arg: IcarusBuilderArg) -> None:
                 f'build-root in build-system {config.ICARUS_CFG_FILENAME} must be a string'
             )
 
+    if not ib_arg.build_jobs:
+        # not a mandatory field
+        pass
+    else:
+        if (
+            not isinstance(ib_arg.build_jobs, int)
+            or isinstance(ib_arg.build_jobs, bool)
+            or ib_arg.build_jobs < 1
+        ):
+            raise utils.IcarusParserException(
+                f'jobs in build-system {config.ICARUS_CFG_FILENAME} must be a positive integer'
+            )
+
+    if not ib_arg.workspace_index:
+        # not a mandatory field
+        pass
+    else:
+        if ib_arg.workspace_index not in _WORKSPACE_INDEX_MODES:
+            raise utils.IcarusParserException(
+                f'workspace-index in build-system {config.ICARUS_CFG_FILENAME} must be one of'
+                f' {", ".join(_WORKSPACE_INDEX_MODES)}'
+            )
+
     if ib_arg.build_system_in_use == BuildSystems.ICARUS_PYTHON3.value:
         if not ib_arg.python_versions_for_icarus:
             raise utils.IcarusParserException(
@@ -856,6 +1098,22 @@ def _validate_icarus_build_cfg(ib_arg: IcarusBuilderArg) -> None:
                     f' {config.ICARUS_CFG_FILENAME} must be a list of strings'
                 )
 
+        if not ib_arg.precompile_farms:
+            # not a mandatory field
+            pass
+        elif isinstance(ib_arg.precompile_farms, list):
+            if not all(v in _PRECOMPILE_FARMS for v in ib_arg.precompile_farms):
+                raise utils.IcarusParserException(
+                    f'All precompile farms in {BuildSystems.ICARUS_PYTHON3.value}'
+                    f' {config.ICARUS_CFG_FILENAME} must be one of: {", ".join(_PRECOMPILE_FARMS)}'
+                )
+        else:
+            if not isinstance(ib_arg.precompile_farms, list):
+                raise utils.IcarusParserException(
+                    f'precompile in {BuildSystems.ICARUS_PYTHON3.value}'
+                    f' {config.ICARUS_CFG_FILENAME} must be a list of strings'
+                )
+
         if not ib_arg.read_the_docs_requirements_path:
             # not a mandatory field
             pass
@@ -904,6 +1162,9 @@ def _parse_pyproject_toml(ib_arg: IcarusBuilderArg) -> None:
     :return:
     """
 
+    # Deferred import, tomllib is only needed on a compiled config miss
+    import tomllib
+
     pyproject_toml_filepath = os.path.join(ib_arg.project_root_dir_abs, 'pyproject.toml')
 
     try:
@@ -929,6 +1190,9 @@ def _normalize_and_set_defaults_icarus_build_cfg(ib_arg: IcarusBuilderArg) -> No
     :return:
     """
 
+    # Deferred import, the library is slow to import
+    import carlogtt_python_library as mylib
+
     stru = mylib.StringUtils()
 
     # Add pkg name snake anf dashed
@@ -948,9 +1212,14 @@ def _normalize_and_set_defaults_icarus_build_cfg(ib_arg: IcarusBuilderArg) -> No
         set(ib_arg.python_versions_for_icarus), key=_sort_version, reverse=True
     )
     ib_arg.icarus_ignore_array = list(set(ib_arg.icarus_ignore_array))
+    # Bash only receives strings, an empty string lets the builder size
+    # the worker pool on the cpu count
+    ib_arg.build_jobs = str(ib_arg.build_jobs) if ib_arg.build_jobs else ''
+    ib_arg.workspace_index = ib_arg.workspace_index or _WORKSPACE_INDEX_MODES[0]
     ib_arg.tool_requirements_paths = list(set(ib_arg.tool_requirements_paths))
     ib_arg.run_requirements_paths = list(set(ib_arg.run_requirements_paths))
     ib_arg.dev_requirements_paths = list(set(ib_arg.dev_requirements_paths))
+    ib_arg.precompile_farms = sorted(set(ib_arg.precompile_farms))
 
 
 def _normalize_and_set_python_version(ib_arg: IcarusBuilderArg) -> None:
@@ -964,7 +1233,7 @@ def _normalize_and_set_python_version(ib_arg: IcarusBuilderArg) -> None:
     if ib_arg.build_system_in_use == BuildSystems.ICARUS_PYTHON3.value:
         if len(ib_arg.python_version_default_for_icarus.split('.')) == 2:
             ib_arg.python_default_version = ib_arg.python_version_default_for_icarus
-            ib_arg.python_default_full_version = _get_latest_python_version(
+            ib_arg.python_default_full_version = python_version_helper.get_latest_python_version(
                 ib_arg.python_default_version
             )
         elif len(ib_arg.python_version_default_for_icarus.split('.')) == 3:
@@ -979,7 +1248,7 @@ def _normalize_and_set_python_version(ib_arg: IcarusBuilderArg) -> None:
         for v in ib_arg.python_versions_for_icarus:
             if len(v.split('.')) == 2:
                 short_version = v
-                full_version = _get_latest_python_version(v)
+                full_version = python_version_helper.get_latest_python_version(v)
             elif len(v.split('.')) == 3:
                 short_version = '.'.join(v.split('.')[:2])
                 full_version = v
@@ -991,14 +1260,16 @@ def _normalize_and_set_python_version(ib_arg: IcarusBuilderArg) -> None:
         ]
 
 
-def _find_project_root_dir() -> str:
+def _find_project_root_dir(cwd: Optional[str] = None) -> str:
     """
     Find the project root directory containing the icarus config file.
 
+    :param cwd: The directory to search from, the current working
+        directory if None.
     :return: Absolute path to the project root directory.
     """
 
-    pwd = os.getcwd()
+    pwd = cwd or os.getcwd()
     while True:
         if os.path.exists(os.path.join(pwd, config.ICARUS_CFG_FILENAME)):
             return pwd
@@ -1014,35 +1285,6 @@ def _find_project_root_dir() -> str:
     )
 
 
-def _get_latest_python_version(python_version: str) -> str:
-    """
-    Get the latest python full version for the given python version.
-
-    :param python_version: The python version.
-    :return:
-    """
-
-    given_major, given_minor = python_version.split('.')
-    given_patch = 0
-
-    reg = re.compile(r'(\d+)\.(\d+)\.(\d+)')
-
-    response = requests.get('https://www.python.org/ftp/python/')
-
-    for version in set(reg.findall(response.text)):
-        major = version[0]
-        minor = version[1]
-        patch = version[2]
-        if major != given_major:
-            continue
-        if minor != given_minor:
-            continue
-        if int(patch) > given_patch:
-            given_patch = int(patch)
-
-    return f"{given_major}.{given_minor}.{given_patch}"
-
-
 def _sort_version(v):
     """
     Sort version.
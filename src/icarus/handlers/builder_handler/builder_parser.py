@@ -34,8 +34,13 @@
 
 # Local Application Imports
 from icarus import config, utils
-from icarus.handlers.builder_handler import builder_helper, create_helper, update_version_helper
-from icarus.handlers.builder_handler.model import IcarusBuilderOperation
+from icarus.handlers.builder_handler import (
+    builder_helper,
+    create_helper,
+    path_helper,
+    update_version_helper,
+)
+from icarus.handlers.builder_handler.model import BuildSystems, IcarusBuilderOperation
 
 # END IMPORTS
 # ======================================================================
@@ -102,6 +107,29 @@ def handle_builder_command(args: argparse.Namespace) -> int:
     elif ib_cli.operation is IcarusBuilderOperation.PATH:
         module_logger.debug(f"Running {args.builder_command=}")
 
+        # Static recipes only read the build config, they need neither
+        # the builder lock nor path.sh
+        if path_helper.is_static_path(ib_cli.args):
+            ib_arg = builder_helper.get_ib_arg(ib_cli.args)
+
+            if ib_arg.build_system_in_use == BuildSystems.ICARUS_PYTHON3.value:
+                print(path_helper.get_static_path(ib_arg))
+
+                return 0
+
+        # Farm NAME and VERSION recipes of a ready farm only read its
+        # packages manifest
+        if path_helper.is_packages_path(ib_cli.args):
+            ib_arg = builder_helper.get_ib_arg(ib_cli.args)
+
+            if ib_arg.build_system_in_use == BuildSystems.ICARUS_PYTHON3.value:
+                response = path_helper.get_packages_path(ib_arg)
+
+                if response is not None:
+                    print(response)
+
+                    return 0
+
         builder_helper.ensure_builder_control_plane()
         builder_lock = builder_helper.acquire_builder_lock()
 
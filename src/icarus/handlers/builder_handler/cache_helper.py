@@ -0,0 +1,526 @@
+# ======================================================================
+# MODULE DETAILS
+# This section provides metadata about the module, including its
+# creation date, author, copyright information, and a brief description
+# of the module's purpose and functionality.
+# ======================================================================
+
+#   __|    \    _ \  |      _ \   __| __ __| __ __|
+#  (      _ \     /  |     (   | (_ |    |      |
+# \___| _/  _\ _|_\ ____| \___/ \___|   _|     _|
+
+# src/icarus/handlers/builder_handler/cache_helper.py
+# Created 10/18/26 - 11:25 PM UK Time (London) by carlogtt
+
+"""
+This module keeps the index of the shared builder cache and evicts the
+least recently used entries.
+
+The index is a JSON file in the cache root that records, for every
+entry, its kind, size, last access time and the projects using it:
+
+    CPython/<tarball>              runtime-tarball
+    runtime-store/<key>            runtime
+    store/<key>/<sha256>           package
+
+The helpers that use an entry record the access when they are given the
+cache root, so `size` answers from the index without walking the cache.
+`size --verify` and `gc` rescan the cache layout, add the entries the
+index does not know yet and drop the ones that are gone.
+
+The entries are evicted through the helper that owns them, under the
+same lock the helper holds while using them. The package and runtime
+entries are hardlinked into the farms and the project runtimes, so an
+entry with files still linked outside of it frees nothing and is kept.
+
+cache.sh runs it with `python -m` through the `size` and `gc`
+subcommands.
+"""
+
+# ======================================================================
+# EXCEPTIONS
+# This section documents any exceptions made code or quality rules.
+# These exceptions may be necessary due to specific coding requirements
+# or to bypass false positives.
+# ======================================================================
+#
+
+# ======================================================================
+# IMPORTS
+# Importing required libraries and modules for the application.
+# ======================================================================
+
+# Standard Library Imports
+import argparse
+import contextlib
+import dataclasses
+import fcntl
+import json
+import os
+import re
+import sys
+import time
+from collections.abc import Iterable, Iterator
+from typing import Any, Optional
+
+# Local Application Imports
+from icarus import config
+
+# END IMPORTS
+# ======================================================================
+
+
+# List of public names in the module
+__all__ = [
+    'CacheGcReport',
+    'record_access',
+    'get_cache_size',
+    'collect_garbage',
+    'parse_size',
+    'format_size',
+]
+
+# Setting up logger for current module
+module_logger = config.master_logger.get_child_logger(__name__)
+
+# Type aliases
+CacheEntry = dict[str, Any]
+CacheIndex = dict[str, CacheEntry]
+
+# Evicted first when two entries were last used at the same time, a
+# package or a tarball is cheaper to get back than an unpacked runtime
+_KINDS = ('package', 'runtime-tarball', 'runtime')
+
+_SIZE_RE = re.compile(r'(\d+(?:\.\d+)?)\s*(?:([KMGT])i?)?B?', re.IGNORECASE)
+_SIZE_UNITS = ('', 'K', 'M', 'G', 'T')
+
+
+@dataclasses.dataclass(kw_only=True)
+class CacheGcReport:
+    removed: list[str] = dataclasses.field(default_factory=list)
+    in_use: list[str] = dataclasses.field(default_factory=list)
+    freed_bytes: int = 0
+    size_bytes: int = 0
+
+
+def record_access(
+    cache_root: str,
+    entry_paths: Iterable[str],
+    owner: str,
+    refresh: bool = False,
+) -> None:
+    """
+    Record that a project used some cache entries.
+
+    The size of an entry is computed the first time it is recorded, or
+    again when refresh is set because the entry was just populated.
+    Paths that are not cache entries or do not exist are ignored.
+
+    :param cache_root: The builder cache directory.
+    :param entry_paths: The paths of the entries used.
+    :param owner: The project using the entries.
+    :param refresh: Whether to compute the sizes again.
+    :return: None
+    """
+
+    now = int(time.time())
+
+    with _index_lock(cache_root):
+        index = _read_index(cache_root)
+
+        for entry_path in entry_paths:
+            relpath = os.path.relpath(os.path.abspath(entry_path), os.path.abspath(cache_root))
+            kind = _get_kind(relpath)
+            if kind is None or not os.path.lexists(entry_path):
+                module_logger.debug(f"Not a cache entry {entry_path=}")
+                continue
+
+            entry = index.setdefault(relpath, {'kind': kind, 'owners': []})
+            if refresh or 'size' not in entry:
+                entry['size'] = _get_size(os.path.join(cache_root, relpath))
+            entry['last_access'] = now
+            if owner and owner not in entry['owners']:
+                entry['owners'] = sorted([*entry['owners'], owner])
+
+        _write_index(cache_root, index)
+
+
+def get_cache_size(cache_root: str, verify: bool = False) -> dict[str, int]:
+    """
+    Get the size of the cache by entry kind.
+
+    :param cache_root: The builder cache directory.
+    :param verify: Whether to rescan the cache and measure every entry
+        instead of answering from the index.
+    :return: The size in bytes of every kind.
+    """
+
+    with _index_lock(cache_root):
+        index = _read_index(cache_root)
+        if verify:
+            index = _rescan(cache_root, index, measure=True)
+            _write_index(cache_root, index)
+
+    sizes = {kind: 0 for kind in _KINDS}
+    for relpath, entry in index.items():
+        # Entries removed behind the index back, e.g. by the store gc
+        if verify or os.path.lexists(os.path.join(cache_root, relpath)):
+            sizes[entry['kind']] += entry['size']
+
+    return sizes
+
+
+def collect_garbage(cache_root: str, max_size: Optional[int] = None) -> CacheGcReport:
+    """
+    Reconcile the index with the cache and evict the least recently
+    used entries until the cache fits in max_size, skipping the entries
+    still hardlinked into a farm or a project runtime.
+
+    :param cache_root: The builder cache directory.
+    :param max_size: The maximum size of the cache in bytes, nothing is
+        evicted when it is None.
+    :return: The CacheGcReport of the run.
+    """
+
+    report = CacheGcReport()
+
+    with _index_lock(cache_root):
+        index = _rescan(cache_root, _read_index(cache_root), measure=False)
+        report.size_bytes = sum(entry['size'] for entry in index.values())
+
+        if max_size is not None:
+            lru = sorted(
+                index.items(),
+                key=lambda item: (item[1]['last_access'], _KINDS.index(item[1]['kind'])),
+            )
+            for relpath, entry in lru:
+                if report.size_bytes <= max_size:
+                    break
+                reclaimable = _get_reclaimable_size(os.path.join(cache_root, relpath))
+                if reclaimable is None:
+                    report.in_use.append(relpath)
+                    continue
+                _remove_entry(cache_root, relpath, entry['kind'])
+                del index[relpath]
+                report.removed.append(relpath)
+                report.freed_bytes += reclaimable
+                report.size_bytes -= entry['size']
+
+        _write_index(cache_root, index)
+
+    return report
+
+
+def parse_size(size: str) -> int:
+    """
+    Parse a human readable size, `10G`, `1.5GB`, `500M` or `1024`.
+
+    :param size: The size, the units are powers of 1024.
+    :return: The size in bytes.
+    :raise ValueError: If the size is not valid.
+    """
+
+    match = _SIZE_RE.fullmatch(size.strip())
+    if match is None:
+        raise ValueError(f"Invalid size '{size}'")
+
+    unit = (match.group(2) or '').upper()
+
+    return int(float(match.group(1)) * 1024 ** _SIZE_UNITS.index(unit))
+
+
+def format_size(size: int) -> str:
+    """
+    Format a size in bytes the same way `du -h` does.
+
+    :param size: The size in bytes.
+    :return: The human readable size.
+    """
+
+    value = float(size)
+    for unit in _SIZE_UNITS:
+        if value < 1024 or unit == _SIZE_UNITS[-1]:
+            break
+        value /= 1024
+
+    if not unit:
+        return str(size)
+    if value < 10:
+        return f"{value:.1f}{unit}"
+
+    return f"{round(value)}{unit}"
+
+
+def _rescan(cache_root: str, index: CacheIndex, measure: bool) -> CacheIndex:
+    """
+    Match the index with the entries in the cache.
+
+    :param cache_root: The builder cache directory.
+    :param index: The current index.
+    :param measure: Whether to measure the known entries again.
+    :return: The new index, the new entries are recorded as last used
+        at their modification time.
+    """
+
+    rescanned: CacheIndex = {}
+
+    for relpath, kind in _list_entries(cache_root):
+        entry_path = os.path.join(cache_root, relpath)
+        entry = index.get(relpath) or {
+            'kind': kind,
+            'owners': [],
+            'last_access': int(os.lstat(entry_path).st_mtime),
+        }
+        if measure or 'size' not in entry:
+            entry['size'] = _get_size(entry_path)
+        rescanned[relpath] = entry
+
+    return rescanned
+
+
+def _list_entries(cache_root: str) -> Iterator[tuple[str, str]]:
+    """
+    List the entries in the cache layout.
+
+    :param cache_root: The builder cache directory.
+    :return: The relpath and kind of every entry.
+    """
+
+    for entry in _scandir(os.path.join(cache_root, 'CPython')):
+        # Partial downloads and their lock files are not entries
+        if entry.is_file(follow_symlinks=False) and not entry.name.endswith(('.part', '.flock')):
+            yield f"CPython/{entry.name}", 'runtime-tarball'
+
+    for entry in _scandir(os.path.join(cache_root, 'runtime-store')):
+        if entry.is_dir(follow_symlinks=False) and not entry.name.startswith('.'):
+            yield f"runtime-store/{entry.name}", 'runtime'
+
+    for key_entry in _scandir(os.path.join(cache_root, 'store')):
+        if not key_entry.is_dir(follow_symlinks=False):
+            continue
+        for entry in _scandir(key_entry.path):
+            # Scratch prefixes of the installs in progress
+            if entry.is_dir(follow_symlinks=False) and not entry.name.startswith('.'):
+                yield f"store/{key_entry.name}/{entry.name}", 'package'
+
+
+def _get_kind(relpath: str) -> Optional[str]:
+    parts = relpath.split(os.sep)
+
+    if len(parts) == 2 and parts[0] == 'CPython':
+        return 'runtime-tarball'
+    if len(parts) == 2 and parts[0] == 'runtime-store':
+        return 'runtime'
+    if len(parts) == 3 and parts[0] == 'store':
+        return 'package'
+
+    return None
+
+
+def _remove_entry(cache_root: str, relpath: str, kind: str) -> None:
+    """
+    Remove an entry through the helper that owns it.
+
+    :param cache_root: The builder cache directory.
+    :param relpath: The entry path relative to the cache root.
+    :param kind: The entry kind.
+    :return: None
+    """
+
+    # Imported here, the helpers import this module to record accesses
+    from icarus.handlers.builder_handler import download_helper, runtime_helper, store_helper
+
+    entry_path = os.path.join(cache_root, relpath)
+
+    if kind == 'runtime-tarball':
+        download_helper.remove_cached(entry_path)
+    elif kind == 'runtime':
+        runtime_helper.remove_entry(entry_path)
+    else:
+        store_helper.remove_entry(os.path.join(cache_root, 'store'), entry_path)
+
+
+def _get_size(path: str) -> int:
+    """
+    Get the size of a file or a directory tree, the hardlinks within
+    the tree are counted once.
+
+    :param path: The file or directory path.
+    :return: The size in bytes, 0 if the path is gone.
+    """
+
+    try:
+        stat = os.lstat(path)
+    except FileNotFoundError:
+        return 0
+    if not os.path.isdir(path) or os.path.islink(path):
+        return stat.st_size
+
+    size = 0
+    seen: set[tuple[int, int]] = set()
+    for dirpath, _, filenames in os.walk(path):
+        for filename in filenames:
+            stat = os.lstat(os.path.join(dirpath, filename))
+            if (stat.st_dev, stat.st_ino) not in seen:
+                seen.add((stat.st_dev, stat.st_ino))
+                size += stat.st_size
+
+    return size
+
+
+def _get_reclaimable_size(path: str) -> Optional[int]:
+    """
+    Get the size freed by removing a file or a directory tree, the
+    hardlinks within the tree are counted once.
+
+    :param path: The file or directory path.
+    :return: The size in bytes, 0 if the path is gone, None if some of
+        its files are still hardlinked outside of it.
+    """
+
+    if not os.path.isdir(path) or os.path.islink(path):
+        filepaths = [path]
+    else:
+        filepaths = [
+            os.path.join(dirpath, filename)
+            for dirpath, _, filenames in os.walk(path)
+            for filename in filenames
+        ]
+
+    links: dict[tuple[int, int], int] = {}
+    stats: dict[tuple[int, int], os.stat_result] = {}
+    for filepath in filepaths:
+        try:
+            stat = os.lstat(filepath)
+        except FileNotFoundError:
+            continue
+        links[(stat.st_dev, stat.st_ino)] = links.get((stat.st_dev, stat.st_ino), 0) + 1
+        stats[(stat.st_dev, stat.st_ino)] = stat
+
+    if any(stat.st_nlink > links[inode] for inode, stat in stats.items()):
+        return None
+
+    return sum(stat.st_size for stat in stats.values())
+
+
+def _scandir(path: str) -> list[os.DirEntry]:
+    try:
+        with os.scandir(path) as it:
+            return sorted(it, key=lambda entry: entry.name)
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+
+
+def _read_index(cache_root: str) -> CacheIndex:
+    try:
+        with open(os.path.join(cache_root, config.ICARUS_CACHE_INDEX_FILENAME), 'r') as f:
+            index = json.load(f).get('entries', {})
+    except (OSError, ValueError, AttributeError):
+        return {}
+
+    if not isinstance(index, dict):
+        return {}
+
+    return {
+        relpath: entry
+        for relpath, entry in index.items()
+        if isinstance(entry, dict) and entry.get('kind') in _KINDS
+    }
+
+
+def _write_index(cache_root: str, index: CacheIndex) -> None:
+    """
+    Atomically write the cache index.
+
+    :param cache_root: The builder cache directory.
+    :param index: The index content.
+    :return: None
+    """
+
+    index_filepath = os.path.join(cache_root, config.ICARUS_CACHE_INDEX_FILENAME)
+    tmp_filepath = f"{index_filepath}.{os.getpid()}.tmp"
+
+    with open(tmp_filepath, 'w') as tmp_file:
+        json.dump({'entries': dict(sorted(index.items()))}, tmp_file, indent=2)
+    os.replace(tmp_filepath, index_filepath)
+
+
+@contextlib.contextmanager
+def _index_lock(cache_root: str) -> Iterator[None]:
+    """
+    Lock the cache index while it is read and rewritten.
+
+    :param cache_root: The builder cache directory.
+    :return: None
+    """
+
+    os.makedirs(cache_root, exist_ok=True)
+
+    with open(os.path.join(cache_root, f"{config.ICARUS_CACHE_INDEX_FILENAME}.flock"), 'a') as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """
+    Entry point used by cache.sh.
+
+    :param argv: The command line arguments.
+    :return: Exit code of the script.
+    """
+
+    parser = argparse.ArgumentParser(prog=f"{config.CLI_NAME}-cache-helper")
+    subparsers = parser.add_subparsers(dest='cache_command', required=True)
+
+    size_parser = subparsers.add_parser('size')
+    size_parser.add_argument('cache_root')
+    size_parser.add_argument('--verify', action='store_true')
+
+    gc_parser = subparsers.add_parser('gc')
+    gc_parser.add_argument('cache_root')
+    gc_parser.add_argument('--max-size', default='')
+
+    args = parser.parse_args(argv)
+
+    if args.cache_command == 'size':
+        try:
+            sizes = get_cache_size(args.cache_root, verify=args.verify)
+        except OSError as e:
+            print(f"Failed to read the cache index -- {repr(e)}", file=sys.stderr)
+            return 1
+
+        total = sum(sizes.values())
+        print(f"Cache size: {format_size(total)} ({total} bytes)")
+        for kind in sorted(sizes):
+            print(f"  {kind}: {format_size(sizes[kind])} ({sizes[kind]} bytes)")
+        return 0
+
+    try:
+        max_size = parse_size(args.max_size) if args.max_size else None
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 1
+
+    try:
+        report = collect_garbage(args.cache_root, max_size=max_size)
+    except OSError as e:
+        print(f"Failed to clean '{args.cache_root}' -- {repr(e)}", file=sys.stderr)
+        return 1
+
+    for relpath in report.removed:
+        print(f"Evicted {relpath}")
+    for relpath in report.in_use:
+        print(f"Kept {relpath}, still linked into a project")
+    print(
+        f"{len(report.removed)} evicted, {format_size(report.freed_bytes)} freed,"
+        f" cache size {format_size(report.size_bytes)}"
+    )
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
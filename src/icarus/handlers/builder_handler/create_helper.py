@@ -34,9 +34,6 @@
 # Standard Library Imports
 import re
 
-# My Library Imports
-import carlogtt_python_library as mylib
-
 # Local Application Imports
 from icarus import config, utils
 
@@ -60,6 +57,9 @@ def get_argv(package_name: str, package_language: str) -> list[str]:
     :return: The arguments for the create.sh script.
     """
 
+    # Deferred import, the library is slow to import
+    import carlogtt_python_library as mylib
+
     stru = mylib.StringUtils()
     name_re = re.compile(r'^[A-Za-z0-9]{1,64}$')
 
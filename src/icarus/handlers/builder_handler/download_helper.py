@@ -0,0 +1,611 @@
+# ======================================================================
+# MODULE DETAILS
+# This section provides metadata about the module, including its
+# creation date, author, copyright information, and a brief description
+# of the module's purpose and functionality.
+# ======================================================================
+
+#   __|    \    _ \  |      _ \   __| __ __| __ __|
+#  (      _ \     /  |     (   | (_ |    |      |
+# \___| _/  _\ _|_\ ____| \___/ \___|   _|     _|
+
+# src/icarus/handlers/builder_handler/download_helper.py
+# Created 10/18/26 - 9:05 PM UK Time (London) by carlogtt
+
+"""
+This module downloads the python runtimes into the builder cache.
+
+Every download holds an flock on `<dest>.flock`, so concurrent builds
+fetching the same file wait on the lock and wake up as soon as it is
+released, then find the file in the cache. The data is written to
+`<dest>.part` and resumed with a Range request after an interrupted
+transfer, a transfer that ends before the size announced by the server
+is retried from where it stopped. build_runtime.sh publishes a
+`<url>.sha256` checksum next to the runtime tarball, and the file is
+verified against it before it is moved into place, so the cache only
+ever holds complete files.
+
+The `unpack` subcommand streams the archive into tar while it is
+downloaded and written to the cache, so the runtime is extracted
+without a second read of the tarball. The compression is detected from
+the magic bytes and the extracted directory is renamed into place only
+once the archive is complete and verified.
+
+runtime_helper unpacks the runtimes into its store with `unpack`, the
+`fetch` subcommand downloads files into the cache from the command
+line.
+"""
+
+# ======================================================================
+# EXCEPTIONS
+# This section documents any exceptions made code or quality rules.
+# These exceptions may be necessary due to specific coding requirements
+# or to bypass false positives.
+# ======================================================================
+#
+
+# ======================================================================
+# IMPORTS
+# Importing required libraries and modules for the application.
+# ======================================================================
+
+# Standard Library Imports
+import argparse
+import concurrent.futures
+import contextlib
+import dataclasses
+import fcntl
+import hashlib
+import http.client
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.error
+import urllib.request
+from collections.abc import Callable, Iterator
+from typing import Optional
+
+# Local Application Imports
+from icarus import config, utils
+from icarus.handlers.builder_handler import cache_helper
+
+# END IMPORTS
+# ======================================================================
+
+
+# List of public names in the module
+__all__ = [
+    'DownloadResult',
+    'fetch',
+    'fetch_all',
+    'unpack',
+    'remove_cached',
+]
+
+# Setting up logger for current module
+module_logger = config.master_logger.get_child_logger(__name__)
+
+# Type aliases
+#
+
+_CHUNK_SIZE = 1024 * 1024
+_TIMEOUT_SECONDS = 60
+_MAX_ATTEMPTS = 5
+
+# Content-Range of a 206 or a 416 response
+_CONTENT_RANGE_RE = re.compile(r'bytes\s+(?:(\d+)-(\d+)|\*)/(\d+|\*)')
+
+# Magic bytes of the archive compressions and their tar option
+_MAGIC_SIZE = 6
+_COMPRESSIONS = (
+    (b'\x1f\x8b', '--gzip'),
+    (b'\x28\xb5\x2f\xfd', '--zstd'),
+    (b'\xfd7zXZ\x00', '--xz'),
+    (b'BZh', '--bzip2'),
+)
+
+
+@dataclasses.dataclass(kw_only=True)
+class DownloadResult:
+    url: str
+    dest: str
+    cached: bool = False
+    resumed_from: int = 0
+    verified: bool = False
+    unpacked: bool = False
+    error: str = ''
+
+
+class _TarSink:
+    """
+    Extract the archive chunks written to it into a staging directory.
+
+    tar is started once the magic bytes of the archive are known, its
+    stderr goes to a file so a chatty tar cannot block the pipe.
+    """
+
+    def __init__(self, staging_dir: str) -> None:
+        self.staging_dir = staging_dir
+        self.process: Optional[subprocess.Popen[bytes]] = None
+        self.stderr = tempfile.TemporaryFile()
+        self.head = b''
+
+    def write(self, chunk: bytes) -> None:
+        if self.process is None:
+            self.head += chunk
+            if len(self.head) < _MAGIC_SIZE:
+                return
+            self._start()
+            chunk, self.head = self.head, b''
+
+        assert self.process is not None and self.process.stdin is not None
+        try:
+            self.process.stdin.write(chunk)
+        except BrokenPipeError as e:
+            raise utils.IcarusDownloadException(f"tar exited early -- {self.close()}") from e
+
+    def close(self) -> str:
+        """
+        Wait for tar to extract the archive.
+
+        :return: The tar error, empty on success.
+        """
+
+        if self.process is None:
+            self._start()
+            assert self.process is not None and self.process.stdin is not None
+            with contextlib.suppress(BrokenPipeError):
+                self.process.stdin.write(self.head)
+
+        assert self.process is not None and self.process.stdin is not None
+        with contextlib.suppress(BrokenPipeError):
+            self.process.stdin.close()
+        returncode = self.process.wait()
+
+        self.stderr.seek(0)
+        error = self.stderr.read().decode('utf-8', errors='replace').strip()
+        self.stderr.close()
+
+        if returncode != 0:
+            return error or f"tar exit code {returncode}"
+
+        return ''
+
+    def abort(self) -> None:
+        if self.process is not None:
+            self.process.kill()
+            self.process.wait()
+            if self.process.stdin is not None:
+                with contextlib.suppress(BrokenPipeError):
+                    self.process.stdin.close()
+        self.stderr.close()
+
+    def _start(self) -> None:
+        compression = [option for magic, option in _COMPRESSIONS if self.head.startswith(magic)]
+        self.process = subprocess.Popen(
+            ['tar', '-x', *compression, '-f', '-', '-C', self.staging_dir],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=self.stderr,
+        )
+
+
+def fetch(url: str, dest: str, max_attempts: int = _MAX_ATTEMPTS) -> DownloadResult:
+    """
+    Download url to dest unless dest is already in the cache.
+
+    :param url: The file URL.
+    :param dest: The cache file path.
+    :param max_attempts: The transfer attempts, every retry resumes the
+        partial file.
+    :return: The DownloadResult of the fetch.
+    :raise IcarusDownloadException: If the file cannot be downloaded or
+        does not match its published checksum.
+    """
+
+    return _fetch(url, dest, max_attempts, target_dir=None)
+
+
+def unpack(
+    url: str, dest: str, target_dir: str, max_attempts: int = _MAX_ATTEMPTS
+) -> DownloadResult:
+    """
+    Extract the archive at url into target_dir while it is downloaded
+    to dest, or extract the cached dest.
+
+    The archive holds a single top level directory, it is extracted in
+    a staging directory next to target_dir and renamed to target_dir.
+
+    :param url: The archive URL.
+    :param dest: The cache file path.
+    :param target_dir: The directory to create, it must not exist.
+    :param max_attempts: The transfer attempts, every retry resumes the
+        partial file and extracts it again from the start.
+    :return: The DownloadResult of the fetch.
+    :raise IcarusDownloadException: If the archive cannot be downloaded,
+        does not match its published checksum or cannot be extracted.
+    """
+
+    return _fetch(url, dest, max_attempts, target_dir=target_dir)
+
+
+def remove_cached(dest: str) -> None:
+    """
+    Remove a cached file and its partial download, waiting for the
+    fetch in progress if any.
+
+    :param dest: The cache file path.
+    :return: None
+    """
+
+    with _flock(f"{dest}.flock"):
+        for filepath in (dest, f"{dest}.part"):
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(filepath)
+
+
+def _fetch(url: str, dest: str, max_attempts: int, target_dir: Optional[str]) -> DownloadResult:
+    result = DownloadResult(url=url, dest=dest)
+    part_filepath = f"{dest}.part"
+
+    os.makedirs(os.path.dirname(dest), exist_ok=True)
+
+    with _flock(f"{dest}.flock"):
+        if os.path.isfile(dest):
+            result.cached = True
+            if target_dir is not None:
+                _unpack_file(url, dest, target_dir)
+                result.unpacked = True
+            return result
+
+        expected_sha256 = _get_published_sha256(url)
+
+        for attempt in range(1, max_attempts + 1):
+            digest = hashlib.sha256()
+            staging_dir = None
+            sink = None
+            if target_dir is not None:
+                staging_dir = _make_staging_dir(target_dir)
+                sink = _TarSink(staging_dir)
+
+            try:
+                result.resumed_from = _download_part(url, part_filepath, digest, sink)
+                tar_error = sink.close() if sink is not None else ''
+
+                if expected_sha256 is not None:
+                    if digest.hexdigest() != expected_sha256:
+                        os.remove(part_filepath)
+                        raise utils.IcarusDownloadException(
+                            f"Checksum mismatch for '{url}', expected {expected_sha256} got"
+                            f" {digest.hexdigest()}"
+                        )
+                    result.verified = True
+
+                # An archive tar cannot read is not cached, without a
+                # published checksum tar is the only check of the file
+                if tar_error:
+                    os.remove(part_filepath)
+                    raise utils.IcarusDownloadException(f"Failed to unpack '{url}' -- {tar_error}")
+
+                os.replace(part_filepath, dest)
+
+                if staging_dir is not None and target_dir is not None:
+                    _commit_staging_dir(url, staging_dir, target_dir)
+                    result.unpacked = True
+
+                return result
+
+            except urllib.error.HTTPError as e:
+                if e.code == 404:
+                    raise utils.IcarusDownloadException(f"'{url}' not available") from e
+                if attempt == max_attempts or e.code < 500:
+                    raise utils.IcarusDownloadException(f"Failed to download '{url}' -- {e}") from e
+            except (urllib.error.URLError, http.client.HTTPException, OSError) as e:
+                if attempt == max_attempts:
+                    raise utils.IcarusDownloadException(f"Failed to download '{url}' -- {e}") from e
+            finally:
+                if sink is not None:
+                    sink.abort()
+                if staging_dir is not None:
+                    shutil.rmtree(staging_dir, ignore_errors=True)
+
+            module_logger.debug(f"Retrying {url=} {attempt=}")
+            time.sleep(attempt)
+
+    return result
+
+
+def fetch_all(downloads: list[tuple[str, str]], jobs: int) -> list[DownloadResult]:
+    """
+    Fetch several files concurrently.
+
+    :param downloads: The (url, dest) pairs to fetch.
+    :param jobs: The maximum number of concurrent downloads.
+    :return: The DownloadResult of every fetch, in the same order, with
+        the error set on failure.
+    """
+
+    def _fetch(url: str, dest: str) -> DownloadResult:
+        try:
+            return fetch(url, dest)
+        except utils.IcarusDownloadException as e:
+            return DownloadResult(url=url, dest=dest, error=str(e))
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, jobs)) as executor:
+        futures = [executor.submit(_fetch, url, dest) for url, dest in downloads]
+
+    return [future.result() for future in futures]
+
+
+def _download_part(
+    url: str, part_filepath: str, digest: "hashlib._Hash", sink: Optional[_TarSink]
+) -> int:
+    """
+    Download url into the partial file, resuming it when it exists.
+
+    Every byte of the file, the resumed ones included, is fed to the
+    digest and to the sink, so the file is never read back.
+
+    :param url: The file URL.
+    :param part_filepath: The partial file path.
+    :param digest: The sha256 of the file.
+    :param sink: The tar extracting the file or None.
+    :return: The offset the transfer resumed from.
+    :raise URLError: If the transfer ends before the size announced by
+        the server, the partial file is kept to be resumed.
+    """
+
+    def _consume(chunk: bytes) -> None:
+        digest.update(chunk)
+        if sink is not None:
+            sink.write(chunk)
+
+    offset = os.path.getsize(part_filepath) if os.path.isfile(part_filepath) else 0
+    request = urllib.request.Request(url)
+    if offset:
+        request.add_header('Range', f"bytes={offset}-")
+
+    try:
+        response = urllib.request.urlopen(request, timeout=_TIMEOUT_SECONDS)
+    except urllib.error.HTTPError as e:
+        # The partial file is already complete
+        if e.code == 416 and offset:
+            total = _parse_content_range(e.headers.get('Content-Range'))[2]
+            if total is not None and total != offset:
+                os.remove(part_filepath)
+                raise urllib.error.URLError(
+                    f"partial file of {offset} bytes does not match the size {total}"
+                ) from e
+            _read_file(part_filepath, _consume)
+            return offset
+        raise
+
+    with response:
+        # A server ignoring the Range header sends the whole file again
+        if response.status != 206:
+            offset = 0
+            content_length = response.headers.get('Content-Length')
+            expected_size = int(content_length) if content_length else None
+        else:
+            start, end, _ = _parse_content_range(response.headers.get('Content-Range'))
+            if start != offset or end is None:
+                os.remove(part_filepath)
+                raise urllib.error.URLError(
+                    f"range {response.headers.get('Content-Range')} does not resume at {offset}"
+                )
+            expected_size = end + 1
+            _read_file(part_filepath, _consume)
+
+        # http.client ends the body quietly when the connection closes
+        # early, the partial file is kept and resumed by the next try
+        size = offset
+        with open(part_filepath, 'ab' if offset else 'wb') as part_file:
+            while chunk := response.read(_CHUNK_SIZE):
+                part_file.write(chunk)
+                _consume(chunk)
+                size += len(chunk)
+
+        if expected_size is not None and size < expected_size:
+            raise urllib.error.ContentTooShortError(
+                f"got only {size} out of {expected_size} bytes",
+                (part_filepath, response.headers),
+            )
+
+    return offset
+
+
+def _parse_content_range(
+    content_range: Optional[str],
+) -> tuple[Optional[int], Optional[int], Optional[int]]:
+    """
+    Parse a `bytes <start>-<end>/<total>` Content-Range header.
+
+    :param content_range: The header value or None.
+    :return: The first and last byte positions and the total size, None
+        when absent or unknown.
+    """
+
+    match = _CONTENT_RANGE_RE.fullmatch((content_range or '').strip())
+    if match is None:
+        return None, None, None
+
+    start, end, total = match.groups()
+
+    return (
+        int(start) if start is not None else None,
+        int(end) if end is not None else None,
+        int(total) if total != '*' else None,
+    )
+
+
+def _unpack_file(url: str, filepath: str, target_dir: str) -> None:
+    """
+    Extract the cached archive into target_dir, an archive tar cannot
+    read is removed so the next fetch downloads it again.
+
+    :param url: The archive URL, for the error messages.
+    :param filepath: The archive path.
+    :param target_dir: The directory to create.
+    :return: None
+    """
+
+    staging_dir = _make_staging_dir(target_dir)
+    sink = _TarSink(staging_dir)
+
+    try:
+        _read_file(filepath, sink.write)
+        tar_error = sink.close()
+        if tar_error:
+            os.remove(filepath)
+            raise utils.IcarusDownloadException(f"Failed to unpack '{url}' -- {tar_error}")
+        _commit_staging_dir(url, staging_dir, target_dir)
+    finally:
+        sink.abort()
+        shutil.rmtree(staging_dir, ignore_errors=True)
+
+
+def _make_staging_dir(target_dir: str) -> str:
+    parent_dir = os.path.dirname(os.path.abspath(target_dir))
+    os.makedirs(parent_dir, exist_ok=True)
+
+    return tempfile.mkdtemp(prefix='.unpack-', dir=parent_dir)
+
+
+def _commit_staging_dir(url: str, staging_dir: str, target_dir: str) -> None:
+    """
+    Rename the single top level directory of the archive to target_dir.
+
+    :param url: The archive URL, for the error messages.
+    :param staging_dir: The directory the archive was extracted into.
+    :param target_dir: The directory to create.
+    :return: None
+    """
+
+    entries = os.listdir(staging_dir)
+    if len(entries) != 1 or not os.path.isdir(os.path.join(staging_dir, entries[0])):
+        raise utils.IcarusDownloadException(
+            f"Failed to unpack '{url}' -- expected a single top level directory, got {entries}"
+        )
+
+    try:
+        os.rename(os.path.join(staging_dir, entries[0]), target_dir)
+    except OSError as e:
+        raise utils.IcarusDownloadException(f"Failed to unpack '{url}' -- {e}") from e
+
+
+def _read_file(filepath: str, consume: Callable[[bytes], None]) -> None:
+    with open(filepath, 'rb') as f:
+        while chunk := f.read(_CHUNK_SIZE):
+            consume(chunk)
+
+
+def _get_published_sha256(url: str) -> Optional[str]:
+    """
+    Get the checksum published next to the file as `<url>.sha256`.
+
+    :param url: The file URL.
+    :return: The sha256 or None when no checksum is published.
+    """
+
+    try:
+        with urllib.request.urlopen(f"{url}.sha256", timeout=_TIMEOUT_SECONDS) as response:
+            content = response.read(4096).decode('utf-8', errors='replace')
+    except urllib.error.HTTPError as e:
+        if e.code == 404:
+            return None
+        raise utils.IcarusDownloadException(f"Failed to download '{url}.sha256' -- {e}") from e
+    except (urllib.error.URLError, OSError) as e:
+        raise utils.IcarusDownloadException(f"Failed to download '{url}.sha256' -- {e}") from e
+
+    # `sha256sum` format, the digest optionally followed by the filename
+    match = re.match(r'\s*([0-9a-fA-F]{64})\b', content)
+    if match is None:
+        raise utils.IcarusDownloadException(f"Invalid checksum file '{url}.sha256'")
+
+    return match.group(1).lower()
+
+
+@contextlib.contextmanager
+def _flock(lock_filepath: str) -> Iterator[None]:
+    """
+    Hold an exclusive flock, waiting for the current holder if any.
+
+    :param lock_filepath: The lock file path.
+    :return: None
+    """
+
+    with open(lock_filepath, 'a') as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """
+    Entry point used by path.sh.
+
+    :param argv: The command line arguments.
+    :return: Exit code of the script, 1 if any download failed.
+    """
+
+    parser = argparse.ArgumentParser(prog=f"{config.CLI_NAME}-download-helper")
+    subparsers = parser.add_subparsers(dest='download_command', required=True)
+
+    fetch_parser = subparsers.add_parser('fetch')
+    fetch_parser.add_argument('--url', action='append', required=True)
+    fetch_parser.add_argument('--dest', action='append', required=True)
+    fetch_parser.add_argument('--jobs', type=int, default=0)
+    fetch_parser.add_argument('--cache-root', default=None)
+    fetch_parser.add_argument('--owner', default='')
+
+    unpack_parser = subparsers.add_parser('unpack')
+    unpack_parser.add_argument('--url', required=True)
+    unpack_parser.add_argument('--dest', required=True)
+    unpack_parser.add_argument('--target', required=True)
+
+    args = parser.parse_args(argv)
+
+    if args.download_command == 'unpack':
+        try:
+            results = [unpack(args.url, args.dest, args.target)]
+        except utils.IcarusDownloadException as e:
+            results = [DownloadResult(url=args.url, dest=args.dest, error=str(e))]
+    else:
+        if len(args.url) != len(args.dest):
+            parser.error('every --url needs a --dest')
+        results = fetch_all(list(zip(args.url, args.dest)), args.jobs or len(args.url))
+
+        if args.cache_root is not None:
+            try:
+                cache_helper.record_access(
+                    args.cache_root, [r.dest for r in results if not r.error], args.owner
+                )
+            except OSError as e:
+                print(f"Failed to record the cache access -- {repr(e)}", file=sys.stderr)
+
+    for result in results:
+        filename = os.path.basename(result.dest)
+        unpacked = ', unpacked' if result.unpacked else ''
+        if result.error:
+            print(result.error, file=sys.stderr)
+        elif result.cached:
+            print(f"Using cached {filename}{unpacked}")
+        else:
+            resumed = f" (resumed at {result.resumed_from} bytes)" if result.resumed_from else ''
+            verified = ', sha256 verified' if result.verified else ', no published checksum'
+            print(f"Downloaded {filename}{resumed}{verified}{unpacked}")
+
+    if any(result.error for result in results):
+        return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
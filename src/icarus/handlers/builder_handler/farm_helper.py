@@ -0,0 +1,785 @@
+# ======================================================================
+# MODULE DETAILS
+# This section provides metadata about the module, including its
+# creation date, author, copyright information, and a brief description
+# of the module's purpose and functionality.
+# ======================================================================
+
+#   __|    \    _ \  |      _ \   __| __ __| __ __|
+#  (      _ \     /  |     (   | (_ |    |      |
+# \___| _/  _\ _|_\ ____| \___/ \___|   _|     _|
+
+# src/icarus/handlers/builder_handler/farm_helper.py
+# Created 10/18/26 - 5:10 PM UK Time (London) by carlogtt
+
+"""
+This module links prefixes into runtime farms.
+
+Prefixes are linked the way stow does: a directory contributed by a
+single prefix is linked as a whole (folded), it is only split into a
+real directory with one link per entry where a second prefix overlaps
+it or where something writes into the farm (nofold paths, e.g. pip
+installing into site-packages). Conflicts are detected while scanning
+the trees.
+
+With a manifest, the links owned by the prefix are recorded per farm,
+so relinking only adds the new entries and removes the ones gone from
+the prefix, and is skipped altogether when the prefix did not change.
+
+The python shebangs of a farm are pointed at the envroot shim in the
+same process, only the first bytes of each file are read and the files
+already checked are recorded in a manifest and skipped on the next run.
+
+The packages installed in a farm are listed in a JSON manifest read
+straight from the dist-info METADATA headers, the name and version path
+recipes are answered from it.
+
+path.sh runs it with `python -m` through the `link`, `shebang`,
+`packages` and `join-packages` subcommands.
+"""
+
+# ======================================================================
+# EXCEPTIONS
+# This section documents any exceptions made code or quality rules.
+# These exceptions may be necessary due to specific coding requirements
+# or to bypass false positives.
+# ======================================================================
+#
+
+# ======================================================================
+# IMPORTS
+# Importing required libraries and modules for the application.
+# ======================================================================
+
+# Standard Library Imports
+import argparse
+import contextlib
+import dataclasses
+import fnmatch
+import hashlib
+import json
+import os
+import sys
+import tempfile
+from collections.abc import Iterable
+from typing import Optional
+
+# Local Application Imports
+from icarus import config
+
+# END IMPORTS
+# ======================================================================
+
+
+# List of public names in the module
+__all__ = [
+    'FarmLinkReport',
+    'ShebangReport',
+    'link_prefix_to_farm',
+    'fix_shebangs',
+    'write_packages_manifest',
+    'read_packages_manifest',
+    'join_packages',
+]
+
+# Setting up logger for current module
+module_logger = config.master_logger.get_child_logger(__name__)
+
+# Type aliases
+Package = dict[str, str]
+
+
+@dataclasses.dataclass(kw_only=True)
+class FarmLinkReport:
+    links: int = 0
+    folded: int = 0
+    unfolded: int = 0
+    removed: int = 0
+    unchanged: bool = False
+    conflicts: list[str] = dataclasses.field(default_factory=list)
+    # Farm path -> (source path, link target) of the links of the prefix
+    owned: dict[str, tuple[str, str]] = dataclasses.field(default_factory=dict, compare=False)
+
+
+@dataclasses.dataclass(kw_only=True)
+class ShebangReport:
+    checked: int = 0
+    skipped: int = 0
+    fixed: list[str] = dataclasses.field(default_factory=list)
+
+
+def link_prefix_to_farm(
+    source_prefix: str,
+    dest_prefix: str,
+    excludes: Iterable[str] = (),
+    nofold: Iterable[str] = (),
+    manifest_filepath: Optional[str] = None,
+) -> FarmLinkReport:
+    """
+    Link every top-level entry of source_prefix into dest_prefix.
+
+    Linking the same prefix again is a no-op, so the farm can be
+    relinked on every sync. An existing entry that does not belong to
+    the prefix is a conflict and is left untouched (first source wins).
+
+    :param source_prefix: The prefix to link.
+    :param dest_prefix: The farm directory to link into.
+    :param excludes: Top-level entry names of source_prefix to skip.
+    :param nofold: Glob patterns, relative to dest_prefix, of the
+        directories that must be real directories down to every entry.
+        Their parents are split as well.
+    :param manifest_filepath: The manifest of the links owned by the
+        prefix in this farm, it is read and then rewritten.
+    :return: The FarmLinkReport of the run.
+    """
+
+    report = FarmLinkReport()
+    excludes = set(excludes)
+    nofold_parts = [tuple(p.strip('/').split('/')) for p in nofold]
+
+    if manifest_filepath is not None:
+        signature = _get_prefix_signature(source_prefix, excludes, nofold_parts)
+        manifest = _read_manifest(manifest_filepath)
+
+        if manifest.get('signature') == signature and os.path.isdir(dest_prefix):
+            report.unchanged = True
+            return report
+
+        if manifest.get('source_prefix') == source_prefix:
+            _remove_stale_links(manifest['entries'], report)
+        else:
+            # No manifest yet, e.g. a farm linked by an older version
+            _remove_dangling_links(source_prefix, dest_prefix, excludes, report)
+
+    os.makedirs(dest_prefix, exist_ok=True)
+
+    for entry in _scandir_sorted(source_prefix):
+        if entry.name in excludes:
+            continue
+        _link_entry(
+            source=entry.path,
+            dest=os.path.join(dest_prefix, entry.name),
+            relpath=(entry.name,),
+            nofold_parts=nofold_parts,
+            report=report,
+        )
+
+    if manifest_filepath is not None:
+        # A farm with conflicts is checked again on the next run
+        _write_manifest(
+            manifest_filepath,
+            {
+                'source_prefix': source_prefix,
+                'signature': '' if report.conflicts else signature,
+                'entries': report.owned,
+            },
+        )
+
+    return report
+
+
+def _link_entry(
+    source: str,
+    dest: str,
+    relpath: tuple[str, ...],
+    nofold_parts: list[tuple[str, ...]],
+    report: FarmLinkReport,
+    owned: bool = True,
+) -> None:
+    """
+    Link a single source entry into the farm, recursing into the
+    directories that cannot be folded.
+
+    :param source: The source path.
+    :param dest: The farm path of the entry.
+    :param relpath: The farm path components relative to the prefix.
+    :param nofold_parts: The nofold patterns split in components.
+    :param report: The FarmLinkReport to update.
+    :param owned: False for the entries of another prefix relinked
+        while splitting its folded directory.
+    :return: None
+    """
+
+    # A symlink in the prefix is copied as is, the same as `cp -a`.
+    if os.path.islink(source):
+        _link_file(source, os.readlink(source), dest, report, owned)
+        return
+
+    if not os.path.isdir(source):
+        _link_file(source, source, dest, report, owned)
+        return
+
+    must_split = _is_nofold(relpath, nofold_parts)
+
+    if not os.path.lexists(dest):
+        if not must_split:
+            os.symlink(source, dest)
+            report.folded += 1
+            if owned:
+                report.owned[dest] = (source, source)
+            return
+        os.mkdir(dest)
+
+    elif os.path.islink(dest):
+        current_target = os.readlink(dest)
+
+        if current_target == source and not must_split:
+            if owned:
+                report.owned[dest] = (source, source)
+            return
+
+        # Only a folded directory, an absolute link to a directory, can
+        # be split, any other link is not ours to replace.
+        if not os.path.isabs(current_target) or not os.path.isdir(dest):
+            report.conflicts.append(dest)
+            return
+
+        os.unlink(dest)
+        os.mkdir(dest)
+        report.unfolded += 1
+
+        for entry in _scandir_sorted(current_target):
+            _link_entry(
+                source=entry.path,
+                dest=os.path.join(dest, entry.name),
+                relpath=(*relpath, entry.name),
+                nofold_parts=nofold_parts,
+                report=report,
+                owned=current_target == source,
+            )
+
+    elif not os.path.isdir(dest):
+        report.conflicts.append(dest)
+        return
+
+    for entry in _scandir_sorted(source):
+        _link_entry(
+            source=entry.path,
+            dest=os.path.join(dest, entry.name),
+            relpath=(*relpath, entry.name),
+            nofold_parts=nofold_parts,
+            report=report,
+            owned=owned,
+        )
+
+
+def _link_file(source: str, target: str, dest: str, report: FarmLinkReport, owned: bool) -> None:
+    """
+    Create the dest symlink to target unless it already exists.
+
+    :param source: The source path.
+    :param target: The symlink target.
+    :param dest: The farm path of the entry.
+    :param report: The FarmLinkReport to update.
+    :param owned: Whether the link belongs to the linked prefix.
+    :return: None
+    """
+
+    if os.path.lexists(dest):
+        if not os.path.islink(dest) or os.readlink(dest) != target:
+            report.conflicts.append(dest)
+            return
+    else:
+        os.symlink(target, dest)
+        report.links += 1
+
+    if owned:
+        report.owned[dest] = (source, target)
+
+
+def _is_nofold(relpath: tuple[str, ...], nofold_parts: list[tuple[str, ...]]) -> bool:
+    """
+    Check whether a directory must be a real directory, that is when it
+    matches a nofold pattern, is inside one or is a parent of one.
+
+    :param relpath: The farm path components relative to the prefix.
+    :param nofold_parts: The nofold patterns split in components.
+    :return: True if the directory cannot be folded.
+    """
+
+    for pattern in nofold_parts:
+        depth = min(len(relpath), len(pattern))
+        if all(fnmatch.fnmatchcase(relpath[i], pattern[i]) for i in range(depth)):
+            return True
+
+    return False
+
+
+def _remove_stale_links(entries: dict[str, list[str]], report: FarmLinkReport) -> None:
+    """
+    Remove the links of the manifest whose source is gone from the
+    prefix. A link replaced by something else is left alone.
+
+    :param entries: The manifest entries.
+    :param report: The FarmLinkReport to update.
+    :return: None
+    """
+
+    for dest, (source, target) in entries.items():
+        if os.path.lexists(source):
+            continue
+        if os.path.islink(dest) and os.readlink(dest) == target:
+            os.unlink(dest)
+            report.removed += 1
+
+
+def _remove_dangling_links(
+    source_prefix: str, dest_prefix: str, excludes: set[str], report: FarmLinkReport
+) -> None:
+    """
+    Remove the dangling links into source_prefix, only used for the
+    farms that do not have a manifest yet.
+
+    :param source_prefix: The linked prefix.
+    :param dest_prefix: The farm directory.
+    :param excludes: Top-level entry names of source_prefix to skip.
+    :param report: The FarmLinkReport to update.
+    :return: None
+    """
+
+    if not os.path.isdir(dest_prefix) or not os.path.isdir(source_prefix):
+        return
+
+    for entry in _scandir_sorted(source_prefix):
+        if entry.name in excludes or not entry.is_dir(follow_symlinks=False):
+            continue
+        for dirpath, dirnames, filenames in os.walk(os.path.join(dest_prefix, entry.name)):
+            for name in [*dirnames, *filenames]:
+                path = os.path.join(dirpath, name)
+                if not os.path.islink(path) or os.path.exists(path):
+                    continue
+                if os.readlink(path).startswith(f"{source_prefix}/"):
+                    os.unlink(path)
+                    report.removed += 1
+
+
+def _get_prefix_signature(
+    source_prefix: str, excludes: set[str], nofold_parts: list[tuple[str, ...]]
+) -> str:
+    """
+    Compute the signature of a prefix from the mtime of its
+    directories, adding or removing an entry changes the mtime of its
+    directory. Only directories are stat-ed, which keeps a relink of an
+    unchanged prefix in the millisecond range.
+
+    :param source_prefix: The linked prefix.
+    :param excludes: Top-level entry names of source_prefix to skip.
+    :param nofold_parts: The nofold patterns split in components.
+    :return: The prefix signature.
+    """
+
+    digest = hashlib.sha256()
+    digest.update(repr(sorted(excludes)).encode())
+    digest.update(repr(nofold_parts).encode())
+
+    pending = [source_prefix]
+    while pending:
+        path = pending.pop()
+        digest.update(f"{path}:{os.stat(path).st_mtime_ns}\n".encode())
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if path == source_prefix and entry.name in excludes:
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+
+    return digest.hexdigest()
+
+
+def _read_manifest(manifest_filepath: str) -> dict:
+    """
+    Read the farm manifest.
+
+    :param manifest_filepath: The manifest file path.
+    :return: The manifest or an empty dict if it is missing or
+        unreadable.
+    """
+
+    try:
+        with open(manifest_filepath, 'r') as manifest_file:
+            manifest = json.load(manifest_file)
+    except (OSError, ValueError):
+        return {}
+
+    if not isinstance(manifest, dict) or not isinstance(manifest.get('entries'), dict):
+        return {}
+
+    return manifest
+
+
+def _write_manifest(manifest_filepath: str, manifest: dict) -> None:
+    """
+    Atomically write the farm manifest.
+
+    :param manifest_filepath: The manifest file path.
+    :param manifest: The manifest content.
+    :return: None
+    """
+
+    tmp_filepath = f"{manifest_filepath}.{os.getpid()}.tmp"
+
+    os.makedirs(os.path.dirname(manifest_filepath), exist_ok=True)
+    with open(tmp_filepath, 'w') as tmp_file:
+        json.dump(manifest, tmp_file, indent=2)
+    os.replace(tmp_filepath, manifest_filepath)
+
+
+def fix_shebangs(
+    root: str,
+    shebang: str,
+    prunes: Iterable[str] = (),
+    manifest_filepath: Optional[str] = None,
+) -> ShebangReport:
+    """
+    Point the python3 shebangs under root at the given shebang.
+
+    A file is rewritten only when its first line is an absolute python3
+    shebang that is not the given one already, binary files are never
+    touched. Symlinks are followed, the same as the shell version did
+    with `cat > file`, and the files shared through hardlinks are
+    replaced instead of rewritten in place.
+
+    :param root: The directory to scan.
+    :param shebang: The shebang line, without the trailing newline.
+    :param prunes: Paths relative to root that are not scanned.
+    :param manifest_filepath: The manifest of the files already checked,
+        it is read and then rewritten. Files with the same mtime and
+        size are not read again.
+    :return: The ShebangReport of the run.
+    """
+
+    report = ShebangReport()
+    prunes = {os.path.join(root, prune.strip('/')) for prune in prunes}
+    shebang_line = shebang.encode()
+
+    checked: dict[str, list[int]] = {}
+    if manifest_filepath is not None:
+        manifest = _read_manifest(manifest_filepath)
+        if manifest.get('shebang') == shebang:
+            checked = manifest['entries']
+
+    seen: dict[str, list[int]] = {}
+    pending = [root]
+    while pending:
+        for entry in _scandir_sorted(pending.pop()):
+            if entry.path in prunes:
+                continue
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                    continue
+                stat = entry.stat()
+            except FileNotFoundError:
+                # Dangling symlink
+                continue
+            if not entry.is_file():
+                continue
+
+            signature = [stat.st_mtime_ns, stat.st_size]
+            if checked.get(entry.path) == signature:
+                report.skipped += 1
+                seen[entry.path] = signature
+                continue
+
+            report.checked += 1
+            if _fix_shebang(entry.path, shebang_line):
+                report.fixed.append(entry.path)
+                stat = os.stat(entry.path)
+                signature = [stat.st_mtime_ns, stat.st_size]
+            seen[entry.path] = signature
+
+    if manifest_filepath is not None:
+        _write_manifest(manifest_filepath, {'shebang': shebang, 'entries': seen})
+
+    return report
+
+
+def _fix_shebang(filepath: str, shebang_line: bytes) -> bool:
+    """
+    Rewrite the first line of a python3 script.
+
+    :param filepath: The file path.
+    :param shebang_line: The new shebang line.
+    :return: True if the file was rewritten.
+    """
+
+    with open(filepath, 'rb') as f:
+        if f.read(3) != b'#!/':
+            return False
+        content = b'#!/' + f.read()
+
+    first_line, newline, rest = content.partition(b'\n')
+    if b'python3' not in first_line or first_line == shebang_line or b'\0' in content:
+        return False
+
+    filepath = os.path.realpath(filepath)
+    file_stat = os.stat(filepath)
+
+    # A file hardlinked from the runtime or the package store is shared
+    # with every farm using it, it is replaced instead with a copy that
+    # keeps its mode. Any other file is rewritten in place.
+    if file_stat.st_nlink == 1 and os.access(filepath, os.W_OK):
+        with open(filepath, 'r+b') as f:
+            f.write(shebang_line + b'\n' + rest)
+            f.truncate()
+        return True
+
+    fd, tmp_filepath = tempfile.mkstemp(
+        prefix=f".{os.path.basename(filepath)}.", dir=os.path.dirname(filepath)
+    )
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(shebang_line + b'\n' + rest)
+        os.chmod(tmp_filepath, file_stat.st_mode & 0o7777)
+        os.replace(tmp_filepath, filepath)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(tmp_filepath)
+        raise
+
+    return True
+
+
+def write_packages_manifest(site_packages: str, manifest_filepath: str) -> list[Package]:
+    """
+    List the distributions installed in site-packages into the farm
+    packages manifest, the same set as `pip freeze --all` with the
+    editable installs left out.
+
+    :param site_packages: The farm site-packages directory.
+    :param manifest_filepath: The packages manifest file path.
+    :return: The packages sorted by name.
+    """
+
+    packages = []
+
+    for entry in _scandir_sorted(site_packages):
+        if entry.name.endswith('.dist-info'):
+            metadata_filepath = os.path.join(entry.path, 'METADATA')
+        elif entry.name.endswith('.egg-info'):
+            metadata_filepath = entry.path
+            if entry.is_dir():
+                metadata_filepath = os.path.join(entry.path, 'PKG-INFO')
+        else:
+            continue
+
+        headers = _read_metadata_headers(metadata_filepath)
+        if not headers.get('Name') or not headers.get('Version'):
+            continue
+        if _is_editable(entry.path):
+            continue
+
+        packages.append({'name': headers['Name'], 'version': headers['Version']})
+
+    packages.sort(key=lambda package: package['name'].lower())
+
+    _write_manifest(manifest_filepath, {'packages': packages})
+
+    return packages
+
+
+def read_packages_manifest(manifest_filepath: str) -> list[Package]:
+    """
+    Read the farm packages manifest.
+
+    :param manifest_filepath: The packages manifest file path.
+    :return: The packages sorted by name.
+    """
+
+    with open(manifest_filepath, 'r') as manifest_file:
+        packages: list[Package] = json.load(manifest_file)['packages']
+
+    return packages
+
+
+def join_packages(packages: list[Package], delimiter: str, with_version: bool) -> str:
+    """
+    Join the packages the way the name and version path recipes answer,
+    `name==version` or just the name.
+
+    :param packages: The packages of the manifest.
+    :param delimiter: The path delimiter.
+    :param with_version: Whether to pin the version.
+    :return: The joined packages.
+    """
+
+    if with_version:
+        return delimiter.join(f"{p['name']}=={p['version']}" for p in packages)
+
+    return delimiter.join(p['name'] for p in packages)
+
+
+def _read_metadata_headers(metadata_filepath: str) -> dict[str, str]:
+    """
+    Read the headers of a METADATA file, stopping at the description.
+
+    :param metadata_filepath: The METADATA or PKG-INFO file path.
+    :return: The first value of each header.
+    """
+
+    headers: dict[str, str] = {}
+
+    try:
+        with open(metadata_filepath, 'r', encoding='utf-8', errors='replace') as metadata:
+            for line in metadata:
+                if not line.strip():
+                    break
+                name, sep, value = line.partition(':')
+                if sep and not line[0].isspace():
+                    headers.setdefault(name, value.strip())
+    except (FileNotFoundError, NotADirectoryError):
+        pass
+
+    return headers
+
+
+def _is_editable(dist_info: str) -> bool:
+    """
+    Check whether a distribution is an editable install.
+
+    :param dist_info: The dist-info directory.
+    :return: True if direct_url.json marks it as editable.
+    """
+
+    try:
+        with open(os.path.join(dist_info, 'direct_url.json'), 'r') as direct_url_file:
+            direct_url = json.load(direct_url_file)
+    except (OSError, ValueError):
+        return False
+
+    return bool(direct_url.get('dir_info', {}).get('editable'))
+
+
+def _scandir_sorted(path: str) -> list[os.DirEntry]:
+    """
+    List a directory sorted by name, so that the links and the
+    conflicts are reported in a stable order.
+
+    :param path: The directory to list.
+    :return: The directory entries.
+    """
+
+    with os.scandir(path) as entries:
+        return sorted(entries, key=lambda e: e.name)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """
+    Entry point used by path.sh.
+
+    Exit code is 0 on success, 2 when link conflicts were found (the
+    same as a WARN in path.sh) and 1 on error.
+
+    :param argv: The command line arguments.
+    :return: Exit code of the script.
+    """
+
+    parser = argparse.ArgumentParser(prog=f"{config.CLI_NAME}-farm-helper")
+    subparsers = parser.add_subparsers(dest='farm_command', required=True)
+
+    link_parser = subparsers.add_parser('link')
+    link_parser.add_argument('source_prefix')
+    link_parser.add_argument('dest_prefix')
+    link_parser.add_argument('--exclude', action='append', default=[])
+    link_parser.add_argument('--nofold', action='append', default=[])
+    link_parser.add_argument('--manifest', default=None)
+
+    shebang_parser = subparsers.add_parser('shebang')
+    shebang_parser.add_argument('root')
+    shebang_parser.add_argument('--shebang', required=True)
+    shebang_parser.add_argument('--prune', action='append', default=[])
+    shebang_parser.add_argument('--manifest', default=None)
+
+    packages_parser = subparsers.add_parser('packages')
+    packages_parser.add_argument('site_packages')
+    packages_parser.add_argument('--output', required=True)
+
+    join_packages_parser = subparsers.add_parser('join-packages')
+    join_packages_parser.add_argument('manifest')
+    join_packages_parser.add_argument('--delimiter', default=';')
+    join_packages_parser.add_argument('--names', action='store_true')
+
+    args = parser.parse_args(argv)
+
+    if args.farm_command == 'shebang':
+        return _main_shebang(args)
+
+    if args.farm_command == 'packages':
+        try:
+            write_packages_manifest(args.site_packages, args.output)
+        except OSError as e:
+            print(f"Failed to list '{args.site_packages}' -- {repr(e)}", file=sys.stderr)
+            return 1
+        return 0
+
+    if args.farm_command == 'join-packages':
+        try:
+            packages = read_packages_manifest(args.manifest)
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Failed to read '{args.manifest}' -- {repr(e)}", file=sys.stderr)
+            return 1
+        print(join_packages(packages, args.delimiter, with_version=not args.names))
+        return 0
+
+    try:
+        report = link_prefix_to_farm(
+            source_prefix=args.source_prefix,
+            dest_prefix=args.dest_prefix,
+            excludes=args.exclude,
+            nofold=args.nofold,
+            manifest_filepath=args.manifest,
+        )
+    except OSError as e:
+        print(f"Failed to link '{args.source_prefix}' -- {repr(e)}", file=sys.stderr)
+        return 1
+
+    if report.unchanged:
+        print(f"'{args.source_prefix}' unchanged since the last link")
+        return 0
+
+    for conflict in report.conflicts:
+        print(f"Destination file exists: '{conflict}'")
+
+    print(
+        f"{report.links} link(s), {report.folded} folded dir(s),"
+        f" {report.unfolded} unfolded dir(s), {report.removed} removed link(s)"
+    )
+
+    if report.conflicts:
+        return 2
+
+    return 0
+
+
+def _main_shebang(args: argparse.Namespace) -> int:
+    """
+    Run the shebang subcommand.
+
+    :param args: The parsed arguments.
+    :return: Exit code of the script.
+    """
+
+    try:
+        report = fix_shebangs(
+            root=args.root,
+            shebang=args.shebang,
+            prunes=args.prune,
+            manifest_filepath=args.manifest,
+        )
+    except OSError as e:
+        print(f"Failed to fix shebangs in '{args.root}' -- {repr(e)}", file=sys.stderr)
+        return 1
+
+    for filepath in report.fixed:
+        print(f"Fixing {filepath}")
+
+    print(
+        f"{len(report.fixed)} fixed, {report.checked} checked,"
+        f" {report.skipped} unchanged file(s) skipped"
+    )
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,267 @@
+# ======================================================================
+# MODULE DETAILS
+# This section provides metadata about the module, including its
+# creation date, author, copyright information, and a brief description
+# of the module's purpose and functionality.
+# ======================================================================
+
+#   __|    \    _ \  |      _ \   __| __ __| __ __|
+#  (      _ \     /  |     (   | (_ |    |      |
+# \___| _/  _\ _|_\ ____| \___/ \___|   _|     _|
+
+# src/icarus/handlers/builder_handler/hygiene_helper.py
+# Created 10/19/26 - 1:40 AM UK Time (London) by carlogtt
+
+"""
+This module runs the text hygiene hooks of the builder in a single pass
+over the package files.
+
+Every file is read once, the binary files are told apart in process
+and the enabled fixes are applied in memory, in the order the builder
+runs the hooks:
+
+    eolnorm      CRLF and CR line endings converted to LF
+    whitespaces  narrow no-break spaces replaced with spaces
+    trailing     trailing whitespaces removed from every line
+    eofnewline   exactly one newline at the end of the file
+
+Only the files that changed are written back, atomically, and the
+files are spread across a process pool.
+
+builder.sh runs it with `python -m` through the `fix` subcommand and
+reads back the NUL-separated `<hook>` `<status>` `<path>` records.
+"""
+
+# ======================================================================
+# EXCEPTIONS
+# This section documents any exceptions made code or quality rules.
+# These exceptions may be necessary due to specific coding requirements
+# or to bypass false positives.
+# ======================================================================
+#
+
+# ======================================================================
+# IMPORTS
+# Importing required libraries and modules for the application.
+# ======================================================================
+
+# Standard Library Imports
+import argparse
+import concurrent.futures
+import dataclasses
+import os
+import re
+import stat
+import sys
+import tempfile
+from collections.abc import Iterable
+from typing import Optional
+
+# Local Application Imports
+from icarus import config
+
+# END IMPORTS
+# ======================================================================
+
+
+# List of public names in the module
+__all__ = [
+    'HYGIENE_FIXES',
+    'HygieneResult',
+    'fix_text',
+    'fix_file',
+    'fix_files',
+]
+
+# Setting up logger for current module
+module_logger = config.master_logger.get_child_logger(__name__)
+
+# Type aliases
+#
+
+# Same names and order as the builder hooks
+HYGIENE_FIXES = ('eolnorm', 'whitespaces', 'trailing', 'eofnewline')
+
+# A NUL byte in the first bytes of a file makes it binary, as for git
+_BINARY_SNIFF_SIZE = 8000
+
+# Below this many files per worker the pool costs more than it saves
+_FILES_PER_WORKER = 64
+
+_NARROW_NBSP = '\u202f'.encode()
+_TRAILING_WHITESPACES_REGEX = re.compile(rb'[ \t\r\v\f]+$', re.MULTILINE)
+
+
+@dataclasses.dataclass(kw_only=True)
+class HygieneResult:
+    filepath: str
+    fixes: list[str] = dataclasses.field(default_factory=list)
+    error: Optional[str] = None
+
+
+def fix_text(data: bytes, fixes: Iterable[str]) -> tuple[bytes, list[str]]:
+    """
+    Apply the enabled fixes to the content of a text file.
+
+    :param data: The file content.
+    :param fixes: The enabled fixes, names from HYGIENE_FIXES.
+    :return: The fixed content and the fixes that changed it.
+    """
+
+    fixes = set(fixes)
+    applied = []
+
+    for fix in HYGIENE_FIXES:
+        if fix not in fixes:
+            continue
+
+        fixed = data
+        if fix == 'eolnorm':
+            if b'\r' in data:
+                fixed = data.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+        elif fix == 'whitespaces':
+            fixed = data.replace(_NARROW_NBSP, b' ')
+        elif fix == 'trailing':
+            fixed = _TRAILING_WHITESPACES_REGEX.sub(b'', data)
+        elif fix == 'eofnewline' and data:
+            fixed = data.rstrip(b'\n') + b'\n'
+
+        if fixed != data:
+            applied.append(fix)
+            data = fixed
+
+    return data, applied
+
+
+def fix_file(filepath: str, fixes: Iterable[str]) -> HygieneResult:
+    """
+    Apply the enabled fixes to a file, the empty and the binary files
+    are left untouched.
+
+    :param filepath: The file to fix, a symlink is resolved and its
+        target is fixed.
+    :param fixes: The enabled fixes, names from HYGIENE_FIXES.
+    :return: The HygieneResult of the file.
+    """
+
+    result = HygieneResult(filepath=filepath)
+
+    try:
+        with open(filepath, 'rb') as text_file:
+            data = text_file.read()
+
+        if not data or b'\0' in data[:_BINARY_SNIFF_SIZE]:
+            return result
+
+        fixed, result.fixes = fix_text(data, fixes)
+        if result.fixes:
+            _write_atomically(os.path.realpath(filepath), fixed)
+
+    except OSError as e:
+        result.fixes = []
+        result.error = repr(e)
+
+    return result
+
+
+def fix_files(
+    filepaths: list[str], fixes: Iterable[str], jobs: Optional[int] = None
+) -> list[HygieneResult]:
+    """
+    Apply the enabled fixes to every file across a process pool.
+
+    :param filepaths: The files to fix.
+    :param fixes: The enabled fixes, names from HYGIENE_FIXES.
+    :param jobs: The maximum number of worker processes, defaults to
+        the cpu count.
+    :return: The HygieneResult of every file, in the filepaths order.
+    """
+
+    fixes = list(fixes)
+    workers = min(jobs or os.cpu_count() or 1, len(filepaths) // _FILES_PER_WORKER)
+
+    if workers <= 1:
+        return [fix_file(filepath, fixes) for filepath in filepaths]
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(
+            executor.map(
+                fix_file,
+                filepaths,
+                [fixes] * len(filepaths),
+                chunksize=max(1, len(filepaths) // (workers * 4)),
+            )
+        )
+
+
+def _write_atomically(filepath: str, data: bytes) -> None:
+    """
+    Replace a file with a new content, keeping its permissions.
+
+    :param filepath: The file to replace.
+    :param data: The new content.
+    :return: None
+    """
+
+    mode = stat.S_IMODE(os.stat(filepath).st_mode)
+    fd, tmp_filepath = tempfile.mkstemp(
+        prefix=f".{os.path.basename(filepath)}.", dir=os.path.dirname(filepath)
+    )
+
+    try:
+        with os.fdopen(fd, 'wb') as tmp_file:
+            tmp_file.write(data)
+        os.chmod(tmp_filepath, mode)
+        os.replace(tmp_filepath, filepath)
+    except BaseException:
+        os.unlink(tmp_filepath)
+        raise
+
+
+def _read_filepaths(files_from: str) -> list[str]:
+    with open(files_from, 'rb') as files_from_file:
+        return [os.fsdecode(p) for p in files_from_file.read().split(b'\0') if p]
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """
+    Entry point used by builder.sh.
+
+    A file that could not be fixed is reported as failed for every
+    enabled hook.
+
+    :param argv: The command line arguments.
+    :return: Exit code of the script.
+    """
+
+    parser = argparse.ArgumentParser(prog=f"{config.CLI_NAME}-hygiene-helper")
+    subparsers = parser.add_subparsers(dest='hygiene_command', required=True)
+
+    fix_parser = subparsers.add_parser('fix')
+    fix_parser.add_argument('--fix', action='append', choices=HYGIENE_FIXES, required=True)
+    fix_parser.add_argument('--files-from', required=True)
+    fix_parser.add_argument('--jobs', type=int, default=None)
+    fix_parser.add_argument('--output', required=True)
+
+    args = parser.parse_args(argv)
+
+    try:
+        results = fix_files(_read_filepaths(args.files_from), args.fix, args.jobs)
+        with open(args.output, 'wb') as output_file:
+            for result in results:
+                path = os.fsencode(result.filepath)
+                if result.error is not None:
+                    print(f"Failed to fix '{result.filepath}' -- {result.error}", file=sys.stderr)
+                    for fix in args.fix:
+                        output_file.write(f"{fix}\0failed\0".encode() + path + b'\0')
+                for fix in result.fixes:
+                    output_file.write(f"{fix}\0fixed\0".encode() + path + b'\0')
+    except OSError as e:
+        print(f"Failed to run the text hygiene -- {repr(e)}", file=sys.stderr)
+        return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,139 @@
+# ======================================================================
+# MODULE DETAILS
+# This section provides metadata about the module, including its
+# creation date, author, copyright information, and a brief description
+# of the module's purpose and functionality.
+# ======================================================================
+
+#   __|    \    _ \  |      _ \   __| __ __| __ __|
+#  (      _ \     /  |     (   | (_ |    |      |
+# \___| _/  _\ _|_\ ____| \___/ \___|   _|     _|
+
+# src/icarus/handlers/builder_handler/lock_helper.py
+# Created 10/19/26 - 4:40 AM UK Time (London) by carlogtt
+
+"""
+This module takes the farm and runtime locks of path.sh.
+
+path.sh opens the lock file on a file descriptor it keeps and this
+module takes an exclusive flock on the inherited descriptor. The lock
+belongs to the open file description shared with the shell, so it is
+still held when this process exits and it is released when path.sh
+closes the descriptor or dies, a crashed build never leaves a stale
+lock behind. Waiters block in the kernel and are woken as soon as the
+lock is released.
+
+path.sh runs it with `python -m` through the `acquire` subcommand.
+"""
+
+# ======================================================================
+# EXCEPTIONS
+# This section documents any exceptions made code or quality rules.
+# These exceptions may be necessary due to specific coding requirements
+# or to bypass false positives.
+# ======================================================================
+#
+
+# ======================================================================
+# IMPORTS
+# Importing required libraries and modules for the application.
+# ======================================================================
+
+# Standard Library Imports
+import argparse
+import fcntl
+import signal
+import sys
+from typing import Any, Optional
+
+# Local Application Imports
+from icarus import config
+
+# END IMPORTS
+# ======================================================================
+
+
+# List of public names in the module
+__all__ = [
+    'acquire_lock',
+]
+
+# Setting up logger for current module
+module_logger = config.master_logger.get_child_logger(__name__)
+
+# Type aliases
+#
+
+
+class _LockTimeout(Exception):
+    pass
+
+
+def acquire_lock(fd: int, timeout: Optional[float] = None) -> bool:
+    """
+    Take an exclusive flock on a file descriptor.
+
+    :param fd: The file descriptor of the open lock file.
+    :param timeout: Seconds to wait for the current holder, 0 does not
+        wait and None waits forever.
+    :return: True if the lock was taken.
+    """
+
+    if timeout == 0:
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            return False
+        return True
+
+    if timeout is None:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        return True
+
+    def _raise_timeout(*_: Any) -> None:
+        raise _LockTimeout()
+
+    # The alarm interrupts the blocking flock
+    previous_handler = signal.signal(signal.SIGALRM, _raise_timeout)
+    signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+    except _LockTimeout:
+        return False
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous_handler)
+
+    return True
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """
+    Entry point used by path.sh.
+
+    :param argv: The command line arguments.
+    :return: Exit code of the script, 2 if the lock is held by another
+        process past the timeout.
+    """
+
+    parser = argparse.ArgumentParser(prog=f"{config.CLI_NAME}-lock-helper")
+    subparsers = parser.add_subparsers(dest='lock_command', required=True)
+
+    acquire_parser = subparsers.add_parser('acquire')
+    acquire_parser.add_argument('--fd', type=int, required=True)
+    acquire_parser.add_argument('--timeout', type=float, default=None)
+
+    args = parser.parse_args(argv)
+
+    try:
+        if not acquire_lock(args.fd, args.timeout):
+            return 2
+    except OSError as e:
+        print(f"Failed to acquire the lock on fd {args.fd} -- {repr(e)}", file=sys.stderr)
+        return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -32,6 +32,7 @@
 # Standard Library Imports
 import dataclasses
 import enum
+import sys
 from typing import Any, Literal, Union
 
 # Local Application Imports
@@ -126,13 +127,17 @@ class IcarusBuilderArg:
     running_hooks_name: list[str] = dataclasses.field(default_factory=list)
     running_hooks_count: str = ''
     platform_identifier: str = utils.platform_id()
+    cli_python_executable: str = sys.executable
     verbose: str = 'N'
+    refresh: str = ''
     run_log_filepath: str = ''
     icarus_config_filename: str = ''
     icarus_config_filepath: str = ''
     project_root_dir_abs: str = ''
     project_workspace_name: str = ''
     build_root_dir: str = ''
+    build_jobs: str = ''
+    workspace_index: str = ''
     package_name_pascal_case: str = ''
     package_name_snake_case: str = ''
     package_name_dashed: str = ''
@@ -151,6 +156,7 @@ class IcarusBuilderArg:
     run_requirements_paths: list[str] = dataclasses.field(default_factory=list)
     run_requirements_pyproject_toml: list[str] = dataclasses.field(default_factory=list)
     dev_requirements_paths: list[str] = dataclasses.field(default_factory=list)
+    precompile_farms: list[str] = dataclasses.field(default_factory=list)
     read_the_docs_requirements_path: str = ''
     icarus_ignore_array: list[str] = dataclasses.field(default_factory=list)
     is_release: str = ''
@@ -188,6 +194,9 @@ class IcarusBuilderArg:
     cache_root_dir: str = ''
     cache_clean: str = ''
     cache_size: str = ''
+    cache_gc: str = ''
+    cache_verify: str = ''
+    cache_max_size: str = ''
 
     def as_dict(self) -> dict[str, Any]:
         """
@@ -0,0 +1,189 @@
+# ======================================================================
+# MODULE DETAILS
+# This section provides metadata about the module, including its
+# creation date, author, copyright information, and a brief description
+# of the module's purpose and functionality.
+# ======================================================================
+
+#   __|    \    _ \  |      _ \   __| __ __| __ __|
+#  (      _ \     /  |     (   | (_ |    |      |
+# \___| _/  _\ _|_\ ____| \___/ \___|   _|     _|
+
+# src/icarus/handlers/builder_handler/path_helper.py
+# Created 10/18/26 - 3:05 PM UK Time (London) by carlogtt
+
+"""
+This module answers the static `builder path` recipes.
+
+Static recipes are pure functions of the build config, they mirror the
+SIMPLE, CONFIG, LANGUAGE, NAME and VERSION recipes of
+`path.sh::build_path_icarus_python3` and are answered from the
+IcarusBuilderArg without taking the builder lock or spawning bash.
+
+The farm NAME and VERSION recipes are answered from the packages
+manifest of a ready farm the same way, and fall back to path.sh when
+the farm is not built. Recipes that build or sync farms are still
+resolved by path.sh.
+"""
+
+# ======================================================================
+# EXCEPTIONS
+# This section documents any exceptions made code or quality rules.
+# These exceptions may be necessary due to specific coding requirements
+# or to bypass false positives.
+# ======================================================================
+#
+
+# ======================================================================
+# IMPORTS
+# Importing required libraries and modules for the application.
+# ======================================================================
+
+# Standard Library Imports
+import os
+from typing import Callable, Optional, Union
+
+# Local Application Imports
+from icarus import config
+from icarus.handlers.builder_handler.model import BuildSystems, IcarusBuilderArg
+
+# END IMPORTS
+# ======================================================================
+
+
+# List of public names in the module
+__all__ = [
+    'is_static_path',
+    'get_static_path',
+    'is_packages_path',
+    'get_packages_path',
+]
+
+# Setting up logger for current module
+module_logger = config.master_logger.get_child_logger(__name__)
+
+# Type aliases
+StaticRecipe = Callable[[IcarusBuilderArg], str]
+
+# Same delimiter as path.sh
+_DELIMITER_CHAR = ';'
+
+_STATIC_RECIPES: dict[str, StaticRecipe] = {
+    # SIMPLE RECIPE
+    'platform-identifier': lambda ib_arg: ib_arg.platform_identifier,
+    'workspace.name': lambda ib_arg: ib_arg.project_workspace_name,
+    'workspace.root': lambda ib_arg: ib_arg.project_root_dir_abs,
+    'workspace.src-root': lambda ib_arg: f"{ib_arg.project_root_dir_abs}/src",
+    'workspace.build-root': lambda ib_arg: f"{ib_arg.project_root_dir_abs}/{ib_arg.build_root_dir}",
+    'workspace.python-interpreters': lambda ib_arg: _DELIMITER_CHAR.join(ib_arg.python_versions),
+    # CONFIG RECIPE
+    'pkg.config': lambda ib_arg: f"{ib_arg.project_root_dir_abs}/icarus.cfg",
+    # LANGUAGE RECIPE
+    'pkg.language': lambda ib_arg: ib_arg.package_language,
+    # NAME RECIPE
+    'pkg.name-pascal': lambda ib_arg: ib_arg.package_name_pascal_case,
+    'pkg.name-snake': lambda ib_arg: ib_arg.package_name_snake_case,
+    'pkg.name-dashed': lambda ib_arg: ib_arg.package_name_dashed,
+    # VERSION RECIPE
+    'pkg.version': lambda ib_arg: ib_arg.package_version_full,
+    'pkg.version-major': lambda ib_arg: ib_arg.package_version_major,
+    'pkg.version-minor': lambda ib_arg: ib_arg.package_version_minor,
+    'pkg.version-patch': lambda ib_arg: ib_arg.package_version_patch,
+}
+
+# Farm and whether the version is pinned, NAME and VERSION recipes
+_PACKAGES_RECIPES: dict[str, tuple[str, bool]] = {
+    'tool.name': ('tool.runtimefarm', False),
+    'run.name': ('run.runtimefarm', False),
+    'run_excluderoot.name': ('run_excluderoot.runtimefarm', False),
+    'devrun.name': ('devrun.runtimefarm', False),
+    'devrun_excluderoot.name': ('devrun_excluderoot.runtimefarm', False),
+    'tool.version': ('tool.runtimefarm', True),
+    'run.version': ('run.runtimefarm', True),
+    'run_excluderoot.version': ('run_excluderoot.runtimefarm', True),
+    'devrun.version': ('devrun.runtimefarm', True),
+    'devrun_excluderoot.version': ('devrun_excluderoot.runtimefarm', True),
+}
+
+
+def is_static_path(cli_ib_arg: dict[str, Union[int, str, list[str]]]) -> bool:
+    """
+    Check whether the requested path is a static recipe.
+
+    :param cli_ib_arg: The parsed arguments of the path operation.
+    :return: True if the path can be answered by get_static_path.
+    """
+
+    if cli_ib_arg.get('list_paths'):
+        return False
+
+    return cli_ib_arg.get('path_name') in _STATIC_RECIPES
+
+
+def get_static_path(ib_arg: IcarusBuilderArg) -> str:
+    """
+    Resolve a static recipe from the build config, same response as
+    path.sh for the icarus-python3 build system.
+
+    :param ib_arg: The IcarusBuilderArg object.
+    :return: The path response.
+    """
+
+    assert ib_arg.build_system_in_use == BuildSystems.ICARUS_PYTHON3.value
+
+    return _STATIC_RECIPES[ib_arg.path_name](ib_arg)
+
+
+def is_packages_path(cli_ib_arg: dict[str, Union[int, str, list[str]]]) -> bool:
+    """
+    Check whether the requested path is a farm NAME or VERSION recipe.
+
+    :param cli_ib_arg: The parsed arguments of the path operation.
+    :return: True if the path can be answered by get_packages_path.
+    """
+
+    if cli_ib_arg.get('list_paths'):
+        return False
+
+    return cli_ib_arg.get('path_name') in _PACKAGES_RECIPES
+
+
+def get_packages_path(ib_arg: IcarusBuilderArg) -> Optional[str]:
+    """
+    Resolve a farm NAME or VERSION recipe from the packages manifest,
+    same response as path.sh for the icarus-python3 build system.
+
+    :param ib_arg: The IcarusBuilderArg object.
+    :return: The path response or None when the farm is not ready.
+    """
+
+    # Imported here, path.sh runs farm_helper with `python -m` and it
+    # must not be imported by the package already
+    from icarus.handlers.builder_handler import farm_helper
+
+    assert ib_arg.build_system_in_use == BuildSystems.ICARUS_PYTHON3.value
+
+    farm_name, with_version = _PACKAGES_RECIPES[ib_arg.path_name]
+    # Same interpreter as the run_once recipes of path.sh, the default
+    python_full_version = ib_arg.python_versions[0].split(':')[1]
+    farm_info_dir = os.path.join(
+        ib_arg.project_root_dir_abs,
+        ib_arg.build_root_dir,
+        ib_arg.platform_identifier,
+        'env',
+        'path',
+        farm_name,
+        'farm-info',
+    )
+
+    if not os.path.isfile(os.path.join(farm_info_dir, f"ready-py{python_full_version}")):
+        return None
+
+    try:
+        packages = farm_helper.read_packages_manifest(
+            os.path.join(farm_info_dir, f"packages-py{python_full_version}.json")
+        )
+    except (OSError, ValueError, KeyError):
+        return None
+
+    return farm_helper.join_packages(packages, _DELIMITER_CHAR, with_version)
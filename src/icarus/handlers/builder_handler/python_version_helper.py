@@ -0,0 +1,233 @@
+# ======================================================================
+# MODULE DETAILS
+# This section provides metadata about the module, including its
+# creation date, author, copyright information, and a brief description
+# of the module's purpose and functionality.
+# ======================================================================
+
+#   __|    \    _ \  |      _ \   __| __ __| __ __|
+#  (      _ \     /  |     (   | (_ |    |      |
+# \___| _/  _\ _|_\ ____| \___/ \___|   _|     _|
+
+# src/icarus/handlers/builder_handler/python_version_helper.py
+# Created 10/18/26 - 9:12 AM UK Time (London) by carlogtt
+
+"""
+This module resolves floating python versions (MAJOR.MINOR) to the
+latest released full version (MAJOR.MINOR.PATCH).
+
+The python.org release index is fetched at most once per invocation
+and the parsed version table is persisted in the builder cache root so
+that subsequent invocations within the TTL make no network call at all.
+Expired entries are revalidated with ETag / Last-Modified, and the last
+known table is used when python.org cannot be reached.
+"""
+
+# ======================================================================
+# EXCEPTIONS
+# This section documents any exceptions made code or quality rules.
+# These exceptions may be necessary due to specific coding requirements
+# or to bypass false positives.
+# ======================================================================
+#
+
+# ======================================================================
+# IMPORTS
+# Importing required libraries and modules for the application.
+# ======================================================================
+
+# Standard Library Imports
+import json
+import os
+import pathlib
+import re
+import tempfile
+import time
+from typing import Optional
+
+# Local Application Imports
+from icarus import config, utils
+
+# END IMPORTS
+# ======================================================================
+
+
+# List of public names in the module
+__all__ = [
+    'get_latest_python_version',
+]
+
+# Setting up logger for current module
+module_logger = config.master_logger.get_child_logger(__name__)
+
+# Type aliases
+VersionTable = dict[str, str]
+
+PYTHON_RELEASES_INDEX_URL = 'https://www.python.org/ftp/python/'
+PYTHON_VERSIONS_CACHE_TTL_SECONDS = 6 * 60 * 60
+PYTHON_RELEASES_INDEX_TIMEOUT_SECONDS = 10
+
+# In-process memo, the index is fetched at most once per invocation
+_version_table: Optional[VersionTable] = None
+_version_table_revalidated = False
+
+
+def get_latest_python_version(python_version: str) -> str:
+    """
+    Get the latest python full version for the given python version.
+
+    :param python_version: The python version as MAJOR.MINOR.
+    :return: The latest full version as MAJOR.MINOR.PATCH.
+    """
+
+    version_table = _get_version_table()
+
+    # A minor missing from a cached table may have been released after
+    # the table was stored, so revalidate once before giving up
+    if python_version not in version_table and not _version_table_revalidated:
+        version_table = _get_version_table(force_revalidate=True)
+
+    if python_version in version_table:
+        return version_table[python_version]
+
+    return f"{python_version}.0"
+
+
+def _get_version_table(force_revalidate: bool = False) -> VersionTable:
+    """
+    Return the python version table, from memory, from the builder
+    cache or from python.org in this order.
+
+    :param force_revalidate: Revalidate the cached table even if it is
+        still within its TTL.
+    :return: Mapping of MAJOR.MINOR to the latest MAJOR.MINOR.PATCH.
+    """
+
+    global _version_table, _version_table_revalidated
+
+    if _version_table is not None and not force_revalidate:
+        return _version_table
+
+    cache = _read_cache()
+    is_fresh = time.time() - cache.get('fetched_at', 0) < PYTHON_VERSIONS_CACHE_TTL_SECONDS
+
+    if cache and is_fresh and not force_revalidate:
+        _version_table = cache['versions']
+        return _version_table
+
+    headers = {}
+    if cache.get('etag'):
+        headers['If-None-Match'] = cache['etag']
+    if cache.get('last_modified'):
+        headers['If-Modified-Since'] = cache['last_modified']
+
+    _version_table_revalidated = True
+
+    # Deferred import, requests is only needed to revalidate the cache
+    import requests
+
+    try:
+        response = requests.get(
+            PYTHON_RELEASES_INDEX_URL,
+            headers=headers,
+            timeout=PYTHON_RELEASES_INDEX_TIMEOUT_SECONDS,
+        )
+        if response.status_code == 304 and cache:
+            cache['fetched_at'] = time.time()
+        else:
+            response.raise_for_status()
+            cache = {
+                'fetched_at': time.time(),
+                'etag': response.headers.get('ETag', ''),
+                'last_modified': response.headers.get('Last-Modified', ''),
+                'versions': _parse_version_table(response.text),
+            }
+        _write_cache(cache)
+
+    except requests.RequestException as e:
+        if not cache:
+            raise utils.IcarusParserException(
+                f"Unable to resolve python versions from {PYTHON_RELEASES_INDEX_URL} and no"
+                f" cached version table is available -- {repr(e)}"
+            )
+        module_logger.warning(
+            f"Unable to reach {PYTHON_RELEASES_INDEX_URL}, using the last known python"
+            f" versions -- {repr(e)}"
+        )
+
+    _version_table = cache['versions']
+
+    return _version_table
+
+
+def _parse_version_table(index_html: str) -> VersionTable:
+    """
+    Parse the python.org release index into a version table.
+
+    :param index_html: The body of the python.org release index.
+    :return: Mapping of MAJOR.MINOR to the latest MAJOR.MINOR.PATCH.
+    """
+
+    latest_patch: dict[str, int] = {}
+
+    for major, minor, patch in set(re.findall(r'(\d+)\.(\d+)\.(\d+)', index_html)):
+        short_version = f"{major}.{minor}"
+        if int(patch) >= latest_patch.get(short_version, 0):
+            latest_patch[short_version] = int(patch)
+
+    return {k: f"{k}.{v}" for k, v in latest_patch.items()}
+
+
+def _get_cache_filepath() -> pathlib.Path:
+    """
+    Return the path of the python versions cache file.
+
+    :return: The cache file path.
+    """
+
+    return config.ICARUS_BUILDER_CACHE_ROOT_DIR / config.ICARUS_PYTHON_VERSIONS_CACHE_FILENAME
+
+
+def _read_cache() -> dict:
+    """
+    Read the python versions cache file.
+
+    :return: The cache content or an empty dict if the cache is missing
+        or unreadable.
+    """
+
+    try:
+        with open(_get_cache_filepath(), 'r') as cache_file:
+            cache = json.load(cache_file)
+    except (OSError, ValueError):
+        return {}
+
+    if not isinstance(cache, dict) or not isinstance(cache.get('versions'), dict):
+        return {}
+
+    return cache
+
+
+def _write_cache(cache: dict) -> None:
+    """
+    Atomically write the python versions cache file.
+    Failing to write the cache is not fatal.
+
+    :param cache: The cache content.
+    :return: None
+    """
+
+    cache_filepath = _get_cache_filepath()
+
+    try:
+        cache_filepath.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_filepath = tempfile.mkstemp(dir=cache_filepath.parent, prefix='.python-versions-')
+        try:
+            with os.fdopen(fd, 'w') as tmp_file:
+                json.dump(cache, tmp_file, indent=2)
+            os.replace(tmp_filepath, cache_filepath)
+        except BaseException:
+            os.unlink(tmp_filepath)
+            raise
+    except OSError as e:
+        module_logger.debug(f"Unable to write {cache_filepath} -- {repr(e)}")
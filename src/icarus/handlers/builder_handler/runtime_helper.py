@@ -0,0 +1,514 @@
+# ======================================================================
+# MODULE DETAILS
+# This section provides metadata about the module, including its
+# creation date, author, copyright information, and a brief description
+# of the module's purpose and functionality.
+# ======================================================================
+
+#   __|    \    _ \  |      _ \   __| __ __| __ __|
+#  (      _ \     /  |     (   | (_ |    |      |
+# \___| _/  _\ _|_\ ____| \___/ \___|   _|     _|
+
+# src/icarus/handlers/builder_handler/runtime_helper.py
+# Created 10/18/26 - 10:20 PM UK Time (London) by carlogtt
+
+"""
+This module installs the python runtimes from a store of unpacked
+runtimes shared by every project.
+
+The store lives in the shared builder cache and keeps every runtime
+unpacked once, keyed by interpreter version and platform identifier:
+
+    <store>/<key>/runtime/<runtime files>
+    <store>/<key>/.icarus-runtime.json
+
+A store entry is populated under an flock on `<store>/<key>.flock`: the
+tarball is unpacked, the python3 shebangs are pointed at the shim and
+the files are made read-only. The marker file is written last, so an
+entry without it is incomplete and populated again.
+
+The project runtimes are hardlink clones of the store entry, or copies
+when the store is on another filesystem. A clone whose file count does
+not match the marker means the entry was damaged, it is populated again.
+
+path.sh runs it with `python -m` through the `install` subcommand, and
+through the `store` subcommand to populate the missing entries of every
+interpreter of the config concurrently.
+"""
+
+# ======================================================================
+# EXCEPTIONS
+# This section documents any exceptions made code or quality rules.
+# These exceptions may be necessary due to specific coding requirements
+# or to bypass false positives.
+# ======================================================================
+#
+
+# ======================================================================
+# IMPORTS
+# Importing required libraries and modules for the application.
+# ======================================================================
+
+# Standard Library Imports
+import argparse
+import concurrent.futures
+import contextlib
+import dataclasses
+import errno
+import fcntl
+import json
+import os
+import shutil
+import stat
+import sys
+import tempfile
+from collections.abc import Iterable, Iterator
+from typing import Any, Optional
+
+# Local Application Imports
+from icarus import config, utils
+from icarus.handlers.builder_handler import cache_helper, download_helper, farm_helper
+
+# END IMPORTS
+# ======================================================================
+
+
+# List of public names in the module
+__all__ = [
+    'RuntimeInstallReport',
+    'install_runtime',
+    'store_runtime',
+    'store_runtimes',
+    'remove_entry',
+]
+
+# Setting up logger for current module
+module_logger = config.master_logger.get_child_logger(__name__)
+
+# Type aliases
+#
+
+# Written in every store entry once it is complete
+_MARKER_FILENAME = '.icarus-runtime.json'
+
+# Removes the write bits of the stored files
+_READ_ONLY_MASK = ~(stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH)
+
+
+@dataclasses.dataclass(kw_only=True)
+class RuntimeInstallReport:
+    populated: bool = False
+    download: Optional[download_helper.DownloadResult] = None
+    files: int = 0
+    copied: bool = False
+    error: Optional[str] = None
+
+
+def install_runtime(
+    url: str,
+    tarball: str,
+    store_root: str,
+    store_key: str,
+    target_dir: str,
+    shebang: str,
+    prunes: Iterable[str] = (),
+) -> RuntimeInstallReport:
+    """
+    Clone the stored runtime into target_dir, populating the store entry
+    first when it is missing or damaged.
+
+    :param url: The runtime tarball URL.
+    :param tarball: The cache path of the tarball.
+    :param store_root: The runtime store directory.
+    :param store_key: The store key of the runtime.
+    :param target_dir: The project runtime directory, it must not exist.
+    :param shebang: The shebang shim of the runtime python3 scripts.
+    :param prunes: Paths relative to the runtime that are not scanned
+        for shebangs.
+    :return: The RuntimeInstallReport of the install.
+    :raise IcarusDownloadException: If the tarball cannot be downloaded
+        or unpacked.
+    """
+
+    report = RuntimeInstallReport()
+    entry_path = os.path.join(store_root, store_key)
+
+    with _entry_lock(entry_path):
+        for _ in range(2):
+            marker = _read_marker(entry_path)
+            if marker is None:
+                marker = _populate_entry(url, tarball, entry_path, shebang, prunes, report)
+
+            files, report.copied = _clone_tree(os.path.join(entry_path, 'runtime'), target_dir)
+            if files == marker['files']:
+                report.files = files
+                return report
+
+            module_logger.debug(f"Damaged store entry {entry_path=} {files=} {marker=}")
+            shutil.rmtree(target_dir)
+            os.remove(os.path.join(entry_path, _MARKER_FILENAME))
+
+    raise utils.IcarusDownloadException(f"Store entry '{entry_path}' does not match its marker")
+
+
+def store_runtime(
+    url: str,
+    tarball: str,
+    store_root: str,
+    store_key: str,
+    shebang: str,
+    prunes: Iterable[str] = (),
+) -> RuntimeInstallReport:
+    """
+    Populate the store entry of a runtime when it is missing, without
+    cloning it into a project.
+
+    :param url: The runtime tarball URL.
+    :param tarball: The cache path of the tarball.
+    :param store_root: The runtime store directory.
+    :param store_key: The store key of the runtime.
+    :param shebang: The shebang shim of the runtime python3 scripts.
+    :param prunes: Paths relative to the runtime that are not scanned
+        for shebangs.
+    :return: The RuntimeInstallReport of the population.
+    :raise IcarusDownloadException: If the tarball cannot be downloaded
+        or unpacked.
+    """
+
+    report = RuntimeInstallReport()
+    entry_path = os.path.join(store_root, store_key)
+
+    with _entry_lock(entry_path):
+        if _read_marker(entry_path) is None:
+            _populate_entry(url, tarball, entry_path, shebang, prunes, report)
+
+    return report
+
+
+def store_runtimes(
+    runtimes: list[tuple[str, str, str, str]],
+    store_root: str,
+    prunes: Iterable[str],
+    jobs: int,
+) -> list[RuntimeInstallReport]:
+    """
+    Populate several store entries concurrently, every runtime is
+    unpacked while it is downloaded.
+
+    :param runtimes: The (url, tarball, store_key, shebang) of every
+        runtime.
+    :param store_root: The runtime store directory.
+    :param prunes: Paths not scanned for shebangs.
+    :param jobs: The maximum number of concurrent populations.
+    :return: The RuntimeInstallReport of every runtime, in the same
+        order, with the error set on failure.
+    """
+
+    prunes = list(prunes)
+
+    def _store(url: str, tarball: str, store_key: str, shebang: str) -> RuntimeInstallReport:
+        try:
+            return store_runtime(url, tarball, store_root, store_key, shebang, prunes)
+        except (OSError, utils.IcarusDownloadException) as e:
+            return RuntimeInstallReport(error=str(e))
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, jobs)) as executor:
+        futures = [executor.submit(_store, *runtime) for runtime in runtimes]
+
+    return [future.result() for future in futures]
+
+
+def remove_entry(entry_path: str) -> None:
+    """
+    Remove a store entry, waiting for the install in progress if any.
+    The project runtimes cloned from it are left as they are.
+
+    :param entry_path: The store entry directory.
+    :return: None
+    """
+
+    with _entry_lock(entry_path):
+        # Without its marker a partially removed entry is never used
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(os.path.join(entry_path, _MARKER_FILENAME))
+        shutil.rmtree(entry_path, ignore_errors=True)
+
+
+def _populate_entry(
+    url: str,
+    tarball: str,
+    entry_path: str,
+    shebang: str,
+    prunes: Iterable[str],
+    report: RuntimeInstallReport,
+) -> dict[str, Any]:
+    """
+    Unpack the runtime into the store entry and mark it complete.
+
+    :param url: The runtime tarball URL.
+    :param tarball: The cache path of the tarball.
+    :param entry_path: The store entry directory.
+    :param shebang: The shebang shim of the runtime python3 scripts.
+    :param prunes: Paths not scanned for shebangs.
+    :param report: The RuntimeInstallReport to update.
+    :return: The marker of the entry.
+    """
+
+    runtime_dir = os.path.join(entry_path, 'runtime')
+
+    # Leftovers of an interrupted population
+    shutil.rmtree(entry_path, ignore_errors=True)
+    os.makedirs(entry_path)
+
+    report.download = download_helper.unpack(url, tarball, runtime_dir)
+    farm_helper.fix_shebangs(runtime_dir, shebang, prunes=prunes)
+
+    marker = {'url': url, 'shebang': shebang, 'files': _make_read_only(runtime_dir)}
+
+    tmp_filepath = os.path.join(entry_path, f"{_MARKER_FILENAME}.{os.getpid()}.tmp")
+    with open(tmp_filepath, 'w') as tmp_file:
+        json.dump(marker, tmp_file, indent=2)
+    os.replace(tmp_filepath, os.path.join(entry_path, _MARKER_FILENAME))
+
+    report.populated = True
+
+    return marker
+
+
+def _make_read_only(root: str) -> int:
+    """
+    Remove the write bits of every file under root, the directories are
+    left writable so the store can still be cleaned.
+
+    :param root: The directory to walk.
+    :return: The number of files and symlinks under root.
+    """
+
+    files = 0
+
+    for dirpath, dirnames, filenames in os.walk(root):
+        for name in dirnames:
+            if os.path.islink(os.path.join(dirpath, name)):
+                files += 1
+        for name in filenames:
+            filepath = os.path.join(dirpath, name)
+            files += 1
+            if not os.path.islink(filepath):
+                os.chmod(filepath, os.stat(filepath).st_mode & _READ_ONLY_MASK)
+
+    return files
+
+
+def _clone_tree(source_dir: str, target_dir: str) -> tuple[int, bool]:
+    """
+    Hardlink the files of source_dir into a staging directory and rename
+    it to target_dir. The files are copied when the two are on different
+    filesystems and the symlinks are recreated as they are.
+
+    :param source_dir: The stored runtime.
+    :param target_dir: The directory to create.
+    :return: The number of files and symlinks cloned and whether they
+        were copied instead of hardlinked.
+    """
+
+    parent_dir = os.path.dirname(os.path.abspath(target_dir))
+    os.makedirs(parent_dir, exist_ok=True)
+    staging_dir = tempfile.mkdtemp(prefix='.clone-', dir=parent_dir)
+
+    files = 0
+    is_copied = False
+
+    try:
+        pending = ['']
+        while pending:
+            relpath = pending.pop()
+            for entry in os.scandir(os.path.join(source_dir, relpath)):
+                dest = os.path.join(staging_dir, relpath, entry.name)
+                if entry.is_symlink():
+                    os.symlink(os.readlink(entry.path), dest)
+                    files += 1
+                elif entry.is_dir():
+                    os.mkdir(dest)
+                    pending.append(os.path.join(relpath, entry.name))
+                else:
+                    if not is_copied:
+                        try:
+                            os.link(entry.path, dest)
+                            files += 1
+                            continue
+                        except OSError as e:
+                            if e.errno not in (errno.EXDEV, errno.EPERM, errno.EMLINK):
+                                raise
+                            is_copied = True
+                    shutil.copy2(entry.path, dest)
+                    files += 1
+
+        os.chmod(staging_dir, os.stat(source_dir).st_mode)
+        os.rename(staging_dir, target_dir)
+
+    except BaseException:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+        raise
+
+    return files, is_copied
+
+
+def _read_marker(entry_path: str) -> Optional[dict[str, Any]]:
+    try:
+        with open(os.path.join(entry_path, _MARKER_FILENAME), 'r') as marker_file:
+            marker: dict[str, Any] = json.load(marker_file)
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(marker.get('files'), int):
+        return None
+
+    return marker
+
+
+@contextlib.contextmanager
+def _entry_lock(entry_path: str) -> Iterator[None]:
+    """
+    Lock a store entry while it is populated or cloned.
+
+    :param entry_path: The store entry directory.
+    :return: None
+    """
+
+    os.makedirs(os.path.dirname(entry_path), exist_ok=True)
+
+    with open(f"{entry_path}.flock", 'a') as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """
+    Entry point used by path.sh.
+
+    :param argv: The command line arguments.
+    :return: Exit code of the script.
+    """
+
+    parser = argparse.ArgumentParser(prog=f"{config.CLI_NAME}-runtime-helper")
+    subparsers = parser.add_subparsers(dest='runtime_command', required=True)
+
+    install_parser = subparsers.add_parser('install')
+    install_parser.add_argument('--url', required=True)
+    install_parser.add_argument('--tarball', required=True)
+    install_parser.add_argument('--store', required=True)
+    install_parser.add_argument('--key', required=True)
+    install_parser.add_argument('--target', required=True)
+    install_parser.add_argument('--shebang', required=True)
+    install_parser.add_argument('--prune', action='append', default=[])
+    install_parser.add_argument('--cache-root', default=None)
+    install_parser.add_argument('--owner', default='')
+
+    store_parser = subparsers.add_parser('store')
+    store_parser.add_argument(
+        '--runtime',
+        nargs=4,
+        action='append',
+        required=True,
+        metavar=('URL', 'TARBALL', 'KEY', 'SHEBANG'),
+    )
+    store_parser.add_argument('--store', required=True)
+    store_parser.add_argument('--prune', action='append', default=[])
+    store_parser.add_argument('--jobs', type=int, default=0)
+    store_parser.add_argument('--cache-root', default=None)
+    store_parser.add_argument('--owner', default='')
+
+    args = parser.parse_args(argv)
+
+    if args.runtime_command == 'store':
+        return _main_store(args)
+
+    try:
+        report = install_runtime(
+            url=args.url,
+            tarball=args.tarball,
+            store_root=args.store,
+            store_key=args.key,
+            target_dir=args.target,
+            shebang=args.shebang,
+            prunes=args.prune,
+        )
+    except (OSError, utils.IcarusDownloadException) as e:
+        print(f"Failed to install '{args.key}' -- {e}", file=sys.stderr)
+        return 1
+
+    if report.download is None:
+        print(f"Using stored runtime {args.key}")
+    elif report.download.cached:
+        print(f"Stored runtime {args.key} from the cached {os.path.basename(args.tarball)}")
+    else:
+        print(f"Stored runtime {args.key} from {args.url}")
+
+    if report.copied:
+        print("Runtime store on another filesystem, files copied instead of hardlinked")
+
+    print(f"Cloned {report.files} file(s) into {args.target}")
+
+    if args.cache_root is not None:
+        try:
+            cache_helper.record_access(
+                args.cache_root, [args.tarball], args.owner, refresh=report.download is not None
+            )
+            cache_helper.record_access(
+                args.cache_root,
+                [os.path.join(args.store, args.key)],
+                args.owner,
+                refresh=report.populated,
+            )
+        except OSError as e:
+            print(f"Failed to record the cache access -- {repr(e)}", file=sys.stderr)
+
+    return 0
+
+
+def _main_store(args: argparse.Namespace) -> int:
+    """
+    Run the store subcommand.
+
+    :param args: The parsed command line arguments.
+    :return: Exit code of the script, 1 if any runtime failed.
+    """
+
+    reports = store_runtimes(
+        [tuple(runtime) for runtime in args.runtime],
+        args.store,
+        args.prune,
+        args.jobs or len(args.runtime),
+    )
+
+    return_code = 0
+    for (url, tarball, key, _), report in zip(args.runtime, reports):
+        if report.error is not None:
+            print(f"Failed to store '{key}' -- {report.error}", file=sys.stderr)
+            return_code = 1
+            continue
+
+        if report.download is None:
+            print(f"Using stored runtime {key}")
+        elif report.download.cached:
+            print(f"Stored runtime {key} from the cached {os.path.basename(tarball)}")
+        else:
+            print(f"Stored runtime {key} from {url}")
+
+        if args.cache_root is not None and report.download is not None:
+            try:
+                cache_helper.record_access(args.cache_root, [tarball], args.owner, refresh=True)
+                cache_helper.record_access(
+                    args.cache_root, [os.path.join(args.store, key)], args.owner, refresh=True
+                )
+            except OSError as e:
+                print(f"Failed to record the cache access -- {repr(e)}", file=sys.stderr)
+
+    return return_code
+
+
+if __name__ == '__main__':
+    sys.exit(main())
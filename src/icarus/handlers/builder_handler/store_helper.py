@@ -0,0 +1,682 @@
+# ======================================================================
+# MODULE DETAILS
+# This section provides metadata about the module, including its
+# creation date, author, copyright information, and a brief description
+# of the module's purpose and functionality.
+# ======================================================================
+
+#   __|    \    _ \  |      _ \   __| __ __| __ __|
+#  (      _ \     /  |     (   | (_ |    |      |
+# \___| _/  _\ _|_\ ____| \___/ \___|   _|     _|
+
+# src/icarus/handlers/builder_handler/store_helper.py
+# Created 10/18/26 - 7:20 PM UK Time (London) by carlogtt
+
+"""
+This module installs the farm dependencies from a content-addressed
+package store.
+
+The store lives in the shared builder cache and keeps every installed
+distribution unpacked once, keyed by interpreter and archive sha256:
+
+    <store>/<key>/<sha256>/<files relative to the python prefix>
+
+The distributions of a pip install report that are not in the store yet
+are installed by a single pip run into a scratch prefix and split into
+store entries by their RECORD. The farms are then assembled by
+hardlinking the entry files into their python prefix, or by copying them
+when the store is on another filesystem. The entry files are made read
+only when the entry is added, a write through one farm would change
+every farm sharing them.
+
+A hardlinked file is shared by every farm that uses it, so its link
+count is the reference count of the entry, and the entries with no file
+linked anywhere else are removed by the garbage collection.
+
+Requirements that are not from an index (local paths, VCS or direct
+URLs) are not stored, they are written to a requirements file that is
+installed by pip as before.
+
+path.sh runs it with `python -m` through the `install` and `gc`
+subcommands.
+"""
+
+# ======================================================================
+# EXCEPTIONS
+# This section documents any exceptions made code or quality rules.
+# These exceptions may be necessary due to specific coding requirements
+# or to bypass false positives.
+# ======================================================================
+#
+
+# ======================================================================
+# IMPORTS
+# Importing required libraries and modules for the application.
+# ======================================================================
+
+# Standard Library Imports
+import argparse
+import contextlib
+import csv
+import dataclasses
+import email.parser
+import errno
+import fcntl
+import glob
+import json
+import os
+import re
+import shutil
+import stat
+import subprocess
+import sys
+import tempfile
+from collections.abc import Iterator
+from typing import Any, Optional
+
+# Local Application Imports
+from icarus import config
+from icarus.handlers.builder_handler import cache_helper, farm_helper
+
+# END IMPORTS
+# ======================================================================
+
+
+# List of public names in the module
+__all__ = [
+    'StoreInstallReport',
+    'StoreGcReport',
+    'install_from_report',
+    'collect_garbage',
+    'remove_entry',
+]
+
+# Setting up logger for current module
+module_logger = config.master_logger.get_child_logger(__name__)
+
+# Type aliases
+ReportItem = dict[str, Any]
+
+# Written in every store entry, it lists the entry files
+_ENTRY_INFO_FILENAME = '.icarus-store.json'
+
+# Removes the write bits of the stored files
+_READ_ONLY_MASK = ~(stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH)
+
+
+@dataclasses.dataclass(kw_only=True)
+class StoreInstallReport:
+    added: list[str] = dataclasses.field(default_factory=list)
+    linked: list[str] = dataclasses.field(default_factory=list)
+    unchanged: list[str] = dataclasses.field(default_factory=list)
+    fallback: list[str] = dataclasses.field(default_factory=list)
+    entries: list[str] = dataclasses.field(default_factory=list)
+    copied: bool = False
+
+
+@dataclasses.dataclass(kw_only=True)
+class StoreGcReport:
+    removed: list[str] = dataclasses.field(default_factory=list)
+    freed_bytes: int = 0
+
+
+def install_from_report(
+    report_filepath: str,
+    store_root: str,
+    store_key: str,
+    prefix: str,
+    python_executable: str,
+    shebang: Optional[str] = None,
+    fallback_filepath: Optional[str] = None,
+) -> StoreInstallReport:
+    """
+    Install the distributions of a pip install report into a python
+    prefix from the package store.
+
+    A distribution already installed in the prefix is replaced, the
+    same as `pip install --force-reinstall`, unless it is already
+    linked to the same store entry.
+
+    :param report_filepath: The `pip install --dry-run --report` file.
+    :param store_root: The package store directory.
+    :param store_key: The interpreter key, the entries are not shared
+        across interpreters.
+    :param prefix: The python prefix (PYTHONHOME) to install into.
+    :param python_executable: The interpreter running pip to add the
+        missing distributions to the store.
+    :param shebang: The shebang line of the stored scripts.
+    :param fallback_filepath: The requirements file written with the
+        distributions that cannot be stored.
+    :return: The StoreInstallReport of the run.
+    """
+
+    report = StoreInstallReport()
+
+    with open(report_filepath, 'r') as report_file:
+        items = json.load(report_file).get('install', [])
+
+    stored_items = {}
+    for item in items:
+        sha256 = _get_archive_sha256(item)
+        if sha256 is None:
+            report.fallback.append(_get_requirement_line(item))
+        else:
+            stored_items[sha256] = item
+
+    key_root = os.path.join(store_root, store_key)
+    site_packages = _get_site_packages(prefix)
+    os.makedirs(key_root, exist_ok=True)
+
+    with _store_lock(store_root, exclusive=False):
+        missing = {
+            sha256: item
+            for sha256, item in stored_items.items()
+            if not os.path.isdir(os.path.join(key_root, sha256))
+        }
+        if missing:
+            _add_to_store(missing, key_root, site_packages, python_executable, shebang)
+            report.added = [_get_name(item) for item in missing.values()]
+
+        for sha256, item in stored_items.items():
+            entry_path = os.path.join(key_root, sha256)
+            report.entries.append(entry_path)
+            if _is_linked(entry_path, prefix):
+                report.unchanged.append(_get_name(item))
+                continue
+            _uninstall(_get_name(item), prefix, site_packages)
+            if not _link_entry(entry_path, prefix):
+                report.copied = True
+            report.linked.append(_get_name(item))
+
+    if fallback_filepath is not None:
+        with open(fallback_filepath, 'w') as fallback_file:
+            fallback_file.writelines(f"{line}\n" for line in report.fallback)
+
+    return report
+
+
+def collect_garbage(store_root: str) -> StoreGcReport:
+    """
+    Remove the store entries that are not linked into any farm, that is
+    the entries whose files all have a link count of one.
+
+    :param store_root: The package store directory.
+    :return: The StoreGcReport of the run.
+    """
+
+    report = StoreGcReport()
+
+    if not os.path.isdir(store_root):
+        return report
+
+    with _store_lock(store_root, exclusive=True):
+        entry_paths = [
+            entry.path
+            for key_root in glob.glob(os.path.join(glob.escape(store_root), '*'))
+            if os.path.isdir(key_root)
+            for entry in os.scandir(key_root)
+            if entry.is_dir(follow_symlinks=False)
+        ]
+
+        for entry_path in sorted(entry_paths):
+            # Scratch prefixes left by an interrupted install
+            is_scratch = os.path.basename(entry_path).startswith('.')
+
+            size = 0
+            is_referenced = False
+            for dirpath, _, filenames in os.walk(entry_path):
+                for filename in filenames:
+                    stat = os.lstat(os.path.join(dirpath, filename))
+                    size += stat.st_size
+                    if stat.st_nlink > 1:
+                        is_referenced = True
+
+            if is_referenced and not is_scratch:
+                continue
+
+            shutil.rmtree(entry_path)
+            report.removed.append(os.path.relpath(entry_path, store_root))
+            report.freed_bytes += size
+
+    return report
+
+
+def remove_entry(store_root: str, entry_path: str) -> None:
+    """
+    Remove a store entry, waiting for the installs in progress. The
+    farms keep their hardlinks to the entry files.
+
+    :param store_root: The package store directory.
+    :param entry_path: The store entry directory.
+    :return: None
+    """
+
+    with _store_lock(store_root, exclusive=True):
+        shutil.rmtree(entry_path, ignore_errors=True)
+
+
+def _add_to_store(
+    items: dict[str, ReportItem],
+    key_root: str,
+    site_packages: str,
+    python_executable: str,
+    shebang: Optional[str],
+) -> None:
+    """
+    Install the missing distributions into a scratch prefix with a
+    single pip run and move them into their store entries.
+
+    :param items: The report items to store by archive sha256.
+    :param key_root: The store directory of the interpreter.
+    :param site_packages: The site-packages path relative to the prefix.
+    :param python_executable: The interpreter running pip.
+    :param shebang: The shebang line of the stored scripts.
+    :return: None
+    """
+
+    with tempfile.TemporaryDirectory(prefix='.install-', dir=key_root) as scratch_root:
+        scratch_prefix = os.path.join(scratch_root, 'prefix')
+
+        subprocess.run(
+            [
+                python_executable,
+                '-m',
+                'pip',
+                'install',
+                '--no-deps',
+                '--no-compile',
+                '--ignore-installed',
+                '--no-warn-script-location',
+                '--disable-pip-version-check',
+                '--prefix',
+                scratch_prefix,
+                *(
+                    f"{item['download_info']['url']}#sha256={sha256}"
+                    for sha256, item in items.items()
+                ),
+            ],
+            check=True,
+        )
+
+        dist_infos = _get_dist_infos(os.path.join(scratch_prefix, site_packages))
+
+        for sha256, item in items.items():
+            dist_info = dist_infos[_canonicalize_name(_get_name(item))]
+            entry_scratch = os.path.join(scratch_root, sha256)
+
+            files = _move_dist(dist_info, scratch_prefix, site_packages, entry_scratch)
+
+            if shebang is not None and os.path.isdir(os.path.join(entry_scratch, 'bin')):
+                farm_helper.fix_shebangs(os.path.join(entry_scratch, 'bin'), shebang)
+
+            with open(os.path.join(entry_scratch, _ENTRY_INFO_FILENAME), 'w') as info_file:
+                json.dump(
+                    {'name': _get_name(item), 'version': _get_version(item), 'files': files},
+                    info_file,
+                    indent=2,
+                )
+
+            _make_read_only(entry_scratch, [*files, _ENTRY_INFO_FILENAME])
+
+            try:
+                os.rename(entry_scratch, os.path.join(key_root, sha256))
+            except OSError as e:
+                # Added by a concurrent install
+                if e.errno not in (errno.EEXIST, errno.ENOTEMPTY):
+                    raise
+
+
+def _move_dist(
+    dist_info: str, scratch_prefix: str, site_packages: str, entry_path: str
+) -> list[str]:
+    """
+    Move the files of an installed distribution into a store entry.
+
+    The distribution is installed from its archive URL, so pip records
+    it as a direct URL install, direct_url.json is dropped to keep it
+    an index install in the farms.
+
+    :param dist_info: The dist-info directory in the scratch prefix.
+    :param scratch_prefix: The scratch prefix.
+    :param site_packages: The site-packages path relative to the prefix.
+    :param entry_path: The store entry directory.
+    :return: The entry files relative to the prefix.
+    """
+
+    record_filepath = os.path.join(dist_info, 'RECORD')
+    direct_url = os.path.join(os.path.basename(dist_info), 'direct_url.json')
+
+    with open(record_filepath, 'r', newline='') as record_file:
+        rows = [row for row in csv.reader(record_file) if row and row[0] != direct_url]
+
+    with open(record_filepath, 'w', newline='') as record_file:
+        csv.writer(record_file, lineterminator='\n').writerows(rows)
+
+    files = []
+    for row in rows:
+        relpath = os.path.normpath(os.path.join(site_packages, row[0]))
+        if relpath.startswith('..') or os.path.isabs(relpath):
+            continue
+        source = os.path.join(scratch_prefix, relpath)
+        if not os.path.lexists(source):
+            continue
+        os.renames(source, os.path.join(entry_path, relpath))
+        files.append(relpath)
+
+    return files
+
+
+def _make_read_only(entry_path: str, relpaths: list[str]) -> None:
+    """
+    Remove the write bits of the entry files, the directories are left
+    writable so the entry can still be removed.
+
+    :param entry_path: The store entry directory.
+    :param relpaths: The entry files relative to entry_path.
+    :return: None
+    """
+
+    for relpath in relpaths:
+        filepath = os.path.join(entry_path, relpath)
+        if not os.path.islink(filepath):
+            os.chmod(filepath, os.stat(filepath).st_mode & _READ_ONLY_MASK)
+
+
+def _link_entry(entry_path: str, prefix: str) -> bool:
+    """
+    Hardlink the files of a store entry into the prefix, the files are
+    copied when the store is on another filesystem.
+
+    :param entry_path: The store entry directory.
+    :param prefix: The python prefix.
+    :return: True if the files were hardlinked.
+    """
+
+    is_hardlinked = True
+
+    for relpath in _read_entry_info(entry_path)['files']:
+        source = os.path.join(entry_path, relpath)
+        dest = os.path.join(prefix, relpath)
+
+        os.makedirs(os.path.dirname(dest), exist_ok=True)
+        if os.path.lexists(dest):
+            os.unlink(dest)
+
+        if is_hardlinked and not os.path.islink(source):
+            try:
+                os.link(source, dest)
+                continue
+            except OSError as e:
+                if e.errno not in (errno.EXDEV, errno.EPERM, errno.EMLINK):
+                    raise
+                is_hardlinked = False
+
+        shutil.copy2(source, dest, follow_symlinks=False)
+
+    return is_hardlinked
+
+
+def _is_linked(entry_path: str, prefix: str) -> bool:
+    """
+    Check whether every file of a store entry is already hardlinked into
+    the prefix.
+
+    :param entry_path: The store entry directory.
+    :param prefix: The python prefix.
+    :return: True if the prefix is linked to the entry.
+    """
+
+    try:
+        files = _read_entry_info(entry_path)['files']
+        return all(
+            os.path.samefile(os.path.join(entry_path, relpath), os.path.join(prefix, relpath))
+            for relpath in files
+        )
+    except (OSError, ValueError, KeyError):
+        return False
+
+
+def _uninstall(name: str, prefix: str, site_packages: str) -> None:
+    """
+    Remove a distribution from the prefix by its RECORD.
+
+    :param name: The distribution name.
+    :param prefix: The python prefix.
+    :param site_packages: The site-packages path relative to the prefix.
+    :return: None
+    """
+
+    site_packages_path = os.path.join(prefix, site_packages)
+    dist_info = _get_dist_infos(site_packages_path).get(_canonicalize_name(name))
+
+    if dist_info is None:
+        return
+
+    with open(os.path.join(dist_info, 'RECORD'), 'r', newline='') as record_file:
+        relpaths = [row[0] for row in csv.reader(record_file) if row]
+
+    parents = set()
+    for relpath in relpaths:
+        path = os.path.normpath(os.path.join(site_packages_path, relpath))
+        if not path.startswith(f"{prefix}/"):
+            continue
+        if path.endswith('.py'):
+            cache_dir = os.path.join(os.path.dirname(path), '__pycache__')
+            stem = os.path.splitext(os.path.basename(path))[0]
+            for pyc in glob.glob(
+                os.path.join(glob.escape(cache_dir), f"{glob.escape(stem)}.*.pyc")
+            ):
+                os.unlink(pyc)
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(path)
+        parents.add(os.path.dirname(path))
+
+    shutil.rmtree(dist_info, ignore_errors=True)
+
+    # Empty package directories, deepest first
+    for parent in sorted(parents, key=len, reverse=True):
+        while parent.startswith(f"{site_packages_path}/"):
+            with contextlib.suppress(OSError):
+                os.rmdir(os.path.join(parent, '__pycache__'))
+            try:
+                os.rmdir(parent)
+            except OSError:
+                break
+            parent = os.path.dirname(parent)
+
+
+def _get_dist_infos(site_packages_path: str) -> dict[str, str]:
+    """
+    Map the distributions installed in a site-packages directory to
+    their dist-info directory.
+
+    :param site_packages_path: The site-packages directory.
+    :return: The dist-info paths by canonical distribution name.
+    """
+
+    dist_infos = {}
+
+    for dist_info in glob.glob(os.path.join(glob.escape(site_packages_path), '*.dist-info')):
+        try:
+            with open(os.path.join(dist_info, 'METADATA'), 'r', encoding='utf-8') as metadata:
+                name = email.parser.HeaderParser().parse(metadata)['Name']
+        except OSError:
+            continue
+        if name:
+            dist_infos[_canonicalize_name(name)] = dist_info
+
+    return dist_infos
+
+
+def _get_site_packages(prefix: str) -> str:
+    """
+    Get the site-packages path of a python prefix.
+
+    :param prefix: The python prefix.
+    :return: The site-packages path relative to the prefix.
+    """
+
+    site_packages = glob.glob(os.path.join(glob.escape(prefix), 'lib', 'python*', 'site-packages'))
+
+    if len(site_packages) != 1:
+        raise FileNotFoundError(errno.ENOENT, 'No single site-packages directory', prefix)
+
+    return os.path.relpath(site_packages[0], prefix)
+
+
+def _get_archive_sha256(item: ReportItem) -> Optional[str]:
+    """
+    Get the archive sha256 of a report item that comes from an index.
+
+    :param item: The report item.
+    :return: The sha256 or None if the item cannot be stored.
+    """
+
+    if item.get('is_direct'):
+        return None
+
+    archive_info = item.get('download_info', {}).get('archive_info')
+    if not archive_info:
+        return None
+
+    sha256 = archive_info.get('hashes', {}).get('sha256')
+    if sha256 is None and archive_info.get('hash', '').startswith('sha256='):
+        sha256 = archive_info['hash'].removeprefix('sha256=')
+
+    return str(sha256) if sha256 is not None else None
+
+
+def _get_requirement_line(item: ReportItem) -> str:
+    """
+    Get the requirements file line of a report item.
+
+    :param item: The report item.
+    :return: The requirement line.
+    """
+
+    download_info = item['download_info']
+    url = download_info['url']
+
+    if 'vcs_info' in download_info:
+        vcs_info = download_info['vcs_info']
+        url = f"{vcs_info['vcs']}+{url}@{vcs_info['commit_id']}"
+    elif download_info.get('dir_info', {}).get('editable'):
+        return f"--editable {url}"
+
+    return f"{_get_name(item)} @ {url}"
+
+
+def _get_name(item: ReportItem) -> str:
+    return str(item['metadata']['name'])
+
+
+def _get_version(item: ReportItem) -> str:
+    return str(item['metadata']['version'])
+
+
+def _canonicalize_name(name: str) -> str:
+    # Same normalization as PEP 503
+    return re.sub(r'[-_.]+', '-', name).lower()
+
+
+def _read_entry_info(entry_path: str) -> dict[str, Any]:
+    with open(os.path.join(entry_path, _ENTRY_INFO_FILENAME), 'r') as info_file:
+        entry_info: dict[str, Any] = json.load(info_file)
+
+    return entry_info
+
+
+@contextlib.contextmanager
+def _store_lock(store_root: str, exclusive: bool) -> Iterator[None]:
+    """
+    Lock the store, installs share the lock while the garbage collection
+    takes it exclusively.
+
+    :param store_root: The package store directory.
+    :param exclusive: Whether to take the exclusive lock.
+    :return: None
+    """
+
+    os.makedirs(store_root, exist_ok=True)
+
+    with open(os.path.join(store_root, '.lock'), 'a') as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """
+    Entry point used by path.sh.
+
+    :param argv: The command line arguments.
+    :return: Exit code of the script.
+    """
+
+    parser = argparse.ArgumentParser(prog=f"{config.CLI_NAME}-store-helper")
+    subparsers = parser.add_subparsers(dest='store_command', required=True)
+
+    install_parser = subparsers.add_parser('install')
+    install_parser.add_argument('report')
+    install_parser.add_argument('--store', required=True)
+    install_parser.add_argument('--key', required=True)
+    install_parser.add_argument('--prefix', required=True)
+    install_parser.add_argument('--python', required=True)
+    install_parser.add_argument('--shebang', default=None)
+    install_parser.add_argument('--fallback', default=None)
+    install_parser.add_argument('--cache-root', default=None)
+    install_parser.add_argument('--owner', default='')
+
+    gc_parser = subparsers.add_parser('gc')
+    gc_parser.add_argument('store')
+
+    args = parser.parse_args(argv)
+
+    if args.store_command == 'gc':
+        try:
+            gc_report = collect_garbage(args.store)
+        except OSError as e:
+            print(f"Failed to clean '{args.store}' -- {repr(e)}", file=sys.stderr)
+            return 1
+
+        print(
+            f"{len(gc_report.removed)} unreferenced package(s) removed,"
+            f" {gc_report.freed_bytes} bytes freed"
+        )
+        return 0
+
+    try:
+        report = install_from_report(
+            report_filepath=args.report,
+            store_root=args.store,
+            store_key=args.key,
+            prefix=args.prefix,
+            python_executable=args.python,
+            shebang=args.shebang,
+            fallback_filepath=args.fallback,
+        )
+    except (OSError, ValueError, KeyError, subprocess.CalledProcessError) as e:
+        print(f"Failed to install from the package store -- {repr(e)}", file=sys.stderr)
+        return 1
+
+    if args.cache_root is not None:
+        try:
+            cache_helper.record_access(args.cache_root, report.entries, args.owner)
+        except OSError as e:
+            print(f"Failed to record the cache access -- {repr(e)}", file=sys.stderr)
+
+    if report.copied:
+        print("Package store on another filesystem, files copied instead of hardlinked")
+
+    print(
+        f"{len(report.added)} added to the store, {len(report.linked)} linked,"
+        f" {len(report.unchanged)} unchanged, {len(report.fallback)} left to pip"
+    )
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,593 @@
+# ======================================================================
+# MODULE DETAILS
+# This section provides metadata about the module, including its
+# creation date, author, copyright information, and a brief description
+# of the module's purpose and functionality.
+# ======================================================================
+
+#   __|    \    _ \  |      _ \   __| __ __| __ __|
+#  (      _ \     /  |     (   | (_ |    |      |
+# \___| _/  _\ _|_\ ____| \___/ \___|   _|     _|
+
+# src/icarus/handlers/builder_handler/workspace_helper.py
+# Created 10/19/26 - 12:30 AM UK Time (London) by carlogtt
+
+"""
+This module indexes the files of the package root that the builder
+hooks run on.
+
+The icarus.cfg ignore list is compiled once into a gitignore-style
+matcher:
+
+    /pat    anchored to the package root
+    pat/    only matches directories
+    **/pat  matches at any depth, the same as pat without a leading /
+    *       matches within a path component, ** across components
+
+An ignored directory is pruned during the walk, nothing under it is
+indexed. The control plane directory is always ignored, its files are
+rewritten on every build.
+
+The listing of every walked directory is persisted in the control
+plane together with the directory mtime, keyed by the package root and
+the hash of the ignore list. The next walk only lists again the
+directories whose mtime changed, adding, removing or renaming an entry
+changes the mtime of its directory. In git mode the files are read
+from the git index instead, the tracked ones plus the untracked ones
+that are not gitignored.
+
+builder.sh runs it with `python -m` through the `index` subcommand and
+reads back the NUL-separated `<list name>` `<path>` records into the
+active_* arrays.
+"""
+
+# ======================================================================
+# EXCEPTIONS
+# This section documents any exceptions made code or quality rules.
+# These exceptions may be necessary due to specific coding requirements
+# or to bypass false positives.
+# ======================================================================
+#
+
+# ======================================================================
+# IMPORTS
+# Importing required libraries and modules for the application.
+# ======================================================================
+
+# Standard Library Imports
+import argparse
+import dataclasses
+import hashlib
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+from collections.abc import Iterable
+from typing import Any, Optional
+
+# Local Application Imports
+from icarus import config
+
+# END IMPORTS
+# ======================================================================
+
+
+# List of public names in the module
+__all__ = [
+    'IgnoreMatcher',
+    'WorkspaceIndex',
+    'index_workspace',
+]
+
+# Setting up logger for current module
+module_logger = config.master_logger.get_child_logger(__name__)
+
+# Type aliases
+#
+
+# Names of the builder.sh arrays, in the order they are written
+_LIST_NAMES = (
+    'active_dirs_d1',
+    'active_py_files_d1',
+    'active_sh_files_d1',
+    'active_other_files_d1',
+    'active_files_all',
+)
+
+# Bumped when the persisted index layout changes
+_INDEX_VERSION = 2
+
+# A directory modified less than this before the walk may be modified
+# again within the same mtime tick, its listing is stored without the
+# mtime so the next walk lists it again
+_RACY_MTIME_NS = 2_000_000_000
+
+
+class IgnoreMatcher:
+    """
+    The icarus.cfg ignore list compiled into one regex for directories
+    and one for files, the control plane directory is always ignored.
+    """
+
+    def __init__(self, patterns: Iterable[str]) -> None:
+        dir_regexes = []
+        file_regexes = []
+
+        for pattern in [f"/{config.ICARUS_CONTROL_PLANE_DIRNAME}/", *patterns]:
+            regex, dir_only = self._compile_pattern(pattern)
+            if regex is None:
+                continue
+            dir_regexes.append(regex)
+            if not dir_only:
+                file_regexes.append(regex)
+
+        self._dir_regex = self._join(dir_regexes)
+        self._file_regex = self._join(file_regexes)
+
+    def matches(self, relpath: str, is_dir: bool) -> bool:
+        """
+        Check a path against the ignore list.
+
+        :param relpath: The path relative to the package root, with /
+            separators.
+        :param is_dir: Whether the path is a directory.
+        :return: True if the path is ignored.
+        """
+
+        regex = self._dir_regex if is_dir else self._file_regex
+        if regex is None:
+            return False
+
+        return regex.fullmatch(relpath) is not None
+
+    @staticmethod
+    def _compile_pattern(pattern: str) -> tuple[Optional[str], bool]:
+        """
+        Translate one ignore pattern into a regex.
+
+        :param pattern: The ignore pattern.
+        :return: The regex, None for an empty pattern, and whether the
+            pattern only matches directories.
+        """
+
+        pattern = pattern.strip().removeprefix('./')
+
+        anchored = pattern.startswith('/')
+        pattern = pattern.lstrip('/')
+
+        dir_only = pattern.endswith('/')
+        pattern = pattern.rstrip('/')
+
+        while pattern.startswith('**/'):
+            pattern = pattern[3:]
+
+        if not pattern:
+            return None, dir_only
+
+        regex = ''
+        i = 0
+        while i < len(pattern):
+            char = pattern[i]
+            if pattern.startswith('**/', i):
+                regex += '(?:.*/)?'
+                i += 3
+                continue
+            if pattern.startswith('**', i):
+                regex += '.*'
+                i += 2
+                continue
+            if char == '*':
+                regex += '[^/]*'
+            elif char == '?':
+                regex += '[^/]'
+            elif char == '[':
+                end = pattern.find(']', i + 2)
+                if end == -1:
+                    regex += re.escape(char)
+                else:
+                    body = pattern[i + 1 : end].replace('\\', '\\\\')
+                    if body[0] in '!^':
+                        body = '^' + body[1:]
+                    regex += f"[{body}]"
+                    i = end
+            else:
+                regex += re.escape(char)
+            i += 1
+
+        if not anchored:
+            regex = f"(?:.*/)?{regex}"
+
+        return regex, dir_only
+
+    @staticmethod
+    def _join(regexes: list[str]) -> Optional[re.Pattern]:
+        if not regexes:
+            return None
+
+        return re.compile('|'.join(f"(?:{r})" for r in regexes), re.DOTALL)
+
+
+@dataclasses.dataclass(kw_only=True)
+class WorkspaceIndex:
+    active_dirs_d1: list[str] = dataclasses.field(default_factory=list)
+    active_py_files_d1: list[str] = dataclasses.field(default_factory=list)
+    active_sh_files_d1: list[str] = dataclasses.field(default_factory=list)
+    active_other_files_d1: list[str] = dataclasses.field(default_factory=list)
+    active_files_all: list[str] = dataclasses.field(default_factory=list)
+    mode: str = 'walk'
+    scanned_dirs: int = 0
+    reused_dirs: int = 0
+
+    def add_path(self, path: str, relpath: str, is_dir: bool) -> None:
+        """
+        Classify a path that is not ignored.
+
+        The depth-1 directories and files are split by type, every file
+        at any depth is in active_files_all.
+
+        :param path: The absolute path.
+        :param relpath: The path relative to the package root.
+        :param is_dir: Whether the path is a directory.
+        :return: None
+        """
+
+        is_depth_1 = '/' not in relpath
+
+        if is_dir:
+            if is_depth_1:
+                self.active_dirs_d1.append(path)
+            return
+
+        if is_depth_1:
+            if relpath.endswith('.py'):
+                self.active_py_files_d1.append(path)
+            elif relpath.endswith('.sh'):
+                self.active_sh_files_d1.append(path)
+            else:
+                self.active_other_files_d1.append(path)
+
+        self.active_files_all.append(path)
+
+
+def index_workspace(
+    root: str,
+    ignores: Iterable[str],
+    mode: str = 'walk',
+    index_filepath: Optional[str] = None,
+) -> WorkspaceIndex:
+    """
+    Index the paths of the package root that are not ignored.
+
+    In walk mode the package root is walked and, with index_filepath,
+    only the directories whose mtime changed since the last run are
+    listed again. In git mode the tracked and the untracked but not
+    gitignored files are read from `git ls-files`, falling back to walk
+    mode outside a git checkout. Symlinks are not followed, a symlink
+    to a directory is classified as a directory.
+
+    :param root: The package root.
+    :param ignores: The icarus.cfg ignore patterns.
+    :param mode: 'walk' or 'git'.
+    :param index_filepath: The persisted index of the walk mode, it is
+        read and then rewritten.
+    :return: The WorkspaceIndex of the package root, with absolute
+        paths in walk order.
+    """
+
+    ignores = sorted(set(ignores))
+    matcher = IgnoreMatcher(ignores)
+    root = os.path.abspath(root)
+
+    if mode == 'git':
+        relpaths = _list_git_files(root)
+        if relpaths is not None:
+            return _index_git_files(root, relpaths, matcher)
+
+    ignore_hash = hashlib.sha256('\0'.join(ignores).encode()).hexdigest()
+
+    cached_dirs: dict[str, dict[str, Any]] = {}
+    if index_filepath is not None:
+        cached_dirs = _read_index(index_filepath, root, ignore_hash)
+
+    index, dirs = _walk(root, matcher, cached_dirs)
+
+    if index_filepath is not None and (index.scanned_dirs or len(dirs) != len(cached_dirs)):
+        try:
+            _write_index(index_filepath, root, ignore_hash, dirs)
+        except OSError as e:
+            module_logger.debug(f"Failed to persist the workspace index -- {repr(e)}")
+
+    return index
+
+
+def _walk(
+    root: str, matcher: IgnoreMatcher, cached_dirs: dict[str, dict[str, Any]]
+) -> tuple[WorkspaceIndex, dict[str, dict[str, Any]]]:
+    """
+    Walk the package root, reusing the cached listing of every directory
+    whose mtime did not change.
+
+    :param root: The package root.
+    :param matcher: The compiled ignore list.
+    :param cached_dirs: The directory listings of the last run.
+    :return: The WorkspaceIndex and the directory listings to persist.
+    """
+
+    index = WorkspaceIndex()
+    dirs: dict[str, dict[str, Any]] = {}
+    # Listings of directories modified this close to the walk are not
+    # trusted on the next run, see _RACY_MTIME_NS
+    racy_mtime_ns = time.time_ns() - _RACY_MTIME_NS
+
+    # Directory by directory, each one in name order
+    pending = ['']
+    while pending:
+        reldir = pending.pop()
+        dirpath = os.path.join(root, reldir)
+
+        try:
+            mtime_ns = os.stat(dirpath).st_mtime_ns
+        except FileNotFoundError:
+            if not reldir:
+                raise
+            # Removed since its parent was listed
+            continue
+
+        listing = cached_dirs.get(reldir)
+        if listing is not None and listing['mtime_ns'] == mtime_ns:
+            index.reused_dirs += 1
+        else:
+            listing = _list_dir(dirpath, reldir, matcher)
+            listing['mtime_ns'] = mtime_ns if mtime_ns < racy_mtime_ns else None
+            index.scanned_dirs += 1
+        dirs[reldir] = listing
+
+        prefix = f"{reldir}/" if reldir else ''
+        for name in listing['files']:
+            index.add_path(os.path.join(dirpath, name), prefix + name, is_dir=False)
+        for name in listing['dirs']:
+            index.add_path(os.path.join(dirpath, name), prefix + name, is_dir=True)
+
+        links = set(listing['links'])
+        pending.extend(prefix + name for name in reversed(listing['dirs']) if name not in links)
+
+    return index, dirs
+
+
+def _list_dir(dirpath: str, reldir: str, matcher: IgnoreMatcher) -> dict[str, Any]:
+    """
+    List the entries of a directory that are not ignored.
+
+    :param dirpath: The directory to list.
+    :param reldir: The directory relative to the package root.
+    :param matcher: The compiled ignore list.
+    :return: The sorted names of the files, of the directories and of
+        the directories that are symlinks.
+    """
+
+    listing: dict[str, Any] = {'files': [], 'dirs': [], 'links': []}
+
+    with os.scandir(dirpath) as entries:
+        for entry in sorted(entries, key=lambda e: e.name):
+            relpath = f"{reldir}/{entry.name}" if reldir else entry.name
+            is_dir = entry.is_dir()
+
+            if matcher.matches(relpath, is_dir):
+                continue
+
+            if not is_dir:
+                listing['files'].append(entry.name)
+                continue
+
+            listing['dirs'].append(entry.name)
+            if entry.is_symlink():
+                listing['links'].append(entry.name)
+
+    return listing
+
+
+def _read_index(index_filepath: str, root: str, ignore_hash: str) -> dict[str, dict[str, Any]]:
+    """
+    Read the directory listings persisted by the last run.
+
+    :param index_filepath: The persisted index.
+    :param root: The package root.
+    :param ignore_hash: The hash of the current ignore list.
+    :return: The directory listings, empty when the index is missing
+        or was written for another root or ignore list.
+    """
+
+    try:
+        with open(index_filepath, 'r') as index_file:
+            persisted = json.load(index_file)
+    except (OSError, ValueError):
+        return {}
+
+    if not isinstance(persisted, dict) or persisted.get('key') != {
+        'version': _INDEX_VERSION,
+        'root': root,
+        'ignore_hash': ignore_hash,
+    }:
+        return {}
+
+    dirs = persisted.get('dirs')
+
+    return dirs if isinstance(dirs, dict) else {}
+
+
+def _write_index(
+    index_filepath: str, root: str, ignore_hash: str, dirs: dict[str, dict[str, Any]]
+) -> None:
+    os.makedirs(os.path.dirname(index_filepath), exist_ok=True)
+
+    tmp_filepath = f"{index_filepath}.{os.getpid()}.tmp"
+    with open(tmp_filepath, 'w') as tmp_file:
+        json.dump(
+            {
+                'key': {'version': _INDEX_VERSION, 'root': root, 'ignore_hash': ignore_hash},
+                'dirs': dirs,
+            },
+            tmp_file,
+            separators=(',', ':'),
+        )
+    os.replace(tmp_filepath, index_filepath)
+
+
+def _list_git_files(root: str) -> Optional[list[str]]:
+    """
+    List the tracked and the untracked but not gitignored files under
+    root from the git index. The tracked files deleted from the working
+    tree are left out.
+
+    :param root: The package root.
+    :return: The paths relative to root, or None when root is not in a
+        git checkout.
+    """
+
+    try:
+        git_proc = subprocess.run(
+            [
+                'git',
+                '-C',
+                root,
+                'ls-files',
+                '-z',
+                '-t',
+                '--cached',
+                '--deleted',
+                '--others',
+                '--exclude-standard',
+            ],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+    relpaths: dict[str, None] = {}
+    deleted = set()
+
+    # Every record is `<tag> <path>`, R is a tracked file deleted from
+    # the working tree, the other tags are existing files
+    for record in git_proc.stdout.split(b'\0'):
+        if not record:
+            continue
+        relpath = os.fsdecode(record[2:])
+        if record[:1] == b'R':
+            deleted.add(relpath)
+        else:
+            relpaths[relpath] = None
+
+    return [p for p in relpaths if p not in deleted]
+
+
+def _index_git_files(root: str, relpaths: list[str], matcher: IgnoreMatcher) -> WorkspaceIndex:
+    """
+    Classify the files listed by git, a file is ignored when one of its
+    parent directories is.
+
+    :param root: The package root.
+    :param relpaths: The file paths relative to root.
+    :param matcher: The compiled ignore list.
+    :return: The WorkspaceIndex of the package root.
+    """
+
+    index = WorkspaceIndex(mode='git')
+    ignored_dirs: dict[str, bool] = {}
+
+    for relpath in sorted(relpaths):
+        parts = relpath.split('/')
+
+        is_ignored = False
+        for depth in range(1, len(parts)):
+            reldir = '/'.join(parts[:depth])
+            if reldir not in ignored_dirs:
+                ignored_dirs[reldir] = matcher.matches(reldir, is_dir=True)
+                if depth == 1 and not ignored_dirs[reldir]:
+                    index.add_path(os.path.join(root, reldir), reldir, is_dir=True)
+            if ignored_dirs[reldir]:
+                is_ignored = True
+                break
+
+        if is_ignored:
+            continue
+
+        path = os.path.join(root, relpath)
+
+        # Depth-1 submodules and symlinks to directories
+        is_dir = len(parts) == 1 and os.path.isdir(path)
+        if not matcher.matches(relpath, is_dir):
+            index.add_path(path, relpath, is_dir)
+
+    index.active_dirs_d1.sort()
+
+    return index
+
+
+def _write_records(index: WorkspaceIndex, output: str) -> None:
+    """
+    Write the index as NUL-separated `<list name>` `<path>` records.
+
+    :param index: The WorkspaceIndex to write.
+    :param output: The file to write.
+    :return: None
+    """
+
+    with open(output, 'wb') as output_file:
+        for list_name in _LIST_NAMES:
+            prefix = f"{list_name}\0".encode()
+            for path in getattr(index, list_name):
+                output_file.write(prefix + os.fsencode(path) + b'\0')
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """
+    Entry point used by builder.sh.
+
+    :param argv: The command line arguments.
+    :return: Exit code of the script.
+    """
+
+    parser = argparse.ArgumentParser(prog=f"{config.CLI_NAME}-workspace-helper")
+    subparsers = parser.add_subparsers(dest='workspace_command', required=True)
+
+    index_parser = subparsers.add_parser('index')
+    index_parser.add_argument('root')
+    index_parser.add_argument('--ignore', action='append', default=[])
+    index_parser.add_argument('--mode', choices=('walk', 'git'), default='walk')
+    index_parser.add_argument('--persist', action='store_true')
+    index_parser.add_argument('--output', required=True)
+
+    args = parser.parse_args(argv)
+
+    index_filepath = None
+    if args.persist:
+        index_filepath = os.path.join(
+            args.root, config.ICARUS_CONTROL_PLANE_DIRNAME, config.ICARUS_WORKSPACE_INDEX_FILENAME
+        )
+
+    try:
+        index = index_workspace(args.root, args.ignore, args.mode, index_filepath)
+        _write_records(index, args.output)
+    except OSError as e:
+        print(f"Failed to index '{args.root}' -- {repr(e)}", file=sys.stderr)
+        return 1
+
+    if index.mode == 'git':
+        print(f"Listed {len(index.active_files_all)} file(s) from git")
+    else:
+        if args.mode == 'git':
+            print("Not a git checkout, walking the package root")
+        print(
+            f"Indexed {len(index.active_files_all)} file(s), {index.scanned_dirs} dir(s)"
+            f" listed, {index.reused_dirs} unchanged dir(s) reused"
+        )
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,46 @@
+# ======================================================================
+# MODULE DETAILS
+# This section provides metadata about the module, including its
+# creation date, author, copyright information, and a brief description
+# of the module's purpose and functionality.
+# ======================================================================
+
+#   __|    \    _ \  |      _ \   __| __ __| __ __|
+#  (      _ \     /  |     (   | (_ |    |      |
+# \___| _/  _\ _|_\ ____| \___/ \___|   _|     _|
+
+# src/icarus/handlers/daemon_handler/__init__.py
+# Created 10/18/26 - 1:30 PM UK Time (London) by carlogtt
+
+"""
+This module ...
+"""
+
+# ======================================================================
+# EXCEPTIONS
+# This section documents any exceptions made code or quality rules.
+# These exceptions may be necessary due to specific coding requirements
+# or to bypass false positives.
+# ======================================================================
+# flake8: noqa
+
+# ======================================================================
+# IMPORTS
+# Importing required libraries and modules for the application.
+# ======================================================================
+
+# Local Application Imports
+from icarus.handlers.daemon_handler.daemon_parser import *
+
+# END IMPORTS
+# ======================================================================
+
+
+# List of public names in the module
+# __all__ = []
+
+# Setting up logger for current module
+# module_logger =
+
+# Type aliases
+#
@@ -0,0 +1,240 @@
+# ======================================================================
+# MODULE DETAILS
+# This section provides metadata about the module, including its
+# creation date, author, copyright information, and a brief description
+# of the module's purpose and functionality.
+# ======================================================================
+
+#   __|    \    _ \  |      _ \   __| __ __| __ __|
+#  (      _ \     /  |     (   | (_ |    |      |
+# \___| _/  _\ _|_\ ____| \___/ \___|   _|     _|
+
+# src/icarus/handlers/daemon_handler/daemon_parser.py
+# Created 10/18/26 - 1:35 PM UK Time (London) by carlogtt
+
+"""
+This module ...
+"""
+
+# ======================================================================
+# EXCEPTIONS
+# This section documents any exceptions made code or quality rules.
+# These exceptions may be necessary due to specific coding requirements
+# or to bypass false positives.
+# ======================================================================
+#
+
+# ======================================================================
+# IMPORTS
+# Importing required libraries and modules for the application.
+# ======================================================================
+
+# Standard Library Imports
+import argparse
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+from typing import Optional
+
+# Local Application Imports
+from icarus import config, utils
+from icarus.handlers.daemon_handler import daemon_server
+
+# END IMPORTS
+# ======================================================================
+
+
+# List of public names in the module
+__all__ = [
+    'handle_daemon_command',
+]
+
+# Setting up logger for current module
+module_logger = config.master_logger.get_child_logger(__name__)
+
+# Type aliases
+#
+
+_DAEMON_START_TIMEOUT_SECONDS = 10
+_DAEMON_STOP_TIMEOUT_SECONDS = 10
+
+
+def handle_daemon_command(args: argparse.Namespace) -> int:
+    """
+    Handle execution of subcommands under the 'daemon' top-level
+    command.
+
+    This function routes the parsed arguments to the appropriate logic
+    based on the value of the `daemon_command` argument.
+
+    :param args: The parsed arguments containing the `daemon_command`
+        and any associated options or parameters.
+    :return: Exit code of the script.
+    :raise ValueError: If an unknown `daemon_command` is provided.
+    """
+
+    if args.daemon_command == 'start':
+        module_logger.debug(f"Running {args.daemon_command=}")
+
+        return_code = _start_daemon()
+
+        return return_code
+
+    elif args.daemon_command == 'stop':
+        module_logger.debug(f"Running {args.daemon_command=}")
+
+        return_code = _stop_daemon()
+
+        return return_code
+
+    elif args.daemon_command == 'status':
+        module_logger.debug(f"Running {args.daemon_command=}")
+
+        return_code = _status_daemon()
+
+        return return_code
+
+    elif args.daemon_command == 'run':
+        module_logger.debug(f"Running {args.daemon_command=}")
+
+        return_code = daemon_server.serve()
+
+        return return_code
+
+    else:
+        module_logger.debug(f"Running {args.daemon_command=}")
+        raise utils.IcarusParserException('the following arguments are required: <subcommand>')
+
+
+def _start_daemon() -> int:
+    """
+    Start the daemon in the background and wait until it accepts
+    connections.
+
+    :return: Exit code of the function.
+    """
+
+    pid = _get_running_daemon_pid()
+    if pid is not None:
+        print(f"{config.CLI_NAME} daemon already running (pid {pid})")
+        return 0
+
+    daemon_server.ensure_daemon_dir()
+
+    with open(daemon_server.get_daemon_log_path(), 'a') as log_file:
+        subprocess.Popen(
+            [sys.executable, '-m', config.CLI_NAME, 'daemon', 'run'],
+            stdin=subprocess.DEVNULL,
+            stdout=log_file,
+            stderr=log_file,
+            cwd='/',
+            start_new_session=True,
+        )
+
+    deadline = time.monotonic() + _DAEMON_START_TIMEOUT_SECONDS
+
+    while time.monotonic() < deadline:
+        pid = _get_running_daemon_pid()
+        if pid is not None:
+            print(f"{config.CLI_NAME} daemon started (pid {pid})")
+            return 0
+        time.sleep(0.05)
+
+    print(
+        f"{config.CLI_NAME} daemon failed to start, see {daemon_server.get_daemon_log_path()}",
+        file=sys.stderr,
+    )
+
+    return 1
+
+
+def _stop_daemon() -> int:
+    """
+    Stop the running daemon, if any.
+
+    :return: Exit code of the function.
+    """
+
+    pid = _get_running_daemon_pid()
+    if pid is None:
+        print(f"{config.CLI_NAME} daemon not running")
+        return 0
+
+    os.kill(pid, signal.SIGTERM)
+
+    deadline = time.monotonic() + _DAEMON_STOP_TIMEOUT_SECONDS
+
+    while time.monotonic() < deadline:
+        if not _is_process_alive(pid):
+            print(f"{config.CLI_NAME} daemon stopped (pid {pid})")
+            return 0
+        time.sleep(0.05)
+
+    print(f"{config.CLI_NAME} daemon (pid {pid}) did not stop", file=sys.stderr)
+
+    return 1
+
+
+def _status_daemon() -> int:
+    """
+    Print whether the daemon is running.
+
+    :return: 0 if the daemon is running, 1 otherwise.
+    """
+
+    pid = _get_running_daemon_pid()
+    if pid is None:
+        print(f"{config.CLI_NAME} daemon not running")
+        return 1
+
+    print(
+        f"{config.CLI_NAME} daemon running (pid {pid}) on {daemon_server.get_daemon_socket_path()}"
+    )
+
+    return 0
+
+
+def _get_running_daemon_pid() -> Optional[int]:
+    """
+    Return the pid of the running daemon, a daemon is running when its
+    process is alive and its socket accepts connections.
+
+    :return: The daemon pid or None if the daemon is not running.
+    """
+
+    try:
+        pid = int(daemon_server.get_daemon_pid_path().read_text().strip())
+    except (OSError, ValueError):
+        return None
+
+    if not _is_process_alive(pid):
+        return None
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(str(daemon_server.get_daemon_socket_path()))
+        except OSError:
+            return None
+
+    return pid
+
+
+def _is_process_alive(pid: int) -> bool:
+    """
+    Check whether a process is alive.
+
+    :param pid: The process id.
+    :return: True if the process is alive.
+    """
+
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+
+    return True
@@ -0,0 +1,526 @@
+# ======================================================================
+# MODULE DETAILS
+# This section provides metadata about the module, including its
+# creation date, author, copyright information, and a brief description
+# of the module's purpose and functionality.
+# ======================================================================
+
+#   __|    \    _ \  |      _ \   __| __ __| __ __|
+#  (      _ \     /  |     (   | (_ |    |      |
+# \___| _/  _\ _|_\ ____| \___/ \___|   _|     _|
+
+# src/icarus/handlers/daemon_handler/daemon_server.py
+# Created 10/18/26 - 1:40 PM UK Time (London) by carlogtt
+
+"""
+This module contains the resident icarus daemon.
+
+The daemon keeps an interpreter with every handler and third party
+library already imported, and listens on a per-user Unix socket. The
+launcher forwards each invocation to it and every request is served in
+a forked child that inherits the warm interpreter. The compiled config
+of the project is loaded by the daemon before forking, so a child
+parses it again only when its key changed.
+
+Only the hot, non-interactive `builder path` and `builder cache`
+commands are served. The children run in the daemon session, with no
+controlling terminal, so any other command is refused and the launcher
+spawns icarus as usual.
+
+Wire protocol, all integers are 32-bit big-endian:
+
+- request: the payload length, sent together with the client stdin,
+  stdout and stderr as SCM_RIGHTS, followed by the payload made of
+  NUL-terminated fields: protocol, project root, cwd, argc, argv...,
+  envc, env...
+- response: the pid of the child serving the request, 0 if the request
+  is refused (another checkout, a command that is not served or icarus
+  sources changed on disk) and the client must fall back to spawning
+  icarus, then the exit code once the request is done.
+"""
+
+# ======================================================================
+# EXCEPTIONS
+# This section documents any exceptions made code or quality rules.
+# These exceptions may be necessary due to specific coding requirements
+# or to bypass false positives.
+# ======================================================================
+#
+
+# ======================================================================
+# IMPORTS
+# Importing required libraries and modules for the application.
+# ======================================================================
+
+# Standard Library Imports
+import dataclasses
+import importlib
+import io
+import os
+import pathlib
+import signal
+import socket
+import stat
+import struct
+import sys
+import traceback
+from typing import Optional
+
+# Local Application Imports
+from icarus import cli, config, utils
+from icarus.handlers.builder_handler import builder_helper
+from icarus.main import main
+
+# END IMPORTS
+# ======================================================================
+
+
+# List of public names in the module
+__all__ = [
+    'get_daemon_project_root',
+    'get_daemon_socket_path',
+    'get_daemon_pid_path',
+    'get_daemon_log_path',
+    'ensure_daemon_dir',
+    'serve',
+]
+
+# Setting up logger for current module
+module_logger = config.master_logger.get_child_logger(__name__)
+
+# Type aliases
+#
+
+# Modules imported once by the daemon, requests never pay for them
+_PRELOAD_MODULES = (
+    'icarus.main',
+    'icarus.handlers.amazon_handler',
+    'icarus.handlers.builder_handler',
+    'icarus.handlers.global_handler',
+    'icarus.handlers.macos_handler',
+    'icarus.handlers.provision_handler',
+    'icarus.handlers.unison_handler',
+    'carlogtt_python_library',
+    'requests',
+    'tomllib',
+    'yaml',
+)
+
+# Builder commands served by the daemon, see the module docstring
+_SERVED_BUILDER_COMMANDS = frozenset({
+    'path',
+    'cache',
+})
+
+_INT32 = struct.Struct('!i')
+_UINT32 = struct.Struct('!I')
+_MAX_PAYLOAD_SIZE = 16 * 1024 * 1024
+
+
+@dataclasses.dataclass(kw_only=True)
+class _DaemonRequest:
+    project_root: str
+    cwd: str
+    argv: list[str]
+    env: dict[str, str]
+    fds: list[int]
+
+
+def get_daemon_project_root() -> str:
+    """
+    Return the icarus project root served by this interpreter, the
+    interpreter lives in <project root>/runtime/env/bin.
+
+    :return: The project root directory.
+    """
+
+    return os.path.realpath(pathlib.Path(os.path.abspath(sys.executable)).parents[3])
+
+
+def get_daemon_socket_path() -> pathlib.Path:
+    """
+    Return the path of the daemon socket.
+
+    :return: The daemon socket path.
+    """
+
+    return config.ICARUS_DAEMON_DIR / config.ICARUS_DAEMON_SOCKET_FILENAME
+
+
+def get_daemon_pid_path() -> pathlib.Path:
+    """
+    Return the path of the daemon pid file.
+
+    :return: The daemon pid file path.
+    """
+
+    return config.ICARUS_DAEMON_DIR / config.ICARUS_DAEMON_PID_FILENAME
+
+
+def get_daemon_log_path() -> pathlib.Path:
+    """
+    Return the path of the daemon log file.
+
+    :return: The daemon log file path.
+    """
+
+    return config.ICARUS_DAEMON_DIR / config.ICARUS_DAEMON_LOG_FILENAME
+
+
+def ensure_daemon_dir() -> None:
+    """
+    Create the per-user daemon directory and make sure nobody else can
+    reach the socket inside it.
+
+    :return: None
+    """
+
+    config.ICARUS_DAEMON_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+
+    dir_stat = os.lstat(config.ICARUS_DAEMON_DIR)
+
+    if not stat.S_ISDIR(dir_stat.st_mode) or dir_stat.st_uid != os.getuid():
+        raise utils.IcarusParserException(
+            f"{config.ICARUS_DAEMON_DIR} is not a directory owned by the current user"
+        )
+
+    if stat.S_IMODE(dir_stat.st_mode) != 0o700:
+        os.chmod(config.ICARUS_DAEMON_DIR, 0o700)
+
+
+def serve() -> int:
+    """
+    Run the daemon in the foreground until it is terminated or the
+    icarus sources it has loaded change on disk.
+
+    :return: Exit code of the daemon.
+    """
+
+    ensure_daemon_dir()
+
+    socket_path = get_daemon_socket_path()
+    pid_path = get_daemon_pid_path()
+    project_root = get_daemon_project_root()
+
+    _preload()
+    sources_fingerprint = _get_sources_fingerprint()
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    socket_path.unlink(missing_ok=True)
+    server.bind(str(socket_path))
+    os.chmod(socket_path, 0o600)
+    server.listen(64)
+
+    pid_path.write_text(f"{os.getpid()}\n")
+
+    # Children are never waited for, they report their own exit code
+    signal.signal(signal.SIGCHLD, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, _raise_system_exit)
+    signal.signal(signal.SIGHUP, _raise_system_exit)
+
+    module_logger.warning(f"icarus daemon {os.getpid()} listening on {socket_path}")
+
+    try:
+        while True:
+            conn, _ = server.accept()
+
+            try:
+                request = _receive_request(conn)
+            except (OSError, ValueError) as ex:
+                module_logger.debug(f"Dropping malformed request -- {repr(ex)}")
+                conn.close()
+                continue
+
+            if request.project_root != project_root or not _is_served(request.argv):
+                _refuse_request(conn, request)
+                continue
+
+            if _get_sources_fingerprint() != sources_fingerprint:
+                module_logger.warning('icarus sources changed on disk, shutting down')
+                _refuse_request(conn, request)
+                break
+
+            _preload_project(request.cwd)
+
+            sys.stdout.flush()
+            sys.stderr.flush()
+
+            pid = os.fork()
+
+            if pid == 0:
+                server.close()
+                _serve_request(conn, request)
+
+            for fd in request.fds:
+                os.close(fd)
+            conn.close()
+
+    except SystemExit:
+        pass
+
+    finally:
+        server.close()
+        socket_path.unlink(missing_ok=True)
+        pid_path.unlink(missing_ok=True)
+
+    return 0
+
+
+def _raise_system_exit(signum, frame) -> None:
+    raise SystemExit(128 + signum)
+
+
+def _preload() -> None:
+    """
+    Import everything a request may need, so that forked children start
+    with a warm interpreter.
+
+    :return: None
+    """
+
+    for module_name in _PRELOAD_MODULES:
+        importlib.import_module(module_name)
+
+    # Resolve the lazy parts of the config as well
+    config.master_logger.get_logger()
+    config.CLI_VERSION
+
+
+def _preload_project(cwd: str) -> None:
+    """
+    Load the compiled config of the project the request runs in, the
+    forked child inherits it.
+
+    :param cwd: The working directory of the request.
+    :return: None
+    """
+
+    try:
+        builder_helper.preload_compiled_cfg(cwd)
+    except Exception as ex:
+        # The request reports it, if it reads the config at all
+        module_logger.debug(f"Not preloading {cwd} -- {repr(ex)}")
+
+
+def _is_served(argv: list[str]) -> bool:
+    """
+    Check whether the daemon serves a command.
+
+    :param argv: The command-line arguments, without the program name.
+    :return: True if the command is served by a forked child.
+    """
+
+    args = cli.fast_parse_args(argv)
+    if args is None or args.tl_command != 'builder':
+        return False
+
+    return args.builder_command in _SERVED_BUILDER_COMMANDS
+
+
+def _get_sources_fingerprint() -> dict[str, int]:
+    """
+    Return the mtime of every icarus module loaded by the daemon.
+
+    :return: Mapping of module file to its mtime.
+    """
+
+    fingerprint = {}
+
+    for module in list(sys.modules.values()):
+        module_file = getattr(module, '__file__', None)
+        if not module_file or not getattr(module, '__name__', '').startswith(config.CLI_NAME):
+            continue
+        try:
+            fingerprint[module_file] = os.stat(module_file).st_mtime_ns
+        except OSError:
+            fingerprint[module_file] = -1
+
+    return fingerprint
+
+
+def _receive_request(conn: socket.socket) -> _DaemonRequest:
+    """
+    Receive a request and the client stdio from the socket.
+
+    :param conn: The client connection.
+    :return: The received request.
+    """
+
+    # The socket directory is private, peer credentials are checked on
+    # top of it where the platform exposes them
+    if hasattr(socket, 'SO_PEERCRED'):
+        creds = conn.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize('3i'))
+        _, peer_uid, _ = struct.unpack('3i', creds)
+
+        if peer_uid != os.getuid():
+            raise ValueError(f"peer uid {peer_uid} is not allowed")
+
+    header, fds, _, _ = socket.recv_fds(conn, _UINT32.size, 3)
+
+    if len(fds) != 3:
+        for fd in fds:
+            os.close(fd)
+        raise ValueError('the client stdio was not received')
+
+    try:
+        header += _recv_exactly(conn, _UINT32.size - len(header))
+        (payload_size,) = _UINT32.unpack(header)
+
+        if payload_size > _MAX_PAYLOAD_SIZE:
+            raise ValueError(f"payload too large {payload_size}")
+
+        fields = _recv_exactly(conn, payload_size).split(b'\0')[:-1]
+        decoded = [os.fsdecode(field) for field in fields]
+
+        if decoded[0] != config.ICARUS_DAEMON_PROTOCOL:
+            raise ValueError(f"unknown protocol {decoded[0]}")
+
+        argc = int(decoded[3])
+        argv = decoded[4 : 4 + argc]
+        envc = int(decoded[4 + argc])
+        env = decoded[5 + argc : 5 + argc + envc]
+
+        if len(argv) != argc or len(env) != envc:
+            raise ValueError('truncated payload')
+
+    except IndexError:
+        for fd in fds:
+            os.close(fd)
+        raise ValueError('truncated payload')
+
+    except BaseException:
+        for fd in fds:
+            os.close(fd)
+        raise
+
+    return _DaemonRequest(
+        project_root=os.path.realpath(decoded[1]),
+        cwd=decoded[2],
+        argv=argv,
+        env=dict(e.split('=', 1) for e in env if '=' in e),
+        fds=fds,
+    )
+
+
+def _recv_exactly(conn: socket.socket, size: int) -> bytes:
+    """
+    Receive exactly size bytes from the socket.
+
+    :param conn: The client connection.
+    :param size: The number of bytes to receive.
+    :return: The received bytes.
+    """
+
+    chunks = []
+
+    while size > 0:
+        chunk = conn.recv(min(size, 65536))
+        if not chunk:
+            raise ValueError('connection closed by the client')
+        chunks.append(chunk)
+        size -= len(chunk)
+
+    return b''.join(chunks)
+
+
+def _refuse_request(conn: socket.socket, request: _DaemonRequest) -> None:
+    """
+    Tell the client to fall back to spawning icarus.
+
+    :param conn: The client connection.
+    :param request: The refused request.
+    :return: None
+    """
+
+    try:
+        conn.sendall(_INT32.pack(0))
+    except OSError:
+        pass
+
+    for fd in request.fds:
+        os.close(fd)
+    conn.close()
+
+
+def _serve_request(conn: socket.socket, request: _DaemonRequest) -> None:
+    """
+    Run icarus for the request, in the forked child, as if it had been
+    started by the client. Never returns.
+
+    :param conn: The client connection.
+    :param request: The request to serve.
+    :return: None
+    """
+
+    exit_code = 1
+
+    try:
+        signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        signal.signal(signal.SIGHUP, signal.SIG_DFL)
+        signal.signal(signal.SIGINT, signal.default_int_handler)
+
+        # Own process group, so the client can signal the whole tree
+        os.setpgid(0, 0)
+        conn.sendall(_INT32.pack(os.getpid()))
+
+        for target_fd, fd in enumerate(request.fds):
+            os.dup2(fd, target_fd)
+            os.close(fd)
+
+        for stream in (sys.stdout, sys.stderr):
+            if isinstance(stream, io.TextIOWrapper):
+                stream.reconfigure(line_buffering=stream is sys.stderr or stream.isatty())
+
+        os.chdir(request.cwd)
+        os.environ.clear()
+        os.environ.update(request.env)
+        config.load_env_vars()
+
+        sys.argv = [config.CLI_NAME, *request.argv]
+        exit_code = _run_main()
+
+    except BaseException:
+        traceback.print_exc()
+
+    finally:
+        try:
+            sys.stdout.flush()
+            sys.stderr.flush()
+        except BaseException:
+            pass
+        try:
+            conn.sendall(_INT32.pack(exit_code))
+        except OSError:
+            pass
+        os._exit(exit_code)
+
+
+def _run_main() -> int:
+    """
+    Run the icarus entry point and convert its outcome to an exit code
+    the same way the interpreter does.
+
+    :return: Exit code of the entry point.
+    """
+
+    code: Optional[object]
+
+    try:
+        code = main()
+    except SystemExit as ex:
+        code = ex.code
+    except KeyboardInterrupt:
+        return 128 + signal.SIGINT
+    except Exception as ex:
+        print(f"unexpected error: {repr(ex)}")
+        return 1
+
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code & 0xFF
+
+    print(code, file=sys.stderr)
+
+    return 1
@@ -30,7 +30,9 @@
 # ======================================================================
 
 # Standard Library Imports
+import argparse
 import sys
+from typing import Optional
 
 # Local Application Imports
 from icarus import cli, config, utils
@@ -58,11 +60,17 @@ def main() -> int:
     :return: Exit code of the script.
     """
 
-    # Initialize parser and parse args
-    parser = cli.initialize_parser()
+    parser: Optional[argparse.ArgumentParser] = None
 
-    # Parse cli args
-    args = cli.parse_args(parser=parser)
+    # Hot, fixed-shape commands skip building the full parser
+    args = cli.fast_parse_args(sys.argv[1:])
+
+    if args is None:
+        # Initialize parser and parse args
+        parser = cli.initialize_parser()
+
+        # Parse cli args
+        args = cli.parse_args(parser=parser)
 
     # Set CLI logging level
     utils.set_logger_level(args.verbose)
@@ -77,6 +85,8 @@ def main() -> int:
 
     except utils.IcarusParserException as ex:
         module_logger.debug(repr(ex))
+        if parser is None:
+            parser = cli.initialize_parser()
         parser.error(str(ex))
 
     except Exception as ex:
@@ -38,6 +38,7 @@
 # List of public names in the module
 __all__ = [
     'IcarusParserException',
+    'IcarusDownloadException',
 ]
 
 # Setting up logger for current module
@@ -51,3 +52,9 @@ class IcarusParserException(Exception):
     """
     Base exception class for IcarusParser-related exceptions.
     """
+
+
+class IcarusDownloadException(Exception):
+    """
+    Base exception class for download-related exceptions.
+    """
@@ -0,0 +1,167 @@
+# ======================================================================
+# MODULE DETAILS
+# This section provides metadata about the module, including its
+# creation date, author, copyright information, and a brief description
+# of the module's purpose and functionality.
+# ======================================================================
+
+#   __|    \    _ \  |      _ \   __| __ __| __ __|
+#  (      _ \     /  |     (   | (_ |    |      |
+# \___| _/  _\ _|_\ ____| \___/ \___|   _|     _|
+
+# test/test_action_cache_helper.py
+# Created 10/19/26 - 3:10 AM UK Time (London) by carlogtt
+
+"""
+This module checks the action cache of the builder hooks.
+"""
+
+# ======================================================================
+# EXCEPTIONS
+# This section documents any exceptions made code or quality rules.
+# These exceptions may be necessary due to specific coding requirements
+# or to bypass false positives.
+# ======================================================================
+# flake8: noqa
+# mypy: ignore-errors
+
+# ======================================================================
+# IMPORTS
+# Importing required libraries and modules for the application.
+# ======================================================================
+
+# Standard Library Imports
+import os
+
+# Third Party Library Imports
+import pytest
+
+# Local Application Imports
+from icarus.handlers.builder_handler import action_cache_helper, workspace_helper
+
+# END IMPORTS
+# ======================================================================
+
+
+@pytest.fixture
+def package(tmp_path):
+    for relpath in ('setup.py', 'src/pkg/main.py', 'README.md', 'pyproject.toml'):
+        path = tmp_path / relpath
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(relpath)
+        os.utime(path, ns=(10**18, 10**18))
+
+    return tmp_path
+
+
+def _key(root, hook='flake8', **kwargs):
+    filepaths = [str(root / n) for n in ('README.md', 'setup.py', 'src/pkg/main.py')]
+
+    return action_cache_helper.compute_action_key(str(root), hook, filepaths, **kwargs)
+
+
+def _rewrite(path, text):
+    path.write_text(text)
+    os.utime(path, ns=(10**18 + 1, 10**18 + 1))
+
+
+def test_key_changes_with_what_the_hook_reads(package):
+    key = _key(package)
+
+    assert _key(package) == key
+    assert _key(package, hook='mypy') != key
+    assert _key(package, extras=['trailing']) != key
+    assert _key(package, interpreter='3.13.5-linux_x86_64') != key
+
+    # Python hooks only read the python files
+    _rewrite(package / 'README.md', 'changed')
+    assert _key(package) == key
+    assert _key(package, hook='pytest') != _key(package, hook='pytest', extras=['x'])
+
+    _rewrite(package / 'src' / 'pkg' / 'main.py', 'changed')
+    assert _key(package) != key
+    key = _key(package)
+
+    _rewrite(package / 'pyproject.toml', 'changed')
+    assert _key(package) != key
+
+
+def test_key_ignores_the_control_plane(package):
+    def key():
+        index = workspace_helper.index_workspace(str(package), [])
+        return action_cache_helper.compute_action_key(
+            str(package), 'gitleaks', index.active_files_all
+        )
+
+    first = key()
+    action_cache_helper.store_action(str(package), 'gitleaks', first, 'passed', b'')
+
+    assert (package / '.icarus' / 'action-cache' / 'file-digests.json').exists()
+    assert key() == first
+
+
+def test_unchanged_files_are_not_read_again(package):
+    key = _key(package)
+
+    # Same size, mtime and inode, the persisted digest is trusted
+    main_py = package / 'src' / 'pkg' / 'main.py'
+    with open(main_py, 'r+') as main_file:
+        main_file.write('X')
+    os.utime(main_py, ns=(10**18, 10**18))
+    assert _key(package) == key
+
+    os.utime(main_py, ns=(10**18 + 1, 10**18 + 1))
+    assert _key(package) != key
+
+
+def test_store_and_lookup(package):
+    root = str(package)
+
+    assert action_cache_helper.lookup_action(root, 'mypy', 'k1') is None
+    assert action_cache_helper.store_action(root, 'mypy', 'k1', 'failed', b'error') is False
+    assert action_cache_helper.lookup_action(root, 'mypy', 'k1') is None
+
+    assert action_cache_helper.store_action(root, 'mypy', 'k1', 'warned', b'note') is True
+    result = action_cache_helper.lookup_action(root, 'mypy', 'k1')
+    assert result.status == 'warned'
+    with open(result.output_filepath, 'rb') as output_file:
+        assert output_file.read() == b'note'
+
+
+def test_store_evicts_the_least_recently_used(package):
+    root = str(package)
+    hook_dir = package / '.icarus' / 'action-cache' / 'black'
+
+    for i in range(4):
+        action_cache_helper.store_action(root, 'black', f'k{i}', 'passed', b'')
+        os.utime(hook_dir / f'k{i}.json', ns=(10**18 + i, 10**18 + i))
+    action_cache_helper.lookup_action(root, 'black', 'k0')
+    action_cache_helper.store_action(root, 'black', 'k4', 'passed', b'')
+
+    assert sorted(p.stem for p in hook_dir.glob('*.json')) == ['k0', 'k2', 'k3', 'k4']
+    assert sorted(p.stem for p in hook_dir.glob('*.out')) == ['k0', 'k2', 'k3', 'k4']
+
+
+def test_main_stores_only_when_the_inputs_did_not_change(package, capsys):
+    files_from = package / 'files'
+    files_from.write_bytes(f'{package / "setup.py"}\0'.encode())
+    output = package / 'output'
+    output.write_bytes(b'All done!\n')
+    key_argv = ['--root', str(package), '--hook', 'black', '--files-from', str(files_from)]
+
+    assert action_cache_helper.main(['lookup', *key_argv]) == 0
+    key, status, output_filepath = capsys.readouterr().out.splitlines()
+    assert (status, output_filepath) == ('', '')
+
+    # The writer changed its input, the run is not stored
+    _rewrite(package / 'setup.py', 'formatted')
+    store_argv = ['--before-key', key, '--status', 'passed', '--output-file', str(output)]
+    assert action_cache_helper.main(['store', *key_argv, *store_argv]) == 0
+    assert action_cache_helper.main(['lookup', *key_argv]) == 0
+    key, status, _ = capsys.readouterr().out.splitlines()
+    assert status == ''
+
+    store_argv[1] = key
+    assert action_cache_helper.main(['store', *key_argv, *store_argv]) == 0
+    assert action_cache_helper.main(['lookup', *key_argv]) == 0
+    assert capsys.readouterr().out.splitlines()[:2] == [key, 'passed']
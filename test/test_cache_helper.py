@@ -0,0 +1,154 @@
+# ======================================================================
+# MODULE DETAILS
+# This section provides metadata about the module, including its
+# creation date, author, copyright information, and a brief description
+# of the module's purpose and functionality.
+# ======================================================================
+
+#   __|    \    _ \  |      _ \   __| __ __| __ __|
+#  (      _ \     /  |     (   | (_ |    |      |
+# \___| _/  _\ _|_\ ____| \___/ \___|   _|     _|
+
+# test/test_cache_helper.py
+# Created 10/18/26 - 11:55 PM UK Time (London) by carlogtt
+
+"""
+This module checks the builder cache index and its LRU eviction.
+"""
+
+# ======================================================================
+# EXCEPTIONS
+# This section documents any exceptions made code or quality rules.
+# These exceptions may be necessary due to specific coding requirements
+# or to bypass false positives.
+# ======================================================================
+# flake8: noqa
+# mypy: ignore-errors
+
+# ======================================================================
+# IMPORTS
+# Importing required libraries and modules for the application.
+# ======================================================================
+
+# Standard Library Imports
+import os
+from unittest import mock
+
+# Third Party Library Imports
+import pytest
+
+# Local Application Imports
+from icarus.handlers.builder_handler import cache_helper
+
+# END IMPORTS
+# ======================================================================
+
+
+def _make_cache(cache_root):
+    files = {
+        'CPython/cpython-3.12.8-linux.tar.gz': 3000,
+        'CPython/cpython-3.13.1-linux.tar.gz': 3000,
+        'CPython/cpython-3.13.1-linux.tar.gz.part': 50,
+        'runtime-store/cpython-3.13.1-linux/runtime/bin/python3': 5000,
+        'store/cpython-3.13.1-linux/aaa/six.py': 100,
+        'store/cpython-3.13.1-linux/.install-x/tmp.py': 10,
+        'python-versions.json': 10,
+    }
+    for relpath, size in files.items():
+        path = cache_root / relpath
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b'x' * size)
+
+
+def test_size_answers_from_the_index(tmp_path):
+    _make_cache(tmp_path)
+
+    assert sum(cache_helper.get_cache_size(str(tmp_path)).values()) == 0
+    assert cache_helper.get_cache_size(str(tmp_path), verify=True) == {
+        'package': 100,
+        'runtime-tarball': 6000,
+        'runtime': 5000,
+    }
+
+    # Grown behind the index back, only a rescan sees it
+    (tmp_path / 'store' / 'cpython-3.13.1-linux' / 'aaa' / 'six.py').write_bytes(b'x' * 200)
+    assert cache_helper.get_cache_size(str(tmp_path))['package'] == 100
+    assert cache_helper.get_cache_size(str(tmp_path), verify=True)['package'] == 200
+
+
+def test_gc_evicts_the_least_recently_used_entries(tmp_path):
+    _make_cache(tmp_path)
+    cache_root = str(tmp_path)
+
+    with mock.patch('time.time', return_value=1000):
+        cache_helper.record_access(
+            cache_root,
+            [
+                tmp_path / 'CPython' / 'cpython-3.12.8-linux.tar.gz',
+                tmp_path / 'store' / 'cpython-3.13.1-linux' / 'aaa',
+            ],
+            '/projects/old',
+        )
+    with mock.patch('time.time', return_value=2000):
+        cache_helper.record_access(
+            cache_root,
+            [
+                tmp_path / 'CPython' / 'cpython-3.13.1-linux.tar.gz',
+                tmp_path / 'runtime-store' / 'cpython-3.13.1-linux',
+            ],
+            '/projects/new',
+        )
+
+    report = cache_helper.collect_garbage(cache_root, max_size=cache_helper.parse_size('8K'))
+
+    assert report.removed == [
+        'store/cpython-3.13.1-linux/aaa',
+        'CPython/cpython-3.12.8-linux.tar.gz',
+    ]
+    assert (report.freed_bytes, report.size_bytes) == (3100, 8000)
+    assert not (tmp_path / 'store' / 'cpython-3.13.1-linux' / 'aaa').exists()
+    assert (tmp_path / 'python-versions.json').exists()
+    assert cache_helper.get_cache_size(cache_root) == {
+        'package': 0,
+        'runtime-tarball': 3000,
+        'runtime': 5000,
+    }
+
+
+def test_gc_keeps_the_entries_linked_into_a_project(tmp_path):
+    _make_cache(tmp_path)
+    cache_root = str(tmp_path)
+    farm = tmp_path / 'farm'
+    farm.mkdir()
+    os.link(tmp_path / 'store' / 'cpython-3.13.1-linux' / 'aaa' / 'six.py', farm / 'six.py')
+
+    with mock.patch('time.time', return_value=1000):
+        cache_helper.record_access(
+            cache_root,
+            [
+                tmp_path / 'store' / 'cpython-3.13.1-linux' / 'aaa',
+                tmp_path / 'CPython' / 'cpython-3.12.8-linux.tar.gz',
+            ],
+            '/projects/old',
+        )
+
+    report = cache_helper.collect_garbage(cache_root, max_size=cache_helper.parse_size('8K'))
+
+    assert report.in_use == ['store/cpython-3.13.1-linux/aaa']
+    assert report.removed == ['CPython/cpython-3.12.8-linux.tar.gz']
+    assert (report.freed_bytes, report.size_bytes) == (3000, 8100)
+    assert (farm / 'six.py').read_bytes() == b'x' * 100
+    assert (tmp_path / 'store' / 'cpython-3.13.1-linux' / 'aaa' / 'six.py').exists()
+
+
+@pytest.mark.parametrize(
+    'size, expected',
+    [('1024', 1024), ('10K', 10240), ('1.5G', 1610612736), ('500MB', 524288000), ('2GiB', 2**31)],
+)
+def test_parse_size(size, expected):
+    assert cache_helper.parse_size(size) == expected
+
+
+def test_parse_size_rejects_garbage():
+    with pytest.raises(ValueError):
+        cache_helper.parse_size('ten gigs')
@@ -0,0 +1,159 @@
+# ======================================================================
+# MODULE DETAILS
+# This section provides metadata about the module, including its
+# creation date, author, copyright information, and a brief description
+# of the module's purpose and functionality.
+# ======================================================================
+
+#   __|    \    _ \  |      _ \   __| __ __| __ __|
+#  (      _ \     /  |     (   | (_ |    |      |
+# \___| _/  _\ _|_\ ____| \___/ \___|   _|     _|
+
+# test/test_cli.py
+# Created 10/18/26 - 11:20 AM UK Time (London) by carlogtt
+
+"""
+This module checks the CLI fast-path parser against the full parser.
+"""
+
+# ======================================================================
+# EXCEPTIONS
+# This section documents any exceptions made code or quality rules.
+# These exceptions may be necessary due to specific coding requirements
+# or to bypass false positives.
+# ======================================================================
+# flake8: noqa
+# mypy: ignore-errors
+
+# ======================================================================
+# IMPORTS
+# Importing required libraries and modules for the application.
+# ======================================================================
+
+# Standard Library Imports
+import argparse
+
+# Third Party Library Imports
+import pytest
+
+# Local Application Imports
+from icarus import cli
+
+# END IMPORTS
+# ======================================================================
+
+
+# List of public names in the module
+# __all__ = []
+
+# Setting up logger for current module
+# module_logger =
+
+# Type aliases
+#
+
+GLOBAL_FLAGS = (
+    [],
+    ['-v'],
+    ['-vvv'],
+    ['--verbose', '-v'],
+    ['--version'],
+    ['-v', '--version', '--verbose'],
+)
+
+FALLBACK_ARGV = (
+    ['--help'],
+    ['-h'],
+    ['--update'],
+    ['--verb'],
+    ['-vx'],
+    ['builder'],
+    ['builder', 'path'],
+    ['builder', 'path', '--help'],
+    ['builder', 'path', 'pkg.version', '--help'],
+    ['builder', 'path', 'pkg.version', 'extra'],
+    ['builder', 'path', '--list', 'pkg.version'],
+    ['builder', 'path', 'not.a.path'],
+    ['builder', 'cache'],
+    ['builder', 'cache', 'root', 'extra'],
+    ['builder', 'cache', 'nope'],
+    ['builder', 'exec-tool'],
+    ['builder', 'exec-tool', 'ls', '-la'],
+    ['builder', 'exec-run', '--', 'ls'],
+    ['builder', 'exec-dev', '-h'],
+    ['builder', '-v', 'path', 'pkg.version'],
+    ['builder', 'build'],
+    ['amazon', 'auth-init'],
+)
+
+
+@pytest.fixture(scope='module')
+def parser():
+    return cli.initialize_parser()
+
+
+def _subparsers(parser):
+    for action in parser._actions:
+        if isinstance(action, argparse._SubParsersAction):
+            return action.choices
+    return {}
+
+
+def _all_commands(parser, prefix=()):
+    yield list(prefix)
+    for name, subparser in _subparsers(parser).items():
+        yield from _all_commands(subparser, prefix + (name,))
+
+
+def _fast_path_argv(parser):
+    builder = _subparsers(parser)['builder']
+    path_names = _subparsers(_subparsers(builder)['path'])
+    cache_subcommands = _subparsers(_subparsers(builder)['cache'])
+
+    commands = [[]]
+    commands += [['builder', 'path', name] for name in path_names]
+    commands += [['builder', 'path', '--list']]
+    commands += [['builder', 'cache', name] for name in cache_subcommands]
+    for exec_command in ('exec-tool', 'exec-run', 'exec-dev'):
+        commands += [
+            ['builder', exec_command, 'ls'],
+            ['builder', exec_command, 'python3 -m pytest'],
+            ['builder', exec_command, 'echo', '', '{}', 'a b'],
+        ]
+
+    return [flags + command for flags in GLOBAL_FLAGS for command in commands]
+
+
+def _parse(parser, argv):
+    try:
+        return parser.parse_args(argv)
+    except SystemExit:
+        return None
+
+
+def test_fast_path_covers_hot_commands(parser):
+    for argv in _fast_path_argv(parser):
+        args = cli.fast_parse_args(argv)
+        expected = parser.parse_args(argv)
+
+        assert args is not None, argv
+        assert list(vars(args).items()) == list(vars(expected).items()), argv
+
+
+def test_fast_path_matches_full_parser_on_all_commands(parser):
+    for command in _all_commands(parser):
+        for flags in GLOBAL_FLAGS:
+            argv = flags + command
+            args = cli.fast_parse_args(argv)
+            if args is None:
+                continue
+
+            expected = _parse(parser, argv)
+
+            assert expected is not None, argv
+            assert list(vars(args).items()) == list(vars(expected).items()), argv
+
+
+def test_fast_path_falls_back_to_full_parser():
+    for argv in FALLBACK_ARGV:
+        assert cli.fast_parse_args(argv) is None, argv
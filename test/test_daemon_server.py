@@ -0,0 +1,258 @@
+# ======================================================================
+# MODULE DETAILS
+# This section provides metadata about the module, including its
+# creation date, author, copyright information, and a brief description
+# of the module's purpose and functionality.
+# ======================================================================
+
+#   __|    \    _ \  |      _ \   __| __ __| __ __|
+#  (      _ \     /  |     (   | (_ |    |      |
+# \___| _/  _\ _|_\ ____| \___/ \___|   _|     _|
+
+# test/test_daemon_server.py
+# Created 10/19/26 - 9:10 AM UK Time (London) by carlogtt
+
+"""
+This module checks the daemon socket protocol and the requests it
+serves.
+"""
+
+# ======================================================================
+# EXCEPTIONS
+# This section documents any exceptions made code or quality rules.
+# These exceptions may be necessary due to specific coding requirements
+# or to bypass false positives.
+# ======================================================================
+# flake8: noqa
+# mypy: ignore-errors
+
+# ======================================================================
+# IMPORTS
+# Importing required libraries and modules for the application.
+# ======================================================================
+
+# Standard Library Imports
+import contextlib
+import os
+import signal
+import socket
+import struct
+import sys
+import time
+
+# Third Party Library Imports
+import pytest
+
+# Local Application Imports
+from icarus import config
+from icarus.handlers.builder_handler import builder_helper
+from icarus.handlers.builder_handler.model import IcarusBuilderArg
+from icarus.handlers.daemon_handler import daemon_server
+
+# END IMPORTS
+# ======================================================================
+
+
+def _payload(argv, cwd, project_root, env=('A=1',), protocol=config.ICARUS_DAEMON_PROTOCOL):
+    fields = [protocol, project_root, cwd, str(len(argv)), *argv, str(len(env)), *env]
+
+    return b''.join(os.fsencode(field) + b'\0' for field in fields)
+
+
+def _send(sock, payload, fds):
+    socket.send_fds(sock, [struct.pack('!I', len(payload))], fds)
+    sock.sendall(payload)
+
+
+def _recv_int32(sock):
+    data = b''
+    while len(data) < 4:
+        chunk = sock.recv(4 - len(data))
+        if not chunk:
+            return None
+        data += chunk
+
+    return struct.unpack('!i', data)[0]
+
+
+def _open_fds():
+    return len(os.listdir('/proc/self/fd'))
+
+
+def test_request_is_received_with_the_client_stdio(tmp_path):
+    read_fd, write_fd = os.pipe()
+    server, client = socket.socketpair()
+
+    with server, client:
+        _send(
+            client,
+            _payload(
+                ['builder', 'path', 'pkg.version'], '/ws', str(tmp_path), env=['A=1', 'B=x=y']
+            ),
+            [read_fd, write_fd, write_fd],
+        )
+        request = daemon_server._receive_request(server)
+
+    assert (request.project_root, request.cwd) == (os.path.realpath(tmp_path), '/ws')
+    assert request.argv == ['builder', 'path', 'pkg.version']
+    assert request.env == {'A': '1', 'B': 'x=y'}
+    assert len(request.fds) == 3
+
+    # New descriptors of the client pipe
+    os.write(request.fds[2], b'stderr')
+    assert os.read(read_fd, 6) == b'stderr'
+
+    for fd in (read_fd, write_fd, *request.fds):
+        os.close(fd)
+
+
+@pytest.mark.parametrize(
+    'payload, size, with_fds, error',
+    [
+        (_payload(['builder'], '/ws', '/'), None, False, 'stdio was not received'),
+        (
+            _payload(['builder'], '/ws', '/', protocol='ICARUS-DAEMON-0'),
+            None,
+            True,
+            'unknown protocol',
+        ),
+        (
+            b'\0'.join([b'ICARUS-DAEMON-1', b'/', b'/ws', b'3', b'builder', b'']),
+            None,
+            True,
+            'truncated',
+        ),
+        (b'short', 64, True, 'closed by the client'),
+    ],
+)
+def test_malformed_request_is_dropped(payload, size, with_fds, error):
+    fds_before = _open_fds()
+    server, client = socket.socketpair()
+
+    with server, client:
+        fds = [0, 1, 2] if with_fds else []
+        socket.send_fds(client, [struct.pack('!I', size or len(payload))], fds)
+        client.sendall(payload)
+        client.shutdown(socket.SHUT_WR)
+
+        with pytest.raises(ValueError, match=error):
+            daemon_server._receive_request(server)
+
+    assert _open_fds() == fds_before
+
+
+def _fake_main():
+    os.write(1, f"{os.getcwd()} {os.environ.get('A')} {sys.argv[1:]}\n".encode())
+
+    return 3
+
+
+@pytest.fixture
+def daemon(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, 'ICARUS_DAEMON_DIR', tmp_path / 'daemon')
+    monkeypatch.setattr(daemon_server, 'get_daemon_project_root', lambda: str(tmp_path))
+    monkeypatch.setattr(daemon_server, '_preload', lambda: None)
+    monkeypatch.setattr(daemon_server, 'main', _fake_main)
+    # The sources fingerprint is read from a file the tests rewrite
+    (tmp_path / 'sources').write_text('v1')
+    monkeypatch.setattr(
+        daemon_server, '_get_sources_fingerprint', lambda: (tmp_path / 'sources').read_text()
+    )
+    socket_path = tmp_path / 'daemon' / config.ICARUS_DAEMON_SOCKET_FILENAME
+
+    pid = os.fork()
+    if pid == 0:
+        try:
+            daemon_server.serve()
+        finally:
+            os._exit(0)
+
+    deadline = time.monotonic() + 10
+    while not socket_path.exists() and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    def request(argv, project_root=str(tmp_path)):
+        read_fd, write_fd = os.pipe()
+        stdin_fd = os.open(os.devnull, os.O_RDONLY)
+
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(str(socket_path))
+            _send(sock, _payload(argv, str(tmp_path), project_root), [stdin_fd, write_fd, write_fd])
+            os.close(stdin_fd)
+            os.close(write_fd)
+            child_pid = _recv_int32(sock)
+            exit_code = _recv_int32(sock) if child_pid else None
+
+        with os.fdopen(read_fd, 'rb') as output:
+            return child_pid, exit_code, output.read().decode()
+
+    yield pid, socket_path, request
+
+    with contextlib.suppress(ProcessLookupError):
+        os.kill(pid, signal.SIGTERM)
+    with contextlib.suppress(ChildProcessError):
+        os.waitpid(pid, 0)
+
+
+def test_served_request_runs_with_the_client_stdio_and_exit_code(tmp_path, daemon):
+    _, _, request = daemon
+
+    child_pid, exit_code, output = request(['-v', 'builder', 'path', 'pkg.version'])
+
+    assert child_pid > 0
+    assert exit_code == 3
+    assert output == f"{tmp_path} 1 ['-v', 'builder', 'path', 'pkg.version']\n"
+
+
+@pytest.mark.parametrize(
+    'argv',
+    [
+        ['provision', 'envroot'],
+        ['builder', 'build'],
+        ['builder', 'exec-dev', 'python3'],
+        ['builder', 'path', '--help'],
+    ],
+)
+def test_interactive_commands_are_left_to_the_client(daemon, argv):
+    _, _, request = daemon
+
+    assert request(argv) == (0, None, '')
+
+
+def test_other_checkout_is_refused(daemon):
+    _, _, request = daemon
+
+    assert request(['builder', 'path', 'pkg.version'], project_root='/') == (0, None, '')
+
+
+def test_changed_sources_are_refused_and_stop_the_daemon(tmp_path, daemon):
+    pid, socket_path, request = daemon
+    (tmp_path / 'sources').write_text('v2')
+
+    assert request(['builder', 'path', 'pkg.version']) == (0, None, '')
+    assert os.waitpid(pid, 0)[1] == 0
+    assert not socket_path.exists()
+
+
+def test_daemon_preloads_the_compiled_config(tmp_path, monkeypatch):
+    monkeypatch.setattr(builder_helper, '_compiled_cfg_memo', {})
+    (tmp_path / 'icarus.cfg').write_text('package:\n')
+    (tmp_path / 'src').mkdir()
+    ib_arg = IcarusBuilderArg(
+        project_root_dir_abs=str(tmp_path),
+        icarus_config_filepath=str(tmp_path / 'icarus.cfg'),
+        package_name_pascal_case='Demo',
+    )
+    key = builder_helper._get_compiled_icarus_build_cfg_key(ib_arg)
+    builder_helper._store_compiled_icarus_build_cfg(ib_arg, key)
+
+    daemon_server._preload_project(str(tmp_path / 'src'))
+    (tmp_path / config.ICARUS_CONTROL_PLANE_DIRNAME / config.ICARUS_COMPILED_CFG_FILENAME).unlink()
+
+    # Answered from memory while the key matches
+    cached = builder_helper._load_compiled_icarus_build_cfg(ib_arg, key)
+    assert cached.package_name_pascal_case == 'Demo'
+
+    (tmp_path / 'icarus.cfg').write_text('package:\n  - name: Other\n')
+    key = builder_helper._get_compiled_icarus_build_cfg_key(ib_arg)
+    assert builder_helper._load_compiled_icarus_build_cfg(ib_arg, key) is None
@@ -0,0 +1,298 @@
+# ======================================================================
+# MODULE DETAILS
+# This section provides metadata about the module, including its
+# creation date, author, copyright information, and a brief description
+# of the module's purpose and functionality.
+# ======================================================================
+
+#   __|    \    _ \  |      _ \   __| __ __| __ __|
+#  (      _ \     /  |     (   | (_ |    |      |
+# \___| _/  _\ _|_\ ____| \___/ \___|   _|     _|
+
+# test/test_download_helper.py
+# Created 10/18/26 - 9:30 PM UK Time (London) by carlogtt
+
+"""
+This module checks the runtime downloader against a local HTTP server.
+"""
+
+# ======================================================================
+# EXCEPTIONS
+# This section documents any exceptions made code or quality rules.
+# These exceptions may be necessary due to specific coding requirements
+# or to bypass false positives.
+# ======================================================================
+# flake8: noqa
+# mypy: ignore-errors
+
+# ======================================================================
+# IMPORTS
+# Importing required libraries and modules for the application.
+# ======================================================================
+
+# Standard Library Imports
+import hashlib
+import http.server
+import io
+import os
+import shutil
+import subprocess
+import tarfile
+import threading
+
+# Third Party Library Imports
+import pytest
+
+# Local Application Imports
+from icarus import utils
+from icarus.handlers.builder_handler import download_helper
+
+# END IMPORTS
+# ======================================================================
+
+
+PAYLOAD = bytes(range(256)) * 4096
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    files = {}
+    requests = []
+    # Bytes sent before the connection is closed, once per path
+    truncate = {}
+    # Start of the Content-Range sent instead of the requested one
+    range_start = None
+
+    def do_GET(self):
+        self.requests.append((self.path, self.headers.get('Range')))
+        data = self.files.get(self.path)
+        if data is None:
+            self.send_error(404)
+            return
+
+        start = 0
+        if self.headers.get('Range'):
+            start = int(self.headers['Range'].removeprefix('bytes=').rstrip('-'))
+            if start >= len(data):
+                self.send_error(416)
+                return
+            if self.range_start is not None:
+                start = self.range_start
+            self.send_response(206)
+            self.send_header('Content-Range', f'bytes {start}-{len(data) - 1}/{len(data)}')
+        else:
+            self.send_response(200)
+        self.send_header('Content-Length', str(len(data) - start))
+        self.end_headers()
+        self.wfile.write(data[start:][: self.truncate.pop(self.path, None)])
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    _Handler.files = {}
+    _Handler.requests = []
+    _Handler.truncate = {}
+    _Handler.range_start = None
+    httpd = http.server.ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+
+    yield f'http://127.0.0.1:{httpd.server_port}', _Handler
+
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _publish(handler, path, data, sha256=None):
+    handler.files[path] = data
+    if sha256 is not False:
+        sha256 = sha256 or hashlib.sha256(data).hexdigest()
+        handler.files[f'{path}.sha256'] = f'{sha256}  {path.lstrip("/")}\n'.encode()
+
+
+def test_download_is_verified_and_then_cached(tmp_path, server):
+    url, handler = server
+    _publish(handler, '/py.tar.gz', PAYLOAD)
+    dest = tmp_path / 'cache' / 'py.tar.gz'
+
+    result = download_helper.fetch(f'{url}/py.tar.gz', str(dest))
+    assert result.verified and not result.cached
+    assert dest.read_bytes() == PAYLOAD
+    assert not (tmp_path / 'cache' / 'py.tar.gz.part').exists()
+
+    handler.requests.clear()
+    assert download_helper.fetch(f'{url}/py.tar.gz', str(dest)).cached
+    assert handler.requests == []
+
+
+def test_partial_download_is_resumed(tmp_path, server):
+    url, handler = server
+    _publish(handler, '/py.tar.gz', PAYLOAD)
+    dest = tmp_path / 'py.tar.gz'
+    (tmp_path / 'py.tar.gz.part').write_bytes(PAYLOAD[:1000])
+
+    result = download_helper.fetch(f'{url}/py.tar.gz', str(dest))
+
+    assert (result.resumed_from, result.verified) == (1000, True)
+    assert ('/py.tar.gz', 'bytes=1000-') in handler.requests
+    assert dest.read_bytes() == PAYLOAD
+
+
+def test_truncated_transfer_is_resumed(tmp_path, server, monkeypatch):
+    monkeypatch.setattr('time.sleep', lambda seconds: None)
+    url, handler = server
+    _publish(handler, '/py.tar.gz', PAYLOAD, sha256=False)
+    handler.truncate['/py.tar.gz'] = 1000
+    dest = tmp_path / 'py.tar.gz'
+
+    result = download_helper.fetch(f'{url}/py.tar.gz', str(dest))
+
+    assert result.resumed_from == 1000
+    assert handler.requests[-2:] == [('/py.tar.gz', None), ('/py.tar.gz', 'bytes=1000-')]
+    assert dest.read_bytes() == PAYLOAD
+
+
+def test_truncated_transfer_keeps_the_partial_file(tmp_path, server, monkeypatch):
+    monkeypatch.setattr('time.sleep', lambda seconds: None)
+    url, handler = server
+    archive = _runtime_archive('gzip')
+    _publish(handler, '/py.tar.gz', archive)
+    handler.truncate['/py.tar.gz'] = 20
+    dest = tmp_path / 'py.tar.gz'
+
+    with pytest.raises(utils.IcarusDownloadException, match='got only 20 out of'):
+        download_helper.unpack(f'{url}/py.tar.gz', str(dest), str(tmp_path / 'rt'), max_attempts=1)
+
+    assert not dest.exists()
+    assert (tmp_path / 'py.tar.gz.part').read_bytes() == archive[:20]
+
+    result = download_helper.unpack(f'{url}/py.tar.gz', str(dest), str(tmp_path / 'rt'))
+
+    assert (result.resumed_from, result.verified, result.unpacked) == (20, True, True)
+    assert (tmp_path / 'rt' / 'bin' / 'python3').read_bytes() == b'python'
+
+
+def test_range_not_resuming_at_the_offset_restarts(tmp_path, server, monkeypatch):
+    monkeypatch.setattr('time.sleep', lambda seconds: None)
+    url, handler = server
+    _publish(handler, '/py.tar.gz', PAYLOAD)
+    handler.range_start = 0
+    dest = tmp_path / 'py.tar.gz'
+    (tmp_path / 'py.tar.gz.part').write_bytes(PAYLOAD[:1000])
+
+    result = download_helper.fetch(f'{url}/py.tar.gz', str(dest))
+
+    assert (result.resumed_from, result.verified) == (0, True)
+    assert dest.read_bytes() == PAYLOAD
+
+
+def test_checksum_mismatch_is_not_cached(tmp_path, server):
+    url, handler = server
+    _publish(handler, '/py.tar.gz', PAYLOAD, sha256='0' * 64)
+    dest = tmp_path / 'py.tar.gz'
+
+    with pytest.raises(utils.IcarusDownloadException, match='Checksum mismatch'):
+        download_helper.fetch(f'{url}/py.tar.gz', str(dest))
+
+    assert not dest.exists()
+    assert not (tmp_path / 'py.tar.gz.part').exists()
+
+
+def test_fetch_all_reports_every_download(tmp_path, server, capsys):
+    url, handler = server
+    _publish(handler, '/a.tar.gz', PAYLOAD)
+    _publish(handler, '/b.tar.gz', PAYLOAD[:10], sha256=False)
+
+    argv = ['fetch', '--jobs', '3']
+    for name in ('a', 'b', 'missing'):
+        argv += ['--url', f'{url}/{name}.tar.gz', '--dest', str(tmp_path / f'{name}.tar.gz')]
+
+    assert download_helper.main(argv) == 1
+
+    captured = capsys.readouterr()
+    assert 'Downloaded a.tar.gz, sha256 verified' in captured.out
+    assert 'Downloaded b.tar.gz, no published checksum' in captured.out
+    assert f"'{url}/missing.tar.gz' not available" in captured.err
+    assert (tmp_path / 'b.tar.gz').read_bytes() == PAYLOAD[:10]
+
+
+def _runtime_archive(compression):
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode='w') as tar:
+        for name, data in (('3.13.1/bin/python3', b'python'), ('3.13.1/lib/os.py', b'os')):
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+
+    return subprocess.run(
+        [compression, '-c'], input=buffer.getvalue(), stdout=subprocess.PIPE, check=True
+    ).stdout
+
+
+@pytest.mark.parametrize(
+    'compression',
+    [
+        'gzip',
+        pytest.param(
+            'zstd', marks=pytest.mark.skipif(not shutil.which('zstd'), reason='zstd not installed')
+        ),
+    ],
+)
+def test_archive_is_unpacked_while_downloaded(tmp_path, server, compression):
+    url, handler = server
+    archive = _runtime_archive(compression)
+    _publish(handler, '/py.tar.gz', archive)
+    dest = tmp_path / 'cache' / 'py.tar.gz'
+    target = tmp_path / 'CPython' / '3.13.1' / 'runtime'
+    (tmp_path / 'cache').mkdir()
+    (tmp_path / 'cache' / 'py.tar.gz.part').write_bytes(archive[:3])
+
+    result = download_helper.unpack(f'{url}/py.tar.gz', str(dest), str(target))
+
+    assert (result.resumed_from, result.verified, result.unpacked) == (3, True, True)
+    assert dest.read_bytes() == archive
+    assert (target / 'bin' / 'python3').read_bytes() == b'python'
+    assert os.listdir(target.parent) == ['runtime']
+
+    # A cached archive is unpacked without a request
+    shutil.rmtree(target)
+    handler.requests.clear()
+    result = download_helper.unpack(f'{url}/py.tar.gz', str(dest), str(target))
+    assert (result.cached, result.unpacked) == (True, True)
+    assert (target / 'lib' / 'os.py').read_bytes() == b'os'
+    assert handler.requests == []
+
+
+def test_broken_archive_leaves_no_runtime(tmp_path, server):
+    url, handler = server
+    _publish(handler, '/py.tar.gz', b'\x1f\x8b' + PAYLOAD[:1000])
+    target = tmp_path / 'CPython' / 'runtime'
+
+    with pytest.raises(utils.IcarusDownloadException, match='Failed to unpack'):
+        download_helper.unpack(f'{url}/py.tar.gz', str(tmp_path / 'py.tar.gz'), str(target))
+
+    assert os.listdir(tmp_path / 'CPython') == []
+    assert sorted(os.listdir(tmp_path)) == ['CPython', 'py.tar.gz.flock']
+
+    # The next unpack downloads the fixed archive instead of the cache
+    del handler.files['/py.tar.gz.sha256']
+    _publish(handler, '/py.tar.gz', _runtime_archive('gzip'), sha256=False)
+    handler.requests.clear()
+    result = download_helper.unpack(f'{url}/py.tar.gz', str(tmp_path / 'py.tar.gz'), str(target))
+
+    assert (result.cached, result.unpacked) == (False, True)
+    assert ('/py.tar.gz', None) in handler.requests
+
+
+def test_broken_cached_archive_is_dropped(tmp_path, server):
+    url, handler = server
+    dest = tmp_path / 'py.tar.gz'
+    dest.write_bytes(b'\x1f\x8b' + PAYLOAD[:1000])
+    target = tmp_path / 'CPython' / 'runtime'
+
+    with pytest.raises(utils.IcarusDownloadException, match='Failed to unpack'):
+        download_helper.unpack(f'{url}/py.tar.gz', str(dest), str(target))
+
+    assert not dest.exists()
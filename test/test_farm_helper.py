@@ -0,0 +1,284 @@
+# ======================================================================
+# MODULE DETAILS
+# This section provides metadata about the module, including its
+# creation date, author, copyright information, and a brief description
+# of the module's purpose and functionality.
+# ======================================================================
+
+#   __|    \    _ \  |      _ \   __| __ __| __ __|
+#  (      _ \     /  |     (   | (_ |    |      |
+# \___| _/  _\ _|_\ ____| \___/ \___|   _|     _|
+
+# test/test_farm_helper.py
+# Created 10/18/26 - 5:55 PM UK Time (London) by carlogtt
+
+"""
+This module checks the folding symlink farm linker.
+"""
+
+# ======================================================================
+# EXCEPTIONS
+# This section documents any exceptions made code or quality rules.
+# These exceptions may be necessary due to specific coding requirements
+# or to bypass false positives.
+# ======================================================================
+# flake8: noqa
+# mypy: ignore-errors
+
+# ======================================================================
+# IMPORTS
+# Importing required libraries and modules for the application.
+# ======================================================================
+
+# Standard Library Imports
+import os
+
+# Local Application Imports
+from icarus.handlers.builder_handler import farm_helper
+
+# END IMPORTS
+# ======================================================================
+
+
+def _make_tree(root, files):
+    for relpath, content in files.items():
+        path = root / relpath
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+
+
+def _runtime(tmp_path):
+    runtime = tmp_path / 'runtime'
+    _make_tree(
+        runtime,
+        {
+            'bin/python3.13': 'python',
+            'lib/python3.13/os.py': 'os',
+            'lib/python3.13/asyncio/__init__.py': 'asyncio',
+            'lib/python3.13/site-packages/pip/__init__.py': 'pip',
+            'lib64/ignored': 'ignored',
+        },
+    )
+    (runtime / 'bin' / 'python3').symlink_to('python3.13')
+
+    return runtime
+
+
+def test_single_source_directories_are_folded(tmp_path):
+    runtime = _runtime(tmp_path)
+    farm = tmp_path / 'farm'
+
+    report = farm_helper.link_prefix_to_farm(
+        str(runtime), str(farm), excludes=['lib64'], nofold=['bin', 'lib/python*/site-packages']
+    )
+
+    assert not report.conflicts
+    assert not (farm / 'lib64').exists()
+    assert os.readlink(farm / 'lib' / 'python3.13' / 'asyncio') == str(
+        runtime / 'lib' / 'python3.13' / 'asyncio'
+    )
+    # nofold paths and their parents are real directories
+    for relpath in ('bin', 'lib', 'lib/python3.13', 'lib/python3.13/site-packages/pip'):
+        assert not (farm / relpath).is_symlink()
+    # symlinks in the source are copied as is
+    assert os.readlink(farm / 'bin' / 'python3') == 'python3.13'
+    assert (
+        farm / 'lib' / 'python3.13' / 'site-packages' / 'pip' / '__init__.py'
+    ).read_text() == 'pip'
+
+
+def test_relinking_is_a_noop(tmp_path):
+    runtime = _runtime(tmp_path)
+    farm = tmp_path / 'farm'
+
+    farm_helper.link_prefix_to_farm(str(runtime), str(farm), nofold=['bin'])
+    report = farm_helper.link_prefix_to_farm(str(runtime), str(farm), nofold=['bin'])
+
+    assert report == farm_helper.FarmLinkReport()
+
+
+def test_overlapping_sources_unfold_the_directory(tmp_path):
+    user_space = tmp_path / 'local'
+    runtime = tmp_path / 'runtime'
+    farm = tmp_path / 'farm'
+    _make_tree(user_space, {'share/doc/user.txt': 'user'})
+    _make_tree(runtime, {'share/doc/python.txt': 'python', 'share/man/python.1': 'man'})
+
+    farm_helper.link_prefix_to_farm(str(user_space), str(farm))
+    assert (farm / 'share').is_symlink()
+
+    report = farm_helper.link_prefix_to_farm(str(runtime), str(farm))
+
+    assert not report.conflicts
+    assert report.unfolded == 2
+    assert not (farm / 'share').is_symlink()
+    assert not (farm / 'share' / 'doc').is_symlink()
+    assert (farm / 'share' / 'man').is_symlink()
+    assert (farm / 'share' / 'doc' / 'user.txt').read_text() == 'user'
+    assert (farm / 'share' / 'doc' / 'python.txt').read_text() == 'python'
+
+
+def test_conflicts_are_reported_and_first_source_wins(tmp_path):
+    first = tmp_path / 'first'
+    second = tmp_path / 'second'
+    farm = tmp_path / 'farm'
+    _make_tree(first, {'bin/tool': 'first'})
+    _make_tree(second, {'bin/tool': 'second'})
+
+    farm_helper.link_prefix_to_farm(str(first), str(farm), nofold=['bin'])
+    report = farm_helper.link_prefix_to_farm(str(second), str(farm), nofold=['bin'])
+
+    assert report.conflicts == [str(farm / 'bin' / 'tool')]
+    assert (farm / 'bin' / 'tool').read_text() == 'first'
+
+
+def test_main_exit_code(tmp_path, capsys):
+    first = tmp_path / 'first'
+    farm = tmp_path / 'farm'
+    _make_tree(first, {'bin/tool': 'first'})
+    _make_tree(farm, {'bin/tool': 'real file'})
+
+    assert farm_helper.main(['link', str(first), str(farm)]) == 2
+    assert 'Destination file exists' in capsys.readouterr().out
+    assert farm_helper.main(['link', str(tmp_path / 'missing'), str(farm)]) == 1
+
+
+def test_manifest_relink_of_unchanged_prefix_is_skipped(tmp_path):
+    user_space = tmp_path / 'local'
+    farm = tmp_path / 'farm'
+    manifest = tmp_path / 'farm' / 'farm-info' / 'manifest.json'
+    _make_tree(user_space, {'bin/shfmt': 'shfmt'})
+
+    report = farm_helper.link_prefix_to_farm(
+        str(user_space), str(farm), nofold=['bin'], manifest_filepath=str(manifest)
+    )
+    assert report.links == 1
+    assert not report.unchanged
+
+    report = farm_helper.link_prefix_to_farm(
+        str(user_space), str(farm), nofold=['bin'], manifest_filepath=str(manifest)
+    )
+    assert report.unchanged
+    assert report.links == 0
+
+
+def test_manifest_relink_adds_and_removes_only_the_changes(tmp_path):
+    user_space = tmp_path / 'local'
+    runtime = tmp_path / 'runtime'
+    farm = tmp_path / 'farm'
+    manifest = tmp_path / 'farm' / 'farm-info' / 'manifest.json'
+    _make_tree(user_space, {'bin/shfmt': 'shfmt', 'bin/gitleaks': 'gitleaks'})
+    _make_tree(runtime, {'bin/python3': 'python'})
+
+    farm_helper.link_prefix_to_farm(str(runtime), str(farm), nofold=['bin'])
+    farm_helper.link_prefix_to_farm(
+        str(user_space), str(farm), nofold=['bin'], manifest_filepath=str(manifest)
+    )
+
+    (user_space / 'bin' / 'gitleaks').unlink()
+    _make_tree(user_space, {'bin/shellcheck': 'shellcheck'})
+
+    report = farm_helper.link_prefix_to_farm(
+        str(user_space), str(farm), nofold=['bin'], manifest_filepath=str(manifest)
+    )
+
+    assert (report.links, report.removed) == (1, 1)
+    assert sorted(os.listdir(farm / 'bin')) == ['python3', 'shellcheck', 'shfmt']
+
+
+def test_first_manifest_relink_prunes_dangling_links(tmp_path):
+    user_space = tmp_path / 'local'
+    farm = tmp_path / 'farm'
+    manifest = tmp_path / 'farm' / 'farm-info' / 'manifest.json'
+    _make_tree(user_space, {'bin/shfmt': 'shfmt', 'bin/gitleaks': 'gitleaks'})
+
+    farm_helper.link_prefix_to_farm(str(user_space), str(farm), nofold=['bin'])
+    (user_space / 'bin' / 'gitleaks').unlink()
+
+    report = farm_helper.link_prefix_to_farm(
+        str(user_space), str(farm), nofold=['bin'], manifest_filepath=str(manifest)
+    )
+
+    assert report.removed == 1
+    assert os.listdir(farm / 'bin') == ['shfmt']
+
+
+SHIM = '#!/icarus/bin/envroot "$ENVROOT/CPython/3.13.1/bin/python3.13"'
+
+
+def test_python_shebangs_are_pointed_at_the_shim(tmp_path):
+    python_dir = tmp_path / 'CPython'
+    _make_tree(
+        python_dir,
+        {
+            'bin/tool': '#!/usr/bin/env python3\nprint(1)\n',
+            'bin/shim': f'{SHIM}\nprint(1)\n',
+            'bin/bash-tool': '#!/bin/bash\necho 1\n',
+            'lib/script.py': '#!/usr/bin/python3\n',
+        },
+    )
+    (python_dir / 'bin' / 'python3.13').write_bytes(b'\x7fELF\x00python3')
+
+    report = farm_helper.fix_shebangs(str(python_dir), SHIM, prunes=['lib'])
+
+    assert report.fixed == [str(python_dir / 'bin' / 'tool')]
+    assert (python_dir / 'bin' / 'tool').read_text() == f'{SHIM}\nprint(1)\n'
+    assert (python_dir / 'lib' / 'script.py').read_text() == '#!/usr/bin/python3\n'
+
+
+def test_shared_shebangs_are_replaced_not_rewritten(tmp_path):
+    python_dir = tmp_path / 'CPython'
+    _make_tree(tmp_path / 'store', {'bin/tool': '#!/usr/bin/env python3\n'})
+    (python_dir / 'bin').mkdir(parents=True)
+    os.chmod(tmp_path / 'store' / 'bin' / 'tool', 0o555)
+    os.link(tmp_path / 'store' / 'bin' / 'tool', python_dir / 'bin' / 'tool')
+
+    report = farm_helper.fix_shebangs(str(python_dir), SHIM)
+
+    assert report.fixed == [str(python_dir / 'bin' / 'tool')]
+    assert (python_dir / 'bin' / 'tool').read_text() == f'{SHIM}\n'
+    assert os.stat(python_dir / 'bin' / 'tool').st_mode & 0o777 == 0o555
+    assert (tmp_path / 'store' / 'bin' / 'tool').read_text() == '#!/usr/bin/env python3\n'
+
+
+def test_shebang_manifest_skips_unchanged_files(tmp_path):
+    python_dir = tmp_path / 'CPython'
+    manifest = tmp_path / 'manifest.json'
+    _make_tree(python_dir, {'bin/tool': '#!/usr/bin/env python3\n', 'bin/other': 'text\n'})
+
+    farm_helper.fix_shebangs(str(python_dir), SHIM, manifest_filepath=str(manifest))
+    _make_tree(python_dir, {'bin/new-tool': '#!/usr/bin/python3\n'})
+    report = farm_helper.fix_shebangs(str(python_dir), SHIM, manifest_filepath=str(manifest))
+
+    assert (report.checked, report.skipped) == (1, 2)
+    assert report.fixed == [str(python_dir / 'bin' / 'new-tool')]
+
+
+def test_packages_manifest_matches_pip_freeze(tmp_path):
+    site_packages = tmp_path / 'site-packages'
+    _make_tree(
+        site_packages,
+        {
+            'six-1.17.0.dist-info/METADATA': (
+                'Metadata-Version: 2.1\nName: six\nVersion: 1.17.0\n\nName: no\n'
+            ),
+            'Black-24.1.0.dist-info/METADATA': (
+                'Metadata-Version: 2.1\nName: Black\nVersion: 24.1.0\n'
+            ),
+            'legacy-1.0.egg-info/PKG-INFO': 'Metadata-Version: 1.0\nName: legacy\nVersion: 1.0\n',
+            'mine-0.1.dist-info/METADATA': 'Metadata-Version: 2.1\nName: mine\nVersion: 0.1\n',
+            'mine-0.1.dist-info/direct_url.json': (
+                '{"url": "file:///src", "dir_info": {"editable": true}}'
+            ),
+        },
+    )
+    manifest = tmp_path / 'packages.json'
+
+    farm_helper.write_packages_manifest(str(site_packages), str(manifest))
+    packages = farm_helper.read_packages_manifest(str(manifest))
+
+    assert (
+        farm_helper.join_packages(packages, ';', with_version=True)
+        == 'Black==24.1.0;legacy==1.0;six==1.17.0'
+    )
+    assert farm_helper.join_packages(packages, ';', with_version=False) == 'Black;legacy;six'
@@ -0,0 +1,117 @@
+# ======================================================================
+# MODULE DETAILS
+# This section provides metadata about the module, including its
+# creation date, author, copyright information, and a brief description
+# of the module's purpose and functionality.
+# ======================================================================
+
+#   __|    \    _ \  |      _ \   __| __ __| __ __|
+#  (      _ \     /  |     (   | (_ |    |      |
+# \___| _/  _\ _|_\ ____| \___/ \___|   _|     _|
+
+# test/test_hygiene_helper.py
+# Created 10/19/26 - 2:05 AM UK Time (London) by carlogtt
+
+"""
+This module checks the single pass text hygiene engine.
+"""
+
+# ======================================================================
+# EXCEPTIONS
+# This section documents any exceptions made code or quality rules.
+# These exceptions may be necessary due to specific coding requirements
+# or to bypass false positives.
+# ======================================================================
+# flake8: noqa
+# mypy: ignore-errors
+
+# ======================================================================
+# IMPORTS
+# Importing required libraries and modules for the application.
+# ======================================================================
+
+# Standard Library Imports
+import os
+
+# Third Party Library Imports
+import pytest
+
+# Local Application Imports
+from icarus.handlers.builder_handler import hygiene_helper
+
+# END IMPORTS
+# ======================================================================
+
+
+ALL_FIXES = hygiene_helper.HYGIENE_FIXES
+
+
+@pytest.mark.parametrize(
+    'data, fixes, expected, applied',
+    [
+        (b'a\r\nb\rc\n', ALL_FIXES, b'a\nb\nc\n', ['eolnorm']),
+        (b'a \r\nb\n', ['trailing'], b'a\nb\n', ['trailing']),
+        ('a\u202fb\n'.encode(), ALL_FIXES, b'a b\n', ['whitespaces']),
+        (b'a\t \nb  ', ALL_FIXES, b'a\nb\n', ['trailing', 'eofnewline']),
+        (b'a\n\n\n', ALL_FIXES, b'a\n', ['eofnewline']),
+        (b'a\n\n\n', ['trailing'], b'a\n\n\n', []),
+        (b'   ', ALL_FIXES, b'', ['trailing']),
+        (b'clean\n', ALL_FIXES, b'clean\n', []),
+    ],
+)
+def test_fix_text(data, fixes, expected, applied):
+    assert hygiene_helper.fix_text(data, fixes) == (expected, applied)
+
+
+def test_fix_file_only_writes_changed_text_files(tmp_path):
+    dirty = tmp_path / 'run.sh'
+    dirty.write_bytes(b'echo  \r\n')
+    os.chmod(dirty, 0o750)
+    clean = tmp_path / 'clean.txt'
+    clean.write_bytes(b'clean\n')
+    os.utime(clean, ns=(10**18, 10**18))
+    binary = tmp_path / 'image.png'
+    binary.write_bytes(b'\x89PNG\0  \r\n')
+
+    results = [hygiene_helper.fix_file(str(p), ALL_FIXES) for p in (dirty, clean, binary)]
+
+    assert [r.fixes for r in results] == [['eolnorm', 'trailing'], [], []]
+    assert dirty.read_bytes() == b'echo\n'
+    assert os.stat(dirty).st_mode & 0o777 == 0o750
+    assert os.stat(clean).st_mtime_ns == 10**18
+    assert binary.read_bytes() == b'\x89PNG\0  \r\n'
+    assert sorted(os.listdir(tmp_path)) == ['clean.txt', 'image.png', 'run.sh']
+
+
+def test_fix_files_across_the_pool(tmp_path):
+    filepaths = []
+    for i in range(200):
+        filepath = tmp_path / f'{i}.txt'
+        filepath.write_bytes(b'x \n' if i % 2 else b'x\n')
+        filepaths.append(str(filepath))
+
+    results = hygiene_helper.fix_files(filepaths, ['trailing'], jobs=2)
+
+    assert [r.filepath for r in results] == filepaths
+    assert [bool(r.fixes) for r in results] == [bool(i % 2) for i in range(200)]
+    assert (tmp_path / '1.txt').read_bytes() == b'x\n'
+
+
+def test_main_writes_nul_separated_records(tmp_path):
+    (tmp_path / 'a.txt').write_bytes(b'a  ')
+    files_from = tmp_path / 'files'
+    files_from.write_bytes(f'{tmp_path / "a.txt"}\0{tmp_path / "missing.txt"}\0'.encode())
+    output = tmp_path / 'report'
+
+    argv = ['fix', '--fix', 'trailing', '--fix', 'eofnewline']
+    argv += ['--files-from', str(files_from), '--output', str(output)]
+    assert hygiene_helper.main(argv) == 0
+
+    a_txt, missing = (str(tmp_path / n).encode() for n in ('a.txt', 'missing.txt'))
+    assert output.read_bytes().split(b'\0') == [
+        b'trailing', b'fixed', a_txt,
+        b'eofnewline', b'fixed', a_txt,
+        b'trailing', b'failed', missing,
+        b'eofnewline', b'failed', missing,
+        b'',
+    ]  # fmt: skip
@@ -0,0 +1,106 @@
+# ======================================================================
+# MODULE DETAILS
+# This section provides metadata about the module, including its
+# creation date, author, copyright information, and a brief description
+# of the module's purpose and functionality.
+# ======================================================================
+
+#   __|    \    _ \  |      _ \   __| __ __| __ __|
+#  (      _ \     /  |     (   | (_ |    |      |
+# \___| _/  _\ _|_\ ____| \___/ \___|   _|     _|
+
+# test/test_import_time.py
+# Created 10/18/26 - 10:05 AM UK Time (London) by carlogtt
+
+"""
+This module guards the CLI import time budget.
+"""
+
+# ======================================================================
+# EXCEPTIONS
+# This section documents any exceptions made code or quality rules.
+# These exceptions may be necessary due to specific coding requirements
+# or to bypass false positives.
+# ======================================================================
+# flake8: noqa
+# mypy: ignore-errors
+
+# ======================================================================
+# IMPORTS
+# Importing required libraries and modules for the application.
+# ======================================================================
+
+# Standard Library Imports
+import subprocess
+import sys
+
+# END IMPORTS
+# ======================================================================
+
+
+# List of public names in the module
+# __all__ = []
+
+# Setting up logger for current module
+# module_logger =
+
+# Type aliases
+#
+
+# Cumulative import time of icarus.main, in microseconds
+IMPORT_TIME_BUDGET_US = 250_000
+
+# Modules that must only be imported by the code paths that use them
+DEFERRED_MODULES = (
+    'carlogtt_python_library',
+    'dotenv',
+    'importlib.metadata',
+    'requests',
+    'tomllib',
+    'yaml',
+)
+
+
+def _run_python(code):
+    return subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def _imported_modules(importtime_stderr):
+    modules = {}
+    for line in importtime_stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line.split('|')
+        modules[name.strip()] = int(cumulative.strip())
+    return modules
+
+
+def test_import_time_budget():
+    modules = _imported_modules(_run_python('import icarus.main').stderr)
+
+    assert modules['icarus.main'] < IMPORT_TIME_BUDGET_US, modules['icarus.main']
+
+
+def test_heavy_imports_are_deferred():
+    modules = _imported_modules(_run_python('import icarus.main').stderr)
+
+    assert [m for m in DEFERRED_MODULES if m in modules] == []
+    assert [m for m in modules if m.startswith('icarus.handlers.')] == []
+
+
+def test_handlers_are_imported_on_dispatch():
+    code = 'import icarus.handlers; icarus.handlers.handle_builder_command'
+    modules = _imported_modules(_run_python(code).stderr)
+
+    assert 'icarus.handlers.builder_handler.builder_parser' in modules
+    assert [m for m in DEFERRED_MODULES if m in modules] == []
+    assert [
+        m
+        for m in modules
+        if m.startswith('icarus.handlers.') and not m.startswith('icarus.handlers.builder_handler')
+    ] == []
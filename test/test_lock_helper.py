@@ -0,0 +1,90 @@
+# ======================================================================
+# MODULE DETAILS
+# This section provides metadata about the module, including its
+# creation date, author, copyright information, and a brief description
+# of the module's purpose and functionality.
+# ======================================================================
+
+#   __|    \    _ \  |      _ \   __| __ __| __ __|
+#  (      _ \     /  |     (   | (_ |    |      |
+# \___| _/  _\ _|_\ ____| \___/ \___|   _|     _|
+
+# test/test_lock_helper.py
+# Created 10/19/26 - 4:55 AM UK Time (London) by carlogtt
+
+"""
+This module checks the flock based farm and runtime locks.
+"""
+
+# ======================================================================
+# EXCEPTIONS
+# This section documents any exceptions made code or quality rules.
+# These exceptions may be necessary due to specific coding requirements
+# or to bypass false positives.
+# ======================================================================
+# flake8: noqa
+# mypy: ignore-errors
+
+# ======================================================================
+# IMPORTS
+# Importing required libraries and modules for the application.
+# ======================================================================
+
+# Standard Library Imports
+import os
+import subprocess
+import sys
+import time
+
+# Local Application Imports
+from icarus.handlers.builder_handler import lock_helper
+
+# END IMPORTS
+# ======================================================================
+
+
+def _open(lock_file):
+    return os.open(lock_file, os.O_WRONLY | os.O_CREAT | os.O_APPEND)
+
+
+def test_lock_is_held_by_the_open_file_description(tmp_path):
+    lock_file = tmp_path / 'farm.flock'
+    holder, waiter = _open(lock_file), _open(lock_file)
+
+    # Taken by a child process on the inherited fd, as path.sh does
+    argv = [sys.executable, '-m', 'icarus.handlers.builder_handler.lock_helper']
+    argv += ['acquire', '--fd', str(holder), '--timeout', '0']
+    subprocess.run(argv, pass_fds=[holder], check=True)
+
+    assert lock_helper.acquire_lock(waiter, timeout=0) is False
+    assert lock_helper.main(['acquire', '--fd', str(waiter), '--timeout', '0.2']) == 2
+
+    os.close(holder)
+    assert lock_helper.acquire_lock(waiter, timeout=0) is True
+    os.close(waiter)
+
+
+def test_waiter_is_woken_when_the_holder_dies(tmp_path):
+    lock_file = tmp_path / 'runtime.flock'
+    holder = subprocess.Popen(
+        [
+            sys.executable,
+            '-c',
+            (
+                f'import fcntl, time; f = open({str(lock_file)!r}, "a"); '
+                'fcntl.flock(f, fcntl.LOCK_EX); print(flush=True); time.sleep(60)'
+            ),
+        ],
+        stdout=subprocess.PIPE,
+    )
+    holder.stdout.readline()
+    waiter = _open(lock_file)
+
+    started = time.monotonic()
+    holder.kill()
+    assert lock_helper.acquire_lock(waiter, timeout=10) is True
+    assert time.monotonic() - started < 5
+
+    holder.wait()
+    holder.stdout.close()
+    os.close(waiter)
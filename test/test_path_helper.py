@@ -0,0 +1,125 @@
+# ======================================================================
+# MODULE DETAILS
+# This section provides metadata about the module, including its
+# creation date, author, copyright information, and a brief description
+# of the module's purpose and functionality.
+# ======================================================================
+
+#   __|    \    _ \  |      _ \   __| __ __| __ __|
+#  (      _ \     /  |     (   | (_ |    |      |
+# \___| _/  _\ _|_\ ____| \___/ \___|   _|     _|
+
+# test/test_path_helper.py
+# Created 10/18/26 - 3:40 PM UK Time (London) by carlogtt
+
+"""
+This module checks the native answers for static builder paths.
+"""
+
+# ======================================================================
+# EXCEPTIONS
+# This section documents any exceptions made code or quality rules.
+# These exceptions may be necessary due to specific coding requirements
+# or to bypass false positives.
+# ======================================================================
+# flake8: noqa
+# mypy: ignore-errors
+
+# ======================================================================
+# IMPORTS
+# Importing required libraries and modules for the application.
+# ======================================================================
+
+# Standard Library Imports
+import json
+
+# Third Party Library Imports
+import pytest
+
+# Local Application Imports
+from icarus.handlers.builder_handler import path_helper
+from icarus.handlers.builder_handler.model import IcarusBuilderArg
+
+# END IMPORTS
+# ======================================================================
+
+
+def _ib_arg(path_name, project_root_dir_abs='/ws/project'):
+    return IcarusBuilderArg(
+        platform_identifier='debian12-x86-64',
+        project_root_dir_abs=project_root_dir_abs,
+        project_workspace_name='project',
+        build_root_dir='build',
+        package_name_pascal_case='MyPkg',
+        package_name_snake_case='my_pkg',
+        package_name_dashed='my-pkg',
+        package_language='Python3',
+        package_version_full='1.2.3',
+        package_version_major='1',
+        package_version_minor='2',
+        package_version_patch='3',
+        build_system_in_use='icarus-python3',
+        python_versions=['3.13:3.13.1', '3.12:3.12.8'],
+        path_name=path_name,
+    )
+
+
+@pytest.mark.parametrize(
+    'path_name, expected',
+    [
+        ('platform-identifier', 'debian12-x86-64'),
+        ('workspace.name', 'project'),
+        ('workspace.root', '/ws/project'),
+        ('workspace.src-root', '/ws/project/src'),
+        ('workspace.build-root', '/ws/project/build'),
+        ('workspace.python-interpreters', '3.13:3.13.1;3.12:3.12.8'),
+        ('pkg.config', '/ws/project/icarus.cfg'),
+        ('pkg.language', 'Python3'),
+        ('pkg.name-pascal', 'MyPkg'),
+        ('pkg.name-snake', 'my_pkg'),
+        ('pkg.name-dashed', 'my-pkg'),
+        ('pkg.version', '1.2.3'),
+        ('pkg.version-major', '1'),
+        ('pkg.version-minor', '2'),
+        ('pkg.version-patch', '3'),
+    ],
+)
+def test_static_path_matches_path_sh_recipe(path_name, expected):
+    assert path_helper.is_static_path({'path_name': path_name})
+    assert path_helper.get_static_path(_ib_arg(path_name)) == expected
+
+
+@pytest.mark.parametrize(
+    'cli_ib_arg',
+    [
+        {'path_name': 'pkg.runtimefarm'},
+        {'path_name': 'devrun.pythonpath'},
+        {'path_name': 'pkg.artifact'},
+        {'path_name': '', 'list_paths': '--list'},
+    ],
+)
+def test_farm_paths_are_not_static(cli_ib_arg):
+    assert not path_helper.is_static_path(cli_ib_arg)
+
+
+def test_packages_path_is_answered_from_the_ready_farm(tmp_path):
+    ib_arg = _ib_arg('tool.version', project_root_dir_abs=str(tmp_path))
+    farm_info = (
+        tmp_path / 'build' / 'debian12-x86-64' / 'env' / 'path' / 'tool.runtimefarm' / 'farm-info'
+    )
+    farm_info.mkdir(parents=True)
+    (farm_info / 'packages-py3.13.1.json').write_text(
+        json.dumps({
+            'packages': [{'name': 'black', 'version': '24.1.0'}, {'name': 'pip', 'version': '25.0'}]
+        })
+    )
+
+    assert path_helper.is_packages_path({'path_name': 'tool.version'})
+    # Not ready yet, left to path.sh
+    assert path_helper.get_packages_path(ib_arg) is None
+
+    (farm_info / 'ready-py3.13.1').touch()
+
+    assert path_helper.get_packages_path(ib_arg) == 'black==24.1.0;pip==25.0'
+    ib_arg.path_name = 'tool.name'
+    assert path_helper.get_packages_path(ib_arg) == 'black;pip'
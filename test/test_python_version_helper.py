@@ -0,0 +1,174 @@
+# ======================================================================
+# MODULE DETAILS
+# This section provides metadata about the module, including its
+# creation date, author, copyright information, and a brief description
+# of the module's purpose and functionality.
+# ======================================================================
+
+#   __|    \    _ \  |      _ \   __| __ __| __ __|
+#  (      _ \     /  |     (   | (_ |    |      |
+# \___| _/  _\ _|_\ ____| \___/ \___|   _|     _|
+
+# test/test_python_version_helper.py
+# Created 10/19/26 - 4:10 AM UK Time (London) by carlogtt
+
+"""
+This module checks the cached resolution of the floating python
+versions.
+"""
+
+# ======================================================================
+# EXCEPTIONS
+# This section documents any exceptions made code or quality rules.
+# These exceptions may be necessary due to specific coding requirements
+# or to bypass false positives.
+# ======================================================================
+# flake8: noqa
+# mypy: ignore-errors
+
+# ======================================================================
+# IMPORTS
+# Importing required libraries and modules for the application.
+# ======================================================================
+
+# Standard Library Imports
+import http.server
+import json
+import socket
+import threading
+
+# Third Party Library Imports
+import pytest
+
+# Local Application Imports
+from icarus import config, utils
+from icarus.handlers.builder_handler import python_version_helper
+
+# END IMPORTS
+# ======================================================================
+
+
+INDEX_HTML = (
+    '<a href="3.13.1/">3.13.1/</a><a href="3.13.5/">3.13.5/</a><a href="3.12.9/">3.12.9/</a>'
+)
+ETAG = '"index-v1"'
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    requests = []
+
+    def do_GET(self):
+        self.requests.append(self.headers.get('If-None-Match'))
+        if self.headers.get('If-None-Match') == ETAG:
+            self.send_response(304)
+            self.end_headers()
+            return
+
+        body = INDEX_HTML.encode()
+        self.send_response(200)
+        self.send_header('ETag', ETAG)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def cache_root(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, 'ICARUS_BUILDER_CACHE_ROOT_DIR', tmp_path)
+    _forget_memo(monkeypatch)
+
+    return tmp_path
+
+
+@pytest.fixture
+def server(monkeypatch):
+    _Handler.requests = []
+    httpd = http.server.ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setattr(
+        python_version_helper,
+        'PYTHON_RELEASES_INDEX_URL',
+        f'http://127.0.0.1:{httpd.server_port}/',
+    )
+
+    yield _Handler
+
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def offline(monkeypatch):
+    # A port nothing listens on, the connection is refused
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        port = sock.getsockname()[1]
+    monkeypatch.setattr(
+        python_version_helper, 'PYTHON_RELEASES_INDEX_URL', f'http://127.0.0.1:{port}/'
+    )
+
+
+def _forget_memo(monkeypatch):
+    monkeypatch.setattr(python_version_helper, '_version_table', None)
+    monkeypatch.setattr(python_version_helper, '_version_table_revalidated', False)
+
+
+def _cache_file(cache_root):
+    return cache_root / config.ICARUS_PYTHON_VERSIONS_CACHE_FILENAME
+
+
+def _expire_cache(cache_root):
+    cache = json.loads(_cache_file(cache_root).read_text())
+    cache['fetched_at'] -= python_version_helper.PYTHON_VERSIONS_CACHE_TTL_SECONDS + 1
+    _cache_file(cache_root).write_text(json.dumps(cache))
+
+
+def test_fresh_cache_makes_no_request(cache_root, server, monkeypatch):
+    assert python_version_helper.get_latest_python_version('3.13') == '3.13.5'
+    assert server.requests == [None]
+
+    # Another invocation within the TTL reads the cache file only
+    _forget_memo(monkeypatch)
+    assert python_version_helper.get_latest_python_version('3.12') == '3.12.9'
+    assert server.requests == [None]
+
+
+def test_expired_cache_is_revalidated(cache_root, server, monkeypatch):
+    python_version_helper.get_latest_python_version('3.13')
+    _expire_cache(cache_root)
+    expired_at = json.loads(_cache_file(cache_root).read_text())['fetched_at']
+
+    _forget_memo(monkeypatch)
+    assert python_version_helper.get_latest_python_version('3.13') == '3.13.5'
+
+    assert server.requests == [None, ETAG]
+    cache = json.loads(_cache_file(cache_root).read_text())
+    assert cache['fetched_at'] > expired_at
+    assert cache['versions'] == {'3.13': '3.13.5', '3.12': '3.12.9'}
+
+
+def test_unknown_minor_revalidates_once(cache_root, server, monkeypatch):
+    python_version_helper.get_latest_python_version('3.13')
+
+    _forget_memo(monkeypatch)
+    assert python_version_helper.get_latest_python_version('3.99') == '3.99.0'
+    assert python_version_helper.get_latest_python_version('3.98') == '3.98.0'
+
+    assert server.requests == [None, ETAG]
+
+
+def test_offline_falls_back_to_the_last_known_table(cache_root, offline):
+    _cache_file(cache_root).write_text(
+        json.dumps({'fetched_at': 0, 'etag': ETAG, 'versions': {'3.13': '3.13.5'}})
+    )
+
+    assert python_version_helper.get_latest_python_version('3.13') == '3.13.5'
+
+
+def test_offline_without_cache_fails(cache_root, offline):
+    with pytest.raises(utils.IcarusParserException):
+        python_version_helper.get_latest_python_version('3.13')
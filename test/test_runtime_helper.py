@@ -0,0 +1,130 @@
+# ======================================================================
+# MODULE DETAILS
+# This section provides metadata about the module, including its
+# creation date, author, copyright information, and a brief description
+# of the module's purpose and functionality.
+# ======================================================================
+
+#   __|    \    _ \  |      _ \   __| __ __| __ __|
+#  (      _ \     /  |     (   | (_ |    |      |
+# \___| _/  _\ _|_\ ____| \___/ \___|   _|     _|
+
+# test/test_runtime_helper.py
+# Created 10/18/26 - 10:50 PM UK Time (London) by carlogtt
+
+"""
+This module checks the shared store of unpacked runtimes.
+"""
+
+# ======================================================================
+# EXCEPTIONS
+# This section documents any exceptions made code or quality rules.
+# These exceptions may be necessary due to specific coding requirements
+# or to bypass false positives.
+# ======================================================================
+# flake8: noqa
+# mypy: ignore-errors
+
+# ======================================================================
+# IMPORTS
+# Importing required libraries and modules for the application.
+# ======================================================================
+
+# Standard Library Imports
+import io
+import os
+import tarfile
+
+# Third Party Library Imports
+import pytest
+
+# Local Application Imports
+from icarus.handlers.builder_handler import runtime_helper
+
+# END IMPORTS
+# ======================================================================
+
+
+SHIM = '#!/icarus/bin/envroot "$ENVROOT/CPython/3.13.1/bin/python3.13"'
+
+
+@pytest.fixture
+def tarball(tmp_path):
+    tarball = tmp_path / 'cache' / 'cpython-3.13.1-linux.tar.gz'
+    tarball.parent.mkdir()
+
+    with tarfile.open(tarball, 'w:gz') as tar:
+        for name, data in (
+            ('3.13.1/bin/python3.13', b'\x7fELF\x00python'),
+            ('3.13.1/bin/pip3', b'#!/usr/bin/python3\nimport pip\n'),
+            ('3.13.1/lib/os.py', b'os'),
+        ):
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            info.mode = 0o755
+            tar.addfile(info, io.BytesIO(data))
+        info = tarfile.TarInfo('3.13.1/bin/python3')
+        info.type = tarfile.SYMTYPE
+        info.linkname = 'python3.13'
+        tar.addfile(info)
+
+    return str(tarball)
+
+
+def _install(tmp_path, tarball, project):
+    return runtime_helper.install_runtime(
+        url='https://example.invalid/cpython-3.13.1-linux.tar.gz',
+        tarball=tarball,
+        store_root=str(tmp_path / 'store'),
+        store_key='cpython-3.13.1-linux',
+        target_dir=str(tmp_path / project / 'runtime'),
+        shebang=SHIM,
+        prunes=['lib'],
+    )
+
+
+def test_projects_share_the_stored_runtime(tmp_path, tarball):
+    first = _install(tmp_path, tarball, 'first')
+    second = _install(tmp_path, tarball, 'second')
+
+    assert (first.populated, first.files) == (True, 4)
+    assert (second.populated, second.files, second.copied) == (False, 4, False)
+
+    stored = tmp_path / 'store' / 'cpython-3.13.1-linux' / 'runtime' / 'bin' / 'pip3'
+    cloned = tmp_path / 'second' / 'runtime' / 'bin' / 'pip3'
+    assert os.path.samefile(stored, cloned)
+    assert not os.stat(stored).st_mode & 0o222
+    assert cloned.read_text() == f'{SHIM}\nimport pip\n'
+    assert os.readlink(tmp_path / 'second' / 'runtime' / 'bin' / 'python3') == 'python3.13'
+
+
+def test_damaged_store_entry_is_populated_again(tmp_path, tarball):
+    _install(tmp_path, tarball, 'first')
+    os.remove(tmp_path / 'store' / 'cpython-3.13.1-linux' / 'runtime' / 'lib' / 'os.py')
+
+    report = _install(tmp_path, tarball, 'second')
+
+    assert (report.populated, report.files) == (True, 4)
+    assert (tmp_path / 'second' / 'runtime' / 'lib' / 'os.py').read_bytes() == b'os'
+    assert sorted(os.listdir(tmp_path / 'second')) == ['runtime']
+
+
+def test_store_populates_only_the_missing_entries(tmp_path, tarball, capsys):
+    url = 'https://example.invalid/cpython-3.13.1-linux.tar.gz'
+    argv = ['store', '--store', str(tmp_path / 'store'), '--prune', 'lib']
+    argv += ['--runtime', url, tarball, 'cpython-3.13.1-linux', SHIM]
+    argv += ['--runtime', f'{url}.missing', f'{tarball}.missing', 'cpython-3.13.2-linux', SHIM]
+
+    assert runtime_helper.main(argv) == 1
+
+    captured = capsys.readouterr()
+    assert 'Stored runtime cpython-3.13.1-linux from the cached' in captured.out
+    assert "Failed to store 'cpython-3.13.2-linux'" in captured.err
+    assert sorted(os.listdir(tmp_path / 'store' / 'cpython-3.13.1-linux')) == [
+        '.icarus-runtime.json',
+        'runtime',
+    ]
+
+    # The install clones the stored entry without unpacking it again
+    report = _install(tmp_path, tarball, 'first')
+    assert (report.populated, report.download, report.files) == (False, None, 4)
@@ -0,0 +1,175 @@
+# ======================================================================
+# MODULE DETAILS
+# This section provides metadata about the module, including its
+# creation date, author, copyright information, and a brief description
+# of the module's purpose and functionality.
+# ======================================================================
+
+#   __|    \    _ \  |      _ \   __| __ __| __ __|
+#  (      _ \     /  |     (   | (_ |    |      |
+# \___| _/  _\ _|_\ ____| \___/ \___|   _|     _|
+
+# test/test_store_helper.py
+# Created 10/18/26 - 7:55 PM UK Time (London) by carlogtt
+
+"""
+This module checks the content-addressed package store.
+"""
+
+# ======================================================================
+# EXCEPTIONS
+# This section documents any exceptions made code or quality rules.
+# These exceptions may be necessary due to specific coding requirements
+# or to bypass false positives.
+# ======================================================================
+# flake8: noqa
+# mypy: ignore-errors
+
+# ======================================================================
+# IMPORTS
+# Importing required libraries and modules for the application.
+# ======================================================================
+
+# Standard Library Imports
+import base64
+import hashlib
+import os
+import subprocess
+import sys
+import sysconfig
+import zipfile
+
+# Third Party Library Imports
+import pytest
+
+# Local Application Imports
+from icarus.handlers.builder_handler import store_helper
+
+# END IMPORTS
+# ======================================================================
+
+
+def _build_wheel(wheels_dir, version):
+    files = {
+        'demo/__init__.py': f'VERSION = "{version}"\n'.encode(),
+        f'demo-{version}.dist-info/METADATA': (
+            f'Metadata-Version: 2.1\nName: demo\nVersion: {version}\n'.encode()
+        ),
+        f'demo-{version}.dist-info/WHEEL': (
+            b'Wheel-Version: 1.0\nGenerator: test\nRoot-Is-Purelib: true\nTag: py3-none-any\n'
+        ),
+    }
+    record = []
+
+    wheels_dir.mkdir(exist_ok=True)
+    with zipfile.ZipFile(wheels_dir / f'demo-{version}-py3-none-any.whl', 'w') as wheel:
+        for name, data in files.items():
+            digest = base64.urlsafe_b64encode(hashlib.sha256(data).digest()).rstrip(b'=')
+            wheel.writestr(name, data)
+            record.append(f'{name},sha256={digest.decode()},{len(data)}')
+        record.append(f'demo-{version}.dist-info/RECORD,,')
+        wheel.writestr(f'demo-{version}.dist-info/RECORD', '\n'.join(record) + '\n')
+
+
+def _pip_report(tmp_path, wheels_dir, requirement):
+    report = tmp_path / 'report.json'
+    subprocess.run(
+        [
+            sys.executable,
+            '-m',
+            'pip',
+            'install',
+            '--quiet',
+            '--dry-run',
+            '--ignore-installed',
+            '--no-index',
+            '--find-links',
+            str(wheels_dir),
+            '--report',
+            str(report),
+            requirement,
+        ],
+        check=True,
+    )
+
+    return str(report)
+
+
+@pytest.fixture
+def farm(tmp_path):
+    site_packages = os.path.relpath(
+        sysconfig.get_path('purelib', vars={'base': str(tmp_path / 'farm')}), tmp_path / 'farm'
+    )
+    (tmp_path / 'farm' / site_packages).mkdir(parents=True)
+
+    return tmp_path / 'farm', tmp_path / 'farm' / site_packages
+
+
+def test_farms_are_assembled_from_the_store(tmp_path, farm):
+    prefix, site_packages = farm
+    wheels_dir = tmp_path / 'wheels'
+    store = tmp_path / 'store'
+    _build_wheel(wheels_dir, '1.0')
+    report_filepath = _pip_report(tmp_path, wheels_dir, 'demo')
+
+    report = store_helper.install_from_report(
+        report_filepath, str(store), 'key', str(prefix), sys.executable
+    )
+    assert (report.added, report.linked) == (['demo'], ['demo'])
+    assert os.stat(site_packages / 'demo' / '__init__.py').st_nlink == 2
+    assert not os.stat(site_packages / 'demo' / '__init__.py').st_mode & 0o222
+    assert not (site_packages / 'demo-1.0.dist-info' / 'direct_url.json').exists()
+
+    report = store_helper.install_from_report(
+        report_filepath, str(store), 'key', str(prefix), sys.executable
+    )
+    assert (report.added, report.linked, report.unchanged) == ([], [], ['demo'])
+
+
+def test_new_version_replaces_the_installed_one(tmp_path, farm):
+    prefix, site_packages = farm
+    wheels_dir = tmp_path / 'wheels'
+    store = tmp_path / 'store'
+    _build_wheel(wheels_dir, '1.0')
+    _build_wheel(wheels_dir, '2.0')
+
+    for requirement in ('demo==1.0', 'demo==2.0'):
+        store_helper.install_from_report(
+            _pip_report(tmp_path, wheels_dir, requirement),
+            str(store),
+            'key',
+            str(prefix),
+            sys.executable,
+        )
+
+    assert sorted(os.listdir(site_packages)) == ['demo', 'demo-2.0.dist-info']
+    assert (site_packages / 'demo' / '__init__.py').read_text() == 'VERSION = "2.0"\n'
+
+    # Only the 2.0 entry is still linked into a farm
+    report = store_helper.collect_garbage(str(store))
+    assert len(report.removed) == 1
+    assert len(os.listdir(store / 'key')) == 1
+
+
+@pytest.mark.parametrize(
+    'download_info, expected',
+    [
+        (
+            {
+                'url': 'https://github.com/org/demo',
+                'vcs_info': {'vcs': 'git', 'commit_id': 'abc123'},
+            },
+            'demo @ git+https://github.com/org/demo@abc123',
+        ),
+        (
+            {'url': 'file:///src/demo', 'dir_info': {'editable': True}},
+            '--editable file:///src/demo',
+        ),
+        ({'url': 'file:///src/demo', 'dir_info': {}}, 'demo @ file:///src/demo'),
+    ],
+)
+def test_direct_requirements_are_left_to_pip(download_info, expected):
+    item = {'is_direct': True, 'download_info': download_info, 'metadata': {'name': 'demo'}}
+
+    assert store_helper._get_archive_sha256(item) is None
+    assert store_helper._get_requirement_line(item) == expected
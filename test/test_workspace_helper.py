@@ -0,0 +1,220 @@
+# ======================================================================
+# MODULE DETAILS
+# This section provides metadata about the module, including its
+# creation date, author, copyright information, and a brief description
+# of the module's purpose and functionality.
+# ======================================================================
+
+#   __|    \    _ \  |      _ \   __| __ __| __ __|
+#  (      _ \     /  |     (   | (_ |    |      |
+# \___| _/  _\ _|_\ ____| \___/ \___|   _|     _|
+
+# test/test_workspace_helper.py
+# Created 10/19/26 - 12:55 AM UK Time (London) by carlogtt
+
+"""
+This module checks the workspace indexer and its ignore matcher.
+"""
+
+# ======================================================================
+# EXCEPTIONS
+# This section documents any exceptions made code or quality rules.
+# These exceptions may be necessary due to specific coding requirements
+# or to bypass false positives.
+# ======================================================================
+# flake8: noqa
+# mypy: ignore-errors
+
+# ======================================================================
+# IMPORTS
+# Importing required libraries and modules for the application.
+# ======================================================================
+
+# Standard Library Imports
+import os
+import shutil
+import subprocess
+
+# Third Party Library Imports
+import pytest
+
+# Local Application Imports
+from icarus.handlers.builder_handler import workspace_helper
+
+# END IMPORTS
+# ======================================================================
+
+
+IGNORES = [
+    '.git/',
+    '**/__pycache__/',
+    '**/*.egg-info/',
+    'build/',
+    '/dist',
+    '*.log',
+    'docs/_build/',
+]
+
+
+@pytest.mark.parametrize(
+    'relpath, is_dir, expected',
+    [
+        ('build', True, True),
+        ('src/build', True, True),
+        ('build', False, False),
+        ('src/pkg/__pycache__', True, True),
+        ('src/pkg.egg-info', True, True),
+        ('dist', True, True),
+        ('src/dist', True, False),
+        ('app.log', False, True),
+        ('logs/app.log', False, True),
+        ('logs/app.log.gz', False, False),
+        ('docs/_build', True, True),
+        ('sub/docs/_build', True, True),
+        ('docs/_build.py', False, False),
+        ('src/main.py', False, False),
+    ],
+)
+def test_ignore_matcher(relpath, is_dir, expected):
+    matcher = workspace_helper.IgnoreMatcher(IGNORES)
+
+    assert matcher.matches(relpath, is_dir) is expected
+
+
+def test_index_prunes_ignored_dirs(tmp_path):
+    for relpath in (
+        'setup.py',
+        'build.sh',
+        'README.md',
+        'debug.log',
+        'src/pkg/__init__.py',
+        'src/pkg/__pycache__/__init__.cpython-313.pyc',
+        'build/lib/pkg/__init__.py',
+        '.git/HEAD',
+        'docs/index.rst',
+    ):
+        path = tmp_path / relpath
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text('x')
+    os.symlink(tmp_path / 'src', tmp_path / 'src-link')
+
+    index = workspace_helper.index_workspace(str(tmp_path), IGNORES)
+
+    assert index.active_dirs_d1 == [str(tmp_path / n) for n in ('docs', 'src', 'src-link')]
+    assert index.active_py_files_d1 == [str(tmp_path / 'setup.py')]
+    assert index.active_sh_files_d1 == [str(tmp_path / 'build.sh')]
+    assert index.active_other_files_d1 == [str(tmp_path / 'README.md')]
+    assert index.active_files_all == [
+        str(tmp_path / n)
+        for n in ('README.md', 'build.sh', 'setup.py', 'docs/index.rst', 'src/pkg/__init__.py')
+    ]
+
+
+def _backdate_dirs(root):
+    for dirpath, _, _ in os.walk(root):
+        os.utime(dirpath, ns=(10**18, 10**18))
+
+
+def test_persisted_index_lists_only_changed_dirs(tmp_path):
+    for relpath in ('a/one.py', 'b/two.py', 'b/c/three.py', 'build/out.py'):
+        path = tmp_path / relpath
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text('x')
+    _backdate_dirs(tmp_path)
+    index_filepath = str(tmp_path / '.icarus' / 'workspace-index.json')
+    ignores = ['.icarus/', 'build/']
+
+    first = workspace_helper.index_workspace(str(tmp_path), ignores, index_filepath=index_filepath)
+    _backdate_dirs(tmp_path)
+    (tmp_path / 'b' / 'c' / 'four.py').write_text('x')
+    second = workspace_helper.index_workspace(str(tmp_path), ignores, index_filepath=index_filepath)
+
+    assert (first.scanned_dirs, first.reused_dirs) == (4, 0)
+    assert (second.scanned_dirs, second.reused_dirs) == (1, 3)
+    assert second.active_files_all == first.active_files_all[:2] + [
+        str(tmp_path / 'b' / 'c' / 'four.py'),
+        str(tmp_path / 'b' / 'c' / 'three.py'),
+    ]
+
+    # Another ignore list invalidates the whole index
+    third = workspace_helper.index_workspace(
+        str(tmp_path), ['.icarus/'], index_filepath=index_filepath
+    )
+    assert (third.scanned_dirs, third.reused_dirs) == (5, 0)
+    assert str(tmp_path / 'build' / 'out.py') in third.active_files_all
+
+
+def test_index_always_prunes_the_control_plane(tmp_path):
+    for relpath in ('setup.py', '.icarus/compiled-cfg.json', 'src/.icarus/keep.py'):
+        path = tmp_path / relpath
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text('x')
+    index_filepath = str(tmp_path / '.icarus' / 'workspace-index.json')
+
+    first = workspace_helper.index_workspace(str(tmp_path), [], index_filepath=index_filepath)
+    (tmp_path / '.icarus' / 'compiled-cfg.json').write_text('changed')
+    second = workspace_helper.index_workspace(str(tmp_path), [], index_filepath=index_filepath)
+
+    assert first.active_dirs_d1 == [str(tmp_path / 'src')]
+    assert first.active_files_all == [
+        str(tmp_path / 'setup.py'),
+        str(tmp_path / 'src' / '.icarus' / 'keep.py'),
+    ]
+    assert second.active_files_all == first.active_files_all
+
+
+@pytest.mark.skipif(not shutil.which('git'), reason='git not installed')
+def test_git_mode_reads_the_git_index(tmp_path):
+    for relpath in (
+        'setup.py',
+        'src/pkg/main.py',
+        'src/gone.py',
+        'notes.txt',
+        'app.log',
+        'x.log',
+        '.icarus/compiled-cfg.json',
+    ):
+        path = tmp_path / relpath
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text('x')
+    (tmp_path / '.gitignore').write_text('*.log\n')
+    subprocess.run(['git', 'init', '-q'], cwd=tmp_path, check=True)
+    subprocess.run(['git', 'add', 'setup.py', 'src', '.gitignore'], cwd=tmp_path, check=True)
+    subprocess.run(['git', 'add', '-f', 'x.log'], cwd=tmp_path, check=True)
+    subprocess.run(['git', 'add', '.icarus'], cwd=tmp_path, check=True)
+    os.remove(tmp_path / 'src' / 'gone.py')
+
+    index = workspace_helper.index_workspace(str(tmp_path), ['**/pkg/'], mode='git')
+
+    assert index.mode == 'git'
+    assert index.active_dirs_d1 == [str(tmp_path / 'src')]
+    assert index.active_py_files_d1 == [str(tmp_path / 'setup.py')]
+    assert index.active_files_all == [
+        str(tmp_path / n) for n in ('.gitignore', 'notes.txt', 'setup.py', 'x.log')
+    ]
+
+
+def test_git_mode_falls_back_to_walk(tmp_path):
+    (tmp_path / 'setup.py').write_text('x')
+
+    index = workspace_helper.index_workspace(str(tmp_path), [], mode='git')
+
+    assert index.mode == 'walk'
+    assert index.active_files_all == [str(tmp_path / 'setup.py')]
+
+
+def test_main_writes_nul_separated_records(tmp_path):
+    (tmp_path / 'root').mkdir()
+    (tmp_path / 'root' / 'run.sh').write_text('x')
+    output = tmp_path / 'index'
+
+    assert workspace_helper.main(['index', str(tmp_path / 'root'), '--output', str(output)]) == 0
+
+    run_sh = str(tmp_path / 'root' / 'run.sh')
+    assert output.read_bytes().split(b'\0') == [
+        b'active_sh_files_d1',
+        run_sh.encode(),
+        b'active_files_all',
+        run_sh.encode(),
+        b'',
+    ]